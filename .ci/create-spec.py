@@ -91,7 +91,11 @@ if __name__ == "__main__":
     # Necessary for get version and
     # another infos in application
     BUILDER_ARGS.append("--add-data=pyproject.toml:.")
-    
+
+    # Screens are imported by name, only when they are
+    # first shown, so they can't be found by the analysis
+    BUILDER_ARGS.append("--collect-submodules=src.app.screens")
+
     # some assets 
     for f in listdir(ASSETS):
         asset = join(ASSETS, f)
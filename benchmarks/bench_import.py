@@ -0,0 +1,225 @@
+# The MIT License (MIT)
+
+# Copyright (c) 2021-2024 Krux contributors
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""
+bench_import.py
+
+Startup benchmark: the import time of the GUI (up to the greetings screen
+and the main screen, built right after it) and of the command line, measured
+with `python -X importtime` in fresh processes, and the check of an import
+budget: the heavy dependencies that each entry point must not import before
+its feature is first used.
+
+    poetry run poe bench-import
+    poetry run poe bench-import --save benchmarks/import-baseline.json
+    poetry run poe bench-import --compare benchmarks/import-baseline.json
+"""
+import os
+import sys
+import json
+import argparse
+import platform
+import subprocess
+import typing
+from benchmarks.bench_utils import compare, TOLERANCE
+
+# module imported by each entry point
+TARGETS = {
+    "app": "src.app",
+    "greetings": "src.app.screens.greetings_screen",
+    "main": "src.app.screens.main_screen",
+    "cli": "src.cli",
+}
+
+# modules that each entry point must not import at startup
+BUDGET = {
+    "app": (
+        "cryptography",
+        "requests",
+        "serial",
+        "pysudoer",
+        "cv2",
+        "pyzbar",
+        "src.utils.kboot.build.ktool",
+    ),
+    "greetings": (
+        "cryptography",
+        "requests",
+        "serial",
+        "pysudoer",
+        "cv2",
+        "pyzbar",
+        "src.utils.kboot.build.ktool",
+    ),
+    # built in the frames after the greetings screen, while it fetches releases
+    "main": (
+        "cryptography",
+        "requests",
+        "serial",
+        "pysudoer",
+        "cv2",
+        "pyzbar",
+        "src.utils.kboot.build.ktool",
+    ),
+    "cli": ("kivy", "cryptography", "requests", "serial", "cv2", "pyzbar"),
+}
+
+TOP = 10
+
+
+def parse_importtime(stderr: str) -> typing.Dict[str, typing.Tuple[int, int]]:
+    """
+    Parse the `-X importtime` report into the self and cumulative
+    microseconds of each imported module
+    """
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+
+        try:
+            self_us, cumulative_us, name = line[len("import time:") :].split("|")
+            modules[name.strip()] = (int(self_us), int(cumulative_us))
+
+        # the header line
+        except ValueError:
+            continue
+
+    return modules
+
+
+def measure(module: str) -> typing.Dict[str, typing.Tuple[int, int]]:
+    """Import a module in a fresh process and return its import times"""
+    env = dict(os.environ, KIVY_NO_ARGS="1", KIVY_NO_CONSOLELOG="1")
+    env.pop("KRUX_PROFILE", None)
+
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+    if proc.returncode != 0:
+        last = proc.stderr.strip().splitlines()[-1:] or ["unknown error"]
+        raise RuntimeError(f"Unable to import {module}: {last[0]}")
+
+    return parse_importtime(proc.stderr)
+
+
+def over_budget(name: str, modules: typing.Iterable[str]) -> typing.List[str]:
+    """Return the heavy modules imported by an entry point, beyond its budget"""
+    return sorted(
+        heavy
+        for heavy in BUDGET.get(name, ())
+        if any(m == heavy or m.startswith(f"{heavy}.") for m in modules)
+    )
+
+
+def run(names: typing.Iterable[str], repeat: int = 1) -> typing.List[dict]:
+    """Measure each entry point, keeping the fastest of the repeated runs"""
+    results = []
+
+    for name in names:
+        module = TARGETS[name]
+        runs = [measure(module) for _ in range(repeat)]
+        best = min(runs, key=lambda modules, target=module: modules[target][1])
+        top = sorted(best.items(), key=lambda item: item[1][0], reverse=True)
+
+        results.append(
+            {
+                "stage": f"import-{name}",
+                "size_mb": None,
+                "seconds": best[module][1] / 1e6,
+                "modules": len(best),
+                "over_budget": over_budget(name, best.keys()),
+                "top_self_ms": {
+                    imported: self_us / 1e3 for imported, (self_us, _) in top[:TOP]
+                },
+            }
+        )
+
+    return results
+
+
+def make_parser() -> argparse.ArgumentParser:
+    """Build the command line parser"""
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.bench_import",
+        description="Benchmark the import time of the GUI and the command line",
+    )
+    parser.add_argument(
+        "--targets",
+        type=lambda value: value.split(","),
+        default=list(TARGETS.keys()),
+        help="comma separated entry points (default: app,greetings,main,cli)",
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="runs of each import")
+    parser.add_argument("--save", default=None, help="save the results as baseline")
+    parser.add_argument("--compare", default=None, help="baseline to compare with")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=TOLERANCE,
+        help="allowed slowdown before a regression (default: 0.2, i.e. 20%%)",
+    )
+    return parser
+
+
+def main(argv: typing.List[str] | None = None) -> int:
+    """
+    Print a JSON line for each entry point; return 1 if any imports a module
+    beyond its budget or is a regression against the --compare baseline
+    """
+    args = make_parser().parse_args(argv)
+    results = run(args.targets, repeat=args.repeat)
+    failures = []
+
+    for result in results:
+        print(json.dumps(result), flush=True)
+        failures.extend(
+            f"{result['stage']}: {module} imported at startup"
+            for module in result["over_budget"]
+        )
+
+    if args.save is not None:
+        with open(args.save, "w", encoding="utf8") as baseline:
+            json.dump(
+                {"machine": platform.platform(), "results": results},
+                baseline,
+                indent=2,
+            )
+
+    if args.compare is not None:
+        with open(args.compare, "r", encoding="utf8") as baseline:
+            failures.extend(
+                compare(results, json.load(baseline)["results"], args.tolerance)
+            )
+
+    for failure in failures:
+        print(failure, file=sys.stderr)
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
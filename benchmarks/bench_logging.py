@@ -0,0 +1,95 @@
+# The MIT License (MIT)
+
+# Copyright (c) 2021-2024 Krux contributors
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""
+bench_logging.py
+
+Micro-benchmark of :class:`src.utils.trigger.Trigger` logging on the
+download hot path (a property getter that logs on every access), against
+the previous frame-walking logger (:func:`src.utils.info.mro` and an
+eagerly built f-string):
+
+    poetry run poe bench-logging
+"""
+import sys
+import timeit
+import logging
+from src.utils.info import mro
+from src.utils.trigger import Logger
+from src.utils.downloader.trigger_downloader import TriggerDownloader
+
+NUMBER = 100000
+URL = "https://github.com/selfcustody/krux/releases/download/v0.0.1/krux-v0.0.1.zip"
+
+
+# pylint: disable=too-few-public-methods
+class LegacyTrigger:
+    """The previous Trigger: resolve the class name on each call"""
+
+    def debug(self, msg: str):
+        """Logger with level 'debug'"""
+        Logger.debug("%s: %s", mro(), msg)
+
+
+class LegacyDownloader(LegacyTrigger):
+    """A getter logging like TriggerDownloader.downloaded_len did"""
+
+    def __init__(self):
+        self._downloaded_len = 0
+
+    @property
+    def downloaded_len(self) -> int:
+        """Getter for the ammount of downloaded data"""
+        self.debug(f"downloaded_len::getter={self._downloaded_len}")
+        return self._downloaded_len
+
+
+def measure(stmt, number: int = NUMBER) -> float:
+    """Best of 5 runs, in nanoseconds per call"""
+    return min(timeit.repeat(stmt, number=number, repeat=5)) / number * 1e9
+
+
+def main() -> int:
+    """Print the cost per call of each logger, with debug filtered out"""
+    Logger.setLevel(logging.INFO)
+    legacy = LegacyDownloader()
+    current = TriggerDownloader(url=URL)
+    current.downloaded_len = 0
+
+    results = {
+        "legacy getter": measure(lambda: legacy.downloaded_len),
+        "trigger getter": measure(lambda: current.downloaded_len),
+        "trigger debug (no args)": measure(lambda: current.debug("chunk")),
+        "trigger debug (lazy args)": measure(
+            lambda: current.debug("chunk=%s", current)
+        ),
+    }
+
+    for name, nsec in results.items():
+        print(f"{name:<28} {nsec:>10.1f} ns/call")
+
+    speedup = results["legacy getter"] / results["trigger getter"]
+    print(f"{'speedup':<28} {speedup:>10.1f}x")
+    return 0 if speedup > 1 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,325 @@
+# The MIT License (MIT)
+
+# Copyright (c) 2021-2024 Krux contributors
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""
+bench_utils.py
+
+Benchmark suite of the utils layer: download (with its chunk handling),
+sha256, signature verification and unzip of synthetic releases (1 MB to
+200 MB, served by a local stand-in for GitHub), plus the latency of
+i18n lookups, :func:`src.utils.info.mro` and a filtered log call.
+
+Each file stage runs in a fresh process, so its peak RSS is its own.
+Results can be saved as a baseline and later runs compared against it:
+
+    poetry run poe bench --save benchmarks/baseline.json
+    poetry run poe bench --compare benchmarks/baseline.json
+
+Baselines are machine dependent, so none is kept in the repository: the
+benchmarks job of the Tests workflow saves one from the base branch of a
+pull request and compares the pull request with it, on the same runner.
+"""
+import os
+import sys
+import json
+import time
+import timeit
+import logging
+import argparse
+import tempfile
+import platform
+import typing
+import multiprocessing
+import multiprocessing.forkserver
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import resource
+except ImportError:  # pragma: no cover (windows)
+    resource = None
+
+VERSION = "v0.0.1"
+SIZES_MB = (1, 20, 200)
+TOLERANCE = 0.2
+NUMBER = 20000
+
+
+def peak_rss_mb() -> float | None:
+    """Peak resident memory of this process, in MB (None if unknown)"""
+    if resource is None:
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # linux reports KB, macOS reports bytes
+    return peak / 1024**2 if sys.platform == "darwin" else peak / 1024
+
+
+def stage_download(paths: dict, base_url: str, workdir: str) -> float:
+    """Download the zip from the stand-in, chunk by chunk, to disk"""
+    # pylint: disable=import-outside-toplevel
+    from benchmarks.release_stand_in import stand_in_github
+    from src.utils.downloader import ZipDownloader
+
+    stand_in_github(base_url)
+    downloader = ZipDownloader(version=VERSION, destdir=workdir)
+
+    start = time.perf_counter()
+    downloader.download(on_data=lambda data: None)
+    elapsed = time.perf_counter() - start
+
+    assert os.path.getsize(downloader.destfile) == os.path.getsize(paths["zip"])
+    return elapsed
+
+
+def stage_sha256(paths: dict, base_url: str, workdir: str) -> float:
+    """Hash the zip and check it against its .sha256.txt"""
+    # pylint: disable=import-outside-toplevel,unused-argument
+    from src.utils.verifyer import Sha256Verifyer
+
+    with open(paths["sha256"], "r", encoding="utf8") as sha:
+        expected = sha.read().split(" ", maxsplit=1)[0]
+
+    start = time.perf_counter()
+    verifyer = Sha256Verifyer(filename=paths["zip"])
+    verifyer.load()
+    ok = verifyer.verify(expected)
+    elapsed = time.perf_counter() - start
+
+    assert ok
+    return elapsed
+
+
+def stage_signature(paths: dict, base_url: str, workdir: str) -> float:
+    """Verify the zip's signature with the public key"""
+    # pylint: disable=import-outside-toplevel,unused-argument
+    from src.utils.verifyer import SigVerifyer
+
+    with open(paths["sig"], "rb") as sig, open(paths["pem"], "rb") as pem:
+        signature, pubkey = sig.read(), pem.read()
+
+    start = time.perf_counter()
+    verifyer = SigVerifyer(
+        filename=paths["zip"], signature=signature, pubkey=pubkey, regexp=r".*\.zip$"
+    )
+    verifyer.load()
+    ok = verifyer.verify()
+    elapsed = time.perf_counter() - start
+
+    assert ok
+    return elapsed
+
+
+def stage_unzip(paths: dict, base_url: str, workdir: str) -> float:
+    """Extract a device's kboot.kfpkg from the zip"""
+    # pylint: disable=import-outside-toplevel,unused-argument
+    from src.utils.unzip import KbootUnzip
+
+    start = time.perf_counter()
+    KbootUnzip(filename=paths["zip"], device="amigo", output=workdir).load()
+    return time.perf_counter() - start
+
+
+FILE_STAGES = {
+    "download": stage_download,
+    "sha256": stage_sha256,
+    "signature": stage_signature,
+    "unzip": stage_unzip,
+}
+
+
+def run_file_stage(name: str, paths: dict, base_url: str) -> dict:
+    """Run a file stage (in a worker process) and measure it"""
+    # the suite measures the code, not the cost of debug logs
+    logging.getLogger("kivy").setLevel(logging.INFO)
+
+    with tempfile.TemporaryDirectory() as workdir:
+        elapsed = FILE_STAGES[name](paths, base_url, workdir)
+
+    size = os.path.getsize(paths["zip"])
+    return {
+        "seconds": elapsed,
+        "throughput_mb_s": size / 1024**2 / elapsed if elapsed > 0 else None,
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+def measure_latency(stmt: typing.Callable, number: int = NUMBER) -> float:
+    """Best of 5 runs, in nanoseconds per call"""
+    return min(timeit.repeat(stmt, number=number, repeat=5)) / number * 1e9
+
+
+def run_latency_stages() -> typing.Dict[str, float]:
+    """Latency, in ns/call, of lookups done many times per screen"""
+    # pylint: disable=import-outside-toplevel
+    from src.i18n import T
+    from src.utils.info import mro
+    from src.utils.trigger import Trigger
+
+    logging.getLogger("kivy").setLevel(logging.INFO)
+
+    # pylint: disable=too-few-public-methods
+    class Caller(Trigger):
+        """Call :func:`mro` from a method, like the old Trigger did"""
+
+        def who(self):
+            """Resolve the name of this class by the call frame"""
+            return mro()
+
+    caller = Caller()
+    return {
+        "i18n": measure_latency(
+            lambda: T("Version", locale="en_US.UTF-8", module="main_screen")
+        ),
+        "mro": measure_latency(caller.who),
+        "debug_filtered": measure_latency(lambda: caller.debug("x=%s", 1)),
+    }
+
+
+def run(sizes_mb: typing.Iterable[int], repeat: int = 1) -> typing.List[dict]:
+    """Run all stages, for each size, keeping the best of `repeat` runs"""
+    # pylint: disable=import-outside-toplevel
+    from benchmarks.release_stand_in import make_release, ReleaseServer
+
+    results = []
+
+    # linux keeps the peak RSS of a process across fork and exec, so
+    # workers are forked from a small server started before the releases
+    # are made, instead of from this (growing) process
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context("forkserver")
+        multiprocessing.forkserver.ensure_running()
+    else:  # pragma: no cover (windows)
+        context = multiprocessing.get_context("spawn")
+
+    with tempfile.TemporaryDirectory() as rootdir:
+        with ReleaseServer(rootdir) as server:
+            for size_mb in sizes_mb:
+                paths = make_release(rootdir, VERSION, size_mb * 1024**2)
+
+                for name in FILE_STAGES:
+                    runs = []
+                    for _ in range(repeat):
+                        # a fresh process, so peak RSS is of this stage only
+                        with ProcessPoolExecutor(1, mp_context=context) as pool:
+                            future = pool.submit(
+                                run_file_stage, name, paths, server.url
+                            )
+                            runs.append(future.result())
+
+                    best = min(runs, key=lambda r: r["seconds"])
+                    results.append({"stage": name, "size_mb": size_mb, **best})
+
+    for name, nsec in run_latency_stages().items():
+        results.append({"stage": name, "size_mb": None, "ns_per_call": nsec})
+
+    return results
+
+
+def result_key(result: dict) -> str:
+    """Identify a result among runs"""
+    if result["size_mb"] is None:
+        return result["stage"]
+    return f"{result['stage']}@{result['size_mb']}MB"
+
+
+def result_cost(result: dict) -> float:
+    """The lower the better: seconds, or ns/call for latency stages"""
+    return result.get("seconds", result.get("ns_per_call"))
+
+
+def compare(
+    results: typing.List[dict], baseline: typing.List[dict], tolerance: float
+) -> typing.List[str]:
+    """Return the results that are slower than the baseline, beyond a tolerance"""
+    before = {result_key(r): result_cost(r) for r in baseline}
+    regressions = []
+
+    for result in results:
+        key = result_key(result)
+        if key not in before or not before[key]:
+            continue
+
+        ratio = result_cost(result) / before[key]
+        if ratio > 1 + tolerance:
+            regressions.append(f"{key}: {ratio:.2f}x slower than baseline")
+
+    return regressions
+
+
+def make_parser() -> argparse.ArgumentParser:
+    """Build the command line parser"""
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.bench_utils",
+        description="Benchmark download, hash, verify, unzip and i18n lookups",
+    )
+    parser.add_argument(
+        "--sizes",
+        type=lambda value: [int(size) for size in value.split(",")],
+        default=list(SIZES_MB),
+        help="comma separated sizes, in MB, of synthetic releases (default: 1,20,200)",
+    )
+    parser.add_argument("--repeat", type=int, default=1, help="runs of each stage")
+    parser.add_argument("--save", default=None, help="save the results as baseline")
+    parser.add_argument("--compare", default=None, help="baseline to compare with")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=TOLERANCE,
+        help="allowed slowdown before a regression (default: 0.2, i.e. 20%%)",
+    )
+    return parser
+
+
+def main(argv: typing.List[str] | None = None) -> int:
+    """
+    Print a JSON line for each result; return 1 if any is a regression
+    against the --compare baseline
+    """
+    args = make_parser().parse_args(argv)
+    results = run(args.sizes, repeat=args.repeat)
+
+    for result in results:
+        print(json.dumps(result), flush=True)
+
+    if args.save is not None:
+        with open(args.save, "w", encoding="utf8") as baseline:
+            json.dump(
+                {"machine": platform.platform(), "results": results},
+                baseline,
+                indent=2,
+            )
+
+    if args.compare is not None:
+        with open(args.compare, "r", encoding="utf8") as baseline:
+            regressions = compare(
+                results, json.load(baseline)["results"], args.tolerance
+            )
+
+        for regression in regressions:
+            print(regression, file=sys.stderr)
+
+        return 1 if regressions else 0
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
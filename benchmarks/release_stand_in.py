@@ -0,0 +1,153 @@
+# The MIT License (MIT)
+
+# Copyright (c) 2021-2024 Krux contributors
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""
+release_stand_in.py
+
+Synthetic krux releases, served from a local HTTP server that stands in
+for GitHub, so the utils layer can be benchmarked offline with assets of
+any size (and without being rate limited)
+"""
+import os
+import functools
+import threading
+from zipfile import ZipFile, ZIP_DEFLATED
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from requests.adapters import HTTPAdapter
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.hazmat.primitives.asymmetric.utils import Prehashed
+from src.utils.session import get_session
+
+GITHUB = "https://github.com"
+RELEASE_PATH = "selfcustody/krux/releases/download"
+DEVICES = ("m5stickv", "amigo", "dock", "bit", "yahboom", "cube")
+BLOCK_SIZE = 1024 * 1024
+
+
+def write_zip(zipname: str, base_name: str, size: int):
+    """
+    Write a zip with a layout like the real releases, whose members
+    add up to about `size` bytes of random (incompressible) data
+    """
+    # split the size among the kboot.kfpkg of each device
+    member_size = max(size // len(DEVICES), 1)
+
+    with ZipFile(zipname, "w", compression=ZIP_DEFLATED, compresslevel=1) as zip_obj:
+        for device in DEVICES:
+            name = f"{base_name}/maixpy_{device}/kboot.kfpkg"
+            with zip_obj.open(name, "w") as member:
+                remaining = member_size
+                while remaining > 0:
+                    block = os.urandom(min(BLOCK_SIZE, remaining))
+                    member.write(block)
+                    remaining -= len(block)
+
+
+def make_release(destdir: str, version: str, size: int) -> dict:
+    """
+    Write a synthetic `krux-<version>.zip` of about `size` bytes, with
+    its .sha256.txt, .sig and selfcustody.pem. Return their paths
+    """
+    base_name = f"krux-{version}"
+    releasedir = os.path.join(destdir, RELEASE_PATH, version)
+    os.makedirs(releasedir, exist_ok=True)
+
+    paths = {
+        "zip": os.path.join(releasedir, f"{base_name}.zip"),
+        "pem": os.path.join(destdir, "selfcustody.pem"),
+    }
+    paths["sig"] = f"{paths['zip']}.sig"
+    paths["sha256"] = f"{paths['zip']}.sha256.txt"
+    write_zip(paths["zip"], base_name, size)
+
+    # hash by blocks and sign the digest, to not load the whole zip
+    digest = hashes.Hash(hashes.SHA256())
+    with open(paths["zip"], "rb") as zip_file:
+        while block := zip_file.read(BLOCK_SIZE):
+            digest.update(block)
+
+    sha256 = digest.finalize()
+    with open(paths["sha256"], "w", encoding="utf8") as sha:
+        sha.write(f"{sha256.hex()} {base_name}.zip")
+
+    key = ec.generate_private_key(ec.SECP256K1())
+    with open(paths["sig"], "wb") as sig:
+        sig.write(key.sign(sha256, ec.ECDSA(Prehashed(hashes.SHA256()))))
+
+    with open(paths["pem"], "wb") as pem:
+        pem.write(
+            key.public_key().public_bytes(
+                serialization.Encoding.PEM,
+                serialization.PublicFormat.SubjectPublicKeyInfo,
+            )
+        )
+
+    return paths
+
+
+class QuietHandler(SimpleHTTPRequestHandler):
+    """Serve files without logging each request on stderr"""
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        pass
+
+
+class ReleaseServer:
+    """Serve a directory on a local port, in a background thread"""
+
+    def __init__(self, rootdir: str):
+        handler = functools.partial(QuietHandler, directory=rootdir)
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        """Base url of the server"""
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self) -> "ReleaseServer":
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        self.thread.join()
+
+
+class StandInAdapter(HTTPAdapter):
+    """Send the requests to GitHub to a :class:`ReleaseServer` instead"""
+
+    def __init__(self, base_url: str, **kwargs):
+        super().__init__(**kwargs)
+        self.base_url = base_url
+
+    # pylint: disable=arguments-differ
+    def send(self, request, **kwargs):
+        request.url = request.url.replace(GITHUB, self.base_url, 1)
+        return super().send(request, **kwargs)
+
+
+def stand_in_github(base_url: str):
+    """Route the shared session's requests to GitHub to `base_url`"""
+    get_session().mount(f"{GITHUB}/", StandInAdapter(base_url))
@@ -1,5 +1,6 @@
 import os
 import sys
+import tempfile
 from pathlib import Path
 from unittest.mock import patch, call, MagicMock
 from kivy.base import EventLoop, EventLoopBase
@@ -8,6 +9,7 @@ from kivy.tests.common import GraphicUnitTest
 from kivy.uix.button import Button
 from kivy.uix.screenmanager import ScreenManager
 from src.app.screens.base_screen import BaseScreen
+from src.utils.cache import FlashLedger
 
 
 class TestBaseScreen(GraphicUnitTest):
@@ -506,3 +508,90 @@ class TestBaseScreen(GraphicUnitTest):
         mock_color.assert_called_once_with(0, 0, 0, 1)
         mock_rectangle.assert_called_once()
         mock_get_locale.assert_called_once()
+
+    @patch("src.app.screens.base_screen.BaseScreen.get_locale")
+    def test_run_in_background(self, mock_get_locale):
+        screen = BaseScreen(wid="mock", name="Mock")
+        on_result = MagicMock()
+        on_error = MagicMock()
+
+        thread = screen.run_in_background(
+            target=lambda: ["v0.0.1"], on_result=on_result, on_error=on_error
+        )
+        thread.join()
+        Clock.tick()
+
+        on_result.assert_called_once_with(["v0.0.1"])
+        on_error.assert_not_called()
+        mock_get_locale.assert_called_once()
+
+    @patch("src.app.screens.base_screen.BaseScreen.get_locale")
+    @patch("src.app.screens.base_screen.BaseScreen.redirect_exception")
+    def test_fail_run_in_background(self, mock_redirect_exception, mock_get_locale):
+        screen = BaseScreen(wid="mock", name="Mock")
+        exc = RuntimeError("Mocked")
+
+        def target():
+            raise exc
+
+        thread = screen.run_in_background(target=target, on_result=MagicMock())
+        thread.join()
+        Clock.tick()
+
+        mock_redirect_exception.assert_called_once_with(exception=exc)
+        mock_get_locale.assert_called_once()
+
+    @patch("src.app.screens.base_screen.BaseScreen.get_locale")
+    def test_cancel_background(self, mock_get_locale):
+        screen = BaseScreen(wid="mock", name="Mock")
+        on_result = MagicMock()
+
+        thread = screen.run_in_background(
+            target=lambda: ["v0.0.1"], on_result=on_result
+        )
+        screen.cancel_background()
+        thread.join()
+        Clock.tick()
+
+        on_result.assert_not_called()
+        mock_get_locale.assert_called_once()
+
+    @patch("src.app.screens.base_screen.BaseScreen.get_locale")
+    @patch("src.app.screens.base_screen.BaseScreen.get_cachedir")
+    def test_forget_flashed(self, mock_get_cachedir, mock_get_locale):
+        with tempfile.TemporaryDirectory() as cachedir:
+            mock_get_cachedir.return_value = cachedir
+            ledger = FlashLedger(cachedir=cachedir)
+            ledger.record("0403:6010:abc", "00ff", device="amigo_tft")
+            ledger.record("0403:6001:ghi", "00ff", device="m5stickv")
+            ledger.record("1a86:7523:def", "00ff", device="dock")
+            ledger.save()
+
+            screen = BaseScreen(wid="mock", name="Mock")
+            screen.forget_flashed("amigo")
+
+            entries = FlashLedger(cachedir=cachedir).entries
+            self.assertEqual(list(entries.keys()), ["1a86:7523:def"])
+
+        mock_get_cachedir.assert_called_once()
+        mock_get_locale.assert_called_once()
+
+    @patch("src.app.screens.base_screen.BaseScreen.get_locale")
+    @patch("src.app.screens.base_screen.BaseScreen.get_cachedir", return_value="mock")
+    @patch("src.app.screens.base_screen.FlashLedger")
+    @patch("src.app.screens.base_screen.BaseScreen.warning")
+    def test_fail_forget_flashed(
+        self, mock_warning, mock_ledger, mock_get_cachedir, mock_get_locale
+    ):
+        mock_ledger.return_value.save.side_effect = OSError("Read-only")
+
+        screen = BaseScreen(wid="mock", name="Mock")
+        screen.forget_flashed("amigo")
+
+        mock_ledger.assert_called_once_with(cachedir="mock")
+        mock_ledger.return_value.forget_usb_id.assert_called_once_with("0403")
+        mock_warning.assert_called_once_with(
+            "Unable to update the flashed devices ledger: Read-only"
+        )
+        mock_get_cachedir.assert_called_once()
+        mock_get_locale.assert_called_once()
@@ -7,6 +7,7 @@ from kivy.base import EventLoop, EventLoopBase
 from kivy.clock import Clock
 from kivy.tests.common import GraphicUnitTest
 from src.app.screens.greetings_screen import GreetingsScreen
+from src.utils.selector.release_catalog import get_release_catalog
 
 
 class TestAboutScreen(GraphicUnitTest):
@@ -19,6 +20,11 @@ class TestAboutScreen(GraphicUnitTest):
             Clock.unschedule(event)
         EventLoop.exit()
 
+    def setUp(self):
+        super().setUp()
+        # releases are memoized process-wide, so each test fetches its own
+        get_release_catalog().clear()
+
     @patch.object(EventLoopBase, "ensure_window", lambda x: None)
     @patch(
         "src.app.screens.base_screen.BaseScreen.get_locale", return_value="en_US.UTF-8"
@@ -383,34 +389,67 @@ class TestAboutScreen(GraphicUnitTest):
             mock_get_locale.assert_called()
             mock_grp.getgrall.assert_called()
 
+    @patch.object(EventLoopBase, "ensure_window", lambda x: None)
+    @patch(
+        "src.app.screens.base_screen.BaseScreen.get_locale", return_value="en_US.UTF-8"
+    )
+    @patch("src.utils.selector.release_catalog.Selector")
+    @patch("src.app.screens.base_screen.BaseScreen.run_in_background")
+    @patch(
+        "src.app.screens.base_screen.BaseScreen.get_cachedir", return_value="mockdir"
+    )
+    def test_check_internet_connection(
+        self,
+        mock_get_cachedir,
+        mock_run_in_background,
+        mock_selector,
+        mock_get_locale,
+    ):
+        mock_selector.return_value = MagicMock(releases=["v0.0.1"])
+        screen = GreetingsScreen()
+        self.render(screen)
+
+        # get your Window instance safely
+        EventLoop.ensure_window()
+
+        screen.update(name=screen.name, key="check-internet-connection")
+
+        # the request is made on background thread
+        kwargs = mock_run_in_background.call_args.kwargs
+        self.assertEqual(kwargs["on_result"], screen.on_check_internet_connection)
+        self.assertEqual(kwargs["target"](), ["v0.0.1"])
+
+        # patch assertions
+        mock_get_locale.assert_called_once()
+        mock_get_cachedir.assert_called_once()
+        mock_run_in_background.assert_called_once()
+        mock_selector.assert_called_once_with(cachedir="mockdir")
+
     @patch.object(EventLoopBase, "ensure_window", lambda x: None)
     @patch(
         "src.app.screens.base_screen.BaseScreen.get_locale", return_value="en_US.UTF-8"
     )
     @patch("src.app.screens.base_screen.BaseScreen.manager")
-    @patch("src.app.screens.greetings_screen.Selector")
     @patch("src.app.screens.greetings_screen.partial")
     @patch("src.app.screens.greetings_screen.Clock.schedule_once")
     @patch("src.app.screens.greetings_screen.GreetingsScreen.set_screen")
-    def test_check_internet_connection(
+    def test_on_check_internet_connection(
         self,
         mock_set_screen,
         mock_schedule_once,
         mock_partial,
-        mock_selector,
         mock_manager,
         mock_get_locale,
     ):
         mock_manager.get_screen = MagicMock()
         mock_manager.get_screen.update = MagicMock()
-        mock_selector.return_value = MagicMock(releases=["v0.0.1"])
         screen = GreetingsScreen()
         self.render(screen)
 
         # get your Window instance safely
         EventLoop.ensure_window()
 
-        screen.update(name=screen.name, key="check-internet-connection")
+        screen.on_check_internet_connection(["v0.0.1", "odudex/krux_binaries"])
 
         # patch assertions
         mock_get_locale.assert_called_once()
@@ -429,11 +468,18 @@ class TestAboutScreen(GraphicUnitTest):
         "src.app.screens.base_screen.BaseScreen.get_locale", return_value="en_US.UTF-8"
     )
     @patch(
-        "src.app.screens.greetings_screen.Selector", side_effect=[Exception("Mocked")]
+        "src.utils.selector.release_catalog.Selector", side_effect=[Exception("Mocked")]
+    )
+    @patch("src.app.screens.base_screen.BaseScreen.run_in_background")
+    @patch(
+        "src.app.screens.base_screen.BaseScreen.get_cachedir", return_value="mockdir"
     )
-    @patch("src.app.screens.greetings_screen.GreetingsScreen.redirect_exception")
     def test_fail_check_internet_connection(
-        self, mock_redirect_exception, mock_selector, mock_get_locale
+        self,
+        mock_get_cachedir,
+        mock_run_in_background,
+        mock_selector,
+        mock_get_locale,
     ):
         screen = GreetingsScreen()
         self.render(screen)
@@ -443,10 +489,18 @@ class TestAboutScreen(GraphicUnitTest):
 
         screen.update(name=screen.name, key="check-internet-connection")
 
+        # the exception is raised on background thread, and
+        # delivered to the default `on_background_error` callback
+        kwargs = mock_run_in_background.call_args.kwargs
+        self.assertNotIn("on_error", kwargs)
+        with self.assertRaises(Exception) as exc_info:
+            kwargs["target"]()
+
         # patch assertions
+        self.assertEqual(str(exc_info.exception), "Mocked")
         mock_get_locale.assert_called_once()
         mock_selector.assert_called()
-        mock_redirect_exception.assert_called()
+        mock_get_cachedir.assert_called_once()
 
     @patch("sys.platform", "win32")
     @patch.object(EventLoopBase, "ensure_window", lambda x: None)
@@ -535,8 +589,12 @@ class TestAboutScreen(GraphicUnitTest):
         return_value=True,
     )
     @patch("src.app.screens.base_screen.BaseScreen.manager")
+    @patch("src.app.screens.greetings_screen.partial")
+    @patch("src.app.screens.greetings_screen.Clock.schedule_once")
     def test_check_dialout_permission_in_dialout(
         self,
+        mock_schedule_once,
+        mock_partial,
         mock_manager,
         mock_in_dialout,
         mock_get_os,
@@ -558,6 +616,10 @@ class TestAboutScreen(GraphicUnitTest):
         mock_get_locale.assert_called()
         mock_get_os.assert_called()
         mock_in_dialout.assert_called()
+        mock_partial.assert_called_once_with(
+            screen.update, name="GreetingsScreen", key="check-internet-connection"
+        )
+        mock_schedule_once.assert_called_with(mock_partial(), 0)
 
     @patch.object(EventLoopBase, "ensure_window", lambda x: None)
     @patch("sys.platform", "linux")
@@ -565,8 +565,12 @@ class TestMainScreen(GraphicUnitTest):
     )
     @patch("src.app.screens.base_screen.BaseScreen.get_destdir_assets")
     @patch("src.app.screens.main_screen.os.path.isfile", side_effect=[False])
+    @patch(
+        "src.app.screens.main_screen.MainScreen.is_release_cached", return_value=False
+    )
     def test_on_release_flash_to_download_stable_zip_screen(
         self,
+        mock_is_release_cached,
         mock_isfile,
         mock_get_destdir_assets,
         mock_get_locale,
@@ -593,6 +597,7 @@ class TestMainScreen(GraphicUnitTest):
         mock_get_locale.assert_any_call()
         mock_get_destdir_assets.assert_called_once()
         mock_set_background.assert_called_once_with(wid="main_flash", rgba=(0, 0, 0, 1))
+        mock_is_release_cached.assert_called_once()
         mock_set_screen.assert_called_once_with(
             name="DownloadStableZipScreen", direction="left"
         )
@@ -642,8 +647,12 @@ class TestMainScreen(GraphicUnitTest):
     )
     @patch("src.app.screens.base_screen.BaseScreen.get_destdir_assets")
     @patch("src.app.screens.main_screen.os.path.isfile", side_effect=[True])
+    @patch(
+        "src.app.screens.main_screen.MainScreen.is_release_cached", return_value=False
+    )
     def test_on_release_flash_to_warning_already_downloaded_zip_screen(
         self,
+        mock_is_release_cached,
         mock_isfile,
         mock_get_destdir_assets,
         mock_get_locale,
@@ -670,12 +679,69 @@ class TestMainScreen(GraphicUnitTest):
         mock_get_locale.assert_any_call()
         mock_get_destdir_assets.assert_called_once()
         mock_set_background.assert_called_once_with(wid="main_flash", rgba=(0, 0, 0, 1))
+        mock_is_release_cached.assert_called_once()
         mock_set_screen.assert_called_once_with(
             name="WarningAlreadyDownloadedScreen", direction="left"
         )
         pattern = re.compile(r".*v24\.03\.0\.zip")
         self.assertTrue(pattern.match(mock_isfile.call_args[0][0]))
 
+    @patch.object(EventLoopBase, "ensure_window", lambda x: None)
+    @patch("src.app.screens.main_screen.MainScreen.set_background")
+    @patch("src.app.screens.main_screen.MainScreen.set_screen")
+    @patch("src.app.screens.main_screen.MainScreen.manager")
+    @patch(
+        "src.app.screens.base_screen.BaseScreen.get_locale", return_value="en_US.UTF-8"
+    )
+    @patch(
+        "src.app.screens.base_screen.BaseScreen.get_destdir_assets",
+        return_value="mockdir",
+    )
+    @patch("src.utils.downloader.release_bundle_downloader.ReleaseBundleDownloader")
+    @patch("src.app.screens.base_screen.BaseScreen.get_asset_cache")
+    @patch("src.app.screens.main_screen.os.path.isfile")
+    def test_on_release_flash_to_unzip_stable_screen_when_cached(
+        self,
+        mock_isfile,
+        mock_get_asset_cache,
+        mock_bundle,
+        mock_get_destdir_assets,
+        mock_get_locale,
+        mock_manager,
+        mock_set_screen,
+        mock_set_background,
+    ):
+        mock_manager.get_screen = MagicMock()
+        mock_get_asset_cache.return_value.is_verified.return_value = True
+
+        screen = MainScreen()
+        screen.version = "v24.03.0"
+        self.render(screen)
+
+        # get your Window instance safely
+        EventLoop.ensure_window()
+        window = EventLoop.window
+        grid = window.children[0].children[0]
+        button = grid.children[3]
+
+        screen.update(name="SelectVersionScreen", key="device", value="m5stickv")
+        action = getattr(screen.__class__, f"on_release_{button.id}")
+        action(button)
+
+        mock_get_locale.assert_any_call()
+        mock_get_destdir_assets.assert_called_once()
+        mock_bundle.assert_called_once_with(version="v24.03.0", destdir="mockdir")
+        mock_get_asset_cache.return_value.is_verified.assert_called_once_with(
+            mock_bundle.return_value.destfiles
+        )
+        mock_get_asset_cache.return_value.save.assert_called_once()
+        mock_set_background.assert_called_once_with(wid="main_flash", rgba=(0, 0, 0, 1))
+        mock_isfile.assert_not_called()
+        mock_manager.get_screen.assert_called_with("UnzipStableScreen")
+        mock_set_screen.assert_called_once_with(
+            name="UnzipStableScreen", direction="left"
+        )
+
     @patch.object(EventLoopBase, "ensure_window", lambda x: None)
     @patch("src.app.screens.main_screen.MainScreen.set_background")
     @patch("src.app.screens.main_screen.MainScreen.set_screen")
@@ -5,6 +5,12 @@ from kivy.tests.common import GraphicUnitTest
 from src.app.screens.select_device_screen import SelectDeviceScreen
 
 
+# pylint: disable=unused-argument
+def run_in_foreground(target, on_result, on_error=None):
+    """Replace `BaseScreen.run_in_background` to run jobs synchronously"""
+    on_result(target())
+
+
 class TestSelectDeviceScreen(GraphicUnitTest):
 
     @classmethod
@@ -291,3 +297,76 @@ class TestSelectDeviceScreen(GraphicUnitTest):
         mock_manager.get_screen.assert_has_calls(calls_manager)
         mock_set_screen.assert_has_calls(calls_set_screen)
         mock_get_locale.assert_called_once()
+
+    @patch.object(EventLoopBase, "ensure_window", lambda x: None)
+    @patch(
+        "src.app.screens.base_screen.BaseScreen.get_locale", return_value="en_US.UTF-8"
+    )
+    def test_update_connected(self, mock_get_locale):
+        screen = SelectDeviceScreen()
+        screen.update(name=screen.name, key="version", value="v22.03.0")
+        screen.update(name=screen.name, key="connected", value=["m5stickv", "dock"])
+        self.render(screen)
+
+        # get your Window instance safely
+        EventLoop.ensure_window()
+
+        self.assertEqual(screen.connected_devices, ["m5stickv", "dock"])
+        self.assertEqual(
+            screen.ids["select_device_m5stickv"].text,
+            "[color=#00ff00]m5stickv[/color]",
+        )
+
+        # dock is connected, but not enabled for v22.03.0
+        self.assertEqual(
+            screen.ids["select_device_dock"].text, "[color=#333333]dock[/color]"
+        )
+        mock_get_locale.assert_called_once()
+
+    @patch.object(EventLoopBase, "ensure_window", lambda x: None)
+    @patch(
+        "src.app.screens.base_screen.BaseScreen.get_locale", return_value="en_US.UTF-8"
+    )
+    @patch(
+        "src.app.screens.base_screen.BaseScreen.run_in_background",
+        side_effect=run_in_foreground,
+    )
+    @patch("src.app.screens.select_device_screen.get_port_discovery")
+    def test_on_enter_and_leave(
+        self, mock_get_port_discovery, mock_run_in_background, mock_get_locale
+    ):
+        discovery = mock_get_port_discovery.return_value
+        discovery.devices.return_value = ["amigo", "m5stickv"]
+
+        screen = SelectDeviceScreen()
+        screen.update(name=screen.name, key="version", value="v24.07.0")
+        screen.on_enter()
+        self.render(screen)
+
+        # get your Window instance safely
+        EventLoop.ensure_window()
+
+        self.assertEqual(
+            screen.ids["select_device_amigo"].text, "[color=#00ff00]amigo[/color]"
+        )
+        self.assertEqual(screen.ids["select_device_dock"].text, "dock")
+
+        screen.on_leave()
+
+        # patch assertions
+        discovery.watch.assert_called_once_with(screen.on_ports_change)
+        discovery.unwatch.assert_called_once_with(screen.on_ports_change)
+        mock_run_in_background.assert_called_once()
+        mock_get_locale.assert_called_once()
+
+    @patch.object(EventLoopBase, "ensure_window", lambda x: None)
+    @patch(
+        "src.app.screens.base_screen.BaseScreen.get_locale", return_value="en_US.UTF-8"
+    )
+    @patch("src.app.screens.select_device_screen.Clock.schedule_once")
+    def test_on_ports_change(self, mock_schedule_once, mock_get_locale):
+        screen = SelectDeviceScreen()
+        screen.on_ports_change(["/mock/path0"], [])
+
+        mock_schedule_once.assert_called_once_with(screen.refresh_connected, 0)
+        mock_get_locale.assert_called_once()
@@ -4,6 +4,7 @@ from kivy.base import EventLoop, EventLoopBase
 from kivy.clock import Clock
 from kivy.tests.common import GraphicUnitTest
 from src.app.screens.select_version_screen import SelectVersionScreen
+from src.utils.selector.release_catalog import get_release_catalog
 
 MOCKED_FOUND_API = [
     {"author": "test", "tag_name": "v24.03.0"},
@@ -15,6 +16,12 @@ MOCKED_FOUND_API = [
 ]
 
 
+# pylint: disable=unused-argument
+def run_in_foreground(target, on_result, on_error=None):
+    """Replace `BaseScreen.run_in_background` to run jobs synchronously"""
+    on_result(target())
+
+
 class TestSelectVersionScreen(GraphicUnitTest):
 
     @classmethod
@@ -25,6 +32,11 @@ class TestSelectVersionScreen(GraphicUnitTest):
             Clock.unschedule(event)
         EventLoop.exit()
 
+    def setUp(self):
+        super().setUp()
+        # releases are memoized process-wide, so each test fetches its own
+        get_release_catalog().clear()
+
     @patch.object(EventLoopBase, "ensure_window", lambda x: None)
     @patch(
         "src.app.screens.base_screen.BaseScreen.get_locale", return_value="en_US.UTF-8"
@@ -74,18 +86,31 @@ class TestSelectVersionScreen(GraphicUnitTest):
         mock_clear_widgets.assert_called_once()
         mock_get_locale.assert_called_once()
 
+    @patch(
+        "src.app.screens.base_screen.BaseScreen.run_in_background",
+        side_effect=run_in_foreground,
+    )
     @patch.object(EventLoopBase, "ensure_window", lambda x: None)
-    @patch("src.utils.selector.requests")
+    @patch("src.app.screens.base_screen.BaseScreen.get_cachedir", return_value=None)
+    @patch("src.utils.selector.catalog_fetcher.get_session")
     @patch(
         "src.app.screens.base_screen.BaseScreen.get_locale", return_value="en_US.UTF-8"
     )
     @patch("src.app.screens.select_version_screen.SelectVersionScreen.manager")
-    def test_render_buttons(self, mock_manager, mock_get_locale, mock_requests):
+    def test_render_buttons(
+        self,
+        mock_manager,
+        mock_get_locale,
+        mock_get_session,
+        mock_get_cachedir,
+        mock_run_in_background,
+    ):
         # Configure mocks
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.json.return_value = MOCKED_FOUND_API
-        mock_requests.get.return_value = mock_response
+        mock_response.links = {}
+        mock_get_session.return_value.get.return_value = mock_response
         mock_manager.get_screen = MagicMock()
 
         screen = SelectVersionScreen()
@@ -105,22 +130,36 @@ class TestSelectVersionScreen(GraphicUnitTest):
         self.assertEqual(buttons[0].id, "select_version_screen_back")
 
         mock_get_locale.assert_any_call()
+        mock_get_cachedir.assert_called()
+        mock_run_in_background.assert_called_once()
 
+    @patch(
+        "src.app.screens.base_screen.BaseScreen.run_in_background",
+        side_effect=run_in_foreground,
+    )
     @patch.object(EventLoopBase, "ensure_window", lambda x: None)
-    @patch("src.utils.selector.requests")
+    @patch("src.app.screens.base_screen.BaseScreen.get_cachedir", return_value=None)
+    @patch("src.utils.selector.catalog_fetcher.get_session")
     @patch(
         "src.app.screens.base_screen.BaseScreen.get_locale", return_value="en_US.UTF-8"
     )
     @patch("src.app.screens.select_version_screen.SelectVersionScreen.manager")
     @patch("src.app.screens.select_version_screen.SelectVersionScreen.set_background")
     def test_on_press(
-        self, mock_set_background, mock_manager, mock_get_locale, mock_requests
+        self,
+        mock_set_background,
+        mock_manager,
+        mock_get_locale,
+        mock_get_session,
+        mock_get_cachedir,
+        mock_run_in_background,
     ):
         # Configure mocks
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.json.return_value = MOCKED_FOUND_API
-        mock_requests.get.return_value = mock_response
+        mock_response.links = {}
+        mock_get_session.return_value.get.return_value = mock_response
         mock_manager.get_screen = MagicMock()
 
         screen = SelectVersionScreen()
@@ -146,35 +185,54 @@ class TestSelectVersionScreen(GraphicUnitTest):
 
         mock_set_background.assert_has_calls(calls)
         mock_get_locale.assert_any_call()
+        mock_get_cachedir.assert_called()
+        mock_run_in_background.assert_called_once()
 
     @patch.object(EventLoopBase, "ensure_window", lambda x: None)
-    @patch("src.utils.selector.requests")
+    @patch("src.app.screens.base_screen.BaseScreen.get_cachedir", return_value=None)
+    @patch("src.utils.selector.catalog_fetcher.get_session")
     @patch(
         "src.app.screens.base_screen.BaseScreen.get_locale", return_value="en_US.UTF-8"
     )
     @patch("src.app.screens.base_screen.BaseScreen.redirect_exception")
+    @patch("src.app.screens.base_screen.BaseScreen.run_in_background")
     def test_fail_on_fetch_releases(
         self,
+        mock_run_in_background,
         mock_redirect_exception,
         mock_get_locale,
-        mock_requests,
+        mock_get_session,
+        mock_get_cachedir,
     ):
         # Configure mocks
         mock_response = MagicMock(status_code=404)
         mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError(
             "Mocked 404"
         )
-        mock_requests.exceptions = requests.exceptions
-        mock_requests.get.return_value = mock_response
+        mock_get_session.return_value.get.return_value = mock_response
 
         screen = SelectVersionScreen()
         screen.fetch_releases()
 
+        # the request fails on background thread and
+        # its exception is delivered to the default callback
+        target = mock_run_in_background.call_args.kwargs["target"]
+        with self.assertRaises(RuntimeError) as exc_info:
+            target()
+
+        screen.on_background_error(exc_info.exception)
+
         mock_get_locale.assert_called_once()
-        mock_redirect_exception.assert_called_once()
+        mock_redirect_exception.assert_called_once_with(exception=exc_info.exception)
+        mock_get_cachedir.assert_called()
 
+    @patch(
+        "src.app.screens.base_screen.BaseScreen.run_in_background",
+        side_effect=run_in_foreground,
+    )
     @patch.object(EventLoopBase, "ensure_window", lambda x: None)
-    @patch("src.utils.selector.requests")
+    @patch("src.app.screens.base_screen.BaseScreen.get_cachedir", return_value=None)
+    @patch("src.utils.selector.catalog_fetcher.get_session")
     @patch(
         "src.app.screens.base_screen.BaseScreen.get_locale", return_value="en_US.UTF-8"
     )
@@ -187,13 +245,17 @@ class TestSelectVersionScreen(GraphicUnitTest):
         mock_set_screen,
         mock_set_background,
         mock_get_locale,
-        mock_requests,
+        mock_get_session,
+        mock_get_cachedir,
+        mock_run_in_background,
     ):
+        # pylint: disable=too-many-locals
         # Configure mocks
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.json.return_value = MOCKED_FOUND_API
-        mock_requests.get.return_value = mock_response
+        mock_response.links = {}
+        mock_get_session.return_value.get.return_value = mock_response
         mock_manager.get_screen = MagicMock()
 
         screen = SelectVersionScreen()
@@ -236,6 +298,8 @@ class TestSelectVersionScreen(GraphicUnitTest):
         mock_manager.get_screen.assert_has_calls(calls_get_screen)
         mock_set_screen.assert_has_calls(calls_set_screen)
         mock_get_locale.assert_any_call()
+        mock_get_cachedir.assert_called()
+        mock_run_in_background.assert_called_once()
 
     @patch.object(EventLoopBase, "ensure_window", lambda x: None)
     @patch(
@@ -251,3 +315,68 @@ class TestSelectVersionScreen(GraphicUnitTest):
         screen.update(name=screen.name, key="locale", value="en_US")
 
         mock_get_locale.assert_called_once()
+
+    @patch.object(EventLoopBase, "ensure_window", lambda x: None)
+    @patch(
+        "src.app.screens.base_screen.BaseScreen.get_locale", return_value="en_US.UTF-8"
+    )
+    @patch("src.app.screens.select_version_screen.SelectVersionScreen.manager")
+    @patch("src.app.screens.base_screen.BaseScreen.run_in_background")
+    def test_fetch_memoized_releases(
+        self, mock_run_in_background, mock_manager, mock_get_locale
+    ):
+        mock_manager.get_screen = MagicMock()
+        with patch("src.utils.selector.release_catalog.Selector") as mock_selector:
+            mock_selector.return_value.releases = [
+                "v24.03.0",
+                "v23.08.1",
+                "odudex/krux_binaries",
+            ]
+            get_release_catalog().fetch()
+
+        screen = SelectVersionScreen()
+        screen.fetch_releases()
+        self.render(screen)
+
+        # rendered without waiting the network
+        mock_run_in_background.assert_not_called()
+        self.assertIn("select_version_screen_latest", screen.ids)
+        mock_manager.get_screen().fetch_releases.assert_called_once_with(
+            old_versions=["v23.08.1"]
+        )
+        mock_get_locale.assert_called_once()
+
+    @patch.object(EventLoopBase, "ensure_window", lambda x: None)
+    @patch(
+        "src.app.screens.base_screen.BaseScreen.get_locale", return_value="en_US.UTF-8"
+    )
+    @patch("src.app.screens.base_screen.BaseScreen.get_cachedir", return_value=None)
+    @patch("src.app.screens.base_screen.BaseScreen.run_in_background")
+    def test_fetch_releases_loading(
+        self, mock_run_in_background, mock_get_cachedir, mock_get_locale
+    ):
+        screen = SelectVersionScreen()
+        screen.fetch_releases()
+        self.render(screen)
+
+        self.assertIn("select_version_screen_loading", screen.ids)
+        self.assertIn("select_version_screen_back", screen.ids)
+        mock_run_in_background.assert_called_once()
+        self.assertEqual(
+            mock_run_in_background.call_args.kwargs["on_result"],
+            screen.on_fetch_releases,
+        )
+        mock_get_cachedir.assert_called_once()
+        mock_get_locale.assert_called_once()
+
+    @patch.object(EventLoopBase, "ensure_window", lambda x: None)
+    @patch(
+        "src.app.screens.base_screen.BaseScreen.get_locale", return_value="en_US.UTF-8"
+    )
+    @patch("src.app.screens.base_screen.BaseScreen.cancel_background")
+    def test_on_leave(self, mock_cancel_background, mock_get_locale):
+        screen = SelectVersionScreen()
+        screen.on_leave()
+
+        mock_cancel_background.assert_called_once()
+        mock_get_locale.assert_called_once()
@@ -1,5 +1,5 @@
 import os
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, PropertyMock
 from kivy.base import EventLoop, EventLoopBase
 from kivy.clock import Clock
 from kivy.tests.common import GraphicUnitTest
@@ -198,6 +198,49 @@ class TestBaseDownloadScreen(GraphicUnitTest):
         mock_create_trigger.assert_called()
         mock_thread.assert_called_once()
 
+    @patch.object(EventLoopBase, "ensure_window", lambda x: None)
+    @patch(
+        "src.app.screens.base_screen.BaseScreen.get_locale", return_value="en_US.UTF-8"
+    )
+    @patch(
+        "src.app.screens.base_download_screen.BaseDownloadScreen.trigger",
+        new_callable=PropertyMock,
+    )
+    @patch("src.app.screens.base_download_screen.Thread")
+    def test_on_enter_trigger_after_download(
+        self,
+        mock_thread,
+        mock_trigger,
+        mock_get_locale,
+    ):
+        screen = BaseDownloadScreen(wid="mock_screen", name="MockScreen")
+        self.render(screen)
+
+        # get your Window instance safely
+        EventLoop.ensure_window()
+
+        # do tests
+        setattr(BaseDownloadScreen, "on_trigger", MagicMock())
+        setattr(BaseDownloadScreen, "on_progress", MagicMock())
+        screen.downloader = MagicMock()
+
+        screen.on_enter()
+
+        # run the thread target synchronously
+        target = mock_thread.call_args.kwargs["target"]
+        on_trigger = getattr(BaseDownloadScreen, "on_trigger")
+        mock_trigger.assert_called_once_with(on_trigger)
+        screen.downloader.download.assert_not_called()
+        mock_trigger.return_value.assert_not_called()
+
+        target()
+
+        # patch tests
+        mock_get_locale.assert_any_call()
+        on_progress = getattr(BaseDownloadScreen, "on_progress")
+        screen.downloader.download.assert_called_once_with(on_data=on_progress)
+        mock_trigger.return_value.assert_called_once()
+
     @patch.object(EventLoopBase, "ensure_window", lambda x: None)
     @patch(
         "src.app.screens.base_screen.BaseScreen.get_locale", return_value="en_US.UTF-8"
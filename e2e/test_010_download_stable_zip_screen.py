@@ -44,7 +44,7 @@ class TestDownloadStableZipScreen(GraphicUnitTest):
         self.assertEqual(screen.thread, None)
         self.assertEqual(screen.trigger, None)
         self.assertEqual(screen.version, None)
-        self.assertEqual(screen.to_screen, "DownloadStableZipSha256Screen")
+        self.assertEqual(screen.to_screen, "VerifyStableZipScreen")
         self.assertEqual(grid.id, "download_stable_zip_screen_grid")
         self.assertEqual(grid.children[1].id, "download_stable_zip_screen_progress")
         self.assertEqual(grid.children[0].id, "download_stable_zip_screen_info")
@@ -103,7 +103,7 @@ class TestDownloadStableZipScreen(GraphicUnitTest):
         "src.app.screens.base_screen.BaseScreen.get_destdir_assets",
         return_value="mockdir",
     )
-    @patch("src.app.screens.download_stable_zip_screen.ZipDownloader")
+    @patch("src.app.screens.download_stable_zip_screen.ReleaseBundleDownloader")
     def test_update_version(
         self,
         mock_downloader,
@@ -214,13 +214,13 @@ class TestDownloadStableZipScreen(GraphicUnitTest):
 
             # patch assertions
             mock_get_locale.assert_any_call()
-            assert len(mock_trigger.mock_calls) >= 1
+            mock_trigger.assert_not_called()
 
     @patch.object(EventLoopBase, "ensure_window", lambda x: None)
     @patch(
         "src.app.screens.base_screen.BaseScreen.get_locale", return_value="en_US.UTF-8"
     )
-    @patch("src.app.screens.download_stable_zip_screen.ZipDownloader")
+    @patch("src.app.screens.download_stable_zip_screen.ReleaseBundleDownloader")
     @patch("src.app.screens.download_stable_zip_screen.partial")
     @patch("src.app.screens.download_stable_zip_screen.Clock.schedule_once")
     def test_on_progress(
@@ -265,25 +265,39 @@ class TestDownloadStableZipScreen(GraphicUnitTest):
     @patch(
         "src.app.screens.base_screen.BaseScreen.get_locale", return_value="en_US.UTF-8"
     )
-    @patch("src.app.screens.download_stable_zip_screen.time.sleep")
-    @patch("src.app.screens.download_stable_zip_screen.DownloadStableZipScreen.manager")
-    @patch("src.app.screens.download_stable_zip_screen.partial")
-    @patch("src.app.screens.download_stable_zip_screen.Clock.schedule_once")
+    def test_update_progress_unknown_content_len(self, mock_get_locale):
+        screen = DownloadStableZipScreen()
+        self.render(screen)
+
+        # get your Window instance safely
+        EventLoop.ensure_window()
+        text = screen.ids["download_stable_zip_screen_progress"].text
+
+        # do tests
+        with patch.object(screen, "downloader") as mock_downloader:
+            mock_downloader.destdir = "mockdir"
+            screen.update(
+                name="ConfigKruxInstaller",
+                key="progress",
+                value={"downloaded_len": 130, "content_len": 0},
+            )
+
+        self.assertEqual(screen.ids["download_stable_zip_screen_progress"].text, text)
+
+        # patch assertions
+        mock_get_locale.assert_any_call()
+
+    @patch.object(EventLoopBase, "ensure_window", lambda x: None)
+    @patch(
+        "src.app.screens.base_screen.BaseScreen.get_locale", return_value="en_US.UTF-8"
+    )
     @patch(
         "src.app.screens.download_stable_zip_screen.DownloadStableZipScreen.set_screen"
     )
-    def test_on_trigger(
-        self,
-        mock_set_screen,
-        mock_schedule_once,
-        mock_partial,
-        mock_manager,
-        mock_sleep,
-        mock_get_locale,
-    ):
-        # Mocks
-        mock_manager.get_screen = MagicMock()
-
+    @patch(
+        "src.app.screens.download_stable_zip_screen.DownloadStableZipScreen.record_assets"
+    )
+    def test_on_trigger(self, mock_record_assets, mock_set_screen, mock_get_locale):
         # screen
         screen = DownloadStableZipScreen()
         screen.version = "v0.0.1"
@@ -305,20 +319,31 @@ class TestDownloadStableZipScreen(GraphicUnitTest):
 
         # patch assertions
         mock_get_locale.assert_any_call()
-        mock_sleep.assert_called_once_with(2.1)
-        mock_manager.get_screen.assert_called_once_with("DownloadStableZipSha256Screen")
-        mock_partial.assert_has_calls(
-            [
-                call(screen.update, name=screen.name, key="canvas"),
-                call(
-                    mock_manager.get_screen().update,
-                    name=screen.name,
-                    key="version",
-                    value="v0.0.1",
-                ),
-            ]
-        )
-        mock_schedule_once.assert_called()
+        mock_record_assets.assert_called_once()
         mock_set_screen.assert_called_once_with(
-            name="DownloadStableZipSha256Screen", direction="left"
+            name="VerifyStableZipScreen", direction="left"
+        )
+
+    @patch.object(EventLoopBase, "ensure_window", lambda x: None)
+    @patch(
+        "src.app.screens.base_screen.BaseScreen.get_locale", return_value="en_US.UTF-8"
+    )
+    @patch("src.app.screens.base_screen.BaseScreen.get_asset_cache")
+    def test_record_assets(self, mock_get_asset_cache, mock_get_locale):
+        asset = MagicMock(destfile="mockdir/krux-v0.0.1.zip", url="mock", etag="etag")
+        screen = DownloadStableZipScreen()
+        self.render(screen)
+
+        # get your Window instance safely
+        EventLoop.ensure_window()
+
+        with patch.object(screen, "downloader") as mock_downloader:
+            mock_downloader.assets = (asset,)
+            screen.record_assets()
+
+        # patch assertions
+        mock_get_locale.assert_any_call()
+        mock_get_asset_cache.return_value.record.assert_called_once_with(
+            "mockdir/krux-v0.0.1.zip", "mock", etag="etag"
         )
+        mock_get_asset_cache.return_value.save.assert_called_once()
@@ -295,7 +295,7 @@ class TestDownloadBetaScreen(GraphicUnitTest):
 
             # patch assertions
             mock_get_locale.assert_any_call()
-            assert len(mock_trigger.mock_calls) >= 1
+            mock_trigger.assert_not_called()
 
     @patch.object(EventLoopBase, "ensure_window", lambda x: None)
     @patch(
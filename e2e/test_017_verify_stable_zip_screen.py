@@ -8,6 +8,12 @@ from src.app.screens.verify_stable_zip_screen import (
 )
 
 
+# pylint: disable=unused-argument
+def run_in_foreground(target, on_result, on_error=None):
+    """Replace `BaseScreen.run_in_background` to run jobs synchronously"""
+    on_result(target())
+
+
 class TestVerifyStableZipScreen(GraphicUnitTest):
 
     @classmethod
@@ -42,66 +48,83 @@ class TestVerifyStableZipScreen(GraphicUnitTest):
     @patch(
         "src.app.screens.base_screen.BaseScreen.get_locale", return_value="en_US.UTF-8"
     )
-    @patch("src.app.screens.verify_stable_zip_screen.Sha256Verifyer")
-    @patch("src.app.screens.verify_stable_zip_screen.Sha256CheckVerifyer")
-    def test_verify_sha256(
-        self,
-        mock_check_verifyer,
-        mock_verifyer,
-        mock_get_locale,
-    ):
-        screen = VerifyStableZipScreen()
-        self.render(screen)
-
-        # get your Window instance safely
-        EventLoop.ensure_window()
-
-        screen.verify_sha256(assets_dir="mockdir", version="v0.0.1")
-
-        # patch assertions
-        mock_get_locale.assert_called()
-        mock_verifyer.assert_called_once_with(filename="mockdir/krux-v0.0.1.zip")
-        mock_check_verifyer.assert_called_once_with(
-            filename="mockdir/krux-v0.0.1.zip.sha256.txt"
-        )
-
-    @patch.object(EventLoopBase, "ensure_window", lambda x: None)
-    @patch(
-        "src.app.screens.base_screen.BaseScreen.get_locale", return_value="en_US.UTF-8"
-    )
-    @patch("src.app.screens.verify_stable_zip_screen.SigVerifyer")
+    @patch("src.app.screens.verify_stable_zip_screen.ReleaseVerifyer")
     @patch("src.app.screens.verify_stable_zip_screen.PemCheckVerifyer")
     @patch("src.app.screens.verify_stable_zip_screen.SigCheckVerifyer")
-    def test_verify_signature(
+    @patch("src.app.screens.verify_stable_zip_screen.Sha256CheckVerifyer")
+    def test_load_release(
         self,
+        mock_sha256_check_verifyer,
         mock_sig_check_verifyer,
         mock_pem_check_verifyer,
-        mock_sig_verifyer,
+        mock_release_verifyer,
         mock_get_locale,
     ):
+        mock_sha256_check_verifyer.return_value.data = "00ff krux-v0.0.1.zip"
         screen = VerifyStableZipScreen()
         self.render(screen)
 
         # get your Window instance safely
         EventLoop.ensure_window()
 
-        screen.verify_signature(assets_dir="mockdir", version="v0.0.1")
+        release = screen.load_release(assets_dir="mockdir", version="v0.0.1")
 
         # patch assertions
         mock_get_locale.assert_called()
+        mock_sha256_check_verifyer.assert_called_once_with(
+            filename="mockdir/krux-v0.0.1.zip.sha256.txt"
+        )
         mock_sig_check_verifyer.assert_called_once_with(
             filename="mockdir/krux-v0.0.1.zip.sig"
         )
         mock_pem_check_verifyer.assert_called_once_with(
             filename="mockdir/selfcustody.pem"
         )
-        mock_sig_verifyer.assert_called_once_with(
+        mock_release_verifyer.assert_called_once_with(
             filename="mockdir/krux-v0.0.1.zip",
-            regexp=r"^.*\.zip$",
+            sha256sum="00ff",
             signature=mock_sig_check_verifyer().data,
             pubkey=mock_pem_check_verifyer().data,
         )
 
+        # the zip is read only once, for both checks
+        self.assertEqual(release, mock_release_verifyer())
+        mock_release_verifyer().load.assert_called_once_with(
+            on_data=screen.on_hash_progress
+        )
+
+    @patch.object(EventLoopBase, "ensure_window", lambda x: None)
+    @patch(
+        "src.app.screens.base_screen.BaseScreen.get_locale", return_value="en_US.UTF-8"
+    )
+    def test_verify_sha256(self, mock_get_locale):
+        release = MagicMock(data="00ff", sha256sum="00ff")
+        release.verify_sha256.return_value = True
+        screen = VerifyStableZipScreen()
+
+        verify = screen.verify_sha256(release=release)
+
+        # patch assertions
+        mock_get_locale.assert_called()
+        self.assertEqual(verify, ("00ff", "00ff", True))
+        release.verify_sha256.assert_called_once()
+
+    @patch.object(EventLoopBase, "ensure_window", lambda x: None)
+    @patch(
+        "src.app.screens.base_screen.BaseScreen.get_locale", return_value="en_US.UTF-8"
+    )
+    def test_verify_signature(self, mock_get_locale):
+        release = MagicMock()
+        release.verify_signature.return_value = True
+        screen = VerifyStableZipScreen()
+
+        verify = screen.verify_signature(release=release)
+
+        # patch assertions
+        mock_get_locale.assert_called()
+        self.assertTrue(verify)
+        release.verify_signature.assert_called_once()
+
     @patch.object(EventLoopBase, "ensure_window", lambda x: None)
     @patch(
         "src.app.screens.base_screen.BaseScreen.get_locale", return_value="en_US.UTF-8"
@@ -146,8 +169,17 @@ class TestVerifyStableZipScreen(GraphicUnitTest):
         "src.app.screens.verify_stable_zip_screen.VerifyStableZipScreen.build_message_verify_signature",
         return_value="mock",
     )
+    @patch(
+        "src.app.screens.base_screen.BaseScreen.run_in_background",
+        side_effect=run_in_foreground,
+    )
+    @patch(
+        "src.app.screens.verify_stable_zip_screen.VerifyStableZipScreen.load_release"
+    )
     def test_on_enter(
         self,
+        mock_load_release,
+        mock_run_in_background,
         mock_build_message_verify_signature,
         mock_build_message_verify_sha256,
         mock_get_destdir_assets,
@@ -168,12 +200,24 @@ class TestVerifyStableZipScreen(GraphicUnitTest):
         # patch assertions
         mock_get_locale.assert_called()
         mock_get_destdir_assets.assert_called()
-        mock_build_message_verify_sha256.assert_called_once_with(
+        mock_load_release.assert_called_once_with(
             assets_dir="mockdir", version=screen.manager.get_screen().version
         )
+        mock_build_message_verify_sha256.assert_called_once_with(
+            assets_dir="mockdir",
+            version=screen.manager.get_screen().version,
+            release=mock_load_release(),
+        )
         mock_build_message_verify_signature.assert_called_once_with(
-            assets_dir="mockdir", version=screen.manager.get_screen().version
+            assets_dir="mockdir",
+            version=screen.manager.get_screen().version,
+            release=mock_load_release(),
         )
+        mock_run_in_background.assert_called_once()
+
+        # run the verification scheduled by the last `on_enter` while
+        # still patched, so it won't leak into the next test
+        Clock.tick()
 
     def test_prettyfy_hash(self):
         _hash = "f254692f766dc6b009c8ca7f43b674d088062685bb203b850f8b702f641b5935"
@@ -222,7 +266,9 @@ class TestVerifyStableZipScreen(GraphicUnitTest):
             ]
         )
 
-        actual = screen.build_message_verify_sha256(assets_dir="mock", version="v0.0.1")
+        actual = screen.build_message_verify_sha256(
+            assets_dir="mock", version="v0.0.1", release=MagicMock()
+        )
         self.assertEqual(actual, expected)
         mock_get_locale.assert_any_call()
         mock_verify_sha256.assert_called_once()
@@ -263,7 +309,9 @@ class TestVerifyStableZipScreen(GraphicUnitTest):
             ]
         )
 
-        actual = screen.build_message_verify_sha256(assets_dir="mock", version="v0.0.1")
+        actual = screen.build_message_verify_sha256(
+            assets_dir="mock", version="v0.0.1", release=MagicMock()
+        )
         self.assertEqual(actual, expected)
         mock_get_locale.assert_any_call()
         mock_verify_sha256.assert_called_once()
@@ -314,7 +362,7 @@ class TestVerifyStableZipScreen(GraphicUnitTest):
         )
 
         actual = screen.build_message_verify_signature(
-            assets_dir="mock", version="v0.0.1"
+            assets_dir="mock", version="v0.0.1", release=MagicMock()
         )
 
         self.assertEqual(actual, expected)
@@ -368,7 +416,7 @@ class TestVerifyStableZipScreen(GraphicUnitTest):
         )
 
         actual = screen.build_message_verify_signature(
-            assets_dir="mock", version="v0.0.1"
+            assets_dir="mock", version="v0.0.1", release=MagicMock()
         )
 
         print(actual)
@@ -466,8 +514,21 @@ class TestVerifyStableZipScreen(GraphicUnitTest):
         "src.app.screens.verify_stable_zip_screen.VerifyStableZipScreen.verify_signature",
         return_value=True,
     )
+    @patch(
+        "src.app.screens.verify_stable_zip_screen.VerifyStableZipScreen.record_verified_assets"
+    )
+    @patch(
+        "src.app.screens.base_screen.BaseScreen.run_in_background",
+        side_effect=run_in_foreground,
+    )
+    @patch(
+        "src.app.screens.verify_stable_zip_screen.VerifyStableZipScreen.load_release"
+    )
     def test_on_press_back(
         self,
+        mock_load_release,
+        mock_run_in_background,
+        mock_record_verified_assets,
         mock_verify_signature,
         mock_verify_sha256,
         mock_set_screen,
@@ -494,5 +555,103 @@ class TestVerifyStableZipScreen(GraphicUnitTest):
         mock_get_locale.assert_called()
         mock_get_destdir_assets.assert_called()
         mock_set_screen.assert_called_once_with(name="MainScreen", direction="right")
-        mock_verify_sha256.assert_called()
-        mock_verify_signature.assert_called()
+        mock_load_release.assert_called_once_with(assets_dir="mock", version="v0.0.1")
+        mock_verify_sha256.assert_called_once_with(release=mock_load_release())
+        mock_verify_signature.assert_called_once_with(release=mock_load_release())
+        mock_record_verified_assets.assert_called_once_with(
+            assets_dir="mock", version="v0.0.1"
+        )
+        mock_run_in_background.assert_called_once()
+
+    @patch.object(EventLoopBase, "ensure_window", lambda x: None)
+    @patch(
+        "src.app.screens.base_screen.BaseScreen.get_locale", return_value="en_US.UTF-8"
+    )
+    @patch("src.app.screens.verify_stable_zip_screen.ReleaseBundleDownloader")
+    @patch("src.app.screens.base_screen.BaseScreen.get_asset_cache")
+    def test_record_verified_assets(
+        self, mock_get_asset_cache, mock_bundle, mock_get_locale
+    ):
+        zip_asset = MagicMock(destfile="mock/krux-v0.0.1.zip", url="mock.zip")
+        pem_asset = MagicMock(destfile="mock/selfcustody.pem", url="mock.pem")
+        mock_bundle.return_value.assets = (zip_asset, pem_asset)
+        mock_cache = mock_get_asset_cache.return_value
+        mock_cache.lookup.side_effect = [{"etag": '"abc"'}, None]
+
+        screen = VerifyStableZipScreen()
+        screen.sha256 = "00ff"
+        self.render(screen)
+
+        # get your Window instance safely
+        EventLoop.ensure_window()
+        screen.record_verified_assets(assets_dir="mock", version="v0.0.1")
+
+        # patch assertions
+        mock_get_locale.assert_called()
+        mock_bundle.assert_called_once_with(version="v0.0.1", destdir="mock")
+        mock_cache.record.assert_has_calls(
+            [
+                call(
+                    "mock/krux-v0.0.1.zip",
+                    "mock.zip",
+                    etag='"abc"',
+                    sha256="00ff",
+                    verified=True,
+                ),
+                call(
+                    "mock/selfcustody.pem",
+                    "mock.pem",
+                    etag=None,
+                    sha256=None,
+                    verified=True,
+                ),
+            ]
+        )
+        mock_cache.save.assert_called_once()
+
+    @patch.object(EventLoopBase, "ensure_window", lambda x: None)
+    @patch(
+        "src.app.screens.base_screen.BaseScreen.get_locale", return_value="en_US.UTF-8"
+    )
+    @patch("src.app.screens.verify_stable_zip_screen.partial")
+    @patch("src.app.screens.verify_stable_zip_screen.Clock.schedule_once")
+    def test_on_hash_progress(self, mock_schedule_once, mock_partial, mock_get_locale):
+        screen = VerifyStableZipScreen()
+        mock_partial.reset_mock()
+        mock_schedule_once.reset_mock()
+
+        screen.on_hash_progress(1024, 4096)
+        screen.on_hash_progress(1025, 4096)
+        screen.on_hash_progress(4096, 4096)
+
+        # only changes of percentage are scheduled
+        mock_partial.assert_has_calls(
+            [
+                call(screen.update, name=screen.name, key="progress", value=25),
+                call(screen.update, name=screen.name, key="progress", value=100),
+            ]
+        )
+        self.assertEqual(mock_schedule_once.call_count, 2)
+        self.assertEqual(screen.progress, 100)
+        mock_get_locale.assert_called()
+
+    @patch.object(EventLoopBase, "ensure_window", lambda x: None)
+    @patch(
+        "src.app.screens.base_screen.BaseScreen.get_locale", return_value="en_US.UTF-8"
+    )
+    def test_update_progress(self, mock_get_locale):
+        screen = VerifyStableZipScreen()
+        screen.on_pre_enter()
+        self.render(screen)
+
+        # get your Window instance safely
+        EventLoop.ensure_window()
+
+        screen.update(name=screen.name, key="progress", value=42)
+        text = screen.ids[f"{screen.id}_label"].text
+
+        self.assertEqual(
+            text,
+            "[color=#efcc00]Verifying integrity and authenticity[/color]\n\n42 %",
+        )
+        mock_get_locale.assert_called()
@@ -450,8 +450,9 @@ class TestConfigKruxInstaller(GraphicUnitTest):
         config.setdefaults.assert_has_calls(
             [
                 call("destdir", {"assets": "mockdir"}),
-                call("flash", {"baudrate": 1500000}),
+                call("flash", {"baudrate": 1500000, "adaptive": 0}),
                 call("locale", {"lang": "en_US.UTF-8"}),
+                call("baudrates", {}),
             ]
         )
 
@@ -484,8 +485,9 @@ class TestConfigKruxInstaller(GraphicUnitTest):
         config.setdefaults.assert_has_calls(
             [
                 call("destdir", {"assets": "mockdir"}),
-                call("flash", {"baudrate": 1500000}),
+                call("flash", {"baudrate": 1500000, "adaptive": 0}),
                 call("locale", {"lang": "en_US.UTF-8"}),
+                call("baudrates", {}),
             ]
         )
 
@@ -518,8 +520,9 @@ class TestConfigKruxInstaller(GraphicUnitTest):
         config.setdefaults.assert_has_calls(
             [
                 call("destdir", {"assets": "mockdir"}),
-                call("flash", {"baudrate": 1500000}),
+                call("flash", {"baudrate": 1500000, "adaptive": 0}),
                 call("locale", {"lang": "en_US"}),
+                call("baudrates", {}),
             ]
         )
 
@@ -552,8 +555,9 @@ class TestConfigKruxInstaller(GraphicUnitTest):
         config.setdefaults.assert_has_calls(
             [
                 call("destdir", {"assets": "mockdir"}),
-                call("flash", {"baudrate": 1500000}),
+                call("flash", {"baudrate": 1500000, "adaptive": 0}),
                 call("locale", {"lang": "en_US"}),
+                call("baudrates", {}),
             ]
         )
 
@@ -579,6 +583,13 @@ class TestConfigKruxInstaller(GraphicUnitTest):
                 "section": "flash",
                 "key": "baudrate",
             },
+            {
+                "type": "bool",
+                "title": "Adaptive baudrate",
+                "desc": "Start from the fastest (or last good) baudrate and step down on failures",
+                "section": "flash",
+                "key": "adaptive",
+            },
             {
                 "type": "options",
                 "title": "Locale",
@@ -36,6 +36,31 @@ class TestConfigKruxInstaller(GraphicUnitTest):
         self.assertEqual(len(app.screens), 0)
         self.assertIsInstance(app.screen_manager, ScreenManager)
 
+    def test_screen_module(self):
+        self.assertEqual(
+            KruxInstallerApp.screen_module("DownloadStableZipSha256Screen"),
+            "src.app.screens.download_stable_zip_sha256_screen",
+        )
+
+    @patch.object(EventLoopBase, "ensure_window", lambda x: None)
+    @patch("sys.platform", "win32")
+    @patch(
+        "src.app.screens.base_screen.BaseScreen.get_locale", return_value="en_US.UTF-8"
+    )
+    @patch("src.app.lazy_screen_manager.LazyScreenManager.prewarm")
+    def test_build_lazy(self, mock_prewarm, mock_get_locale):
+        app = KruxInstallerApp()
+        app.build()
+
+        self.assertEqual(
+            [screen.name for screen in app.screen_manager.screens],
+            ["GreetingsScreen"],
+        )
+        self.assertEqual(len(app.screen_manager.registered_names), 22)
+        self.assertEqual(app.screen_manager.current, "GreetingsScreen")
+        mock_prewarm.assert_called_once_with(KruxInstallerApp.PREWARM_SCREENS)
+        mock_get_locale.assert_called()
+
     @mark.skipif(
         sys.platform in ("win32"),
         reason="does not run on windows",
@@ -320,6 +320,50 @@ class TestFlashScreen(GraphicUnitTest):
         mock_get_locale.assert_called()
         mock_done.assert_called_once()
 
+    @patch.object(EventLoopBase, "ensure_window", lambda x: None)
+    @patch(
+        "src.app.screens.base_screen.BaseScreen.get_locale", return_value="en_US.UTF-8"
+    )
+    @patch("src.app.screens.flash_screen.FlashScreen.done")
+    def test_on_print_callback_rebooting_with_metrics(self, mock_done, mock_get_locale):
+        screen = FlashScreen()
+        screen.output = []
+        screen.metrics = MagicMock()
+        screen.metrics.finish.return_value = {
+            "rate": 76800.0,
+            "efficiency": 0.5,
+            "baudrate": 1500000,
+        }
+        metrics = screen.metrics
+        screen.on_pre_enter()
+        self.render(screen)
+
+        # get your Window instance safely
+        EventLoop.ensure_window()
+
+        on_print_callback = getattr(FlashScreen, "on_data")
+        on_print_callback("[color=#00ff00] INFO [/color] Rebooting...\n")
+
+        self.assertEqual(
+            screen.output,
+            [
+                "[color=#00ff00] INFO [/color] Rebooting...\n",
+                "[color=#efcc00]75.00 KiB/s[/color] (50% of 1500000 bauds)",
+            ],
+        )
+        self.assertIsNone(screen.metrics)
+        metrics.on_data.assert_called_once_with(
+            "[color=#00ff00] INFO [/color] Rebooting...\n"
+        )
+        metrics.finish.assert_called_once_with(
+            ok=True, board=screen.flasher.board, port=screen.flasher.port
+        )
+        metrics.save.assert_called_once_with(metrics.finish.return_value)
+
+        # patch assertions
+        mock_get_locale.assert_called()
+        mock_done.assert_called_once()
+
     @patch.object(EventLoopBase, "ensure_window", lambda x: None)
     @patch(
         "src.app.screens.base_screen.BaseScreen.get_locale", return_value="en_US.UTF-8"
@@ -386,6 +430,11 @@ class TestFlashScreen(GraphicUnitTest):
         # patch assertions
         mock_get_locale.assert_any_call()
 
+    @patch(
+        "src.app.screens.base_screen.BaseScreen.get_baudrate_memory", return_value=None
+    )
+    @patch("src.app.screens.base_screen.BaseScreen.get_cachedir", return_value="mock")
+    @patch("src.app.screens.flash_screen.FlashMetrics")
     @patch.object(EventLoopBase, "ensure_window", lambda x: None)
     @patch(
         "src.app.screens.base_screen.BaseScreen.get_locale", return_value="en_US.UTF-8"
@@ -393,10 +442,22 @@ class TestFlashScreen(GraphicUnitTest):
     @patch("src.app.screens.flash_screen.partial")
     @patch("src.app.screens.flash_screen.threading.Thread")
     @patch("src.utils.flasher.Flasher")
-    def test_on_enter(self, mock_flasher, mock_thread, mock_partial, mock_get_locale):
+    @patch("src.app.screens.base_screen.BaseScreen.forget_flashed")
+    def test_on_enter(
+        self,
+        mock_forget_flashed,
+        mock_flasher,
+        mock_thread,
+        mock_partial,
+        mock_get_locale,
+        mock_flash_metrics,
+        mock_get_cachedir,
+        mock_get_baudrate_memory,
+    ):
         mock_flasher.__class__.print_callback = MagicMock()
 
         screen = FlashScreen()
+        screen.manager = MagicMock()
         screen.flasher = MagicMock()
         screen.flasher.ktool = MagicMock()
         screen.flasher.flash = MagicMock()
@@ -411,6 +472,7 @@ class TestFlashScreen(GraphicUnitTest):
         # prepare assertions
         on_process = getattr(FlashScreen, "on_process")
 
+        mock_get_baudrate_memory.assert_called_once()
         # patch assertions
         mock_get_locale.assert_called()
         mock_partial.assert_has_calls(
@@ -421,7 +483,21 @@ class TestFlashScreen(GraphicUnitTest):
             any_order=True,
         )
         mock_thread.assert_called_once_with(name=screen.name, target=mock_partial())
+        mock_get_cachedir.assert_called_once()
+        mock_flash_metrics.assert_called_once_with(
+            baudrate=screen.flasher.baudrate,
+            firmware=screen.flasher.firmware,
+            cachedir="mock",
+        )
+        mock_forget_flashed.assert_called_once_with(
+            screen.manager.get_screen("MainScreen").device
+        )
 
+    @patch(
+        "src.app.screens.base_screen.BaseScreen.get_baudrate_memory", return_value=None
+    )
+    @patch("src.app.screens.base_screen.BaseScreen.get_cachedir", return_value="mock")
+    @patch("src.app.screens.flash_screen.FlashMetrics")
     @patch.object(EventLoopBase, "ensure_window", lambda x: None)
     @patch(
         "src.app.screens.base_screen.BaseScreen.get_locale", return_value="en_US.UTF-8"
@@ -430,17 +506,23 @@ class TestFlashScreen(GraphicUnitTest):
     @patch("src.app.screens.flash_screen.threading.Thread")
     @patch("src.utils.flasher.Flasher")
     @patch("src.app.screens.base_screen.BaseScreen.redirect_exception")
+    @patch("src.app.screens.base_screen.BaseScreen.forget_flashed")
     def test_on_enter_fail_stopiteration(
         self,
+        mock_forget_flashed,
         mock_redirect_exception,
         mock_flasher,
         mock_thread,
         mock_partial,
         mock_get_locale,
+        mock_flash_metrics,
+        mock_get_cachedir,
+        mock_get_baudrate_memory,
     ):
         mock_flasher.__class__.print_callback = MagicMock()
 
         screen = FlashScreen()
+        screen.manager = MagicMock()
         screen.flasher = MagicMock()
         screen.flasher.ktool = MagicMock()
         screen.flasher.flash = MagicMock()
@@ -472,12 +554,21 @@ class TestFlashScreen(GraphicUnitTest):
             )
             threading.excepthook(exc_args)
 
+        mock_flash_metrics.return_value.finish.assert_called_once()
+        mock_get_cachedir.assert_called_once()
+        mock_get_baudrate_memory.assert_called_once()
         # patch assertions
         mock_get_locale.assert_called()
         mock_partial.assert_called()
         mock_thread.assert_called_once_with(name=screen.name, target=mock_partial())
         mock_redirect_exception.assert_called()
+        mock_forget_flashed.assert_called_once()
 
+    @patch(
+        "src.app.screens.base_screen.BaseScreen.get_baudrate_memory", return_value=None
+    )
+    @patch("src.app.screens.base_screen.BaseScreen.get_cachedir", return_value="mock")
+    @patch("src.app.screens.flash_screen.FlashMetrics")
     @patch.object(EventLoopBase, "ensure_window", lambda x: None)
     @patch(
         "src.app.screens.base_screen.BaseScreen.get_locale", return_value="en_US.UTF-8"
@@ -486,17 +577,23 @@ class TestFlashScreen(GraphicUnitTest):
     @patch("src.app.screens.flash_screen.threading.Thread")
     @patch("src.utils.flasher.Flasher")
     @patch("src.app.screens.base_screen.BaseScreen.redirect_exception")
+    @patch("src.app.screens.base_screen.BaseScreen.forget_flashed")
     def test_on_enter_fail_cancel(
         self,
+        mock_forget_flashed,
         mock_redirect_exception,
         mock_flasher,
         mock_thread,
         mock_partial,
         mock_get_locale,
+        mock_flash_metrics,
+        mock_get_cachedir,
+        mock_get_baudrate_memory,
     ):
         mock_flasher.__class__.print_callback = MagicMock()
 
         screen = FlashScreen()
+        screen.manager = MagicMock()
         screen.flasher = MagicMock()
         screen.flasher.ktool = MagicMock()
         screen.flasher.flash = MagicMock()
@@ -523,12 +620,21 @@ class TestFlashScreen(GraphicUnitTest):
             )
             threading.excepthook(exc_args)
 
+        mock_flash_metrics.return_value.finish.assert_called_once()
+        mock_get_cachedir.assert_called_once()
+        mock_get_baudrate_memory.assert_called_once()
         # patch assertions
         mock_get_locale.assert_called()
         mock_partial.assert_called()
         mock_thread.assert_called_once_with(name=screen.name, target=mock_partial())
         mock_redirect_exception.assert_called()
+        mock_forget_flashed.assert_called_once()
 
+    @patch(
+        "src.app.screens.base_screen.BaseScreen.get_baudrate_memory", return_value=None
+    )
+    @patch("src.app.screens.base_screen.BaseScreen.get_cachedir", return_value="mock")
+    @patch("src.app.screens.flash_screen.FlashMetrics")
     @patch.object(EventLoopBase, "ensure_window", lambda x: None)
     @patch(
         "src.app.screens.base_screen.BaseScreen.get_locale", return_value="en_US.UTF-8"
@@ -537,17 +643,23 @@ class TestFlashScreen(GraphicUnitTest):
     @patch("src.app.screens.flash_screen.threading.Thread")
     @patch("src.utils.flasher.Flasher")
     @patch("src.app.screens.base_screen.BaseScreen.redirect_exception")
+    @patch("src.app.screens.base_screen.BaseScreen.forget_flashed")
     def test_on_enter_fail_unknow(
         self,
+        mock_forget_flashed,
         mock_redirect_exception,
         mock_flasher,
         mock_thread,
         mock_partial,
         mock_get_locale,
+        mock_flash_metrics,
+        mock_get_cachedir,
+        mock_get_baudrate_memory,
     ):
         mock_flasher.__class__.print_callback = MagicMock()
 
         screen = FlashScreen()
+        screen.manager = MagicMock()
         screen.flasher = MagicMock()
         screen.flasher.ktool = MagicMock()
         screen.flasher.flash = MagicMock()
@@ -574,11 +686,131 @@ class TestFlashScreen(GraphicUnitTest):
             )
             threading.excepthook(exc_args)
 
+        mock_get_cachedir.assert_called_once()
+        mock_get_baudrate_memory.assert_called_once()
         # patch assertions
+        mock_flash_metrics.return_value.finish.assert_called_once()
+        self.assertFalse(mock_flash_metrics.return_value.finish.call_args.kwargs["ok"])
+        mock_flash_metrics.return_value.save.assert_called_once_with(
+            mock_flash_metrics.return_value.finish.return_value
+        )
         mock_get_locale.assert_called()
         mock_partial.assert_called()
         mock_thread.assert_called_once_with(name=screen.name, target=mock_partial())
         mock_redirect_exception.assert_called()
+        mock_forget_flashed.assert_called_once()
+
+    @patch(
+        "src.app.screens.base_screen.BaseScreen.get_baudrate_memory",
+        return_value={"amigo@/mock/path0": 921600},
+    )
+    @patch("src.app.screens.base_screen.BaseScreen.get_cachedir", return_value="mock")
+    @patch("src.app.screens.flash_screen.FlashMetrics")
+    @patch.object(EventLoopBase, "ensure_window", lambda x: None)
+    @patch(
+        "src.app.screens.base_screen.BaseScreen.get_locale", return_value="en_US.UTF-8"
+    )
+    @patch("src.app.screens.flash_screen.partial")
+    @patch("src.app.screens.flash_screen.threading.Thread")
+    @patch("src.app.screens.base_screen.BaseScreen.forget_flashed")
+    def test_on_enter_adaptive(
+        self,
+        mock_forget_flashed,
+        mock_thread,
+        mock_partial,
+        mock_get_locale,
+        mock_flash_metrics,
+        mock_get_cachedir,
+        mock_get_baudrate_memory,
+    ):
+        screen = FlashScreen()
+        screen.manager = MagicMock()
+        screen.flasher = MagicMock()
+
+        screen.on_pre_enter()
+        screen.on_enter()
+
+        # patch assertions
+        mock_get_locale.assert_called()
+        mock_get_cachedir.assert_called_once()
+        mock_get_baudrate_memory.assert_called_once()
+        mock_flash_metrics.assert_called_once()
+        mock_partial.assert_has_calls(
+            [
+                call(
+                    screen.flash_adaptive,
+                    memory={"amigo@/mock/path0": 921600},
+                    cachedir="mock",
+                ),
+            ],
+            any_order=True,
+        )
+        mock_thread.assert_called_once_with(name=screen.name, target=mock_partial())
+        mock_forget_flashed.assert_called_once()
+
+    @patch.object(EventLoopBase, "ensure_window", lambda x: None)
+    @patch(
+        "src.app.screens.base_screen.BaseScreen.get_locale", return_value="en_US.UTF-8"
+    )
+    @patch("src.app.screens.flash_screen.FlashMetrics")
+    @patch("src.app.screens.flash_screen.Clock.schedule_once")
+    @patch("src.app.screens.base_screen.BaseScreen.remember_baudrate")
+    def test_flash_adaptive(
+        self,
+        mock_remember_baudrate,
+        mock_schedule_once,
+        mock_flash_metrics,
+        mock_get_locale,
+    ):
+        screen = FlashScreen()
+        screen.output = []
+        screen.flasher = MagicMock()
+        screen.flasher.baudrate_key = "amigo@/mock/path0"
+        first = MagicMock(stages={"greeting": 1.0})
+        screen.metrics = first
+        screen.fail_msg = "Greeting fail: mock"
+        screen.build_on_process()
+
+        # pylint: disable=unused-argument
+        def flash_adaptive(callback, memory, on_attempt):
+            on_attempt(1500000)
+            on_attempt(921600)
+            return 921600
+
+        screen.flasher.flash_adaptive.side_effect = flash_adaptive
+        screen.flash_adaptive(memory={}, cachedir="mock")
+
+        # the failed attempt is saved before the retry
+        first.finish.assert_called_once_with(
+            ok=False,
+            board=screen.flasher.board,
+            port=screen.flasher.port,
+            error="Greeting fail: mock",
+        )
+        mock_flash_metrics.assert_has_calls(
+            [
+                call(
+                    baudrate=1500000, firmware=screen.flasher.firmware, cachedir="mock"
+                ),
+                call(
+                    baudrate=921600, firmware=screen.flasher.firmware, cachedir="mock"
+                ),
+            ],
+            any_order=True,
+        )
+        self.assertEqual(
+            screen.output,
+            [
+                "[color=#efcc00]INFO[/color] Trying 1500000 bauds",
+                "[color=#efcc00]INFO[/color] Trying 921600 bauds",
+            ],
+        )
+
+        # the working baudrate is remembered in main thread
+        remember = mock_schedule_once.call_args.args[0]
+        remember(0)
+        mock_remember_baudrate.assert_called_once_with("amigo@/mock/path0", 921600)
+        mock_get_locale.assert_called()
 
     @patch.object(EventLoopBase, "ensure_window", lambda x: None)
     @patch(
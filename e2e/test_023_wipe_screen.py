@@ -243,7 +243,15 @@ class TestWipeScreen(GraphicUnitTest):
     @patch("src.app.screens.wipe_screen.partial")
     @patch("src.app.screens.wipe_screen.threading.Thread")
     @patch("src.utils.flasher.Flasher")
-    def test_on_enter(self, mock_flasher, mock_thread, mock_partial, mock_get_locale):
+    @patch("src.app.screens.base_screen.BaseScreen.forget_flashed")
+    def test_on_enter(
+        self,
+        mock_forget_flashed,
+        mock_flasher,
+        mock_thread,
+        mock_partial,
+        mock_get_locale,
+    ):
         mock_flasher.__class__.print_callback = MagicMock()
 
         screen = WipeScreen()
@@ -270,6 +278,7 @@ class TestWipeScreen(GraphicUnitTest):
             any_order=True,
         )
         mock_thread.assert_called_once_with(name=screen.name, target=mock_partial())
+        mock_forget_flashed.assert_called_once_with("amigo")
 
     @patch(
         "src.app.screens.base_screen.BaseScreen.get_locale", return_value="en_US.UTF-8"
@@ -278,8 +287,10 @@ class TestWipeScreen(GraphicUnitTest):
     @patch("src.app.screens.wipe_screen.threading.Thread")
     @patch("src.utils.flasher.Flasher")
     @patch("src.app.screens.base_screen.BaseScreen.redirect_exception")
+    @patch("src.app.screens.base_screen.BaseScreen.forget_flashed")
     def test_on_enter_fail_stopiteration(
         self,
+        mock_forget_flashed,
         mock_redirect_exception,
         mock_flasher,
         mock_thread,
@@ -326,6 +337,7 @@ class TestWipeScreen(GraphicUnitTest):
         mock_partial.assert_called()
         mock_thread.assert_called_once_with(name=screen.name, target=mock_partial())
         mock_redirect_exception.assert_called()
+        mock_forget_flashed.assert_called_once()
 
     @patch(
         "src.app.screens.base_screen.BaseScreen.get_locale", return_value="en_US.UTF-8"
@@ -334,8 +346,10 @@ class TestWipeScreen(GraphicUnitTest):
     @patch("src.app.screens.wipe_screen.threading.Thread")
     @patch("src.utils.flasher.Flasher")
     @patch("src.app.screens.base_screen.BaseScreen.redirect_exception")
+    @patch("src.app.screens.base_screen.BaseScreen.forget_flashed")
     def test_on_enter_fail_cancel(
         self,
+        mock_forget_flashed,
         mock_redirect_exception,
         mock_flasher,
         mock_thread,
@@ -382,6 +396,7 @@ class TestWipeScreen(GraphicUnitTest):
         mock_partial.assert_called()
         mock_thread.assert_called_once_with(name=screen.name, target=mock_partial())
         mock_redirect_exception.assert_called()
+        mock_forget_flashed.assert_called_once()
 
     @patch(
         "src.app.screens.base_screen.BaseScreen.get_locale", return_value="en_US.UTF-8"
@@ -390,8 +405,10 @@ class TestWipeScreen(GraphicUnitTest):
     @patch("src.app.screens.wipe_screen.threading.Thread")
     @patch("src.utils.flasher.Flasher")
     @patch("src.app.screens.base_screen.BaseScreen.redirect_exception")
+    @patch("src.app.screens.base_screen.BaseScreen.forget_flashed")
     def test_on_enter_fail_unknow(
         self,
+        mock_forget_flashed,
         mock_redirect_exception,
         mock_flasher,
         mock_thread,
@@ -438,6 +455,7 @@ class TestWipeScreen(GraphicUnitTest):
         mock_partial.assert_called()
         mock_thread.assert_called_once_with(name=screen.name, target=mock_partial())
         mock_redirect_exception.assert_called()
+        mock_forget_flashed.assert_called_once()
 
     @patch(
         "src.app.screens.base_screen.BaseScreen.get_locale", return_value="en_US.UTF-8"
@@ -147,8 +147,10 @@ class TestAirgapUpdateScreen(GraphicUnitTest):
         new_callable=mock_open,
         read_data=MOCK_SIG,
     )
+    @patch("src.app.screens.base_screen.BaseScreen.forget_flashed")
     def test_on_release_button(
         self,
+        mock_forget_flashed,
         open_mock,
         mock_exists,
         mock_copyfile,
@@ -177,5 +179,8 @@ class TestAirgapUpdateScreen(GraphicUnitTest):
             name="WarningAfterAirgapUpdateScreen", direction="left"
         )
         mock_copyfile.assert_called()
+        mock_forget_flashed.assert_called_once_with(
+            screen.manager.get_screen("MainScreen").device
+        )
         mock_exists.assert_called()
         open_mock.assert_called()
@@ -0,0 +1,107 @@
+from unittest.mock import patch, MagicMock
+from kivy.base import EventLoop
+from kivy.clock import Clock
+from kivy.tests.common import GraphicUnitTest
+from kivy.uix.screenmanager import Screen, ScreenManagerException
+from src.app.config_krux_installer import ConfigKruxInstaller
+from src.app.lazy_screen_manager import LazyScreenManager
+
+
+def make_factory(name: str):
+    return MagicMock(side_effect=lambda: Screen(name=name))
+
+
+class TestLazyScreenManager(GraphicUnitTest):
+
+    @classmethod
+    def teardown_class(cls):
+        EventLoop.exit()
+
+    def make_manager(self):
+        manager = LazyScreenManager()
+        factories = {name: make_factory(name) for name in ("A", "B", "C")}
+        for name, factory in factories.items():
+            manager.register(name, factory)
+        return manager, factories
+
+    def test_register(self):
+        manager, factories = self.make_manager()
+
+        self.assertEqual(manager.registered_names, ["A", "B", "C"])
+        self.assertEqual(manager.screens, [])
+        self.assertTrue(manager.has_screen("C"))
+        self.assertFalse(manager.is_built("C"))
+        for factory in factories.values():
+            factory.assert_not_called()
+
+    @patch("src.app.lazy_screen_manager.importlib.import_module")
+    def test_register_module(self, mock_import_module):
+        mock_import_module.return_value.D = make_factory("D")
+        manager, _ = self.make_manager()
+
+        manager.register_module("D", "mock.screens.d_screen")
+        mock_import_module.assert_not_called()
+
+        screen = manager.get_screen("D")
+        self.assertEqual(screen.name, "D")
+        mock_import_module.assert_called_once_with("mock.screens.d_screen")
+
+    def test_get_screen_build_once(self):
+        manager, factories = self.make_manager()
+
+        screen = manager.get_screen("B")
+        self.assertIs(manager.get_screen("B"), screen)
+        self.assertTrue(manager.is_built("B"))
+        factories["B"].assert_called_once()
+        factories["A"].assert_not_called()
+
+        # the first screen added is the current one
+        self.assertEqual(manager.current, "B")
+
+    def test_set_current_build(self):
+        manager, factories = self.make_manager()
+        manager.get_screen("A")
+
+        manager.current = "C"
+
+        self.assertEqual(manager.current_screen.name, "C")
+        factories["C"].assert_called_once()
+        factories["B"].assert_not_called()
+
+    def test_fail_get_screen_not_registered(self):
+        manager, _ = self.make_manager()
+
+        with self.assertRaises(ScreenManagerException):
+            manager.get_screen("D")
+
+    def test_prewarm(self):
+        manager, factories = self.make_manager()
+        manager.get_screen("A")
+
+        manager.prewarm(["A", "B", "C"])
+
+        # one screen per frame
+        Clock.tick()
+        self.assertTrue(manager.is_built("B"))
+        self.assertFalse(manager.is_built("C"))
+
+        Clock.tick()
+        self.assertTrue(manager.is_built("C"))
+        factories["A"].assert_called_once()
+
+    @patch("sys.platform", "linux")
+    @patch("src.app.config_krux_installer.partial")
+    def test_on_config_change_skip_not_built(self, mock_partial):
+        app = ConfigKruxInstaller()
+        app.screen_manager = MagicMock()
+        app.screen_manager.is_built.side_effect = lambda name: name == "FlashScreen"
+
+        app.on_config_change(None, "locale", key="lang", value="mock")
+
+        app.screen_manager.get_screen.assert_called_once_with("FlashScreen")
+        mock_partial.assert_called_once_with(
+            app.screen_manager.get_screen().update,
+            name="ConfigKruxInstaller",
+            key="locale",
+            value="mock",
+        )
@@ -22,8 +22,36 @@
 krux_installer.py
 """
 
+import sys
+
+
+def pop_profile_flag(argv: list) -> str | None:
+    """
+    Take `--profile` (or `--profile=<trace.json>`) out of argv, since kivy
+    parses the remaining arguments as its own; return the trace file, if any
+    """
+    for arg in list(argv[1:]):
+        if arg == "--profile":
+            argv.remove(arg)
+            return "krux-installer-trace.json"
+
+        if arg.startswith("--profile="):
+            argv.remove(arg)
+            return arg.split("=", 1)[1]
+
+    return None
+
+
 if __name__ == "__main__":
-    from src.app import KruxInstallerApp
+    from src.utils.profiler import get_profiler
+
+    profiler = get_profiler()
+    trace = pop_profile_flag(sys.argv)
+    if trace is not None:
+        profiler.filename = trace
+
+    with profiler.span("import src.app"):
+        from src.app import KruxInstallerApp
 
     app = KruxInstallerApp()
     app.run()
@@ -21,45 +21,24 @@
 """
 __init__.py
 """
+import re
 import sys
 from kivy.core.window import Window
+from src.utils.profiler import get_profiler
 from src.app.config_krux_installer import ConfigKruxInstaller
-from src.app.screens.about_screen import AboutScreen
-from src.app.screens.ask_permission_dialout_screen import AskPermissionDialoutScreen
-from src.app.screens.download_beta_screen import DownloadBetaScreen
-from src.app.screens.download_selfcustody_pem_screen import DownloadSelfcustodyPemScreen
-from src.app.screens.download_stable_zip_screen import DownloadStableZipScreen
-from src.app.screens.download_stable_zip_sha256_screen import (
-    DownloadStableZipSha256Screen,
-)
-from src.app.screens.download_stable_zip_sig_screen import DownloadStableZipSigScreen
-from src.app.screens.error_screen import ErrorScreen
-from src.app.screens.flash_screen import FlashScreen
-from src.app.screens.greetings_screen import GreetingsScreen
-from src.app.screens.main_screen import MainScreen
-from src.app.screens.select_device_screen import SelectDeviceScreen
-from src.app.screens.select_old_version_screen import SelectOldVersionScreen
-from src.app.screens.select_version_screen import SelectVersionScreen
-from src.app.screens.unzip_stable_screen import UnzipStableScreen
-from src.app.screens.verify_stable_zip_screen import VerifyStableZipScreen
-from src.app.screens.warning_already_downloaded_screen import (
-    WarningAlreadyDownloadedScreen,
-)
-from src.app.screens.warning_beta_screen import WarningBetaScreen
-from src.app.screens.warning_wipe_screen import WarningWipeScreen
-from src.app.screens.wipe_screen import WipeScreen
-from src.app.screens.airgap_update_screen import AirgapUpdateScreen
-from src.app.screens.warning_before_airgap_update_screen import (
-    WarningBeforeAirgapUpdateScreen,
-)
-from src.app.screens.warning_after_airgap_update_screen import (
-    WarningAfterAirgapUpdateScreen,
-)
 
 
 class KruxInstallerApp(ConfigKruxInstaller):
     """KruxInstallerApp is the Root widget"""
 
+    # screens visited by most sessions, right after the greetings
+    PREWARM_SCREENS = [
+        "MainScreen",
+        "SelectDeviceScreen",
+        "SelectVersionScreen",
+        "ErrorScreen",
+    ]
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         # Window.maximize()
@@ -68,41 +47,57 @@ class KruxInstallerApp(ConfigKruxInstaller):
         self.debug(f"Window.size={Window.size}")
         Window.clearcolor = (0.9, 0.9, 0.9, 1)
 
+    @staticmethod
+    def screen_module(name: str) -> str:
+        """Module of a screen class, e.g. `src.app.screens.main_screen` for `MainScreen`"""
+        return "src.app.screens." + re.sub(r"(?<!^)(?=[A-Z])", "_", name).lower()
+
     def build(self):
-        """Create the Root widget with an ScreenManager as manager for its sub-widgets"""
-        screens = []
-        screens.append(GreetingsScreen())
+        """
+        Create the Root widget with an ScreenManager as manager for its sub-widgets.
+
+        Screens are only registered here, and their modules imported and built
+        the first time they are needed, except the :class:`GreetingsScreen` (the
+        first one to be shown); the screens that usually follow it are built in
+        the next frames
+        """
+        screens = ["GreetingsScreen"]
 
         if sys.platform == "linux":
-            screens.append(AskPermissionDialoutScreen())
+            screens.append("AskPermissionDialoutScreen")
 
         screens = screens + [
-            MainScreen(),
-            SelectDeviceScreen(),
-            SelectVersionScreen(),
-            SelectOldVersionScreen(),
-            WarningBetaScreen(),
-            AboutScreen(),
-            DownloadStableZipScreen(),
-            DownloadStableZipSha256Screen(),
-            DownloadStableZipSigScreen(),
-            DownloadSelfcustodyPemScreen(),
-            VerifyStableZipScreen(),
-            UnzipStableScreen(),
-            DownloadBetaScreen(),
-            WarningAlreadyDownloadedScreen(),
-            WarningWipeScreen(),
-            FlashScreen(),
-            WarningBeforeAirgapUpdateScreen(),
-            WarningAfterAirgapUpdateScreen(),
-            AirgapUpdateScreen(),
-            WipeScreen(),
-            ErrorScreen(),
+            "MainScreen",
+            "SelectDeviceScreen",
+            "SelectVersionScreen",
+            "SelectOldVersionScreen",
+            "WarningBetaScreen",
+            "AboutScreen",
+            "DownloadStableZipScreen",
+            "DownloadStableZipSha256Screen",
+            "DownloadStableZipSigScreen",
+            "DownloadSelfcustodyPemScreen",
+            "VerifyStableZipScreen",
+            "UnzipStableScreen",
+            "DownloadBetaScreen",
+            "WarningAlreadyDownloadedScreen",
+            "WarningWipeScreen",
+            "FlashScreen",
+            "WarningBeforeAirgapUpdateScreen",
+            "WarningAfterAirgapUpdateScreen",
+            "AirgapUpdateScreen",
+            "WipeScreen",
+            "ErrorScreen",
         ]
 
-        for screen in screens:
-            msg = f"adding screen '{screen.name}'"
-            self.debug(msg)
-            self.screen_manager.add_widget(screen)
+        with get_profiler().span("KruxInstallerApp.build"):
+            for screen in screens:
+                self.debug("registering screen '%s'", screen)
+                self.screen_manager.register_module(
+                    screen, KruxInstallerApp.screen_module(screen)
+                )
+
+            self.screen_manager.get_screen("GreetingsScreen")
 
+        self.screen_manager.prewarm(KruxInstallerApp.PREWARM_SCREENS)
         return self.screen_manager
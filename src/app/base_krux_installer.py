@@ -28,6 +28,7 @@ from kivy.logger import Logger, LOG_LEVELS
 from kivy.app import App
 from kivy.uix.screenmanager import Screen, ScreenManager
 from ..utils.trigger import Trigger
+from .lazy_screen_manager import LazyScreenManager
 
 DEFAULT_DESTDIR = tempfile.mkdtemp()
 DEFAULT_BAUDRATE = 1500000
@@ -40,7 +41,7 @@ class BaseKruxInstaller(App, Trigger):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self._screens = []
-        self._screen_manager = ScreenManager()
+        self._screen_manager = LazyScreenManager()
 
         if "LOGLEVEL" in os.environ:
             Logger.setLevel(LOG_LEVELS[os.environ["LOGLEVEL"]])
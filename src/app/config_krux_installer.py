@@ -154,7 +154,7 @@ class ConfigKruxInstaller(BaseKruxInstaller, Trigger):
         self.debug(f"{config}.destdir={_dir}")
 
         baudrate = 1500000
-        config.setdefaults("flash", {"baudrate": baudrate})
+        config.setdefaults("flash", {"baudrate": baudrate, "adaptive": 0})
         self.debug(f"{config}.baudrate={baudrate}")
 
         lang = ConfigKruxInstaller.get_system_lang()
@@ -181,6 +181,9 @@ class ConfigKruxInstaller(BaseKruxInstaller, Trigger):
                 self.warning(f"{lang} not supported. Default {config}.lang=en_US")
                 config.setdefaults("locale", {"lang": "en_US"})
 
+        # best baudrates found by adaptive flash, by device@port
+        config.setdefaults("baudrates", {})
+
     def build_settings(self, settings):
         """Create settings panel"""
         json_data = [
@@ -198,6 +201,13 @@ class ConfigKruxInstaller(BaseKruxInstaller, Trigger):
                 "section": "flash",
                 "key": "baudrate",
             },
+            {
+                "type": "bool",
+                "title": "Adaptive baudrate",
+                "desc": "Start from the fastest (or last good) baudrate and step down on failures",
+                "section": "flash",
+                "key": "adaptive",
+            },
             {
                 "type": "options",
                 "title": "Locale",
@@ -457,26 +467,37 @@ class ConfigKruxInstaller(BaseKruxInstaller, Trigger):
                 value = f"{value}.UTF-8"
 
             partials = []
-            self.make_ask_permission_partials(partials=partials, loc=value)
-            self.make_main_partials(partials=partials, loc=value)
-            self.make_select_version_partials(partials=partials, loc=value)
-            self.make_select_old_version_partials(partials=partials, loc=value)
-            self.make_warn_stable_partials(partials=partials, loc=value)
-            self.make_warn_beta_partials(partials=partials, loc=value)
-            self.make_down_zip_partials(partials=partials, loc=value)
-            self.make_down_zip_sha_partials(partials=partials, loc=value)
-            self.make_down_zip_sig_partials(partials=partials, loc=value)
-            self.make_down_pem_partials(partials=partials, loc=value)
-            self.make_down_beta_partials(partials=partials, loc=value)
-            self.make_verify_partials(partials=partials, loc=value)
-            self.make_unzip_partials(partials=partials, loc=value)
-            self.make_flash_partials(partials=partials, loc=value)
-            self.make_warn_wipe_partials(partials=partials, loc=value)
-            self.make_wipe_partials(partials=partials, loc=value)
-            self.make_warn_before_airgapped_partials(partials=partials, loc=value)
-            self.make_airgapped_partials(partials=partials, loc=value)
-            self.make_warn_after_airgapped_partials(partials=partials, loc=value)
-            self.make_about_partials(partials=partials, loc=value)
+            makers = {
+                "AskPermissionDialoutScreen": self.make_ask_permission_partials,
+                "MainScreen": self.make_main_partials,
+                "SelectVersionScreen": self.make_select_version_partials,
+                "SelectOldVersionScreen": self.make_select_old_version_partials,
+                "WarningAlreadyDownloadedScreen": self.make_warn_stable_partials,
+                "WarningBetaScreen": self.make_warn_beta_partials,
+                "DownloadStableZipScreen": self.make_down_zip_partials,
+                "DownloadStableZipSha256Screen": self.make_down_zip_sha_partials,
+                "DownloadStableZipSigScreen": self.make_down_zip_sig_partials,
+                "DownloadSelfcustodyPemScreen": self.make_down_pem_partials,
+                "DownloadBetaScreen": self.make_down_beta_partials,
+                "VerifyStableZipScreen": self.make_verify_partials,
+                "UnzipStableScreen": self.make_unzip_partials,
+                "FlashScreen": self.make_flash_partials,
+                "WarningWipeScreen": self.make_warn_wipe_partials,
+                "WipeScreen": self.make_wipe_partials,
+                "WarningBeforeAirgapUpdateScreen": (
+                    self.make_warn_before_airgapped_partials
+                ),
+                "AirgapUpdateScreen": self.make_airgapped_partials,
+                "WarningAfterAirgapUpdateScreen": (
+                    self.make_warn_after_airgapped_partials
+                ),
+                "AboutScreen": self.make_about_partials,
+            }
+
+            # screens not built yet will read the new locale when built
+            for name, make_partials in makers.items():
+                if self.screen_manager.is_built(name):
+                    make_partials(partials=partials, loc=value)
 
             for fn in partials:
                 Clock.schedule_once(fn, 0)
@@ -0,0 +1,108 @@
+# The MIT License (MIT)
+
+# Copyright (c) 2021-2024 Krux contributors
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""
+lazy_screen_manager.py
+"""
+import typing
+import importlib
+from kivy.clock import Clock
+from kivy.uix.screenmanager import Screen, ScreenManager
+from src.utils.trigger import Trigger
+from src.utils.profiler import get_profiler
+
+
+class LazyScreenManager(ScreenManager, Trigger):
+    """
+    A :class:`ScreenManager` whose screens are registered by name with a
+    factory and only built the first time they are needed: when some screen
+    asks for it (:meth:`get_screen`) or switch to it (`current`, that calls
+    :meth:`get_screen` too). Likely next screens can be built in advance,
+    one per frame, with :meth:`prewarm`.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.factories = {}
+
+    def register(self, name: str, factory: typing.Callable[[], Screen]):
+        """Register a screen name with the factory that builds it"""
+        self.debug("register::%s", name)
+        self.factories[name] = factory
+
+    def register_module(self, name: str, module: str):
+        """
+        Register a screen whose class, with the same name, lives in a module
+        only imported when the screen is built (so the dependencies of a
+        screen are only loaded if it's ever shown)
+        """
+
+        def factory() -> Screen:
+            return getattr(importlib.import_module(module), name)()
+
+        self.register(name, factory)
+
+    @property
+    def registered_names(self) -> typing.List[str]:
+        """Names of all screens, built or not"""
+        return list(self.factories.keys())
+
+    def is_built(self, name: str) -> bool:
+        """Check if a screen was already built"""
+        return any(screen.name == name for screen in self.screens)
+
+    def has_screen(self, name: str) -> bool:
+        """Check if a screen is registered (or was added as a widget)"""
+        return name in self.factories or super().has_screen(name)
+
+    def build_screen(self, name: str) -> Screen:
+        """Build a registered screen and add it to the manager"""
+        with get_profiler().span(f"{name}.__init__"):
+            screen = self.factories[name]()
+
+        self.debug("build_screen::%s", name)
+        self.add_widget(screen)
+        return screen
+
+    def get_screen(self, name: str) -> Screen:
+        """Return a screen, building it on first use"""
+        if name in self.factories and not self.is_built(name):
+            return self.build_screen(name)
+
+        return super().get_screen(name)
+
+    def prewarm(self, names: typing.List[str]):
+        """Build not yet built screens in the next frames, one per frame"""
+        pending = [name for name in names if not self.is_built(name)]
+
+        # pylint: disable=unused-argument
+        def build_next(dt):
+            while pending:
+                name = pending.pop(0)
+                if not self.is_built(name):
+                    self.get_screen(name)
+                    break
+
+            if pending:
+                Clock.schedule_once(build_next, 0)
+
+        if pending:
+            Clock.schedule_once(build_next, 0)
@@ -55,6 +55,7 @@ class AirgapUpdateScreen(BaseScreen):
             try:
                 shutil.copyfile(self.firmware_bin, new_firmware_bin)
                 shutil.copyfile(self.firmware_sig, new_firmware_sig)
+                self.forget_flashed(self.manager.get_screen("MainScreen").device)
 
                 # After copy, make sha256 hash to show
                 sha256 = Sha256Verifyer(filename=new_firmware_bin)
@@ -164,7 +164,7 @@ class BaseDownloadScreen(BaseScreen):
         Event fired when the screen is displayed and the entering animation is complete.
 
         Every inherithed class should implement it own `on_trigger` and `on_progress`
-        staticmethods. The method `on_progress` should call `self.trigger` ath the end:
+        staticmethods. The `on_trigger` is called once the download is finished
         """
         if self.downloader is not None:
             # on trigger should be defined on inherited classes
@@ -175,10 +175,17 @@ class BaseDownloadScreen(BaseScreen):
             on_progress = getattr(self.__class__, "on_progress")
             _fn = partial(download, on_data=on_progress)
 
-            # Now run it as a partial function
-            # on parallel thread to not block
+            # Assets are renamed from their `.part` files only
+            # when `download` returns, so the trigger is called
+            # here and not when progress reaches 100%
+            def on_download():
+                _fn()
+                callback_trigger = getattr(self, "trigger")
+                callback_trigger()
+
+            # Now run it on parallel thread to not block
             # the process during the kivy cycles
-            self.thread = Thread(name=self.name, target=_fn)
+            self.thread = Thread(name=self.name, target=on_download)
             self.thread.start()
         else:
             msg = "Downloader isnt configured. Use `update` method first"
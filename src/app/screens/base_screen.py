@@ -28,6 +28,7 @@ import typing
 from math import sqrt
 from pathlib import Path
 from functools import partial
+from threading import Thread
 from kivy.clock import Clock
 from kivy.app import App
 from kivy.core.window import Window
@@ -41,6 +42,7 @@ from kivy.uix.screenmanager import Screen
 from kivy.weakproxy import WeakProxy
 from src.i18n import T
 from src.utils.trigger import Trigger
+from src.utils.cache import AssetCache, FlashLedger
 
 if sys.platform.startswith("win32"):
     import win32file  # pylint: disable=import-error
@@ -49,6 +51,7 @@ if sys.platform.startswith("linux") or sys.platform.startswith("darwin"):
     import subprocess
 
 
+# pylint: disable=too-many-public-methods
 class BaseScreen(Screen, Trigger):
     """Main screen is the 'Home' page"""
 
@@ -71,6 +74,10 @@ class BaseScreen(Screen, Trigger):
 
         self.locale = BaseScreen.get_locale()
 
+        # Counter of jobs started with `run_in_background`,
+        # used to discard results of cancelled ones
+        self._background_job = 0
+
     @property
     def logo_img(self) -> str:
         """Getter for logo_img"""
@@ -414,6 +421,56 @@ class BaseScreen(Screen, Trigger):
 
         self.set_screen(name="ErrorScreen", direction="left")
 
+    def run_in_background(
+        self,
+        target: typing.Callable,
+        on_result: typing.Callable,
+        on_error: typing.Callable | None = None,
+    ) -> Thread:
+        """
+        Run a blocking `target` (like a network request) in a parallel thread,
+        so the kivy event loop keep rendering, and deliver its result to
+        `on_result` (or its exception to `on_error`, that defaults to
+        `redirect_exception`) on main thread with `Clock.schedule_once`.
+
+        Results of jobs started before a `cancel_background` are discarded.
+        """
+        self._background_job += 1
+        job = self._background_job
+
+        if on_error is None:
+            on_error = self.on_background_error
+
+        # pylint: disable=unused-argument
+        def on_deliver(callback: typing.Callable, value: typing.Any, dt: float):
+            if job != self._background_job:
+                self.debug(f"Discarding cancelled background job {job}")
+                return
+            callback(value)
+
+        def on_process():
+            try:
+                result = target()
+                Clock.schedule_once(partial(on_deliver, on_result, result), 0)
+
+            # pylint: disable=broad-exception-caught
+            except Exception as exc:
+                Clock.schedule_once(partial(on_deliver, on_error, exc), 0)
+
+        thread = Thread(name=f"{self.name}_{job}", target=on_process, daemon=True)
+        thread.start()
+        return thread
+
+    def cancel_background(self):
+        """Discard the result of any running job started with `run_in_background`"""
+        self.debug(f"Cancelling background job {self._background_job}")
+        self._background_job += 1
+
+    def on_background_error(self, exception: Exception):
+        """Default `run_in_background` error callback"""
+        self.error(str(exception))
+        self.redirect_exception(exception=exception)
+
     def update_screen(
         self,
         name: str,
@@ -466,12 +523,60 @@ class BaseScreen(Screen, Trigger):
         app = App.get_running_app()
         return app.config.get("destdir", "assets")
 
+    @staticmethod
+    def get_cachedir() -> str:
+        """Return the app's local dir, where cached data is placed"""
+        app = App.get_running_app()
+        return app.get_app_dir("local")
+
+    @staticmethod
+    def get_asset_cache() -> AssetCache:
+        """Return the index of downloaded assets, placed on app's local dir"""
+        return AssetCache(cachedir=BaseScreen.get_cachedir())
+
+    def forget_flashed(self, device: str):
+        """
+        Forget, on the flashed devices ledger (shared with the CLI, placed
+        on app's local dir), all devices with the same USB id of a device,
+        since the GUI can't tell which one of them will run the new firmware
+        (or none, if wiped), nor which kind it was recorded as
+        """
+        # import here, so the kboot submodule is only loaded when needed
+        # pylint: disable=import-outside-toplevel
+        from src.utils.flasher.base_flasher import BaseFlasher
+
+        try:
+            ledger = FlashLedger(cachedir=BaseScreen.get_cachedir())
+            ledger.forget_usb_id(BaseFlasher.DEVICE_VID_MAP[device])
+            ledger.save()
+
+        except OSError as exc:
+            self.warning(f"Unable to update the flashed devices ledger: {exc}")
+
     @staticmethod
     def get_baudrate() -> int:
         """Return the current selected baudrate"""
         app = App.get_running_app()
         return int(app.config.get("flash", "baudrate"))
 
+    @staticmethod
+    def get_baudrate_memory() -> typing.Dict[str, int] | None:
+        """
+        Return the best baudrates found by adaptive flash, by device@port,
+        or None if adaptive flash is disabled
+        """
+        app = App.get_running_app()
+        if not app.config.getboolean("flash", "adaptive"):
+            return None
+        return {key: int(value) for key, value in app.config.items("baudrates")}
+
+    @staticmethod
+    def remember_baudrate(key: str, baudrate: int):
+        """Store the best baudrate found by adaptive flash for a device@port"""
+        app = App.get_running_app()
+        app.config.set("baudrates", key, str(baudrate))
+        app.config.write()
+
     @staticmethod
     def get_locale() -> str:
         """Return the current locale"""
@@ -169,9 +169,6 @@ class DownloadBetaScreen(BaseDownloadScreen):
         In each iteration of downloaded chunks, update the GUI with a ratio between
         it's downloaded length and content length
         """
-        # trigger is defined in superclass
-
-        callback_trigger = getattr(self, "trigger")
         lens = [value["downloaded_len"], value["content_len"]]
         percent = lens[0] / lens[1]
 
@@ -197,7 +194,3 @@ class DownloadBetaScreen(BaseDownloadScreen):
                     downloaded,
                 ]
             )
-
-            # When finish, change the label, wait some seconds
-            # and then change screen
-            callback_trigger()
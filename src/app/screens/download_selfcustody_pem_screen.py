@@ -137,12 +137,6 @@ class DownloadSelfcustodyPemScreen(BaseDownloadScreen):
                 ]
             )
 
-            # When finish, change the label, wait some seconds
-            # and then change screen
-            # trigger is defined in superclass
-            callback_trigger = getattr(self, "trigger")
-            callback_trigger()
-
     # pylint: disable=unused-argument
     def update(self, *args, **kwargs):
         """Update screen with version key. Should be called before `on_enter`"""
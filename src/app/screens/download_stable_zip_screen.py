@@ -22,21 +22,23 @@
 download_stable_zip_screen.py
 """
 import os
-import time
 from functools import partial
 from kivy.clock import Clock
 from src.app.screens.base_download_screen import BaseDownloadScreen
-from src.utils.downloader.zip_downloader import ZipDownloader
+from src.utils.downloader.release_bundle_downloader import ReleaseBundleDownloader
 
 
 class DownloadStableZipScreen(BaseDownloadScreen):
-    """DownloadStableZipScreen download a official krux zip release"""
+    """
+    DownloadStableZipScreen download a official krux zip release
+    together with its sha256.txt, sig and the selfcustody.pem files
+    """
 
     def __init__(self, **kwargs):
         super().__init__(
             wid="download_stable_zip_screen", name="DownloadStableZipScreen", **kwargs
         )
-        self.to_screen = "DownloadStableZipSha256Screen"
+        self.to_screen = "VerifyStableZipScreen"
 
         # Define some staticmethods in
         # dynamic way, so they can be
@@ -47,16 +49,12 @@ class DownloadStableZipScreen(BaseDownloadScreen):
         # when the download thread is finished
         def on_trigger(dt):
             self.debug(f"latter call timed {dt}ms")
-            time.sleep(2.1)
-            screen = self.manager.get_screen(self.to_screen)
-            fn = partial(
-                screen.update, name=self.name, key="version", value=self.version
-            )
-            Clock.schedule_once(fn, 0)
+            self.record_assets()
             self.set_screen(name=self.to_screen, direction="left")
 
         # This is a function that will be called
         # when a bunch of data are streamed from github
+        # (for any of the assets being downloaded)
         def on_progress(data: bytes):
             self.debug(f"Chunck size: {len(data)}")
             dl_len = getattr(self.downloader, "downloaded_len")
@@ -107,7 +105,7 @@ class DownloadStableZipScreen(BaseDownloadScreen):
     def build_downloader(self, version: str):
         """Creates a Downloader given a firmware version"""
         self.version = version
-        self.downloader = ZipDownloader(
+        self.downloader = ReleaseBundleDownloader(
             version=self.version,
             destdir=DownloadStableZipScreen.get_destdir_assets(),
         )
@@ -124,16 +122,34 @@ class DownloadStableZipScreen(BaseDownloadScreen):
                 "\n",
                 f"[color=#00AABB][ref={url}]{url}[/ref][/color]",
                 "\n",
+                "(+ .sha256.txt, .sig, selfcustody.pem)",
+                "\n",
                 to,
                 "\n",
                 filepath,
             ]
         )
 
+    def record_assets(self):
+        """Index the downloaded (but not verified yet) assets on asset cache"""
+        try:
+            cache = DownloadStableZipScreen.get_asset_cache()
+            for asset in getattr(self.downloader, "assets"):
+                cache.record(asset.destfile, asset.url, etag=asset.etag)
+            cache.save()
+
+        except OSError as exc:
+            self.warning(f"Unable to record assets on cache: {exc}")
+
     def on_download_progress(self, value: dict):
         """update GUI given a ratio between what is downloaded and its total length"""
         # calculate percentage of download
         lens = [value["downloaded_len"], value["content_len"]]
+
+        # The total length is only known once all assets answered
+        if lens[1] == 0:
+            return
+
         percent = lens[0] / lens[1]
 
         # Format bytes (one liner) in MB
@@ -154,7 +170,7 @@ class DownloadStableZipScreen(BaseDownloadScreen):
         )
 
         # When finish, change the label
-        # and then change screen
+        # (the screen changes when the download returns)
         if percent == 1.00:
             destdir = getattr(self.downloader, "destdir")
             downloaded = self.translate("downloaded")
@@ -166,8 +182,3 @@ class DownloadStableZipScreen(BaseDownloadScreen):
                     downloaded,
                 ]
             )
-            # When finish, change the label, wait some seconds
-            # and then change screen
-            # trigger is defined in superclass
-            callback_trigger = getattr(self, "trigger")
-            callback_trigger()
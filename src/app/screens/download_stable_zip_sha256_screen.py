@@ -141,7 +141,7 @@ class DownloadStableZipSha256Screen(BaseDownloadScreen):
         )
 
         # When finish, change the label
-        # and then change screen
+        # (the screen changes when the download returns)
         if percent == 1.00:
             destdir = getattr(self.downloader, "destdir")
             downloaded = self.translate("downloaded")
@@ -153,9 +153,3 @@ class DownloadStableZipSha256Screen(BaseDownloadScreen):
                     downloaded,
                 ]
             )
-
-            # When finish, change the label, wait some seconds
-            # and then change screen
-            # trigger is defined in superclass
-            callback_trigger = getattr(self, "trigger")
-            callback_trigger()
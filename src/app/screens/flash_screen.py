@@ -26,7 +26,7 @@ import traceback
 from functools import partial
 from kivy.clock import Clock
 from src.app.screens.base_flash_screen import BaseFlashScreen
-from src.utils.flasher import Flasher
+from src.utils.flasher import Flasher, FlashMetrics
 
 
 class FlashScreen(BaseFlashScreen):
@@ -38,6 +38,7 @@ class FlashScreen(BaseFlashScreen):
         self.flashing_msg = self.translate("Flashing")
         self.at_msg = self.translate("at")
         self.flasher = Flasher()
+        self.metrics = None
         self.fail_msg = ""
         fn = partial(self.update, name=self.name, key="canvas")
         Clock.schedule_once(fn, 0)
@@ -55,12 +56,19 @@ class FlashScreen(BaseFlashScreen):
         def on_data(*args, **kwargs):
             text = " ".join(str(x) for x in args)
             self.info(text)
+
+            if self.metrics is not None:
+                self.metrics.on_data(text)
+
             text = FlashScreen.parse_general_output(text)
             text = text.replace("\rProgramming", "Programming")
 
             if "INFO" in text:
                 self.output.append(text)
                 if "Rebooting" in text:
+                    record = self.save_metrics(ok=True)
+                    if record is not None and record["rate"]:
+                        self.output.append(FlashScreen.format_rate(record))
                     # pylint: disable=not-callable
                     self.done()
 
@@ -92,6 +100,9 @@ class FlashScreen(BaseFlashScreen):
         """
 
         def on_process(file_type: str, iteration: int, total: int, suffix: str):
+            if self.metrics is not None:
+                self.metrics.on_process(file_type, iteration, total, suffix)
+
             percent = (iteration / total) * 100
             self.ids[f"{self.id}_progress"].text = "".join(
                 [
@@ -116,6 +127,65 @@ class FlashScreen(BaseFlashScreen):
 
         setattr(FlashScreen, "on_process", on_process)
 
+    @staticmethod
+    def format_rate(record: dict) -> str:
+        """Show the effective throughput of a flash against its baudrate"""
+        return "".join(
+            [
+                "[color=#efcc00]",
+                f"{record['rate'] / 1024:.2f} KiB/s",
+                "[/color]",
+                f" ({record['efficiency']:.0%} of {record['baudrate']} bauds)",
+            ]
+        )
+
+    def save_metrics(self, ok: bool, **kwargs) -> dict | None:
+        """
+        Persist the stage timings and effective throughput of the
+        current flash; a failure to write them should not fail the flash
+        """
+        if self.metrics is None:
+            return None
+
+        record = self.metrics.finish(
+            ok=ok, board=self.flasher.board, port=self.flasher.port, **kwargs
+        )
+        try:
+            self.metrics.save(record)
+        except OSError as exc:
+            self.warning(f"Unable to save flash metrics: {exc}")
+        self.metrics = None
+        return record
+
+    def flash_adaptive(self, memory: dict, cachedir: str):
+        """
+        Flash stepping down the baudrate on failures, recording the
+        metrics of each attempt and remembering the one that worked
+        """
+
+        def on_attempt(baudrate: int):
+            if self.metrics is not None and self.metrics.stages:
+                self.save_metrics(ok=False, error=self.fail_msg or "Retry")
+
+            self.fail_msg = ""
+            self.metrics = FlashMetrics(
+                baudrate=baudrate, firmware=self.flasher.firmware, cachedir=cachedir
+            )
+            self.output.append(f"[color=#efcc00]INFO[/color] Trying {baudrate} bauds")
+
+        baudrate = self.flasher.flash_adaptive(
+            callback=getattr(self.__class__, "on_process"),
+            memory=memory,
+            on_attempt=on_attempt,
+        )
+        key = self.flasher.baudrate_key
+
+        # pylint: disable=unused-argument
+        def remember(dt):
+            self.remember_baudrate(key, baudrate)
+
+        Clock.schedule_once(remember, 0)
+
     # pylint: disable=unused-argument
     def on_pre_enter(self, *args):
         self.ids[f"{self.id}_grid"].clear_widgets()
@@ -178,10 +248,22 @@ class FlashScreen(BaseFlashScreen):
         Event fired when the screen is displayed and the entering animation is complete.
         """
         self.done = getattr(FlashScreen, "on_done")
-        self.flasher.ktool.__class__.print_callback = getattr(FlashScreen, "on_data")
-        on_process = partial(
-            self.flasher.flash, callback=getattr(self.__class__, "on_process")
+        cachedir = self.get_cachedir()
+        self.forget_flashed(self.manager.get_screen("MainScreen").device)
+        self.metrics = FlashMetrics(
+            baudrate=self.flasher.baudrate,
+            firmware=self.flasher.firmware,
+            cachedir=cachedir,
         )
+        self.flasher.ktool.__class__.print_callback = getattr(FlashScreen, "on_data")
+        memory = self.get_baudrate_memory()
+
+        if memory is None:
+            on_process = partial(
+                self.flasher.flash, callback=getattr(self.__class__, "on_process")
+            )
+        else:
+            on_process = partial(self.flash_adaptive, memory=memory, cachedir=cachedir)
         self.thread = threading.Thread(name=self.name, target=on_process)
 
         # if anything wrong happen, show it
@@ -191,6 +273,7 @@ class FlashScreen(BaseFlashScreen):
                     err.exc_type, err.exc_value, err.exc_traceback
                 )
                 msg = "".join(trace[-2:])
+                self.save_metrics(ok=False, error=msg.strip())
                 general_msg = "".join(
                     [
                         "Ensure that you have selected the correct device ",
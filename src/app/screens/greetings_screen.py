@@ -23,9 +23,9 @@ greetings_screen.py
 """
 import os
 import sys
+import typing
 from functools import partial
 from kivy.clock import Clock
-from src.utils.selector import Selector
 from src.app.screens.base_screen import BaseScreen
 
 
@@ -229,21 +229,30 @@ class GreetingsScreen(BaseScreen):
         """
         In reality, this method get the latest version and set to
         select version button on main_screen. But it can work as
-        internet connection check
+        internet connection check. The request is made in background,
+        so the logo keeps being rendered while waiting
         """
-        try:
-            selector = Selector()
-            main_screen = self.manager.get_screen("MainScreen")
-            fn = partial(
-                main_screen.update,
-                name=self.name,
-                key="version",
-                value=selector.releases[0],
-            )
-            Clock.schedule_once(fn, 0)
-            self.set_screen(name="MainScreen", direction="left")
+        cachedir = GreetingsScreen.get_cachedir()
 
-        # pylint: disable=broad-exception-caught
-        except Exception as exc:
-            self.error(str(exc))
-            self.redirect_exception(exception=exc)
+        def on_fetch() -> typing.List[str]:
+            # import here, so requests is loaded in background too
+            # pylint: disable=import-outside-toplevel
+            from src.utils.selector.release_catalog import get_release_catalog
+
+            return get_release_catalog().fetch(cachedir=cachedir)
+
+        self.run_in_background(
+            target=on_fetch, on_result=self.on_check_internet_connection
+        )
+
+    def on_check_internet_connection(self, releases: typing.List[str]):
+        """Set the latest version on main_screen and go to it"""
+        main_screen = self.manager.get_screen("MainScreen")
+        fn = partial(
+            main_screen.update,
+            name=self.name,
+            key="version",
+            value=releases[0],
+        )
+        Clock.schedule_once(fn, 0)
+        self.set_screen(name="MainScreen", direction="left")
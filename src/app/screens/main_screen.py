@@ -26,7 +26,7 @@ import re
 import typing
 from functools import partial
 from kivy.clock import Clock
-from src.utils.selector import VALID_DEVICES
+from src.utils.constants import VALID_DEVICES
 from src.app.screens.base_screen import BaseScreen
 
 
@@ -107,16 +107,24 @@ class MainScreen(BaseScreen):
         def on_press(instance):
             self.debug(f"Calling {instance.id}::on_press")
             self.set_background(wid=instance.id, rgba=(0.25, 0.25, 0.25, 1))
-            fetch_msg = self.translate("Fetching data from")
-            self.ids[instance.id].text = "".join(
-                [
-                    "[color=#efcc00]",
-                    f"[b]{fetch_msg}[/b]",
-                    "\n",
-                    url,
-                    "[/color]",
-                ]
-            )
+
+            # import here, so requests isn't loaded with the screen (usually
+            # the greetings screen already loaded it in background)
+            # pylint: disable=import-outside-toplevel
+            from src.utils.selector.release_catalog import get_release_catalog
+
+            # Only warn about the network when releases aren't in memory
+            if get_release_catalog().is_expired():
+                fetch_msg = self.translate("Fetching data from")
+                self.ids[instance.id].text = "".join(
+                    [
+                        "[color=#efcc00]",
+                        f"[b]{fetch_msg}[/b]",
+                        "\n",
+                        url,
+                        "[/color]",
+                    ]
+                )
 
         def on_release(instance):
             self.debug(f"Calling {instance.id}::on_release")
@@ -199,6 +207,11 @@ class MainScreen(BaseScreen):
         zipfile = os.path.join(resources, f"krux-{self.version}.zip")
         to_screen = None
 
+        # A release that was downloaded and verified before
+        # (and not changed since then) can go straight to unzip
+        if self.is_release_cached(resources):
+            return self.on_cached_official_release(partial_list=partial_list)
+
         if os.path.isfile(zipfile):
             to_screen = "WarningAlreadyDownloadedScreen"
         else:
@@ -223,6 +236,46 @@ class MainScreen(BaseScreen):
 
         return to_screen
 
+    def is_release_cached(self, resources: str) -> bool:
+        """Check on asset cache if the release assets are downloaded and verified"""
+        # pylint: disable=import-outside-toplevel
+        from src.utils.downloader.release_bundle_downloader import (
+            ReleaseBundleDownloader,
+        )
+
+        bundle = ReleaseBundleDownloader(version=self.version, destdir=resources)
+
+        try:
+            cache = MainScreen.get_asset_cache()
+            cached = cache.is_verified(bundle.destfiles)
+            cache.save()
+
+        except OSError as exc:
+            self.warning(f"Unable to read asset cache: {exc}")
+            cached = False
+
+        self.debug(f"is_release_cached={cached}")
+        return cached
+
+    def on_cached_official_release(
+        self, partial_list: typing.List[typing.Callable]
+    ) -> str:
+        """Skip download and verification of an already verified release"""
+        to_screen = "UnzipStableScreen"
+        screen = self.manager.get_screen(to_screen)
+        partial_list.extend(
+            [
+                partial(
+                    screen.update, name=self.name, key="version", value=self.version
+                ),
+                partial(screen.update, name=self.name, key="device", value=self.device),
+                partial(screen.update, name=self.name, key="clear"),
+                partial(screen.update, name=self.name, key="flash-button"),
+                partial(screen.update, name=self.name, key="airgap-button"),
+            ]
+        )
+        return to_screen
+
     def on_check_any_beta_release(
         self, partial_list: typing.List[typing.Callable]
     ) -> str:
@@ -25,6 +25,7 @@ import re
 from functools import partial
 from kivy.clock import Clock
 from src.utils.constants import VALID_DEVICES_VERSIONS
+from src.utils.ports import get_port_discovery
 from src.app.screens.base_screen import BaseScreen
 
 
@@ -36,6 +37,7 @@ class SelectDeviceScreen(BaseScreen):
             wid="select_device_screen", name="SelectDeviceScreen", **kwargs
         )
         self.enabled_devices = []
+        self.connected_devices = []
         self.make_grid(wid="select_device_screen_grid", rows=9)
 
         for row, device in enumerate(
@@ -86,6 +88,53 @@ class SelectDeviceScreen(BaseScreen):
                 on_ref_press=None,
             )
 
+    def device_text(self, device: str) -> str:
+        """Text of an enabled device button, highlighted if it is connected"""
+        if device in self.connected_devices:
+            return "".join(["[color=#00ff00]", device, "[/color]"])
+        return device
+
+    # pylint: disable=unused-argument
+    def refresh_connected(self, *args):
+        """Look for connected devices, without blocking the screen"""
+        discovery = get_port_discovery()
+
+        def on_devices():
+            # import here, so the kboot submodule is loaded in background
+            # pylint: disable=import-outside-toplevel
+            from src.utils.flasher.base_flasher import BaseFlasher
+
+            return discovery.devices(BaseFlasher.DEVICE_VID_MAP)
+
+        def on_result(devices):
+            self.update(name=self.name, key="connected", value=devices)
+
+        def on_error(exc):
+            self.warning(f"Unable to list serial ports: {exc}")
+
+        self.run_in_background(
+            on_devices,
+            on_result=on_result,
+            on_error=on_error,
+        )
+
+    # pylint: disable=unused-argument
+    def on_ports_change(self, added, removed):
+        """Called from port discovery's polling thread on hotplug"""
+        Clock.schedule_once(self.refresh_connected, 0)
+
+    # pylint: disable=unused-argument
+    def on_enter(self, *args):
+        """Show which devices are connected while the screen is visible"""
+        get_port_discovery().watch(self.on_ports_change)
+        self.refresh_connected()
+
+    # pylint: disable=unused-argument
+    def on_leave(self, *args):
+        """Stop watching serial ports"""
+        get_port_discovery().unwatch(self.on_ports_change)
+        self.cancel_background()
+
     # pylint: disable=unused-argument
     def update(self, *args, **kwargs):
         """Update buttons according the valid devices for each compatible version"""
@@ -119,7 +168,16 @@ class SelectDeviceScreen(BaseScreen):
                         )
                     else:
                         self.enabled_devices.append(f"select_device_{device}")
-                        self.ids[f"select_device_{device}"].text = device
+                        self.ids[f"select_device_{device}"].text = self.device_text(
+                            device
+                        )
+
+            if key == "connected":
+                self.connected_devices = list(value)
+
+                for wid in self.enabled_devices:
+                    device = wid.replace("select_device_", "")
+                    self.ids[wid].text = self.device_text(device)
 
         setattr(SelectDeviceScreen, "on_update", on_update)
         self.update_screen(
@@ -22,9 +22,10 @@
 select_version_screen.py
 """
 # pylint: disable=no-name-in-module
+import typing
 from functools import partial
 from kivy.clock import Clock
-from src.utils.selector import Selector
+from src.utils.selector.release_catalog import get_release_catalog
 from src.app.screens.base_screen import BaseScreen
 
 
@@ -178,28 +179,55 @@ class SelectVersionScreen(BaseScreen):
             on_ref_press=None,
         )
 
+    def build_fetching_releases(self):
+        """Show a loading image, while releases are fetched, and a back button"""
+        self.make_image(
+            wid=f"{self.id}_loading",
+            source=self.load_img,
+            root_widget="select_version_screen_grid",
+        )
+        self.build_select_version_back_button(self.translate("Back"))
+
     def fetch_releases(self):
-        """Build a set of buttons to select version"""
+        """
+        Build a set of buttons to select version. Releases are memoized
+        for some minutes, so only when they are expired a loading image is
+        shown while they are fetched in background
+        """
         try:
             self.clear()
-            selector = Selector()
-            self.build_select_version_latest_button(selector.releases[0])
-            self.build_select_beta_version_button(selector.releases[-1])
-            self.build_select_version_old_button(self.translate("Old versions"))
-            self.build_select_version_back_button(self.translate("Back"))
-
-            # Push other releases to SelectOldVersionScreen
-            select_old_version_screen = self.manager.get_screen(
-                "SelectOldVersionScreen"
-            )
-            select_old_version_screen.fetch_releases(
-                old_versions=selector.releases[1:-1]
-            )
+            catalog = get_release_catalog()
+
+            if not catalog.is_expired():
+                self.on_fetch_releases(catalog.releases)
+            else:
+                self.build_fetching_releases()
+                cachedir = SelectVersionScreen.get_cachedir()
+                self.run_in_background(
+                    target=partial(catalog.fetch, cachedir=cachedir),
+                    on_result=self.on_fetch_releases,
+                )
 
         # pylint: disable=broad-exception-caught
         except Exception as exc:
-            self.error(str(exc))
-            self.redirect_exception(exception=exc)
+            self.on_background_error(exc)
+
+    def on_fetch_releases(self, releases: typing.List[str]):
+        """Build the buttons of fetched releases"""
+        self.clear()
+        self.build_select_version_latest_button(releases[0])
+        self.build_select_beta_version_button(releases[-1])
+        self.build_select_version_old_button(self.translate("Old versions"))
+        self.build_select_version_back_button(self.translate("Back"))
+
+        # Push other releases to SelectOldVersionScreen
+        select_old_version_screen = self.manager.get_screen("SelectOldVersionScreen")
+        select_old_version_screen.fetch_releases(old_versions=releases[1:-1])
+
+    # pylint: disable=unused-argument
+    def on_leave(self, *args):
+        """Do not render releases fetched after user navigate away"""
+        self.cancel_background()
 
     # pylint: disable=unused-argument
     def update(self, *args, **kwargs):
@@ -73,6 +73,7 @@ class UnzipStableScreen(BaseScreen):
             value=value,
             allowed_screens=(
                 "ConfigKruxInstaller",
+                "MainScreen",
                 "VerifyStableZipScreen",
                 "UnzipStableScreen",
             ),
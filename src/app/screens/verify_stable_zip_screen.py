@@ -26,11 +26,11 @@ from functools import partial
 import typing
 from kivy.clock import Clock
 from src.app.screens.base_screen import BaseScreen
+from src.utils.downloader.release_bundle_downloader import ReleaseBundleDownloader
 from src.utils.verifyer.sha256_check_verifyer import Sha256CheckVerifyer
-from src.utils.verifyer.sha256_verifyer import Sha256Verifyer
 from src.utils.verifyer.sig_check_verifyer import SigCheckVerifyer
-from src.utils.verifyer.sig_verifyer import SigVerifyer
 from src.utils.verifyer.pem_check_verifyer import PemCheckVerifyer
+from src.utils.verifyer.release_verifyer import ReleaseVerifyer
 
 
 class VerifyStableZipScreen(BaseScreen):
@@ -41,6 +41,8 @@ class VerifyStableZipScreen(BaseScreen):
             wid="verify_stable_zip_screen", name="VerifyStableZipScreen", **kwargs
         )
         self.success = False
+        self.sha256 = None
+        self.progress = None
         self.make_grid(wid=f"{self.id}_grid", rows=1, resize_screen=True)
 
         fn = partial(self.update, name=self.name, key="canvas")
@@ -55,19 +57,19 @@ class VerifyStableZipScreen(BaseScreen):
 
         def on_update():
             if key == "verify":
-                assets_dir = VerifyStableZipScreen.get_destdir_assets()
-                main_screen = self.manager.get_screen("MainScreen")
-
-                verified = self.build_message_verify_sha256(
-                    assets_dir=assets_dir, version=main_screen.version
-                )
-
-                verified += self.build_message_verify_signature(
-                    assets_dir=assets_dir, version=main_screen.version
+                self.verify_release()
+
+            if key == "progress":
+                verifying_msg = self.translate("Verifying integrity and authenticity")
+                self.ids[f"{self.id}_label"].text = "".join(
+                    [
+                        f"[color=#efcc00]{verifying_msg}[/color]",
+                        "\n",
+                        "\n",
+                        f"{value} %",
+                    ]
                 )
 
-                self.ids[f"{self.id}_label"].text = verified
-
         self.update_screen(
             name=name,
             key=key,
@@ -126,21 +128,94 @@ class VerifyStableZipScreen(BaseScreen):
         fn = partial(self.update, name=self.name, key="verify")
         Clock.schedule_once(fn)
 
-    def verify_sha256(
-        self, assets_dir: str, version: str
-    ) -> typing.Tuple[str, str, bool]:
-        """Do the verification when entering on screen"""
-        # verify integrity
-        sha256_0 = Sha256Verifyer(filename=f"{assets_dir}/krux-{version}.zip")
-        sha256_1 = Sha256CheckVerifyer(
+    def verify_release(self):
+        """
+        Hash and verify the signature of release in a parallel thread,
+        since a whole zip is read (what can take a while on slow disks),
+        and show the result when done
+        """
+        assets_dir = VerifyStableZipScreen.get_destdir_assets()
+        version = self.manager.get_screen("MainScreen").version
+        self.progress = None
+
+        def on_verify() -> str:
+            release = self.load_release(assets_dir=assets_dir, version=version)
+            verified = self.build_message_verify_sha256(
+                assets_dir=assets_dir, version=version, release=release
+            )
+            verified += self.build_message_verify_signature(
+                assets_dir=assets_dir, version=version, release=release
+            )
+            return verified
+
+        def on_verified(verified: str):
+            self.ids[f"{self.id}_label"].text = verified
+
+            if self.success:
+                self.record_verified_assets(assets_dir=assets_dir, version=version)
+
+        self.run_in_background(target=on_verify, on_result=on_verified)
+
+    def on_hash_progress(self, hashed_len: int, total_len: int):
+        """
+        Called from verification thread while zip is hashed;
+        schedule a label update only when the percentage changes
+        """
+        progress = int(hashed_len * 100 / total_len) if total_len > 0 else 100
+        if progress != self.progress:
+            self.progress = progress
+            fn = partial(self.update, name=self.name, key="progress", value=progress)
+            Clock.schedule_once(fn, 0)
+
+    def load_release(self, assets_dir: str, version: str) -> ReleaseVerifyer:
+        """
+        Load the provided sha256sum, signature and public key, then read
+        the release zip once to compute the digest used by both checks
+        """
+        sha256_txt = Sha256CheckVerifyer(
             filename=f"{assets_dir}/krux-{version}.zip.sha256.txt"
         )
+        signature = SigCheckVerifyer(filename=f"{assets_dir}/krux-{version}.zip.sig")
+        publickey = PemCheckVerifyer(filename=f"{assets_dir}/selfcustody.pem")
+        sha256_txt.load()
+        signature.load()
+        publickey.load()
 
-        sha256_0.load()
-        sha256_1.load()
-        hash_0 = sha256_0.data.split(" ", maxsplit=1)[0]
-        hash_1 = sha256_1.data.split(" ", maxsplit=1)[0]
-        return (hash_0, hash_1, sha256_0.verify(hash_1))
+        release = ReleaseVerifyer(
+            filename=f"{assets_dir}/krux-{version}.zip",
+            sha256sum=sha256_txt.data.split(" ", maxsplit=1)[0],
+            signature=signature.data,
+            pubkey=publickey.data,
+        )
+        release.load(on_data=self.on_hash_progress)
+        return release
+
+    def verify_sha256(self, release: ReleaseVerifyer) -> typing.Tuple[str, str, bool]:
+        """Compare the computed hash against the provided one"""
+        return (release.data, release.sha256sum, release.verify_sha256())
+
+    def record_verified_assets(self, assets_dir: str, version: str):
+        """
+        Mark the release's assets as verified on asset cache,
+        so the next flash of same version can skip the verification
+        """
+        bundle = ReleaseBundleDownloader(version=version, destdir=assets_dir)
+
+        try:
+            cache = VerifyStableZipScreen.get_asset_cache()
+            for asset in bundle.assets:
+                entry = cache.lookup(asset.destfile) or {}
+                cache.record(
+                    asset.destfile,
+                    asset.url,
+                    etag=entry.get("etag"),
+                    sha256=self.sha256 if asset is bundle.assets[0] else None,
+                    verified=True,
+                )
+            cache.save()
+
+        except OSError as exc:
+            self.warning(f"Unable to record assets on cache: {exc}")
 
     @staticmethod
     def prettyfy_hash(msg: str) -> str:
@@ -151,15 +226,18 @@ class VerifyStableZipScreen(BaseScreen):
         ]
         return "\n".join(subsets)
 
-    def build_message_verify_sha256(self, assets_dir: str, version: str) -> str:
+    def build_message_verify_sha256(
+        self, assets_dir: str, version: str, release: ReleaseVerifyer
+    ) -> str:
         """Create a message which user can assert the integrity verification"""
         # memorize result
-        verify = self.verify_sha256(assets_dir=assets_dir, version=version)
+        verify = self.verify_sha256(release=release)
         hash_0 = verify[0]
         hash_1 = verify[1]
         checksummed = verify[2]
 
         self.success = checksummed
+        self.sha256 = hash_0
 
         filepath = os.path.join(assets_dir, f"krux-{version}.zip")
         integrity_msg = self.translate("Integrity verification")
@@ -196,25 +274,15 @@ class VerifyStableZipScreen(BaseScreen):
             ]
         )
 
-    def verify_signature(self, assets_dir: str, version: str) -> bool | str:
-        """Verify official release's signature"""
-        # verify signature
-        signature = SigCheckVerifyer(filename=f"{assets_dir}/krux-{version}.zip.sig")
-        publickey = PemCheckVerifyer(filename=f"{assets_dir}/selfcustody.pem")
-        signature.load()
-        publickey.load()
-        sig_verifyer = SigVerifyer(
-            filename=f"{assets_dir}/krux-{version}.zip",
-            regexp=r"^.*\.zip$",
-            signature=signature.data,
-            pubkey=publickey.data,
-        )
-        sig_verifyer.load()
-        return sig_verifyer.verify()
+    def verify_signature(self, release: ReleaseVerifyer) -> bool:
+        """Verify official release's signature against its computed digest"""
+        return release.verify_signature()
 
-    def build_message_verify_signature(self, assets_dir: str, version: str) -> str:
+    def build_message_verify_signature(
+        self, assets_dir: str, version: str, release: ReleaseVerifyer
+    ) -> str:
         """Create a message which user can assert authenticity the verification"""
-        checksig = self.verify_signature(assets_dir=assets_dir, version=version)
+        checksig = self.verify_signature(release=release)
         self.success = self.success and checksig
 
         authenticity_msg = self.translate("Authenticity verification")
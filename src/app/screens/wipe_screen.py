@@ -150,6 +150,7 @@ class WipeScreen(BaseFlashScreen):
         Event fired when the screen is displayed and the entering animation is complete.
         """
         self.done = getattr(WipeScreen, "on_done")
+        self.forget_flashed(self.device)
         self.wiper.ktool.__class__.print_callback = getattr(WipeScreen, "on_data")
         on_process = partial(self.wiper.wipe, device=self.device)
         self.thread = threading.Thread(name=self.name, target=on_process)
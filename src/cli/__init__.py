@@ -0,0 +1,236 @@
+# The MIT License (MIT)
+
+# Copyright (c) 2021-2024 Krux contributors
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""
+__init__.py
+
+Headless entry point to verify, hash, flash or wipe firmware artifacts:
+
+    python -m src.cli verify <dir> [--pem selfcustody.pem] [--jobs N]
+    python -m src.cli hash <dir> [--jobs N]
+    python -m src.cli flash <kboot.kfpkg> [--device D] [--baudrate B] [--port P]...
+                            [--ledger DIR [--trust-ledger]]
+    python -m src.cli wipe --device D --port P [--baudrate B] [--ledger DIR]
+
+Each artifact (or flashed/wiped device) is reported as a line of JSON on stdout
+(with --events, flash and wipe also print their progress as JSON lines).
+It imports no kivy modules, so it can be driven by scripts without the GUI
+"""
+import os
+import sys
+import json
+import argparse
+import threading
+import typing
+from src.utils.profiler import get_profiler
+from .batch import find_artifacts, run
+
+PRINT_LOCK = threading.Lock()
+
+
+def make_parser() -> argparse.ArgumentParser:
+    """Build the command line parser"""
+    parser = argparse.ArgumentParser(
+        prog="python -m src.cli",
+        description="Verify, hash, flash or wipe krux-*.zip and firmware.bin artifacts",
+    )
+    parser.add_argument(
+        "--profile",
+        default=None,
+        metavar="TRACE",
+        help="write the timed spans of this run as a Chrome trace JSON file",
+    )
+    subparsers = parser.add_subparsers(dest="action", required=True)
+
+    for action in ("verify", "hash"):
+        subparser = subparsers.add_parser(action)
+        subparser.add_argument("rootdir", help="directory tree with artifacts")
+        subparser.add_argument(
+            "--jobs",
+            type=int,
+            default=None,
+            help="number of parallel processes (default: number of CPUs)",
+        )
+
+    subparsers.choices["verify"].add_argument(
+        "--pem",
+        default=None,
+        help="public key to verify signatures (default: <rootdir>/selfcustody.pem)",
+    )
+
+    flash_parser = subparsers.add_parser("flash")
+    flash_parser.add_argument("firmware", help="kboot.kfpkg to be flashed")
+    flash_parser.add_argument(
+        "--device",
+        default=None,
+        help="device name (default: detected from firmware path)",
+    )
+    flash_parser.add_argument("--baudrate", type=int, default=1500000)
+    flash_parser.add_argument(
+        "--port",
+        action="append",
+        default=None,
+        help="port to be flashed, can be repeated (default: all ports of device)",
+    )
+
+    wipe_parser = subparsers.add_parser("wipe")
+    wipe_parser.add_argument("--device", required=True, help="device name")
+    wipe_parser.add_argument("--port", required=True, help="port to be wiped")
+    wipe_parser.add_argument("--baudrate", type=int, default=1500000)
+
+    for subparser in (flash_parser, wipe_parser):
+        subparser.add_argument(
+            "--events",
+            action="store_true",
+            help="also print each stage/percent/rate event as a JSON line",
+        )
+        subparser.add_argument(
+            "--ledger",
+            default=None,
+            metavar="DIR",
+            help="directory of the flashed devices ledger, where flashed devices "
+            "are recorded and wiped ones forgotten",
+        )
+
+    flash_parser.add_argument(
+        "--trust-ledger",
+        action="store_true",
+        help="skip the devices that the ledger says already run the same "
+        "firmware; the devices aren't asked, so only use it if nothing else "
+        "flashes them",
+    )
+
+    return parser
+
+
+def print_event(event) -> None:
+    """Print a flash/wipe event as a JSON line (events come from many threads)"""
+    with PRINT_LOCK:
+        print(json.dumps(event.to_dict()), flush=True)
+
+
+def make_ledger(args: argparse.Namespace):
+    """Open the flashed devices ledger, if asked for"""
+    if args.ledger is None:
+        return None
+
+    # pylint: disable=import-outside-toplevel
+    from src.utils.cache import FlashLedger
+
+    return FlashLedger(cachedir=args.ledger)
+
+
+def flash(args: argparse.Namespace) -> typing.Iterator[dict]:
+    """Flash all devices at once, yielding their pass/fail summary"""
+    if args.trust_ledger and args.ledger is None:
+        raise ValueError("--trust-ledger needs a --ledger")
+
+    # import here, so verify and hash do not need the kboot submodule
+    # pylint: disable=import-outside-toplevel
+    from src.utils.flasher import BatchFlasher
+
+    flasher = BatchFlasher(
+        firmware=args.firmware,
+        baudrate=args.baudrate,
+        device=args.device,
+        ledger=make_ledger(args),
+        trust_ledger=args.trust_ledger,
+    )
+    on_event = print_event if args.events else None
+    yield from flasher.flash(on_event=on_event, ports=args.port)
+
+
+def wipe(args: argparse.Namespace) -> typing.Iterator[dict]:
+    """Wipe a device, yielding its pass/fail summary"""
+    # pylint: disable=import-outside-toplevel
+    from src.utils.flasher import FlashEngine
+
+    engine = FlashEngine(
+        device=args.device,
+        port=args.port,
+        baudrate=args.baudrate,
+        ledger=make_ledger(args),
+    )
+    last = None
+    for event in engine.wipe():
+        last = event
+        if args.events:
+            print_event(event)
+
+    yield {
+        "port": args.port,
+        "device": args.device,
+        "ok": last.stage == "done",
+        "status": "passed" if last.stage == "done" else "failed",
+        "error": last.message if last.stage == "failed" else None,
+    }
+
+
+def load_pubkey(path: str) -> bytes:
+    """Read the public key once, and check it before spawning workers"""
+    with open(path, "rb") as f_pem:
+        pubkey = f_pem.read()
+
+    # pylint: disable=import-outside-toplevel
+    from cryptography.hazmat.primitives import serialization
+
+    serialization.load_pem_public_key(pubkey)
+    return pubkey
+
+
+def main(argv: typing.List[str] | None = None) -> int:
+    """
+    Run the command line, printing a JSON line for each artifact.
+    Return 0 if all artifacts are ok, 1 if any fail and 2 on usage errors
+    """
+    args = make_parser().parse_args(argv)
+    profiler = get_profiler()
+    if args.profile is not None:
+        profiler.filename = args.profile
+
+    try:
+        if args.action == "flash":
+            reports = flash(args)
+
+        elif args.action == "wipe":
+            reports = wipe(args)
+
+        else:
+            filenames = find_artifacts(args.rootdir)
+            pubkey = None
+
+            if args.action == "verify":
+                pem = args.pem or os.path.join(args.rootdir, "selfcustody.pem")
+                pubkey = load_pubkey(pem)
+
+            reports = run(args.action, filenames, jobs=args.jobs, pubkey=pubkey)
+
+        ok = True
+        with profiler.span(f"cli.{args.action}"):
+            for report in reports:
+                ok = ok and report["ok"]
+                print(json.dumps(report), flush=True)
+
+    except (OSError, ValueError, RuntimeError) as exc:
+        print(json.dumps({"ok": False, "error": str(exc)}), file=sys.stderr)
+        return 2
+
+    return 0 if ok else 1
@@ -0,0 +1,170 @@
+# The MIT License (MIT)
+
+# Copyright (c) 2021-2024 Krux contributors
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""
+batch.py
+
+Functions to verify or hash, in parallel, a tree of firmware artifacts
+"""
+import os
+import time
+import typing
+import fnmatch
+from concurrent.futures import ProcessPoolExecutor
+from src.utils.signer.trigger_signer import TriggerSigner
+from src.utils.verifyer.release_verifyer import ReleaseVerifyer
+
+ARTIFACT_PATTERNS = ("krux-*.zip", "firmware.bin")
+
+# Public key loaded by `init_worker` once per process
+# pylint: disable=invalid-name
+_pubkey = None
+
+
+def find_artifacts(rootdir: str) -> typing.List[str]:
+    """Walk a directory tree and list, sorted, the `krux-*.zip` and `firmware.bin`"""
+    if not os.path.isdir(rootdir):
+        raise ValueError(f"{rootdir} is not a directory")
+
+    artifacts = []
+    for dirpath, _, filenames in os.walk(rootdir):
+        for filename in filenames:
+            if any(fnmatch.fnmatch(filename, p) for p in ARTIFACT_PATTERNS):
+                artifacts.append(os.path.join(dirpath, filename))
+
+    return sorted(artifacts)
+
+
+def init_worker(pubkey: bytes | None):
+    """Keep the public key (read once by the parent process) in each worker"""
+    # pylint: disable=global-statement
+    global _pubkey
+    _pubkey = pubkey
+
+
+def make_report(action: str, filename: str, start: float, **kwargs) -> dict:
+    """Build a line of the JSON lines report"""
+    seconds = time.perf_counter() - start
+    size = os.path.getsize(filename) if os.path.exists(filename) else 0
+    report = {
+        "action": action,
+        "file": filename,
+        "size": size,
+        "seconds": round(seconds, 6),
+        "mbps": round(size / seconds / 1e6, 3) if seconds > 0 else 0.0,
+    }
+    report.update(kwargs)
+    return report
+
+
+def verify_artifact(filename: str) -> dict:
+    """
+    Verify the signature of an artifact (`.sig` file beside it) against the
+    public key given to `init_worker` and, if there is a `.sha256.txt` file
+    beside it, its checksum. Both checks share a single read of the file
+    """
+    start = time.perf_counter()
+
+    try:
+        if _pubkey is None:
+            raise ValueError("Public key not loaded")
+
+        sha256sum = None
+        sha256file = f"{filename}.sha256.txt"
+        if os.path.exists(sha256file):
+            with open(sha256file, "r", encoding="utf8") as f_sha:
+                sha256sum = f_sha.read().strip().split(" ", maxsplit=1)[0]
+
+        with open(f"{filename}.sig", "rb") as f_sig:
+            signature = f_sig.read()
+
+        release = ReleaseVerifyer(
+            filename=filename,
+            sha256sum=sha256sum or "",
+            signature=signature,
+            pubkey=_pubkey,
+        )
+        release.load()
+        checksum = release.verify_sha256() if sha256sum is not None else None
+        authentic = release.verify_signature()
+
+        return make_report(
+            "verify",
+            filename,
+            start,
+            sha256=release.data,
+            checksum=checksum,
+            signature=authentic,
+            ok=authentic and checksum is not False,
+            error=None,
+        )
+
+    # pylint: disable=broad-exception-caught
+    except Exception as exc:
+        return make_report("verify", filename, start, ok=False, error=str(exc))
+
+
+def hash_artifact(filename: str) -> dict:
+    """Hash an artifact and save its `.sha256.txt` beside it"""
+    start = time.perf_counter()
+
+    try:
+        signer = TriggerSigner(filename=filename)
+        signer.make_hash()
+        signer.save_hash()
+        return make_report(
+            "hash", filename, start, sha256=signer.filehash, ok=True, error=None
+        )
+
+    # pylint: disable=broad-exception-caught
+    except Exception as exc:
+        return make_report("hash", filename, start, ok=False, error=str(exc))
+
+
+def run(
+    action: typing.Literal["verify", "hash"],
+    filenames: typing.List[str],
+    jobs: int | None = None,
+    pubkey: bytes | None = None,
+) -> typing.Iterator[dict]:
+    """
+    Verify or hash all `filenames` in a pool of `jobs` processes (default to
+    number of CPUs) and yield their reports in the same order of `filenames`.
+    With `jobs=1` they are processed in the current process
+    """
+    if action not in ("verify", "hash"):
+        raise ValueError(f"Invalid action: {action}")
+
+    if jobs is not None and jobs < 1:
+        raise ValueError(f"Invalid jobs: {jobs}")
+
+    target = verify_artifact if action == "verify" else hash_artifact
+
+    if jobs == 1:
+        init_worker(pubkey)
+        for filename in filenames:
+            yield target(filename)
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=jobs, initializer=init_worker, initargs=(pubkey,)
+    ) as executor:
+        yield from executor.map(target, filenames)
@@ -0,0 +1,189 @@
+# The MIT License (MIT)
+
+# Copyright (c) 2021-2024 Krux contributors
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""
+asset_cache.py
+
+Index of downloaded assets, so a release that was already
+downloaded and verified do not need to be downloaded, hashed
+and checked again
+"""
+import os
+import json
+import typing
+from ..trigger import Trigger
+
+
+class AssetCache(Trigger):
+    """
+    Keep a small JSON index of downloaded assets, keyed by their path.
+
+    Each entry records the asset's url, size, modification time, sha256,
+    ETag and if it was verified against the selfcustody.pem. An entry is
+    only valid while the file on disk still have the same size and
+    modification time. The assets live in the user's download dir, so
+    the cache never removes them: entries of files that were removed or
+    changed are dropped when the index is saved.
+    """
+
+    INDEX_FILENAME = "assets-index.json"
+
+    def __init__(self, cachedir: str):
+        super().__init__()
+        self.cachedir = cachedir
+        self.entries = self.load()
+
+    @property
+    def cachedir(self) -> str:
+        """Getter for the directory where the index is placed"""
+        self.debug("cachedir::getter=%s", self._cachedir)
+        return self._cachedir
+
+    @cachedir.setter
+    def cachedir(self, value: str):
+        """Setter for the directory where the index is placed"""
+        self.debug("cachedir::setter=%s", value)
+        if not os.path.exists(value):
+            os.makedirs(value, exist_ok=True)
+
+        self._cachedir = value
+
+    @property
+    def entries(self) -> typing.Dict[str, dict]:
+        """Getter for the index entries"""
+        self.debug("entries::getter=%s", self._entries)
+        return self._entries
+
+    @entries.setter
+    def entries(self, value: typing.Dict[str, dict]):
+        """Setter for the index entries"""
+        self.debug("entries::setter=%s", value)
+        self._entries = value
+
+    @property
+    def index_file(self) -> str:
+        """Full path of the index file"""
+        return os.path.join(self.cachedir, AssetCache.INDEX_FILENAME)
+
+    def load(self) -> typing.Dict[str, dict]:
+        """Read the index from disk; a missing or corrupted index is empty"""
+        try:
+            with open(self.index_file, "r", encoding="utf8") as index:
+                entries = json.load(index)
+
+            if not isinstance(entries, dict):
+                raise ValueError(f"Invalid index: {self.index_file}")
+
+        except FileNotFoundError:
+            entries = {}
+
+        except ValueError as exc:
+            self.warning("load::invalid=%s", exc)
+            entries = {}
+
+        self.debug("load::entries=%s", len(entries))
+        return entries
+
+    def save(self):
+        """Prune stale entries and write the index atomically"""
+        self.prune()
+        tmpfile = f"{self.index_file}.tmp"
+
+        with open(tmpfile, "w", encoding="utf8") as index:
+            json.dump(self.entries, index, indent=2)
+            index.flush()
+            os.fsync(index.fileno())
+
+        os.replace(tmpfile, self.index_file)
+        self.debug("save::index_file=%s", self.index_file)
+
+    def record(
+        self,
+        path: str,
+        url: str,
+        *,
+        etag: str | None = None,
+        sha256: str | None = None,
+        verified: bool = False,
+    ) -> dict:
+        """
+        Add (or replace) the entry of a file that exists on disk.
+        Call :meth:`save` to persist it.
+        """
+        path = os.path.abspath(path)
+        stat = os.stat(path)
+        entry = {
+            "url": url,
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "sha256": sha256,
+            "etag": etag,
+            "verified": verified,
+        }
+        self.entries[path] = entry
+        self.debug("record::%s=%s", path, entry)
+        return entry
+
+    def lookup(self, path: str) -> dict | None:
+        """
+        Return the entry of a path if the file was not changed since
+        it was recorded, otherwise forget it and return None
+        """
+        path = os.path.abspath(path)
+        entry = self.entries.get(path)
+
+        if entry is None:
+            self.debug("lookup::%s=miss", path)
+            return None
+
+        try:
+            stat = os.stat(path)
+            valid = (
+                stat.st_size == entry["size"] and stat.st_mtime_ns == entry["mtime_ns"]
+            )
+        except OSError:
+            valid = False
+
+        if not valid:
+            self.debug("lookup::%s=stale", path)
+            del self.entries[path]
+            return None
+
+        self.debug("lookup::%s=hit", path)
+        return entry
+
+    def is_verified(self, paths: typing.List[str]) -> bool:
+        """Check if all paths have a valid and verified entry"""
+        for path in paths:
+            entry = self.lookup(path)
+            if entry is None or not entry["verified"]:
+                return False
+
+        return True
+
+    def prune(self) -> typing.List[str]:
+        """Forget the entries of files removed or changed on disk"""
+        pruned = [path for path in list(self.entries) if self.lookup(path) is None]
+
+        if pruned:
+            self.info("prune::%s", pruned)
+
+        return pruned
@@ -0,0 +1,161 @@
+# The MIT License (MIT)
+
+# Copyright (c) 2021-2024 Krux contributors
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""
+flash_ledger.py
+
+Index of flashed devices, so a device that already runs
+some kboot.kfpkg do not need to be flashed with it again
+"""
+import os
+import json
+import time
+import typing
+from threading import Lock
+from ..trigger import Trigger
+
+if typing.TYPE_CHECKING:  # pragma: no cover (serial is only needed to flash)
+    from serial.tools.list_ports_common import ListPortInfo
+
+
+class FlashLedger(Trigger):
+    """
+    Keep a small JSON index of flashed devices, keyed by the VID, PID
+    and serial number of their USB-to-serial chip.
+
+    Each entry records the sha256 of the last kboot.kfpkg flashed on
+    the device, and when and where it was flashed. Since KTool can't
+    read the flash back, the ledger is only as good as the history of
+    this host: a device flashed by other tools keeps its old entry.
+    That's why skipping known devices is an explicit choice of the
+    caller (see :class:`FlashEngine`), and every flash, wipe or airgap
+    update made by krux-installer forgets or records the devices it touched.
+    """
+
+    INDEX_FILENAME = "flash-ledger.json"
+
+    def __init__(self, cachedir: str):
+        super().__init__()
+        self.cachedir = cachedir
+        self._lock = Lock()
+        self.entries = self.load()
+
+    @property
+    def cachedir(self) -> str:
+        """Getter for the directory where the index is placed"""
+        self.debug("cachedir::getter=%s", self._cachedir)
+        return self._cachedir
+
+    @cachedir.setter
+    def cachedir(self, value: str):
+        """Setter for the directory where the index is placed"""
+        self.debug("cachedir::setter=%s", value)
+        if not os.path.exists(value):
+            os.makedirs(value, exist_ok=True)
+
+        self._cachedir = value
+
+    @property
+    def index_file(self) -> str:
+        """Full path of the index file"""
+        return os.path.join(self.cachedir, FlashLedger.INDEX_FILENAME)
+
+    @staticmethod
+    def make_key(port: "ListPortInfo | None") -> str | None:
+        """Identify a device by its serial port info, if it have a serial number"""
+        if port is None or not port.serial_number or port.vid is None:
+            return None
+        return f"{port.vid:04x}:{port.pid or 0:04x}:{port.serial_number}".lower()
+
+    def load(self) -> typing.Dict[str, dict]:
+        """Read the index from disk; a missing or corrupted index is empty"""
+        try:
+            with open(self.index_file, "r", encoding="utf8") as index:
+                entries = json.load(index)
+
+            if not isinstance(entries, dict):
+                raise ValueError(f"Invalid index: {self.index_file}")
+
+        except FileNotFoundError:
+            entries = {}
+
+        except ValueError as exc:
+            self.warning("load::invalid=%s", exc)
+            entries = {}
+
+        self.debug("load::entries=%s", len(entries))
+        return entries
+
+    def save(self):
+        """Write the index atomically"""
+        tmpfile = f"{self.index_file}.tmp"
+
+        with self._lock:
+            with open(tmpfile, "w", encoding="utf8") as index:
+                json.dump(self.entries, index, indent=2)
+                index.flush()
+                os.fsync(index.fileno())
+
+            os.replace(tmpfile, self.index_file)
+
+        self.debug("save::index_file=%s", self.index_file)
+
+    def record(self, key: str, sha256: str, **kwargs) -> dict:
+        """
+        Add (or replace) the entry of a flashed device; any keyword
+        (e.g. board, port) is added to it. Call :meth:`save` to persist it.
+        """
+        entry = {"sha256": sha256, "time": time.time(), **kwargs}
+        with self._lock:
+            self.entries[key] = entry
+
+        self.debug("record::%s=%s", key, entry)
+        return entry
+
+    def forget(self, key: str):
+        """Remove the entry of a device (e.g. when it was wiped)"""
+        with self._lock:
+            self.entries.pop(key, None)
+
+        self.debug("forget::%s", key)
+
+    def forget_usb_id(self, usb_id: str):
+        """
+        Remove the entries of all devices whose USB VID or PID is `usb_id`
+        (e.g. '0403'), when one of them is flashed or wiped by a path that
+        can't tell its serial number. Kinds of devices sharing a chip (e.g.
+        amigo and amigo_tft) are all forgotten, since a device flashed as
+        one kind could have been recorded as another
+        """
+        usb_id = f"{int(usb_id, 16):04x}"
+        with self._lock:
+            keys = [k for k in self.entries if usb_id in k.split(":")[:2]]
+            for key in keys:
+                del self.entries[key]
+
+        self.debug("forget_usb_id::%s=%s", usb_id, keys)
+
+    def is_flashed(self, key: str, sha256: str) -> bool:
+        """Check if a device was already flashed with a kboot.kfpkg"""
+        with self._lock:
+            entry = self.entries.get(key)
+
+        return entry is not None and entry.get("sha256") == sha256
@@ -0,0 +1,101 @@
+# The MIT License (MIT)
+
+# Copyright (c) 2021-2024 Krux contributors
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""
+http_cache.py
+
+Persist the body of GET responses with their ETag, so a
+conditional request answered with `304 Not Modified` can be served
+from disk
+"""
+import os
+import json
+import hashlib
+import typing
+from ..trigger import Trigger
+
+
+class HttpCache(Trigger):
+    """
+    Store JSON response bodies, keyed by url, with their `ETag`
+    header on a `http` folder of :attr:`cachedir`
+    """
+
+    def __init__(self, cachedir: str):
+        super().__init__()
+        self.cachedir = cachedir
+
+    @property
+    def cachedir(self) -> str:
+        """Getter for the directory where responses are placed"""
+        self.debug("cachedir::getter=%s", self._cachedir)
+        return self._cachedir
+
+    @cachedir.setter
+    def cachedir(self, value: str):
+        """Setter for the directory where responses are placed"""
+        self.debug("cachedir::setter=%s", value)
+        path = os.path.join(value, "http")
+        if not os.path.exists(path):
+            os.makedirs(path, exist_ok=True)
+
+        self._cachedir = value
+
+    def filename(self, url: str) -> str:
+        """Full path of the file where the response of :attr:`url` is placed"""
+        digest = hashlib.sha256(url.encode("utf8")).hexdigest()
+        return os.path.join(self.cachedir, "http", f"{digest}.json")
+
+    def load(self, url: str) -> dict | None:
+        """Return the stored response of :attr:`url`, if any"""
+        try:
+            with open(self.filename(url), "r", encoding="utf8") as file:
+                entry = json.load(file)
+
+            if entry.get("url") != url:
+                raise ValueError(f"Invalid cached response for {url}")
+
+        except FileNotFoundError:
+            self.debug("load::%s=miss", url)
+            return None
+
+        except ValueError as exc:
+            self.warning("load::invalid=%s", exc)
+            return None
+
+        self.debug("load::%s=hit", url)
+        return entry
+
+    def store(self, url: str, body: typing.Any, etag: str):
+        """Write atomically the JSON :attr:`body` of :attr:`url` with its ETag"""
+        filename = self.filename(url)
+        tmpfile = f"{filename}.tmp"
+        entry = {
+            "url": url,
+            "etag": etag,
+            "body": body,
+        }
+
+        with open(tmpfile, "w", encoding="utf8") as file:
+            json.dump(entry, file)
+
+        os.replace(tmpfile, filename)
+        self.debug("store::%s=%s", url, filename)
@@ -32,6 +32,20 @@ import os
 
 ROOT_DIRNAME = os.path.abspath(os.path.dirname(__file__))
 
+VALID_DEVICES = (
+    "m5stickv",
+    "amigo",
+    "amigo_tft",
+    "amigo_ips",
+    "dock",
+    "bit",
+    "yahboom",
+    "cube",
+    "wonder_mv",
+    "tzt",
+    "embed_fire",
+)
+
 VALID_DEVICES_VERSIONS = {
     "v25.11.0": [
         "m5stickv",
@@ -23,8 +23,11 @@
 asset_downloader.py
 """
 import os
+import json
+import codecs
 import typing
 from .stream_downloader import StreamDownloader
+from ..profiler import profiled
 
 
 class AssetDownloader(StreamDownloader):
@@ -40,76 +43,189 @@ class AssetDownloader(StreamDownloader):
     @property
     def destdir(self) -> str:
         """Getter for destination dir where the downloaded file will be placed"""
-        self.debug(f"destdir::getter={self._destdir}")
+        self.debug("destdir::getter=%s", self._destdir)
         return self._destdir
 
     @destdir.setter
     def destdir(self, value):
         """Setter for destination dir where the downloaded file will be placed"""
-        self.debug(f"destdir::setter={value}")
+        self.debug("destdir::setter=%s", value)
         if not os.path.exists(value):
             os.makedirs(value, exist_ok=True)
 
         self._destdir = value
 
+    @property
+    def destfile(self) -> str:
+        """Getter for the full path of the file once downloaded"""
+        value = os.path.join(self.destdir, os.path.basename(self.url))
+        self.debug("destfile::getter=%s", value)
+        return value
+
     @property
     def write_mode(self) -> str:
         """Getter for write mode ('wb' or 'w')"""
-        self.debug(f"write_mode::getter={self._write_mode}")
+        self.debug("write_mode::getter=%s", self._write_mode)
         return self._write_mode
 
     @write_mode.setter
     def write_mode(self, value: str):
         """Setter for write mode ('wb' or 'w')"""
         if value in ("w", "wb"):
-            self.debug(f"write_mode::setter={value}")
+            self.debug("write_mode::setter=%s", value)
             self._write_mode = value
         else:
             raise ValueError(f"Write Mode '{value}' not supported")
 
+    def load_resume_state(self, partfile: str) -> int:
+        """
+        Check if a previous download left a ``.part`` file with a
+        ``.part.json`` sidecar (the url and validators of the response that
+        created it). If so, restore the validators and return the size of
+        the ``.part`` file as the offset to resume from. Otherwise, remove
+        any stale partial data and return 0.
+        """
+        statefile = f"{partfile}.json"
+        offset = 0
+
+        if os.path.isfile(partfile) and os.path.isfile(statefile):
+            try:
+                with open(statefile, "r", encoding="utf8") as state_file:
+                    state = json.load(state_file)
+
+                if state.get("url") == self.url and (
+                    state.get("etag") or state.get("last_modified")
+                ):
+                    self.etag = state.get("etag")
+                    self.last_modified = state.get("last_modified")
+                    offset = os.path.getsize(partfile)
+
+            except (OSError, ValueError) as exc:
+                self.debug("load_resume_state::invalid=%s", exc)
+
+        if offset == 0:
+            for stale in (partfile, statefile):
+                if os.path.exists(stale):
+                    os.remove(stale)
+
+        self.debug("load_resume_state::offset=%s", offset)
+        return offset
+
+    def save_resume_state(self, partfile: str):
+        """
+        Write the ``.part.json`` sidecar with the url and validators,
+        so an interrupted download can be resumed by another process
+        """
+        if not self.etag and not self.last_modified:
+            return
+
+        statefile = f"{partfile}.json"
+        state = {
+            "url": self.url,
+            "etag": self.etag,
+            "last_modified": self.last_modified,
+        }
+        with open(statefile, "w", encoding="utf8") as state_file:
+            json.dump(state, state_file)
+
+        self.debug("save_resume_state::statefile=%s", statefile)
+
+    @profiled("AssetDownloader.download")
     def download(self, on_data: typing.Callable) -> str:
         """
         Download some zip release given its version and put it
         on a destination directory (default: OS temporary dir)
-        """
 
-        # Before the download the file stream,
-        # you can define some method to be called
-        # after the buffer is wrote
-        # it will need to be a local defined function
-        # because it will need a different behaviour
-        # for different assets.
-        # For example, a kboot.kfpkg will need a different
-        # to update different graphical definition (in app/screens)
-        # if compared to a zip file
-        def local_on_data(data: bytes):
-            self.buffer.write(data)
-            on_data(data)
-
-        setattr(self, "on_data", local_on_data)
-
-        # Now you can start the download process
-        self.download_file_stream(url=self.url)
-
-        # Once the data is downloaded, you can
-        # put it on a file
-        destfile = os.path.join(self.destdir, self.filename)
-        self.debug(f"download::destfile={destfile}")
-        self.debug(f"download::write::{self.write_mode}={self.buffer.getvalue()}")
-
-        # If its a binary file (a zip in our case)
-        # open the file in wb mode
-        if self.write_mode == "wb":
-            # pylint: disable=unspecified-encoding
-            with open(destfile, self.write_mode) as file:
-                file.write(self.buffer.getvalue())
-
-        # If its a text file (a txt or sig file in our case)
-        # open the file in w mode with utf8 encode
-        if self._write_mode == "w":
-            with open(destfile, self.write_mode, encoding="utf8") as file:
-                value = self.buffer.getvalue()
-                text = value.decode("utf8")
-                file.write(text)
+        Each chunk is written to a ``<destfile>.part`` file as soon as it
+        arrives, so the memory usage do not grow with the asset size. Once
+        the stream ends, the ``.part`` file is synced to disk and renamed
+        to its final name, so a crash never leaves a half-written asset
+        that could be mistaken for a complete one.
 
+        Binary assets are resumable: if the download is interrupted, the
+        ``.part`` file is kept alongside a ``.part.json`` file with the
+        server validators, and the next call will ask only for the
+        remaining bytes.
+        """
+        destfile = self.destfile
+        partfile = f"{destfile}.part"
+        statefile = f"{partfile}.json"
+        write_mode = self.write_mode
+        self.debug("download::destfile=%s", destfile)
+        self.debug("download::partfile=%s", partfile)
+
+        # Only binary files (a zip in our case) are resumed,
+        # text files are small enough to be downloaded again
+        offset = self.load_resume_state(partfile) if write_mode == "wb" else 0
+
+        # Text files (a txt or pem file in our case) are decoded
+        # incrementally, since a multi-byte utf8 char can be split
+        # between two chunks
+        decoder = codecs.getincrementaldecoder("utf8")()
+        state = {"saved": False}
+
+        try:
+            # If its a binary file (a zip in our case)
+            # open the file in wb mode (or ab if resuming),
+            # otherwise open the file in w mode with utf8 encode
+            if write_mode == "wb":
+                # pylint: disable=unspecified-encoding,consider-using-with
+                file = open(partfile, "ab" if offset > 0 else "wb")
+            else:
+                # pylint: disable=consider-using-with
+                file = open(partfile, write_mode, encoding="utf8")
+
+            with file:
+                # Before the download the file stream,
+                # you can define some method to be called
+                # after the chunk is wrote
+                # it will need to be a local defined function
+                # because it will need a different behaviour
+                # for different assets.
+                # For example, a kboot.kfpkg will need a different
+                # to update different graphical definition (in app/screens)
+                # if compared to a zip file
+                def local_on_data(data: bytes):
+                    if write_mode == "wb":
+                        if not state["saved"]:
+                            self.save_resume_state(partfile)
+                            state["saved"] = True
+                        file.write(data)
+                    else:
+                        file.write(decoder.decode(data))
+                    on_data(data)
+
+                # If the server do not honor the range request
+                # it will send the whole file again, so discard
+                # what was written until now
+                def local_on_restart():
+                    file.seek(0)
+                    file.truncate()
+                    decoder.reset()
+                    state["saved"] = False
+
+                setattr(self, "on_data", local_on_data)
+                setattr(self, "on_restart", local_on_restart)
+
+                # Now you can start the download process
+                self.download_file_stream(url=self.url, offset=offset)
+
+                if write_mode == "w":
+                    file.write(decoder.decode(b"", final=True))
+
+                # Ensure that data reached the disk
+                # before expose it with the final name
+                file.flush()
+                os.fsync(file.fileno())
+
+        except BaseException:
+            # Keep the partial data only if it can be resumed later
+            if not os.path.exists(statefile) and os.path.exists(partfile):
+                os.remove(partfile)
+            raise
+
+        os.replace(partfile, destfile)
+        if os.path.exists(statefile):
+            os.remove(statefile)
+        self.debug("download::replace=%s->%s", partfile, destfile)
         return destfile
@@ -42,20 +42,20 @@ class BaseDownloader(Trigger):
     @property
     def buffer(self) -> BytesIO:
         """Getter for the buffer of the file to be downloaded"""
-        self.debug(f"buffer::getter={self._buffer}")
+        self.debug("buffer::getter=%s", self._buffer)
         return self._buffer
 
     @property
     def url(self) -> str:
         """The asset's url to be downloaded"""
-        self.debug(f"url::getter={self._url}")
+        self.debug("url::getter=%s", self._url)
         return self._url
 
     @url.setter
     def url(self, value: str):
         """The asset's url to be downloaded"""
         if re.findall(BaseDownloader.REGEXP, value):
-            self.debug(f"url::setter={value}")
+            self.debug("url::setter=%s", value)
             self._url = value
         else:
             raise ValueError(f"Invalid url: {value}")
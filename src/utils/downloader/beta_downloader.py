@@ -58,14 +58,14 @@ class BetaDownloader(AssetDownloader):
     @property
     def device(self):
         """Getter for the device of beta version"""
-        self.debug(f"device::getter={self._device}")
+        self.debug("device::getter=%s", self._device)
         return self._device
 
     @device.setter
     def device(self, value: str):
         """Setter for the device of beta version"""
         if value in BetaDownloader.VALID_DEVICES:
-            self.debug(f"device::setter={value}")
+            self.debug("device::setter=%s", value)
             self._device = value
         else:
             raise ValueError(f"Invalid device {value}")
@@ -73,14 +73,14 @@ class BetaDownloader(AssetDownloader):
     @property
     def binary_type(self):
         """Getter for the binary_type of beta version to be downloaded (firmware or kboot)"""
-        self.debug(f"binary_type::getter={self._binary_type}")
+        self.debug("binary_type::getter=%s", self._binary_type)
         return self._binary_type
 
     @binary_type.setter
     def binary_type(self, value: str):
         """Setter for the binary_type of beta version to be downloaded (firmware or kboot)"""
         if value in BetaDownloader.VALID_BINARY_TYPES:
-            self.debug(f"binary::setter={value}")
+            self.debug("binary::setter=%s", value)
             self._binary_type = value
         else:
             raise ValueError(f"Invalid binary_type {value}")
@@ -0,0 +1,138 @@
+# The MIT License (MIT)
+
+# Copyright (c) 2021-2024 Krux contributors
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""
+release_bundle_downloader.py
+"""
+import tempfile
+from threading import Event, Lock
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_EXCEPTION
+import typing
+from .trigger_downloader import TriggerDownloader
+from .zip_downloader import ZipDownloader
+from .sha256_downloader import Sha256Downloader
+from .sig_downloader import SigDownloader
+from .pem_downloader import PemDownloader
+
+
+class ReleaseBundleDownloader(TriggerDownloader):
+    """
+    Download the set of assets needed to verify a release
+    (.zip, .zip.sha256.txt, .zip.sig and selfcustody.pem)
+    at the same time, reporting an aggregated progress
+    """
+
+    def __init__(self, version: str, destdir: str = tempfile.gettempdir()):
+        self._assets = (
+            ZipDownloader(version=version, destdir=destdir),
+            Sha256Downloader(version=version, destdir=destdir),
+            SigDownloader(version=version, destdir=destdir),
+            PemDownloader(destdir=destdir),
+        )
+        super().__init__(url=self._assets[0].url)
+        self._destdir = destdir
+        self._lock = Lock()
+
+    @property
+    def assets(self) -> tuple:
+        """Getter for the asset downloaders of the bundle"""
+        self.debug("assets::getter=%s", self._assets)
+        return self._assets
+
+    @property
+    def destdir(self) -> str:
+        """Getter for destination dir where the downloaded files will be placed"""
+        self.debug("destdir::getter=%s", self._destdir)
+        return self._destdir
+
+    @property
+    def destfiles(self) -> typing.List[str]:
+        """Getter for the full paths of the assets once downloaded"""
+        value = [asset.destfile for asset in self._assets]
+        self.debug("destfiles::getter=%s", value)
+        return value
+
+    @property
+    def content_len(self) -> int:
+        """
+        Getter for the sum of content's length of all assets, or 0 while
+        the length of any of them isn't known yet (a partial sum would
+        let the small assets alone reach 100%)
+        """
+        # pylint: disable=protected-access
+        lens = [asset._content_len for asset in self._assets]
+        value = sum(lens) if all(lens) else 0
+        self.debug("content_len::getter=%s", value)
+        return value
+
+    @property
+    def downloaded_len(self) -> int:
+        """
+        Getter for the sum of downloaded data of all assets whose content's
+        length is known (before it, a resumed zip only have its offset).
+        Text assets could be served compressed, so each one is limited
+        to its content's length
+        """
+        # pylint: disable=protected-access
+        value = sum(
+            min(asset._downloaded_len, asset._content_len) for asset in self._assets
+        )
+        self.debug("downloaded_len::getter=%s", value)
+        return value
+
+    def download(self, on_data: typing.Callable) -> list[str]:
+        """
+        Download all assets in parallel threads and return their paths
+        (in the same order of :attr:`assets`) once all of them finished.
+
+        :attr:`on_data` is called for each chunk of any asset, but never
+        at the same time, so it can read :attr:`downloaded_len` and
+        :attr:`content_len` safely. If one asset fails, the others are
+        aborted and the first error is raised.
+        """
+        aborted = Event()
+
+        def on_asset_data(data: bytes):
+            if aborted.is_set():
+                raise RuntimeError("Release bundle download aborted")
+            with self._lock:
+                on_data(data)
+
+        with ThreadPoolExecutor(
+            max_workers=len(self._assets), thread_name_prefix="ReleaseBundle"
+        ) as executor:
+            futures = [
+                executor.submit(asset.download, on_data=on_asset_data)
+                for asset in self._assets
+            ]
+            done, _ = wait(futures, return_when=FIRST_EXCEPTION)
+            errors = [f.exception() for f in done if f.exception() is not None]
+
+            if errors:
+                aborted.set()
+
+        if errors:
+            self.error("download::error=%s", errors[0])
+            raise errors[0]
+
+        destfiles = [f.result() for f in futures]
+        self.debug("download::destfiles=%s", destfiles)
+        return destfiles
@@ -23,8 +23,10 @@
 stream_downloader.py
 """
 import os
+import re
 import time
 import requests
+from ..session import get_session
 from .trigger_downloader import TriggerDownloader
 
 
@@ -33,7 +35,73 @@ class StreamDownloader(TriggerDownloader):
     Download files in a stream mode
     """
 
-    def download_file_stream(self, url: str, max_retries: int = 5):
+    def __init__(self, url: str):
+        super().__init__(url=url)
+        self._etag = None
+        self._last_modified = None
+
+    @property
+    def etag(self) -> str | None:
+        """Getter for the ETag validator of the last response"""
+        self.debug("etag::getter=%s", self._etag)
+        return self._etag
+
+    @etag.setter
+    def etag(self, value: str | None):
+        """Setter for the ETag validator of the last response"""
+        self.debug("etag::setter=%s", value)
+        self._etag = value
+
+    @property
+    def last_modified(self) -> str | None:
+        """Getter for the Last-Modified validator of the last response"""
+        self.debug("last_modified::getter=%s", self._last_modified)
+        return self._last_modified
+
+    @last_modified.setter
+    def last_modified(self, value: str | None):
+        """Setter for the Last-Modified validator of the last response"""
+        self.debug("last_modified::setter=%s", value)
+        self._last_modified = value
+
+    def make_headers(self) -> dict:
+        """
+        Build the request headers. When some data was already received
+        (:attr:`downloaded_len` > 0), ask only for the remaining bytes
+        with a `Range` header and, if a validator is known, an `If-Range`
+        header, so the server send the whole file again if it changed.
+        """
+        headers = {
+            "Content-Disposition": f"attachment filename={self.filename}",
+            "Connection": "keep-alive",
+            "Cache-Control": "max-age=0",
+            "Accept-Encoding": "gzip, deflate, br",
+        }
+
+        offset = self.downloaded_len
+        if offset > 0:
+            # byte ranges only make sense over the raw representation
+            headers["Accept-Encoding"] = "identity"
+            headers["Range"] = f"bytes={offset}-"
+            validator = self.etag or self.last_modified
+            if validator:
+                headers["If-Range"] = validator
+
+        return headers
+
+    def wait_retry(self, reason: str, retry_count: int, max_retries: int):
+        """Exponential backoff: 2, 4, 8, 16, 32 seconds"""
+        wait_time = 2 ** (retry_count + 1)
+        self.debug(
+            "%s. Retrying in %ss (attempt %s/%s)",
+            reason,
+            wait_time,
+            retry_count + 1,
+            max_retries,
+        )
+        time.sleep(wait_time)
+
+    def download_file_stream(self, url: str, max_retries: int = 5, offset: int = 0):
         """
         Given a :attr:`url`, download a large file in a streaming manner to given
         destination folder (:attr: `dest_dir`)
@@ -42,78 +110,133 @@ class StreamDownloader(TriggerDownloader):
         some information with :attr:`on_data` as function (total_len, downloaded_len, start_time)
         until reaches the 100%.
 
-        Then return the name
+        If the connection drops, times out or is rate limited, the request is
+        retried (up to :attr:`max_retries` times) from the last received byte.
+        An :attr:`offset` can be given to resume a download started by a
+        previous process. If the server do not honor the `Range` request,
+        the download restart from zero and :attr:`on_restart`, if defined,
+        is called, so the caller can discard the data already received.
         """
         # Get the filename by url and construct the request
         # Check for any HTTPError and then process chunks of data
+        self.filename = os.path.basename(url)
+        self.debug("download_file_stream::filename=%s", self.filename)
+        self.downloaded_len = offset
         retry_count = 0
-        last_exception = None
 
-        while retry_count <= max_retries:
+        while True:
+            res = None
             try:
-                self.filename = os.path.basename(url)
-                self.debug(f"download_file_stream::filename={self.filename}")
-
-                headers = {
-                    "Content-Disposition": f"attachment filename={self.filename}",
-                    "Connection": "keep-alive",
-                    "Cache-Control": "max-age=0",
-                    "Accept-Encoding": "gzip, deflate, br",
-                }
+                headers = self.make_headers()
                 self.debug(
-                    "download_file_stream::requests.get=< url: "
-                    + f"{url}, stream: True, headers: {headers}, timeout: 30 >"
+                    "download_file_stream::session.get=< url: "
+                    "%s, stream: True, headers: %s, timeout: 30 >",
+                    url,
+                    headers,
+                )
+                res = get_session().get(
+                    url=url, stream=True, headers=headers, timeout=30
                 )
-                res = requests.get(url=url, stream=True, headers=headers, timeout=30)
 
                 self.debug("download_file_stream::raise_for_status")
                 res.raise_for_status()
 
-                # If we get here, request was successful, break the retry loop
+                self.read_stream(url=url, res=res)
+
+                # If we get here, all data was received, break the retry loop
                 break
 
             except requests.exceptions.Timeout as t_exc:
-                raise RuntimeError(
-                    f"Download timeout error: {t_exc.__cause__ }"
-                ) from t_exc
-
-            except requests.exceptions.ConnectionError as c_exc:
-                raise RuntimeError(
-                    f"Download connection error: {c_exc.__cause__}"
-                ) from c_exc
+                if retry_count >= max_retries:
+                    raise RuntimeError(
+                        f"Download timeout error: {t_exc.__cause__ }"
+                    ) from t_exc
+                self.wait_retry("Timeout", retry_count, max_retries)
+                retry_count += 1
+
+            except (
+                requests.exceptions.ConnectionError,
+                requests.exceptions.ChunkedEncodingError,
+            ) as c_exc:
+                if retry_count >= max_retries:
+                    raise RuntimeError(
+                        f"Download connection error: {c_exc.__cause__}"
+                    ) from c_exc
+                self.wait_retry("Connection error", retry_count, max_retries)
+                retry_count += 1
 
             except requests.exceptions.HTTPError as h_exc:
                 # Check if it's a 429 rate limit error
                 if res.status_code == 429 and retry_count < max_retries:
-                    # Exponential backoff: 2, 4, 8, 16, 32 seconds
-                    wait_time = 2 ** (retry_count + 1)
-                    self.debug(
-                        f"Rate limited (429). Retrying in {wait_time}s "
-                        f"(attempt {retry_count + 1}/{max_retries})"
-                    )
-                    time.sleep(wait_time)
+                    self.wait_retry("Rate limited (429)", retry_count, max_retries)
+                    retry_count += 1
+                    continue
+
+                # The partial data do not fit on remote file anymore
+                # so restart from zero
+                if (
+                    res.status_code == 416
+                    and self.downloaded_len > 0
+                    and retry_count < max_retries
+                ):
+                    self.restart()
                     retry_count += 1
-                    last_exception = h_exc
                     continue
+
                 raise RuntimeError(
                     f"HTTP error {res.status_code}: {h_exc.__cause__}"
                 ) from h_exc
 
-        # If we exhausted all retries, raise the last exception
-        if retry_count > max_retries and last_exception:
-            raise RuntimeError(
-                f"HTTP error {res.status_code}: Failed after {max_retries} retries"
-            ) from last_exception
+            finally:
+                if res is not None:
+                    # Now you can close connection
+                    self.debug("downloaded_file_stream::closing_connection")
+                    res.close()
+
+    def restart(self):
+        """Discard what was downloaded and call :attr:`on_restart`, if defined"""
+        self.debug("download_file_stream::restart")
+        self.downloaded_len = 0
+        on_restart = getattr(self, "on_restart", None)
+        if on_restart is not None:
+            # pylint: disable=not-callable
+            on_restart()
 
-        # get some contents to calculate the amount
-        # of downloaded data
+    def read_stream(self, url: str, res: requests.Response):
+        """Read the content length, validators and chunks of a successful response"""
         content_len = res.headers.get("Content-Length")
-        if content_len:
-            self.content_len = int(content_len)
+
+        # 206 Partial Content: the server will continue from the
+        # requested offset, the total length comes on Content-Range
+        # (bytes <start>-<end>/<total>)
+        if res.status_code == 206:
+            content_range = res.headers.get("Content-Range", "")
+            total = re.findall(r"/(\d+)$", content_range)
+            if total:
+                self.content_len = int(total[0])
+            elif content_len:
+                self.content_len = self.downloaded_len + int(content_len)
+            else:
+                raise RuntimeError(f"Empty Content-Length response for {url}")
+
         else:
-            raise RuntimeError(f"Empty Content-Length response for {url}")
+            # The server ignored the range (or the file changed)
+            # and is sending the whole file again
+            if self.downloaded_len > 0:
+                self.restart()
 
-        self.debug(f"download_file_stream::content_len={self.content_len}")
+            # get some contents to calculate the amount
+            # of downloaded data
+            if content_len:
+                self.content_len = int(content_len)
+            else:
+                raise RuntimeError(f"Empty Content-Length response for {url}")
+
+        self.debug("download_file_stream::content_len=%s", self.content_len)
+
+        # Keep validators to be used as If-Range on next attempts
+        self.etag = res.headers.get("ETag", self.etag)
+        self.last_modified = res.headers.get("Last-Modified", self.last_modified)
 
         # Get the chunks of bytes data
         # and pass it to a post-processing
@@ -122,12 +245,7 @@ class StreamDownloader(TriggerDownloader):
 
         for chunk in res.iter_content(chunk_size=self.chunk_size):
             self.downloaded_len += len(chunk)
-            self.debug(f"download_file_stream::downloaded_len={self.downloaded_len}")
+            self.debug("download_file_stream::downloaded_len=%s", self.downloaded_len)
 
             # pylint: disable=not-callable
             on_data(data=chunk)
-
-            # Now you can close connection
-            self.debug("downloaded_file_stream::closing_connection")
-
-        res.close()
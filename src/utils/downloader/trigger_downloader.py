@@ -40,43 +40,43 @@ class TriggerDownloader(BaseDownloader):
     @property
     def content_len(self) -> int:
         """Getter for the content's length of the file to be downloaded"""
-        self.debug(f"content_len::getter={self._content_len}")
+        self.debug("content_len::getter=%s", self._content_len)
         return self._content_len
 
     @content_len.setter
     def content_len(self, value: int):
         """Setter for the content's length of the file to be downloaded"""
         self._content_len = value
-        self.debug(f"content_len::setter={value}")
+        self.debug("content_len::setter=%s", value)
 
     @property
     def filename(self) -> str:
         """Getter for the downloaded filename"""
-        self.debug(f"filename::getter={self._filename}")
+        self.debug("filename::getter=%s", self._filename)
         return self._filename
 
     @filename.setter
     def filename(self, value: str):
         """Setter for the downloaded filename"""
         self._filename = value
-        self.debug(f"filename::setter={self._filename}")
+        self.debug("filename::setter=%s", self._filename)
 
     @property
     def downloaded_len(self) -> int:
         """Getter for the ammount of downloaded data"""
-        self.debug(f"downloaded_len::getter={self._downloaded_len}")
+        self.debug("downloaded_len::getter=%s", self._downloaded_len)
         return self._downloaded_len
 
     @downloaded_len.setter
     def downloaded_len(self, value: int):
         """Setter for the ammount of downloaded data"""
         self._downloaded_len = value
-        self.debug(f"downloaded_len:setter={self._downloaded_len}")
+        self.debug("downloaded_len:setter=%s", self._downloaded_len)
 
     @property
     def chunk_size(self) -> int:
         """Getter for the size of chunks on downloaded data"""
-        self.debug(f"chunk_size::getter={self._chunk_size}")
+        self.debug("chunk_size::getter=%s", self._chunk_size)
         return self._chunk_size
 
     @chunk_size.setter
@@ -86,7 +86,7 @@ class TriggerDownloader(BaseDownloader):
         # see
         # https://stackoverflow.com/questions/57025836/how-to-check-if-a-given-number-is-a-power-of-two#57025941
         if (value & (value - 1) == 0) and value != 0:
-            self.debug(f"chunk_size::setter={value}")
+            self.debug("chunk_size::setter=%s", value)
             self._chunk_size = value
         else:
             raise ValueError(f"{value} isnt a power of 2")
@@ -25,3 +25,6 @@ __init__.py
 
 from .flasher import Flasher
 from .wiper import Wiper
+from .batch_flasher import BatchFlasher
+from .engine import FlashEngine, FlashEvent
+from .flash_metrics import FlashMetrics
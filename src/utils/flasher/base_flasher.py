@@ -23,10 +23,9 @@
 base_flasher.py
 """
 import os
-from serial import Serial
-from serial.serialutil import SerialException
-from serial.tools import list_ports
+import typing
 from src.utils.trigger import Trigger
+from src.utils.ports import get_port_discovery
 from src.utils.kboot.build.ktool import KTool
 
 
@@ -82,9 +81,19 @@ class BaseFlasher(Trigger):
         "embed_fire": "dan",
     }
 
+    # Device to max baudrate mapping (devices not listed accept any valid baudrate)
+    DEVICE_MAX_BAUDRATE = {
+        "embed_fire": 400000,
+    }
+
+    # Slowest baudrate tried by adaptive flash, since below it a
+    # flash takes longer than a restart at a known good baudrate
+    MIN_ADAPTIVE_BAUDRATE = 115200
+
     def __init__(self):
         super().__init__()
         self.ktool = KTool()
+        self.device = None
         self.stop_thread = False
         self.print_callback = None
         self._firmware = None
@@ -102,7 +111,7 @@ class BaseFlasher(Trigger):
         """Set firmware file path with validation"""
         if not os.path.exists(value):
             raise ValueError(f"File does not exist: {value}")
-        self.debug(f"firmware::setter={value}")
+        self.debug("firmware::setter=%s", value)
         self._firmware = value
 
     @property
@@ -116,9 +125,9 @@ class BaseFlasher(Trigger):
         if (vid := self.DEVICE_VID_MAP.get(device)) is None:
             raise ValueError(f"Device not implemented: {device}")
 
-        self._available_ports_generator = list_ports.grep(vid)
+        self._available_ports_generator = get_port_discovery().grep(vid)
         self._port = next(self._available_ports_generator).device
-        self.debug(f"port::setter={self._port} (from device {device})")
+        self.debug("port::setter=%s (from device %s)", self._port, device)
 
     @property
     def board(self) -> str:
@@ -131,7 +140,7 @@ class BaseFlasher(Trigger):
         if (board := self.DEVICE_BOARD_MAP.get(device)) is None:
             raise ValueError(f"Device not implemented: {device}")
         self._board = board
-        self.debug(f"board::setter={self._board} (from device {device})")
+        self.debug("board::setter=%s (from device %s)", self._board, device)
 
     @property
     def baudrate(self) -> int:
@@ -143,7 +152,7 @@ class BaseFlasher(Trigger):
         """Set baudrate with validation"""
         if value not in self.VALID_BAUDRATES:
             raise ValueError(f"Invalid baudrate: {value}")
-        self.debug(f"baudrate::setter={value}")
+        self.debug("baudrate::setter=%s", value)
         self._baudrate = value
 
     def set_device(self, device: str) -> None:
@@ -156,13 +165,39 @@ class BaseFlasher(Trigger):
         """
         self.port = device
         self.board = device
+        self.device = device
 
-        # Enforce baudrate limit for embed_fire
-        if device == "embed_fire" and self.baudrate and self.baudrate > 400000:
+        # Enforce device-specific baudrate limit (e.g., embed_fire)
+        limit = self.DEVICE_MAX_BAUDRATE.get(device)
+        if limit and self.baudrate and self.baudrate > limit:
             self.debug(
-                f"baudrate {self.baudrate} exceeds embed_fire limit, capping at 400000"
+                "baudrate %s exceeds %s limit, capping at %s",
+                self.baudrate,
+                device,
+                limit,
             )
-            self.baudrate = 400000
+            self.baudrate = limit
+
+    @property
+    def baudrate_key(self) -> str:
+        """Key to remember the best baudrate of a device on a port"""
+        return f"{self.device}@{self.port}".lower()
+
+    def baudrate_ladder(self, start: int | None = None) -> typing.Tuple[int, ...]:
+        """
+        Baudrates to be tried by adaptive flash, from the fastest one
+        (or `start`, a remembered good one) down to the slowest
+        allowed, respecting the device's limit
+        """
+        limit = self.DEVICE_MAX_BAUDRATE.get(self.device, self.VALID_BAUDRATES[-1])
+        if start is not None:
+            limit = min(limit, start)
+
+        return tuple(
+            baudrate
+            for baudrate in reversed(self.VALID_BAUDRATES)
+            if self.MIN_ADAPTIVE_BAUDRATE <= baudrate <= limit
+        )
 
     def _log_error(self, message: str) -> None:
         """
@@ -174,10 +209,5 @@ class BaseFlasher(Trigger):
         self.ktool.__class__.log(message)
 
     def is_port_working(self, port: str) -> bool:
-        """Check if a port is working"""
-        try:
-            with Serial(port):
-                pass  # Connection successful
-            return True
-        except SerialException:
-            return False
+        """Check if a port is working (can be opened within the probe timeout)"""
+        return get_port_discovery().probe_port(port)
@@ -0,0 +1,243 @@
+# The MIT License (MIT)
+
+# Copyright (c) 2021-2024 Krux contributors
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""
+batch_flasher.py
+"""
+import os
+import threading
+import typing
+from collections.abc import Callable
+from src.utils.trigger import Trigger
+from src.utils.cache import FlashLedger
+from src.utils.ports import get_port_discovery
+from src.utils.selector import VALID_DEVICES
+from src.utils.verifyer import HashEngine
+from src.utils.flasher.base_flasher import BaseFlasher
+from src.utils.flasher.engine import FlashEngine, FlashEvent
+
+
+class BatchFlasher(Trigger):
+    """
+    Flash the same kboot.kfpkg on every serial port that match
+    the device's VID, with one :class:`FlashEngine` (and its own KTool)
+    per port running in its own thread.
+
+    Each port have its own state (status, percent, log and error),
+    available at :attr:`states` while flashing and summarized
+    with :meth:`summary` when done.
+
+    With a :class:`FlashLedger`, flashed devices are recorded and, if
+    `trust_ledger` is set, the devices it knows already run the same
+    firmware are skipped (and counted as passed).
+    """
+
+    PENDING = "pending"
+    FLASHING = "flashing"
+    PASSED = "passed"
+    SKIPPED = "skipped"
+    FAILED = "failed"
+
+    def __init__(
+        self,
+        firmware: str,
+        baudrate: int,
+        device: str | None = None,
+        *,
+        ledger: FlashLedger | None = None,
+        trust_ledger: bool = False,
+    ):
+        super().__init__()
+        self.firmware = firmware
+        self.baudrate = baudrate
+        self.device = device
+        self.ledger = ledger
+        self.trust_ledger = trust_ledger
+        self.digest = None
+        self.states = {}
+        self._lock = threading.Lock()
+
+    @property
+    def firmware(self) -> str:
+        """Firmware file path shared by all ports"""
+        self.debug("firmware::getter=%s", self._firmware)
+        return self._firmware
+
+    @firmware.setter
+    def firmware(self, value: str):
+        """Set firmware file path with validation"""
+        if not os.path.exists(value):
+            raise ValueError(f"File does not exist: {value}")
+        self.debug("firmware::setter=%s", value)
+        self._firmware = value
+
+    @property
+    def baudrate(self) -> int:
+        """Baudrate shared by all ports"""
+        self.debug("baudrate::getter=%s", self._baudrate)
+        return self._baudrate
+
+    @baudrate.setter
+    def baudrate(self, value: int):
+        """Set baudrate with validation"""
+        if value not in BaseFlasher.VALID_BAUDRATES:
+            raise ValueError(f"Invalid baudrate: {value}")
+        self.debug("baudrate::setter=%s", value)
+        self._baudrate = value
+
+    @property
+    def device(self) -> str:
+        """Device name (e.g., 'amigo', 'dock'), detected from firmware if not given"""
+        self.debug("device::getter=%s", self._device)
+        return self._device
+
+    @device.setter
+    def device(self, value: str | None):
+        """Set device name, or detect it from firmware path"""
+        if value is None:
+            value = next((d for d in VALID_DEVICES if d in self.firmware), None)
+
+        if value not in BaseFlasher.DEVICE_VID_MAP:
+            raise ValueError(f"Device not implemented: {value}")
+
+        self.debug("device::setter=%s", value)
+        self._device = value
+
+    def find_ports(self) -> typing.List[str]:
+        """List all serial ports that match the device's VID"""
+        vid = BaseFlasher.DEVICE_VID_MAP[self.device]
+        ports = [p.device for p in get_port_discovery().ports(vid, refresh=True)]
+        self.debug("find_ports=%s", ports)
+        return ports
+
+    def update_state(self, port: str, event: FlashEvent):
+        """Update the state of a port with an event of its engine"""
+        with self._lock:
+            state = self.states[port]
+
+            if event.stage == "start":
+                state["status"] = BatchFlasher.FLASHING
+
+            elif event.stage == "log":
+                state["log"].append(event.message)
+
+            elif event.stage == "done":
+                state["status"] = BatchFlasher.PASSED
+                state["percent"] = 100.0
+
+            elif event.stage == "skipped":
+                state["status"] = BatchFlasher.SKIPPED
+                state["percent"] = 100.0
+
+            elif event.stage == "failed":
+                state["status"] = BatchFlasher.FAILED
+                state["error"] = event.message
+
+            else:
+                state["percent"] = event.percent
+
+    def flash_port(self, port: str, on_event: Callable | None = None):
+        """
+        Flash a single port with its own :class:`FlashEngine`;
+        any failure is recorded in its state instead of being
+        raised, so it won't stop the other ports
+        """
+        try:
+            engine = FlashEngine(
+                device=self.device,
+                port=port,
+                baudrate=self.baudrate,
+                firmware=self.firmware,
+                ledger=self.ledger,
+                trust_ledger=self.trust_ledger,
+                digest=self.digest,
+            )
+            events = engine.flash()
+
+        except ValueError as exc:
+            events = [FlashEvent(port, "failed", message=str(exc))]
+
+        for event in events:
+            self.update_state(port, event)
+            if on_event is not None:
+                on_event(event)
+
+    def flash(
+        self,
+        on_event: Callable | None = None,
+        ports: typing.List[str] | None = None,
+    ) -> typing.List[typing.Dict[str, typing.Any]]:
+        """
+        Flash all ports at once and wait for them.
+
+        Args:
+            on_event: called with each :class:`FlashEvent` of each port
+            ports: ports to be flashed (default: :meth:`find_ports`)
+
+        Return the per-port pass/fail summary
+        """
+        ports = self.find_ports() if ports is None else ports
+        if not ports:
+            raise RuntimeError(f"No ports found for device {self.device}")
+
+        # hash the firmware once, instead of once per port
+        if self.ledger is not None and self.digest is None:
+            self.digest = HashEngine().hash_file(self.firmware).hexdigest()
+
+        self.states = {
+            port: {
+                "status": BatchFlasher.PENDING,
+                "percent": 0.0,
+                "log": [],
+                "error": None,
+            }
+            for port in ports
+        }
+
+        threads = [
+            threading.Thread(
+                name=port, target=self.flash_port, args=(port, on_event), daemon=True
+            )
+            for port in ports
+        ]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        return self.summary()
+
+    def summary(self) -> typing.List[typing.Dict[str, typing.Any]]:
+        """Pass/fail result of each port"""
+        with self._lock:
+            return [
+                {
+                    "port": port,
+                    "device": self.device,
+                    "ok": state["status"]
+                    in (BatchFlasher.PASSED, BatchFlasher.SKIPPED),
+                    "status": state["status"],
+                    "error": state["error"],
+                }
+                for port, state in self.states.items()
+            ]
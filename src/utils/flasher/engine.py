@@ -0,0 +1,311 @@
+# The MIT License (MIT)
+
+# Copyright (c) 2021-2024 Krux contributors
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""
+engine.py
+
+Headless flash/wipe engine: no kivy, no screens. It takes device, port,
+baudrate and firmware explicitly and stream what KTool is doing as
+:class:`FlashEvent` items of an iterator:
+
+    for event in FlashEngine(device="amigo", port="/dev/ttyUSB0",
+                             baudrate=1500000, firmware="kboot.kfpkg").flash():
+        print(event.stage, event.percent, event.rate)
+"""
+import re
+import queue
+import threading
+import typing
+from src.utils.trigger import Trigger
+from src.utils.cache import FlashLedger
+from src.utils.ports import get_port_discovery
+from src.utils.verifyer import HashEngine
+from src.utils.kboot.build.ktool import KTool
+from src.utils.flasher.base_flasher import BaseFlasher
+from src.utils.flasher.flasher import Flasher
+from src.utils.flasher.wiper import Wiper
+
+RATE_REGEX = re.compile(r"(\d+(?:\.\d+)?)\s*([kKMG]?)i?B/s")
+RATE_UNITS = {"": 1, "k": 1024, "K": 1024, "M": 1024**2, "G": 1024**3}
+
+# KTool prints through a class level callback, shared by all instances;
+# each engine register its own callback to the thread where KTool runs
+_routes = {}
+_routes_lock = threading.Lock()
+
+
+def route_print(*args, **kwargs):
+    """Forward a KTool print to the engine running in the current thread"""
+    # pylint: disable=unused-argument
+    with _routes_lock:
+        callback = _routes.get(threading.get_ident())
+
+    if callback is not None:
+        callback(" ".join(str(x) for x in args))
+
+
+def parse_rate(suffix: str) -> float | None:
+    """Parse a KTool speed suffix (e.g. '95.37 KiB/s') into bytes/sec"""
+    match = RATE_REGEX.search(suffix or "")
+    if match is None:
+        return None
+    return float(match.group(1)) * RATE_UNITS[match.group(2)]
+
+
+class FlashEvent(typing.NamedTuple):
+    """
+    Something that happened while flashing or wiping a port:
+
+    - stage: "start", "log", the KTool's file type being written
+      (e.g. "firmware"), "done", "skipped" or "failed"
+    - percent: progress of the stage
+    - rate: bytes/sec, when KTool reported it
+    - message: a KTool output line or an error
+    """
+
+    port: str
+    stage: str
+    percent: float = 0.0
+    rate: float | None = None
+    message: str | None = None
+
+    def to_dict(self) -> dict:
+        """Serializable form (e.g. to be printed as JSON)"""
+        return {
+            "port": self.port,
+            "stage": self.stage,
+            "percent": self.percent,
+            "rate": self.rate,
+            "message": self.message,
+        }
+
+
+class FlashEngine(Trigger):
+    """
+    Flash or wipe a single device on a given port, without
+    depending on screens, class level setattr or threading.excepthook.
+
+    With a :class:`FlashLedger`, each flashed device is recorded with the
+    sha256 of its firmware, and each wiped one is forgotten. Only when
+    `trust_ledger` is set, a device that the ledger says already runs the
+    same firmware is skipped, without entering the ISP mode: the device
+    itself can't be asked, so it's only right if nothing else flashed it.
+
+    Engines on different ports flash at the same time, but wipes run one
+    at a time in the whole process (see :meth:`Wiper._erase_with_port`)
+    """
+
+    def __init__(
+        self,
+        device: str,
+        port: str,
+        baudrate: int,
+        firmware: str | None = None,
+        *,
+        ledger: FlashLedger | None = None,
+        trust_ledger: bool = False,
+        digest: str | None = None,
+    ):
+        super().__init__()
+        if device not in BaseFlasher.DEVICE_BOARD_MAP:
+            raise ValueError(f"Device not implemented: {device}")
+
+        self.device = device
+        self.port = port
+        self.baudrate = baudrate
+        self.firmware = firmware
+        self.ledger = ledger
+        self.trust_ledger = trust_ledger
+        self.digest = digest
+
+    @property
+    def digest(self) -> str | None:
+        """sha256 of the firmware, computed once when needed by the ledger"""
+        if self._digest is None and self.ledger is not None and self.firmware:
+            self._digest = HashEngine().hash_file(self.firmware).hexdigest()
+
+        self.debug("digest::getter=%s", self._digest)
+        return self._digest
+
+    @digest.setter
+    def digest(self, value: str | None):
+        """Setter for sha256 of the firmware"""
+        self.debug("digest::setter=%s", value)
+        self._digest = value
+
+    @property
+    def ledger_key(self) -> str | None:
+        """Key of the device in the ledger, if it can be identified"""
+        if self.ledger is None:
+            return None
+        return FlashLedger.make_key(get_port_discovery().lookup(self.port))
+
+    def make_flasher(self) -> Flasher:
+        """Create a :class:`Flasher` to the device, without port discovery"""
+        if self.firmware is None:
+            raise ValueError("A firmware is needed to flash")
+
+        flasher = Flasher()
+        flasher.firmware = self.firmware
+        flasher.baudrate = self.baudrate
+        flasher.board = self.device
+        return flasher
+
+    def make_wiper(self) -> Wiper:
+        """Create a :class:`Wiper` to the device, without port discovery"""
+        wiper = Wiper()
+        wiper.baudrate = self.baudrate
+        wiper.board = self.device
+        return wiper
+
+    def flash(self) -> typing.Iterator[FlashEvent]:
+        """
+        Flash the firmware, yielding its events; if the ledger is
+        trusted and knows the device already runs it, yield a
+        "skipped" event
+        """
+        flasher = self.make_flasher()
+        key = self.ledger_key
+
+        if (
+            key is not None
+            and self.trust_ledger
+            and self.ledger.is_flashed(key, self.digest)
+        ):
+            self.info("%s: firmware unchanged on %s", self.port, key)
+            return iter(
+                [
+                    FlashEvent(self.port, "start"),
+                    FlashEvent(
+                        self.port,
+                        "skipped",
+                        100.0,
+                        message=f"Firmware unchanged on {key}",
+                    ),
+                ]
+            )
+
+        # a failed flash leaves an unknown firmware on the device
+        if key is not None:
+            self.ledger.forget(key)
+            self.ledger.save()
+
+        # pylint: disable=protected-access
+        def target(callback):
+            flasher._flash_with_port(self.port, callback)
+
+        def on_done():
+            self.ledger.record(key, self.digest, device=self.device, port=self.port)
+            self.ledger.save()
+
+        return self.run(flasher, target, on_done if key is not None else None)
+
+    def wipe(self) -> typing.Iterator[FlashEvent]:
+        """
+        Erase the device, yielding its events. KTool only erases through
+        sys.argv, so a wipe waits for any other wipe of this process
+        """
+        wiper = self.make_wiper()
+        key = self.ledger_key
+
+        # pylint: disable=protected-access,unused-argument
+        def target(callback):
+            wiper._erase_with_port(self.port)
+
+        def on_done():
+            self.ledger.forget(key)
+            self.ledger.save()
+
+        return self.run(wiper, target, on_done if key is not None else None)
+
+    def run(
+        self,
+        base: BaseFlasher,
+        target: typing.Callable,
+        on_done: typing.Callable | None = None,
+    ) -> typing.Iterator[FlashEvent]:
+        """
+        Run `target(callback)` in a worker thread, yielding the events
+        it produces until it is done or failed. Failures are yielded
+        as a "failed" event instead of raised. If given, `on_done()`
+        is called in the worker once the target succeeded
+        """
+        events = queue.Queue()
+        fail = {}
+        last = {}
+
+        def on_print(text: str):
+            self.info("%s: %s", self.port, text)
+            events.put(FlashEvent(self.port, "log", message=text))
+
+            if "Greeting fail" in text:
+                fail["message"] = text
+                base.ktool.kill()
+                base.ktool.checkKillExit()
+
+        def on_process(file_type: str, iteration: int, total: int, suffix: str):
+            percent = (iteration / total) * 100
+
+            # only report when percent changes, to not flood the consumer
+            if last.get(file_type) != int(percent):
+                last[file_type] = int(percent)
+                events.put(
+                    FlashEvent(self.port, file_type, percent, parse_rate(suffix))
+                )
+
+        def worker():
+            with _routes_lock:
+                _routes[threading.get_ident()] = on_print
+
+            try:
+                if not base.is_port_working(self.port):
+                    raise RuntimeError(f"Port {self.port} not working")
+
+                target(on_process)
+                if on_done is not None:
+                    try:
+                        on_done()
+                    except OSError as exc:
+                        self.warning("%s: %s", self.port, exc)
+                events.put(FlashEvent(self.port, "done", 100.0))
+
+            # pylint: disable=broad-exception-caught
+            except Exception as exc:
+                message = fail.get("message") or str(exc) or exc.__class__.__name__
+                self.error("%s: %s", self.port, message)
+                events.put(FlashEvent(self.port, "failed", message=message))
+
+            finally:
+                with _routes_lock:
+                    del _routes[threading.get_ident()]
+                events.put(None)
+
+        KTool.print_callback = route_print
+        thread = threading.Thread(name=self.port, target=worker, daemon=True)
+
+        def stream():
+            yield FlashEvent(self.port, "start")
+            thread.start()
+            while (event := events.get()) is not None:
+                yield event
+            thread.join()
+
+        return stream()
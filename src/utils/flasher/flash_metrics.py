@@ -0,0 +1,192 @@
+# The MIT License (MIT)
+
+# Copyright (c) 2021-2024 Krux contributors
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""
+flash_metrics.py
+"""
+import os
+import re
+import json
+import time
+import typing
+import zipfile
+from src.utils.trigger import Trigger
+from src.utils.flasher.engine import parse_rate
+
+ANSI_REGEX = re.compile(r"\x1b\[[0-9;]*m")
+
+
+class FlashMetrics(Trigger):
+    """
+    Record how long each stage of a flash takes, and the effective
+    bytes/sec of the programming stage against the configured baudrate,
+    by following what KTool prints and reports as progress.
+
+    Each flash is appended as a JSON line to :attr:`metrics_file`, so
+    different baudrates, boards, cables and hubs can be compared later.
+    """
+
+    FILENAME = "flash-metrics.jsonl"
+
+    # Stages, in the order they happen, and the KTool outputs that start them.
+    # Since a line may match more than one stage (e.g. "Greeting Message
+    # Detected, Start Downloading ISP"), the furthest one wins
+    STAGES = (
+        ("greeting", ("Trying to Enter the ISP Mode", "Greeting")),
+        ("isp_load", ("Downloading ISP",)),
+        (
+            "flash_init",
+            ("ISP loaded", "Boot to Flashmode", "Initialize K210 SPI Flash"),
+        ),
+        ("programming", ("Programming BIN",)),
+        ("reboot", ("Rebooting",)),
+    )
+
+    def __init__(
+        self,
+        baudrate: int,
+        firmware: str | None = None,
+        cachedir: str | None = None,
+        clock: typing.Callable = time.perf_counter,
+    ):
+        super().__init__()
+        self.baudrate = int(baudrate)
+        self.firmware = firmware
+        self.metrics_file = (
+            os.path.join(cachedir, FlashMetrics.FILENAME) if cachedir else None
+        )
+        self.clock = clock
+        self.started = clock()
+        self.stages = {}
+        self.rate = None
+        self._stage = None
+        self._stage_started = None
+
+    @property
+    def stage(self) -> str | None:
+        """Current stage"""
+        return self._stage
+
+    def close(self):
+        """Record how long the current stage took, if any"""
+        if self._stage is not None:
+            self.stages[self._stage] = self.clock() - self._stage_started
+            self._stage = None
+
+    def enter(self, stage: str):
+        """Close the current stage and start a new one"""
+        self.close()
+        self.debug("enter=%s", stage)
+        self._stage = stage
+        self._stage_started = self.clock()
+
+    def match(self, text: str):
+        """Enter the furthest stage that text starts, if it is ahead"""
+        text = ANSI_REGEX.sub("", text)
+        names = [name for name, _ in FlashMetrics.STAGES]
+        current = names.index(self._stage) if self._stage in names else -1
+
+        for index in range(len(names) - 1, current, -1):
+            if any(marker in text for marker in FlashMetrics.STAGES[index][1]):
+                self.enter(names[index])
+                return
+
+    def on_data(self, *args):
+        """To be called with what KTool prints"""
+        self.match(" ".join(str(x) for x in args))
+
+    def on_process(self, file_type: str, iteration: int, total: int, suffix: str):
+        """To be called with what KTool reports as progress"""
+        # pylint: disable=unused-argument
+        self.match(file_type)
+        if self._stage == "programming":
+            self.rate = parse_rate(suffix) or self.rate
+
+    @staticmethod
+    def payload_size(firmware: str | None) -> int | None:
+        """Bytes written to the board: the uncompressed binaries of a kfpkg"""
+        if firmware is None:
+            return None
+
+        try:
+            with zipfile.ZipFile(firmware) as kfpkg:
+                return sum(
+                    info.file_size
+                    for info in kfpkg.infolist()
+                    if not info.filename.endswith(".json")
+                )
+        except (OSError, zipfile.BadZipFile):
+            return None
+
+    def finish(self, ok: bool, **kwargs) -> typing.Dict[str, typing.Any]:
+        """
+        Close the current stage and build the record of this flash;
+        any keyword (e.g. board, port, error) is added to it
+        """
+        self.close()
+        size = FlashMetrics.payload_size(self.firmware)
+        programming = self.stages.get("programming")
+        effective = size / programming if size and programming else None
+
+        # 8N1 serial: each byte costs 10 bits on the wire
+        capacity = self.baudrate / 10
+        rate = effective or self.rate
+        record = {
+            "time": time.time(),
+            "ok": ok,
+            "baudrate": self.baudrate,
+            "firmware": self.firmware,
+            "elapsed": self.clock() - self.started,
+            "stages": self.stages,
+            "bytes": size,
+            "rate": rate,
+            "reported_rate": self.rate,
+            "efficiency": rate / capacity if rate else None,
+            **kwargs,
+        }
+        self.info("finish=%s", record)
+        return record
+
+    def save(self, record: typing.Dict[str, typing.Any]):
+        """Append a record as a JSON line to :attr:`metrics_file`"""
+        if self.metrics_file is None:
+            return
+
+        os.makedirs(os.path.dirname(self.metrics_file), exist_ok=True)
+        with open(self.metrics_file, "a", encoding="utf8") as file:
+            file.write(json.dumps(record) + "\n")
+
+        self.debug("save=%s", self.metrics_file)
+
+    @staticmethod
+    def load(metrics_file: str) -> typing.List[typing.Dict[str, typing.Any]]:
+        """Read all records of a metrics file, skipping broken lines"""
+        records = []
+        try:
+            with open(metrics_file, "r", encoding="utf8") as file:
+                for line in file:
+                    try:
+                        records.append(json.loads(line))
+                    except json.JSONDecodeError:
+                        continue
+        except FileNotFoundError:
+            pass
+        return records
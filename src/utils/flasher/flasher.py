@@ -22,9 +22,12 @@
 """
 flasher.py
 """
+import typing
 from collections.abc import Callable
 from src.utils.selector import VALID_DEVICES
+from src.utils.kboot.build.ktool import KTool
 from src.utils.flasher.base_flasher import BaseFlasher
+from src.utils.profiler import profiled
 
 
 class Flasher(BaseFlasher):
@@ -58,6 +61,7 @@ class Flasher(BaseFlasher):
             callback=callback,
         )
 
+    @profiled("Flasher.flash")
     def flash(self, callback: Callable) -> None:
         """
         Detect available ports, try default flash process and
@@ -94,3 +98,50 @@ class Flasher(BaseFlasher):
 
             except Exception as gen_exc:
                 self._log_error(str(gen_exc))
+
+    def flash_adaptive(
+        self,
+        callback: Callable,
+        memory: typing.Dict[str, int] | None = None,
+        on_attempt: Callable | None = None,
+    ) -> int:
+        """
+        Flash trying the baudrates of :meth:`baudrate_ladder`, stepping
+        down on greeting or transfer failures, and return the one that
+        worked. If `memory` knows a good baudrate for this device and
+        port, start from it instead of the fastest one.
+
+        Args:
+            callback: Progress callback function
+            memory: best known baudrates by :attr:`baudrate_key`
+            on_attempt: called with the baudrate before each attempt
+        """
+        self._detect_device_from_firmware()
+
+        if not self.is_port_working(self.port):
+            raise RuntimeError(f"Port {self.port} not working")
+
+        start = (memory or {}).get(self.baudrate_key)
+        errors = []
+
+        for baudrate in self.baudrate_ladder(start=start):
+            self.baudrate = baudrate
+
+            # a killed KTool (e.g. on greeting fail) can't be reused
+            self.ktool = KTool()
+
+            if on_attempt is not None:
+                on_attempt(baudrate)
+
+            try:
+                self._flash_with_port(self.port, callback)
+                self.info("flash_adaptive=%s (%s)", baudrate, self.baudrate_key)
+                return baudrate
+
+            # pylint: disable=broad-exception-caught
+            except Exception as exc:
+                error = str(exc) or exc.__class__.__name__
+                self._log_error(f"Flash at {baudrate} failed: {error}")
+                errors.append(f"{baudrate}: {error}")
+
+        raise RuntimeError(f"Flash failed at all baudrates: {'; '.join(errors)}")
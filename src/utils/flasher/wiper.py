@@ -23,9 +23,14 @@
 wiper.py
 """
 import sys
+import threading
 from src.utils.flasher.base_flasher import BaseFlasher
 from src.utils.selector import VALID_DEVICES
 
+# KTool.process() takes no erase option, it only erases when parsing
+# sys.argv; since it is process wide, only one wipe at time can replace it
+_ARGV_LOCK = threading.Lock()
+
 
 class Wiper(BaseFlasher):
     """Class to wipe some specific board"""
@@ -38,9 +43,30 @@ class Wiper(BaseFlasher):
             device: Device name to wipe
         """
         if device in VALID_DEVICES:
-            self.info(f"Detected valid {device} to be wiped")
+            self.info("Detected valid %s to be wiped", device)
             self.set_device(device)
 
+    def _erase_with_port(self, port: str) -> None:
+        """
+        Attempt to erase the board using the specified port.
+
+        Unlike flashing, KTool.process() can't be asked to erase by its
+        arguments: it only erases when parsing its own command line, so
+        sys.argv is replaced while it runs and restored after. That's why
+        wipes are serialized in the whole process, even on different ports.
+
+        Args:
+            port: Serial port path
+        """
+        argv = ["-B", self.board, "-b", str(self.baudrate), "-p", port, "-E"]
+        with _ARGV_LOCK:
+            saved_argv = sys.argv
+            sys.argv = [saved_argv[0], *argv]
+            try:
+                self.ktool.process()
+            finally:
+                sys.argv = saved_argv
+
     def wipe(self, device: str) -> None:
         """
         Detect available ports, try default erase process and
@@ -57,10 +83,7 @@ class Wiper(BaseFlasher):
             return
 
         try:
-            sys.argv.extend(
-                ["-B", self.board, "-b", str(self.baudrate), "-p", self.port, "-E"]
-            )
-            self.ktool.process()
+            self._erase_with_port(self.port)
 
         except StopIteration as stop_exc:
             self._log_error(str(stop_exc))
@@ -71,16 +94,7 @@ class Wiper(BaseFlasher):
             try:
                 newport = next(self._available_ports_generator)
                 if self.is_port_working(newport.device):
-                    sys.argv = [
-                        "--port",
-                        newport.device,
-                        "--Board",
-                        self.board,
-                        "--baudrate",
-                        str(self.baudrate),
-                        "-E",
-                    ]
-                    self.ktool.process()
+                    self._erase_with_port(newport.device)
                 else:
                     self._log_error(f"Port {newport.device} not working")
 
@@ -0,0 +1,283 @@
+# The MIT License (MIT)
+
+# Copyright (c) 2021-2024 Krux contributors
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""
+port_discovery.py
+
+Process-wide cache of serial ports, indexed by USB VID/PID
+"""
+import time
+import logging
+import typing
+from threading import Event, Lock, Thread
+from serial import Serial
+from serial.serialutil import SerialException
+from serial.tools import list_ports
+from serial.tools.list_ports_common import ListPortInfo
+from ..trigger import Trigger
+
+
+class PortDiscovery(Trigger):
+    """
+    Keep the serial ports listed by :func:`serial.tools.list_ports.comports`
+    in memory for :attr:`ttl` seconds, indexed by their USB VID and PID,
+    so selecting a device do not scan the system again. A :meth:`watch`
+    polling thread refresh it when a port is plugged or unplugged.
+
+    Like :func:`serial.tools.list_ports.grep`, an id matches both the VID
+    and the PID of a port (some devices are known by their CH340's PID).
+    Connected devices are found by their USB ids only: opening the port
+    of a K210 board toggles its DTR/RTS lines and may reset it, so a port
+    is only probed right before it is flashed or wiped.
+    """
+
+    TTL = 2.0
+    INTERVAL = 1.0
+    PROBE_TIMEOUT = 0.5
+
+    def __init__(self, ttl: float = TTL):
+        super().__init__()
+        self.ttl = ttl
+        self._index = {}
+        self._ports = []
+        self._scanned_at = None
+        self._lock = Lock()
+        self._watchers = []
+        self._watch_thread = None
+        self._stop_watch = Event()
+
+    @property
+    def ttl(self) -> float:
+        """Getter for the time, in seconds, the ports are kept in memory"""
+        self.debug("ttl::getter=%s", self._ttl)
+        return self._ttl
+
+    @ttl.setter
+    def ttl(self, value: float):
+        """Setter for the time, in seconds, the ports are kept in memory"""
+        if value >= 0:
+            self.debug("ttl::setter=%s", value)
+            self._ttl = value
+        else:
+            raise ValueError(f"Invalid TTL: {value}")
+
+    @staticmethod
+    def make_key(vid: int | str | None) -> str | None:
+        """Normalize a VID or PID (e.g. 1027, '0403' or '0x0403') to '0403'"""
+        if vid is None:
+            return None
+        if isinstance(vid, str):
+            vid = int(vid, 16)
+        return f"{vid:04x}"
+
+    def is_expired(self) -> bool:
+        """Check if ports were never scanned or are older than :attr:`ttl`"""
+        if self._scanned_at is None:
+            return True
+
+        return time.monotonic() - self._scanned_at > self.ttl
+
+    def scan(self) -> typing.Dict[str, typing.List[ListPortInfo]]:
+        """Scan the system ports and rebuild the VID/PID index"""
+        index = {}
+        ports = []
+        for info in sorted(list_ports.comports(), key=lambda p: p.device):
+            if info.vid is None:
+                continue
+
+            ports.append(info)
+            vid = PortDiscovery.make_key(info.vid)
+            pid = PortDiscovery.make_key(info.pid)
+            index.setdefault(vid, []).append(info)
+            if pid is not None and pid != vid:
+                index.setdefault(pid, []).append(info)
+
+        with self._lock:
+            self._index = index
+            self._ports = ports
+            self._scanned_at = time.monotonic()
+
+        # the index is only summarized when someone will read it
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.debug("scan=%s", {k: [p.device for p in v] for k, v in index.items()})
+        return index
+
+    def ports(
+        self,
+        vid: int | str | None = None,
+        pid: int | str | None = None,
+        refresh: bool = False,
+    ) -> typing.List[ListPortInfo]:
+        """
+        Return the ports with a VID (or PID) and a PID, or all USB ports,
+        scanning the system only if the cache is expired or `refresh`
+        """
+        if refresh or self.is_expired():
+            self.scan()
+
+        with self._lock:
+            if vid is None:
+                found = list(self._ports)
+            else:
+                found = list(self._index.get(PortDiscovery.make_key(vid), []))
+
+        if pid is not None:
+            found = [p for p in found if p.pid == int(PortDiscovery.make_key(pid), 16)]
+
+        return found
+
+    def lookup(self, device: str, refresh: bool = False) -> ListPortInfo | None:
+        """Return the info of a port by its name (e.g. /dev/ttyUSB0), if any"""
+        for port in self.ports(refresh=refresh):
+            if port.device == device:
+                return port
+        return None
+
+    def grep(self, vid: int | str, pid: int | str | None = None):
+        """
+        Like :func:`serial.tools.list_ports.grep` for a VID, but from the cache.
+        The first port comes from the cache and, since the next ones are only
+        asked for when the previous one failed, those are scanned again, so
+        a fallback never gets a port that was unplugged in the meantime
+        """
+        seen = set()
+        refresh = False
+
+        while True:
+            ports = [
+                p
+                for p in self.ports(vid=vid, pid=pid, refresh=refresh)
+                if p.device not in seen
+            ]
+            if not ports:
+                return
+
+            seen.add(ports[0].device)
+            refresh = True
+            yield ports[0]
+
+    def devices(self, device_vid_map: typing.Dict[str, str]) -> typing.List[str]:
+        """Names of the devices, of a device to VID map, with a port connected"""
+        keys = {
+            PortDiscovery.make_key(usb_id)
+            for p in self.ports()
+            for usb_id in (p.vid, p.pid)
+        }
+        return [
+            device
+            for device, vid in device_vid_map.items()
+            if PortDiscovery.make_key(vid) in keys
+        ]
+
+    @staticmethod
+    def probe_port(port: str, timeout: float = PROBE_TIMEOUT) -> bool:
+        """
+        Check if a port can be opened in `timeout` seconds. The timeouts
+        of :class:`serial.Serial` only bound reads and writes, so the port
+        is opened in a daemon thread and one that hangs is not working
+        """
+        opened = Event()
+        finished = Event()
+
+        def target():
+            try:
+                with Serial(port, timeout=timeout, write_timeout=timeout):
+                    opened.set()
+            except (SerialException, OSError):
+                pass
+            finally:
+                finished.set()
+
+        Thread(name=f"PortProbe-{port}", target=target, daemon=True).start()
+        finished.wait(timeout)
+        return opened.is_set()
+
+    def poll(self) -> bool:
+        """
+        Scan once and, if a port was plugged or unplugged, notify
+        the watchers with the (added, removed) port names
+        """
+        with self._lock:
+            before = {p.device for p in self._ports}
+
+        self.scan()
+        with self._lock:
+            after = {p.device for p in self._ports}
+        added, removed = sorted(after - before), sorted(before - after)
+
+        if not added and not removed:
+            return False
+
+        self.info("poll=added %s, removed %s", added, removed)
+        for callback in list(self._watchers):
+            callback(added, removed)
+
+        return True
+
+    def watch(self, callback: typing.Callable, interval: float = INTERVAL):
+        """
+        Call `callback(added, removed)` when ports are plugged or unplugged,
+        polling the system every `interval` seconds in a daemon thread
+        """
+        self._watchers.append(callback)
+
+        if self._watch_thread is None or not self._watch_thread.is_alive():
+            self._stop_watch.clear()
+
+            def loop():
+                while not self._stop_watch.wait(interval):
+                    self.poll()
+
+            self._watch_thread = Thread(name="PortDiscovery", target=loop, daemon=True)
+            self._watch_thread.start()
+
+    def unwatch(self, callback: typing.Callable):
+        """Stop calling `callback`, and stop polling if no one else is watching"""
+        if callback in self._watchers:
+            self._watchers.remove(callback)
+
+        if not self._watchers:
+            self._stop_watch.set()
+            self._watch_thread = None
+
+    def clear(self):
+        """Forget the scanned ports"""
+        with self._lock:
+            self._index = {}
+            self._ports = []
+            self._scanned_at = None
+
+
+# pylint: disable=invalid-name
+_discovery = None
+_discovery_lock = Lock()
+
+
+def get_port_discovery() -> PortDiscovery:
+    """Return the process-wide :class:`PortDiscovery`, creating it on first use"""
+    # pylint: disable=global-statement
+    global _discovery
+
+    with _discovery_lock:
+        if _discovery is None:
+            _discovery = PortDiscovery()
+
+        return _discovery
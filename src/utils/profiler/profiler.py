@@ -0,0 +1,213 @@
+# The MIT License (MIT)
+
+# Copyright (c) 2021-2024 Krux contributors
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""
+profiler.py
+
+Opt-in timed spans of the main phases of a session (screens construction,
+releases fetch, downloads, verification, unzip and flash), saved as a
+Chrome trace JSON file (that can be opened in chrome://tracing,
+https://ui.perfetto.dev or https://www.speedscope.app).
+
+It is enabled with the KRUX_PROFILE environment variable (or the --profile
+flag of krux_installer.py and src.cli), set to the trace file to be written
+at exit; when disabled, spans cost a single attribute check.
+"""
+import os
+import json
+import time
+import atexit
+import typing
+import functools
+import multiprocessing
+import threading
+from contextlib import contextmanager
+from ..trigger import Trigger
+
+ENV = "KRUX_PROFILE"
+DEFAULT_FILENAME = "krux-installer-trace.json"
+
+
+class Profiler(Trigger):
+    """
+    Collect timed spans as Chrome trace "complete" events, one track
+    per thread, and write them to :attr:`filename`
+    """
+
+    def __init__(
+        self,
+        filename: str | None = None,
+        clock: typing.Callable[[], int] = time.perf_counter_ns,
+    ):
+        super().__init__()
+        self.clock = clock
+        self.origin = clock()
+        self.events = []
+        self._threads = set()
+        self._lock = threading.Lock()
+        self._registered = False
+        self.filename = filename
+
+    @property
+    def filename(self) -> str | None:
+        """Trace file to be written; the profiler is disabled when None"""
+        return self._filename
+
+    @filename.setter
+    def filename(self, value: str | None):
+        """Enable (or disable, with None) the profiler"""
+        self.debug("filename::setter=%s", value)
+        self._filename = value
+        self.enabled = value is not None
+
+        # write what was collected even if the session is interrupted
+        if self.enabled and not self._registered:
+            atexit.register(self.save)
+            self._registered = True
+
+    @staticmethod
+    def filename_from_env() -> str | None:
+        """Trace file set by the environment, if any"""
+        value = os.environ.get(ENV)
+
+        # worker processes (see src.cli.batch) would overwrite the trace
+        if not value or multiprocessing.parent_process() is not None:
+            return None
+        if value.lower() in ("1", "true", "yes"):
+            return DEFAULT_FILENAME
+        return value
+
+    def add(self, name: str, start: int, duration: int, **kwargs):
+        """Add a span that began at `start` and lasted `duration` (both in ns)"""
+        thread = threading.current_thread()
+        event = {
+            "name": name,
+            "cat": "krux",
+            "ph": "X",
+            "ts": (start - self.origin) / 1000,
+            "dur": duration / 1000,
+            "pid": os.getpid(),
+            "tid": thread.ident,
+            "args": {k: str(v) for k, v in kwargs.items()},
+        }
+
+        with self._lock:
+            if thread.ident not in self._threads:
+                self._threads.add(thread.ident)
+                self.events.append(
+                    {
+                        "name": "thread_name",
+                        "ph": "M",
+                        "pid": os.getpid(),
+                        "tid": thread.ident,
+                        "args": {"name": thread.name},
+                    }
+                )
+            self.events.append(event)
+
+    @contextmanager
+    def span(self, name: str, **kwargs):
+        """Time the enclosed block; keywords are shown as the span's args"""
+        if not self.enabled:
+            yield
+            return
+
+        start = self.clock()
+        try:
+            yield
+        finally:
+            self.add(name, start, self.clock() - start, **kwargs)
+
+    def summary(self) -> typing.Dict[str, typing.Dict[str, float]]:
+        """Count and total milliseconds of each span name"""
+        result = {}
+        with self._lock:
+            for event in self.events:
+                if event["ph"] != "X":
+                    continue
+                entry = result.setdefault(event["name"], {"count": 0, "total": 0.0})
+                entry["count"] += 1
+                entry["total"] += event["dur"] / 1000
+
+        return result
+
+    def to_dict(self) -> dict:
+        """Chrome trace (JSON object format) of the collected spans"""
+        with self._lock:
+            return {"traceEvents": list(self.events), "displayTimeUnit": "ms"}
+
+    def save(self, filename: str | None = None) -> str | None:
+        """Write the trace file, returning its path (None if disabled)"""
+        filename = filename or self.filename
+        if filename is None:
+            return None
+
+        with open(filename, "w", encoding="utf8") as trace:
+            json.dump(self.to_dict(), trace)
+
+        for name, entry in self.summary().items():
+            self.info("%s: %d calls, %.1f ms", name, entry["count"], entry["total"])
+
+        self.info("save::trace=%s", os.path.abspath(filename))
+        return filename
+
+
+# pylint: disable=invalid-name
+_profiler = None
+_profiler_lock = threading.Lock()
+
+
+def get_profiler() -> Profiler:
+    """
+    Return the process-wide :class:`Profiler`, creating it on first use
+    (enabled if the environment sets a trace file)
+    """
+    # pylint: disable=global-statement
+    global _profiler
+
+    with _profiler_lock:
+        if _profiler is None:
+            _profiler = Profiler(filename=Profiler.filename_from_env())
+
+        return _profiler
+
+
+def profiled(name: str | None = None) -> typing.Callable:
+    """
+    Decorate a function (or method) to be timed as a span
+    named `name` (default: its qualified name)
+    """
+
+    def decorator(func: typing.Callable) -> typing.Callable:
+        span_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            profiler = get_profiler()
+            if not profiler.enabled:
+                return func(*args, **kwargs)
+
+            with profiler.span(span_name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
@@ -37,12 +37,12 @@ class BaseScanner(Trigger):
     @property
     def video_capture(self) -> cv2.VideoCapture:
         """Getter for video capture"""
-        self.debug(f"video_capture::getter={self._video_capture}")
+        self.debug("video_capture::getter=%s", self._video_capture)
         return self._video_capture
 
     @video_capture.setter
     def video_capture(self, value: cv2.VideoCapture):
-        self.debug(f"video_capture::setter={value}")
+        self.debug("video_capture::setter=%s", value)
         self._video_capture = value
 
     def close_cli_capture(self):
@@ -26,23 +26,12 @@ Generic selector to select devices or versions
 """
 
 import typing
-from http.client import HTTPResponse
-import requests
+from ..cache import HttpCache
 from ..trigger import Trigger
-
-VALID_DEVICES = (
-    "m5stickv",
-    "amigo",
-    "amigo_tft",
-    "amigo_ips",
-    "dock",
-    "bit",
-    "yahboom",
-    "cube",
-    "wonder_mv",
-    "tzt",
-    "embed_fire",
-)
+from ..profiler import profiled
+from ..constants import VALID_DEVICES
+from .catalog_fetcher import CatalogFetcher, ReleaseRecord
+from .catalog_fetcher import AssetRecord  # pylint: disable=unused-import
 
 
 class Selector(Trigger):
@@ -56,9 +45,11 @@ class Selector(Trigger):
         "X-GitHub-Api-Version": "2022-11-28",
     }
 
-    def __init__(self):
+    def __init__(self, cachedir: str | None = None):
         super().__init__()
         self.device = None
+        self.http_cache = HttpCache(cachedir=cachedir) if cachedir else None
+        self._catalog = []
         self.releases = self._fetch_releases()
         self.firmware = None
 
@@ -67,15 +58,15 @@ class Selector(Trigger):
         """
         Get the current device
         """
-        self.debug(f"device::getter={self._device}")
+        self.debug("device::getter=%s", self._device)
         return self._device
 
     @device.setter
     def device(self, value: str):
         """Setter for the current device"""
-        self.debug(f"device::setter={value}")
+        self.debug("device::setter=%s", value)
         if value in VALID_DEVICES or value is None:
-            self.debug(f"device::setter={value}")
+            self.debug("device::setter=%s", value)
             self._device = value
         else:
             raise ValueError(f"Device '{value}' is not valid")
@@ -83,14 +74,14 @@ class Selector(Trigger):
     @property
     def firmware(self) -> str:
         """Getter for the current firmware version"""
-        self.debug(f"firmware::getter={self._firmware}")
+        self.debug("firmware::getter=%s", self._firmware)
         return self._firmware
 
     @firmware.setter
     def firmware(self, value: str):
         """Setter for the current firmware version"""
         if value in self.releases or value is None:
-            self.debug(f"firmware::setter={value}")
+            self.debug("firmware::setter=%s", value)
             self._firmware = value
         else:
             raise ValueError(f"Firmware '{value}' is not valid")
@@ -98,53 +89,80 @@ class Selector(Trigger):
     @property
     def releases(self) -> typing.List[dict]:
         """Getter of releases"""
-        self.debug(f"releases::getter={self._releases}")
+        self.debug("releases::getter=%s", self._releases)
         return self._releases
 
     @releases.setter
     def releases(self, value: typing.List[dict]):
         """Set a list of releases"""
-        self.debug(f"releases::setter={value}")
+        self.debug("releases::setter=%s", value)
         self._releases = value
 
+    @property
+    def http_cache(self) -> HttpCache | None:
+        """Getter for the cache of API responses"""
+        self.debug("http_cache::getter=%s", self._http_cache)
+        return self._http_cache
+
+    @http_cache.setter
+    def http_cache(self, value: HttpCache | None):
+        """Setter for the cache of API responses"""
+        self.debug("http_cache::setter=%s", value)
+        self._http_cache = value
+
+    @property
+    def catalog(self) -> typing.List[ReleaseRecord]:
+        """Getter of the compact records (tag and assets) of releases"""
+        self.debug("catalog::getter=%s releases", len(self._catalog))
+        return self._catalog
+
+    @profiled("Selector.fetch")
     def _fetch_releases(self, timeout: int = 10) -> typing.List[str]:
         """
         Get the all available releases at
         https://github.com/selfcustody/krux/releases
-        """
-        try:
-            self.debug(f"releases::getter::URL={Selector.URL}")
-            accept = Selector.HEADERS["Accept"]
-            api = Selector.HEADERS["X-GitHub-Api-Version"]
-            self.debug(f"releases::getter::HEADER=Accept: {accept}")
-            self.debug(f"releases::getter::HEADER=X-Github-Api-Version: {api}")
-            response = requests.get(
-                url=Selector.URL, headers=Selector.HEADERS, timeout=timeout
-            )
-            response.raise_for_status()
-
-        except requests.exceptions.Timeout as t_exc:
-            raise RuntimeError(t_exc) from t_exc
 
-        except requests.exceptions.ConnectionError as c_exc:
-            raise RuntimeError(c_exc) from c_exc
-
-        except requests.exceptions.HTTPError as h_exc:
-            raise RuntimeError(h_exc) from h_exc
-
-        res = response.json()
-        self.debug(f"releases::getter::response='{res}'")
-
-        if len(res) == 0:
+        The releases are fetched by a :class:`CatalogFetcher`, following the
+        API pagination. If a :attr:`http_cache` is defined, the first page is
+        revalidated with its ETag (`If-None-Match`); a `304 Not Modified` is
+        served from disk and do not count against the API rate limit. When it
+        was modified, the fetch stops at the first release already cached.
+        """
+        known = []
+        etag = None
+
+        if self.http_cache is not None:
+            cached = self.http_cache.load(Selector.URL)
+            if cached is not None:
+                try:
+                    known = [ReleaseRecord.from_dict(data) for data in cached["body"]]
+                    etag = cached["etag"]
+                except (KeyError, TypeError) as exc:
+                    self.warning("Ignoring invalid cached releases: %s", exc)
+
+        fetcher = CatalogFetcher(url=Selector.URL, headers=Selector.HEADERS)
+        self._catalog = fetcher.fetch(known=known, etag=etag, timeout=timeout)
+
+        if len(self._catalog) == 0:
             raise ValueError(f"{Selector.URL} returned empty data")
 
-        obj = []
-        for data in res:
-            if not data.get("tag_name"):
-                raise KeyError("Invalid key: 'tag_name' do not exist on api")
-
-            obj.append(data["tag_name"])
+        if not fetcher.not_modified:
+            self._store_releases(etag=fetcher.etag)
 
+        obj = [record.tag for record in self._catalog]
         obj.append("odudex/krux_binaries")
-        self.debug(f"releases::getter={obj}")
+        self.debug("releases::getter=%s", obj)
         return obj
+
+    def _store_releases(self, etag: str | None):
+        """Keep the release records and its ETag to revalidate on next fetch"""
+        if self.http_cache is None or not etag:
+            return
+
+        try:
+            # store only the compact records, the full response is too big
+            body = [record.to_dict() for record in self._catalog]
+            self.http_cache.store(url=Selector.URL, body=body, etag=etag)
+
+        except OSError as exc:
+            self.warning("Unable to store releases on cache: %s", exc)
@@ -0,0 +1,192 @@
+# The MIT License (MIT)
+
+# Copyright (c) 2021-2024 Krux contributors
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""
+catalog_fetcher.py
+
+Paginated and incremental fetcher of the krux releases catalog
+"""
+import typing
+import requests
+from ..session import get_session
+from ..trigger import Trigger
+
+
+class AssetRecord(typing.NamedTuple):
+    """Compact record of a release asset"""
+
+    name: str
+    url: str
+    size: int
+    digest: str | None
+
+
+class ReleaseRecord(typing.NamedTuple):
+    """Compact record of a release, with only the fields used by the installer"""
+
+    tag: str
+    assets: typing.Tuple[AssetRecord, ...] = ()
+
+    @classmethod
+    def from_api(cls, data: dict) -> "ReleaseRecord":
+        """Build a record from an item of the GitHub releases API"""
+        if not data.get("tag_name"):
+            raise KeyError("Invalid key: 'tag_name' do not exist on api")
+
+        assets = tuple(
+            AssetRecord(
+                name=asset.get("name"),
+                url=asset.get("browser_download_url"),
+                size=asset.get("size", 0),
+                digest=asset.get("digest"),
+            )
+            for asset in data.get("assets", [])
+        )
+        return cls(tag=data["tag_name"], assets=assets)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ReleaseRecord":
+        """Build a record from its cached form (see :meth:`to_dict`)"""
+        assets = tuple(AssetRecord(*asset) for asset in data.get("assets", []))
+        return cls(tag=data["tag_name"], assets=assets)
+
+    def to_dict(self) -> dict:
+        """Serializable form of the record, to be kept on cache"""
+        return {
+            "tag_name": self.tag,
+            "assets": [list(asset) for asset in self.assets],
+        }
+
+
+class CatalogFetcher(Trigger):
+    """
+    Fetch the releases catalog following the `Link` pagination of
+    GitHub API, keeping only a :class:`ReleaseRecord` of each release.
+
+    When some releases are already known (i.e. they were cached), the
+    fetch stops at the first page that contains a known tag, since
+    releases are listed from the newest to the oldest.
+    """
+
+    PER_PAGE = 100
+
+    def __init__(self, url: str, headers: dict, per_page: int = PER_PAGE):
+        super().__init__()
+        self.url = url
+        self.headers = headers
+        self.per_page = per_page
+        self.etag = None
+        self.not_modified = False
+
+    @property
+    def per_page(self) -> int:
+        """Getter for the number of releases requested by page"""
+        self.debug("per_page::getter=%s", self._per_page)
+        return self._per_page
+
+    @per_page.setter
+    def per_page(self, value: int):
+        """Setter for the number of releases requested by page (1 to 100)"""
+        if 0 < value <= 100:
+            self.debug("per_page::setter=%s", value)
+            self._per_page = value
+        else:
+            raise ValueError(f"Invalid per_page: {value}")
+
+    def get_page(
+        self, url: str, headers: dict, params: dict | None, timeout: int
+    ) -> requests.Response:
+        """Request a single page of the catalog"""
+        try:
+            self.debug("get_page::URL=%s", url)
+            response = get_session().get(
+                url=url, headers=headers, params=params, timeout=timeout
+            )
+            response.raise_for_status()
+            return response
+
+        except requests.exceptions.Timeout as t_exc:
+            raise RuntimeError(t_exc) from t_exc
+
+        except requests.exceptions.ConnectionError as c_exc:
+            raise RuntimeError(c_exc) from c_exc
+
+        except requests.exceptions.HTTPError as h_exc:
+            raise RuntimeError(h_exc) from h_exc
+
+    def fetch(
+        self,
+        known: typing.List[ReleaseRecord] | None = None,
+        etag: str | None = None,
+        timeout: int = 10,
+    ) -> typing.List[ReleaseRecord]:
+        """
+        Fetch the new releases and append the :attr:`known` ones after them.
+
+        If an :attr:`etag` of the first page is given, it is revalidated with
+        `If-None-Match`; on a `304 Not Modified` the :attr:`known` releases
+        are returned as they are and :attr:`not_modified` is set.
+        """
+        known = known or []
+        known_tags = {record.tag: index for index, record in enumerate(known)}
+        records = []
+
+        headers = dict(self.headers)
+        if etag is not None and known:
+            headers["If-None-Match"] = etag
+
+        url = self.url
+        params = {"per_page": self.per_page}
+        first_page = True
+        self.etag = None
+        self.not_modified = False
+
+        while url is not None:
+            response = self.get_page(
+                url=url, headers=headers, params=params, timeout=timeout
+            )
+
+            if first_page:
+                if response.status_code == 304:
+                    self.debug("fetch::not_modified")
+                    self.not_modified = True
+                    return list(known)
+
+                self.etag = response.headers.get("ETag")
+                headers = dict(self.headers)
+                first_page = False
+
+            # parse one page at time and keep only the compact records,
+            # so the raw payload (with release notes) can be released
+            for data in response.json():
+                record = ReleaseRecord.from_api(data)
+                if record.tag in known_tags:
+                    self.debug("fetch::known_tag=%s", record.tag)
+                    return records + known[known_tags[record.tag] :]
+
+                records.append(record)
+
+            # `next` link already carries the query parameters
+            url = response.links.get("next", {}).get("url")
+            params = None
+
+        self.debug("fetch::records=%s", len(records))
+        return records
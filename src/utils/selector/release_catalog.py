@@ -0,0 +1,115 @@
+# The MIT License (MIT)
+
+# Copyright (c) 2021-2024 Krux contributors
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""
+release_catalog.py
+
+Process-wide memoized list of releases
+"""
+import time
+import typing
+from threading import Lock
+from ..trigger import Trigger
+from . import Selector
+
+
+class ReleaseCatalog(Trigger):
+    """
+    Keep the list of releases fetched by :class:`Selector` in memory
+    for :attr:`ttl` seconds, so screens that show the releases can be
+    rendered without waiting the network on every visit
+    """
+
+    TTL = 600
+
+    def __init__(self, ttl: float = TTL):
+        super().__init__()
+        self.ttl = ttl
+        self._releases = []
+        self._fetched_at = None
+        self._lock = Lock()
+
+    @property
+    def ttl(self) -> float:
+        """Getter for the time, in seconds, the releases are kept in memory"""
+        self.debug("ttl::getter=%s", self._ttl)
+        return self._ttl
+
+    @ttl.setter
+    def ttl(self, value: float):
+        """Setter for the time, in seconds, the releases are kept in memory"""
+        if value >= 0:
+            self.debug("ttl::setter=%s", value)
+            self._ttl = value
+        else:
+            raise ValueError(f"Invalid TTL: {value}")
+
+    @property
+    def releases(self) -> typing.List[str]:
+        """Getter for the memoized releases (empty if never fetched)"""
+        self.debug("releases::getter=%s", self._releases)
+        return list(self._releases)
+
+    def is_expired(self) -> bool:
+        """Check if releases were never fetched or are older than :attr:`ttl`"""
+        if self._fetched_at is None:
+            return True
+
+        return time.monotonic() - self._fetched_at > self.ttl
+
+    def fetch(
+        self, cachedir: str | None = None, refresh: bool = False
+    ) -> typing.List[str]:
+        """
+        Return the memoized releases, fetching them with a :class:`Selector`
+        if they are expired or if :attr:`refresh` is True. Concurrent
+        callers wait for the same fetch instead of doing their own.
+        """
+        with self._lock:
+            if refresh or self.is_expired():
+                self.debug("fetch::refresh=%s", refresh)
+                self._releases = Selector(cachedir=cachedir).releases
+                self._fetched_at = time.monotonic()
+
+            return self.releases
+
+    def clear(self):
+        """Forget the memoized releases"""
+        with self._lock:
+            self._releases = []
+            self._fetched_at = None
+
+
+# pylint: disable=invalid-name
+_catalog = None
+_catalog_lock = Lock()
+
+
+def get_release_catalog() -> ReleaseCatalog:
+    """Return the process-wide :class:`ReleaseCatalog`, creating it on first use"""
+    # pylint: disable=global-statement
+    global _catalog
+
+    with _catalog_lock:
+        if _catalog is None:
+            _catalog = ReleaseCatalog()
+
+        return _catalog
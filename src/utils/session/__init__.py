@@ -0,0 +1,77 @@
+# The MIT License (MIT)
+
+# Copyright (c) 2021-2024 Krux contributors
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""
+session.py
+
+Process-wide HTTP session, so every downloader and the selector
+reuse the same pool of keep-alive connections to github instead of
+doing a new TCP+TLS handshake for each request
+"""
+from threading import Lock
+import requests
+from requests.adapters import HTTPAdapter
+
+# Hosts used in a flash session: api.github.com, github.com,
+# objects.githubusercontent.com (release redirects) and
+# raw.githubusercontent.com (selfcustody.pem)
+POOL_CONNECTIONS = 4
+
+# Connections kept alive per host: the release assets
+# are downloaded in parallel (see ReleaseBundleDownloader)
+POOL_MAXSIZE = 8
+
+# pylint: disable=invalid-name
+_session = None
+_lock = Lock()
+
+
+def get_session() -> requests.Session:
+    """
+    Return the shared :class:`requests.Session`, creating it on first use
+    with a :class:`HTTPAdapter` sized for the hosts above
+    """
+    # pylint: disable=global-statement
+    global _session
+
+    with _lock:
+        if _session is None:
+            adapter = HTTPAdapter(
+                pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE
+            )
+            session = requests.Session()
+            session.headers.update({"Connection": "keep-alive"})
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _session = session
+
+        return _session
+
+
+def close_session():
+    """Close the shared session and its pooled connections, if any"""
+    # pylint: disable=global-statement
+    global _session
+
+    with _lock:
+        if _session is not None:
+            _session.close()
+            _session = None
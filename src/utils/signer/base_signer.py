@@ -62,14 +62,14 @@ class BaseSigner(Trigger):
     @property
     def filename(self) -> str:
         """Getter for filename"""
-        self.debug(f"filename::getter={self._filename}")
+        self.debug("filename::getter=%s", self._filename)
         return self._filename
 
     @filename.setter
     def filename(self, value: str):
         """Setter for filename"""
         if os.path.exists(value):
-            self.debug(f"filename::setter={value}")
+            self.debug("filename::setter=%s", value)
             self._filename = value
         else:
             raise ValueError(f"{value} do not exists")
@@ -78,7 +78,7 @@ class BaseSigner(Trigger):
     def filehash(self) -> str:
         """Getter for filehash"""
         try:
-            self.debug(f"filehash::getter={self._filehash}")
+            self.debug("filehash::getter=%s", self._filehash)
             return self._filehash
         except AttributeError:
             return None
@@ -87,7 +87,7 @@ class BaseSigner(Trigger):
     def filehash(self, value: str):
         """Setter for filehash"""
         if re.findall(r"[a-fA-F0-9]{64}", value):
-            self.debug(f"filehash::setter={value}")
+            self.debug("filehash::setter=%s", value)
             self._filehash = value
         else:
             raise ValueError(f"Invalid hash: {value}")
@@ -96,7 +96,7 @@ class BaseSigner(Trigger):
     def signature(self) -> typing.SupportsBytes:
         """Getter for signature in byte format"""
         try:
-            self.debug(f"signature::getter={self._signature}")
+            self.debug("signature::getter=%s", self._signature)
             return self._signature
         except AttributeError:
             return None
@@ -107,7 +107,7 @@ class BaseSigner(Trigger):
         if re.findall(
             r"^(?:[A-Za-z0-9+/]{4})*(?:[A-Za-z0-9+/]{2}==|[A-Za-z0-9+/]{3}=)?$", value
         ):
-            self.debug(f"signature::setter={value}")
+            self.debug("signature::setter=%s", value)
             self._signature = base64.b64decode(value.encode())
         else:
             raise ValueError(f"Invalid signature: {value}")
@@ -116,7 +116,7 @@ class BaseSigner(Trigger):
     def pubkey(self) -> str:
         """Getter for public key certificate"""
         try:
-            self.debug(f"pubkey::getter={self._pubkey}")
+            self.debug("pubkey::getter=%s", self._pubkey)
             return self._pubkey
         except AttributeError:
             return None
@@ -125,7 +125,7 @@ class BaseSigner(Trigger):
     def pubkey(self, value: typing.SupportsBytes):
         """Setter for public key certificate"""
         if re.findall("[a-f0-9]{64}", value):
-            self.debug(f"pubkey::setter={value}")
+            self.debug("pubkey::setter=%s", value)
             pubkey_data = f"{ASN1_STRUCTURE_FOR_PUBKEY}{value}"
 
             # Convert pubkey data to bytes
@@ -22,7 +22,9 @@
 """
 signer.py
 """
-import hashlib
+import typing
+from functools import partial
+from ..verifyer.hash_engine import HashEngine
 from .base_signer import BaseSigner
 
 
@@ -34,12 +36,43 @@ class TriggerSigner(BaseSigner):
     def __init__(self, filename: str):
         super().__init__(filename=filename)
 
-    def make_hash(self):
-        """Create a file hash before sign"""
-        with open(self.filename, "rb") as f_sig:
-            _bytes = f_sig.read()
-            data = hashlib.sha256(_bytes).hexdigest()
-            self.filehash = data
+    def make_hash(
+        self,
+        on_data: typing.Callable[[int, int], None] | None = None,
+        engine: HashEngine | None = None,
+    ):
+        """
+        Create a file hash before sign. The file is streamed through a fixed
+        size buffer, so memory do not grow with file size. If `on_data` is
+        given, it is called with the number of hashed bytes and the file size.
+        An `engine` can be shared to reuse its buffer between many files
+        """
+        if engine is None:
+            engine = HashEngine(algorithm="sha256")
+
+        self.filehash = engine.hash_file(self.filename, on_data=on_data).hexdigest()
+
+    @staticmethod
+    def hash_files(
+        filenames: typing.List[str],
+        on_data: typing.Callable[[str, int, int], None] | None = None,
+    ) -> typing.List["TriggerSigner"]:
+        """
+        Batch mode: hash many files, one at time with the same buffer, and
+        save each `.sha256.txt`. If `on_data` is given, it is called with
+        the filename, the number of hashed bytes and the file size
+        """
+        engine = HashEngine(algorithm="sha256")
+        signers = []
+
+        for filename in filenames:
+            signer = TriggerSigner(filename=filename)
+            on_file_data = partial(on_data, filename) if on_data is not None else None
+            signer.make_hash(on_data=on_file_data, engine=engine)
+            signer.save_hash()
+            signers.append(signer)
+
+        return signers
 
     def save_hash(self):
         """Save file's hash in a sha256.txt file"""
@@ -50,7 +83,7 @@ class TriggerSigner(BaseSigner):
         with open(filehashname, mode="w", encoding="utf-8") as h_file:
             content = f"{self.filehash} {self.filename}"
             h_file.write(content)
-            self.debug(f"{filehashname} saved")
+            self.debug("%s saved", filehashname)
 
     def save_signature(self):
         """Save the signature data into a .sig file"""
@@ -58,7 +91,7 @@ class TriggerSigner(BaseSigner):
             sigfile = f"{self.filename}.sig"
             with open(sigfile, "wb") as s_file:
                 s_file.write(self.signature)
-                self.debug(f"{sigfile} saved")
+                self.debug("%s saved", sigfile)
         else:
             raise ValueError("Empty signature")
 
@@ -76,6 +109,6 @@ class TriggerSigner(BaseSigner):
             pubfile = f"{self.filename}.pem"
             with open(pubfile, mode="w", encoding="utf-8") as pb_file:
                 pb_file.write(formated_pubkey)
-                self.debug(f"{pubfile} saved")
+                self.debug("%s saved", pubfile)
         else:
             raise ValueError("Empty pubkey")
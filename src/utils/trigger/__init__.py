@@ -24,9 +24,11 @@ trigger.py
 
 Base class to be used accross project
 """
-import os
-from kivy.logger import Logger
-from src.utils.info import mro
+import logging
+
+# same logger that kivy.logger.Logger is, but without importing kivy,
+# so headless tools (see src.cli) do not pay the GUI startup cost
+Logger = logging.getLogger("kivy")
 
 
 class Trigger:
@@ -35,24 +37,53 @@ class Trigger:
 
     Class to be (co)inherited in any class of the project.
     All actions will be logged.
+
+    Each class have its own logger (a child of kivy's one), resolved once
+    when the class is created. Messages can be given with %-style arguments,
+    that are only formatted if the level is enabled:
+
+        self.debug("downloaded_len::getter=%s", self._downloaded_len)
     """
 
-    def info(self, msg: str):
+    logger = Logger.getChild("Trigger")
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.logger = Logger.getChild(cls.__name__)
+
+    def log(self, level: int, msg: str, *args):
+        """Log `msg % args` with the class name, if `level` is enabled"""
+        if self.logger.isEnabledFor(level):
+            self._emit(level, msg, args)
+
+    def _emit(self, level: int, msg: str, args: tuple):
+        """Format and log a message whose level is known to be enabled"""
+        self.logger.log(
+            level, "%s: %s", type(self).__name__, msg % args if args else msg
+        )
+
+    # each level check itself, to spare a call when it's filtered out
+    def info(self, msg: str, *args):
         """Logger with level 'info'"""
-        Logger.info("%s: %s", mro(), msg)
+        if self.logger.isEnabledFor(logging.INFO):
+            self._emit(logging.INFO, msg, args)
 
-    def debug(self, msg: str):
+    def debug(self, msg: str, *args):
         """Logger with level 'debug'"""
-        Logger.debug("%s: %s", mro(), msg)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self._emit(logging.DEBUG, msg, args)
 
-    def warning(self, msg: str):
+    def warning(self, msg: str, *args):
         """Logger with level 'warning'"""
-        Logger.warning("%s: %s", mro(), msg)
+        if self.logger.isEnabledFor(logging.WARNING):
+            self._emit(logging.WARNING, msg, args)
 
-    def error(self, msg: str):
-        """Logger with level 'critical'"""
-        Logger.error("%s: %s", mro(), msg)
+    def error(self, msg: str, *args):
+        """Logger with level 'error'"""
+        if self.logger.isEnabledFor(logging.ERROR):
+            self._emit(logging.ERROR, msg, args)
 
-    def critical(self, msg: str):
+    def critical(self, msg: str, *args):
         """Logger with level 'critical'"""
-        Logger.critical("%s: %s", mro(), msg)
+        if self.logger.isEnabledFor(logging.CRITICAL):
+            self._emit(logging.CRITICAL, msg, args)
@@ -27,6 +27,7 @@ import tempfile
 import typing
 from zipfile import ZipFile, BadZipFile
 from ..verifyer.check_verifyer import CheckVerifyer
+from ..profiler import profiled
 
 
 class BaseUnzip(CheckVerifyer):
@@ -47,14 +48,14 @@ class BaseUnzip(CheckVerifyer):
     @property
     def members(self) -> typing.List[str]:
         """Getter for the name of members files to be extracted from zip"""
-        self.debug(f"members::getter={self._filename}")
+        self.debug("members::getter=%s", self._filename)
         return list(self._members)
 
     @members.setter
     def members(self, value: typing.List[str]):
         """Setter for the name of file to be extracted"""
         if len(value) > 0:
-            self.debug(f"members::setter={value}")
+            self.debug("members::setter=%s", value)
             self._members = set(value)
         else:
             raise ValueError("Members cannot be empty")
@@ -62,14 +63,14 @@ class BaseUnzip(CheckVerifyer):
     @property
     def output(self) -> str:
         """Getter for the path where extracted files will be placed"""
-        self.debug(f"output::getter={self._output}")
+        self.debug("output::getter=%s", self._output)
         return self._output
 
     @output.setter
     def output(self, value: str):
         """Setter for the path where extracted files will be placed"""
         if os.path.exists(value):
-            self.debug(f"output::setter={value}")
+            self.debug("output::setter=%s", value)
             self._output = value
         else:
             raise ValueError(f"Given path not exist: {value}")
@@ -80,16 +81,17 @@ class BaseUnzip(CheckVerifyer):
         base_name = os.path.basename(filename)
         return base_name.replace(".zip", "")
 
+    @profiled("BaseUnzip.load")
     def load(self):
         """Extract from given zip file only the ones that was defined as members"""
         try:
-            self.debug(f"load::opening={self.filename}")
+            self.debug("load::opening=%s", self.filename)
             with ZipFile(self.filename, self.read_mode) as zip_obj:
                 namelist = set(zip_obj.namelist())
-                self.debug(f"load::namelist={namelist}")
+                self.debug("load::namelist=%s", namelist)
                 for name in namelist:
                     if name in self.members:
-                        self.debug(f"load::extract::{self.filename}={name}")
+                        self.debug("load::extract::%s=%s", self.filename, name)
                         zip_obj.extract(name, path=self.output)
 
         except BadZipFile as exc_info:
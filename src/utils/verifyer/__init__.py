@@ -28,3 +28,5 @@ from .sig_check_verifyer import SigCheckVerifyer
 from .pem_check_verifyer import PemCheckVerifyer
 from .sha256_verifyer import Sha256Verifyer
 from .sig_verifyer import SigVerifyer
+from .release_verifyer import ReleaseVerifyer
+from .hash_engine import HashEngine
@@ -39,26 +39,26 @@ class BaseVerifyer(Trigger):
     @property
     def filename(self) -> str:
         """Getter for filename"""
-        self.debug(f"filename::getter={self._filename}")
+        self.debug("filename::getter=%s", self._filename)
         return self._filename
 
     @filename.setter
     def filename(self, value: str):
         """Setter for filename"""
-        self.debug(f"filename::setter={value}")
+        self.debug("filename::setter=%s", value)
         self._filename = value
 
     @property
     def read_mode(self) -> str:
         """Getter for read_mode (r or rb)"""
-        self.debug(f"read_mode::getter={self._read_mode}")
+        self.debug("read_mode::getter=%s", self._read_mode)
         return self._read_mode
 
     @read_mode.setter
     def read_mode(self, value: str):
         """Setter for read_mode"""
         if value in ("r", "rb"):
-            self.debug(f"read_mode::setter={value}")
+            self.debug("read_mode::setter=%s", value)
             self._read_mode = value
         else:
             raise ValueError(f"Invalid read_mode: {value}")
@@ -66,11 +66,11 @@ class BaseVerifyer(Trigger):
     @property
     def data(self) -> str | typing.SupportsBytes:
         """Getter for loaded data"""
-        self.debug(f"data::getter={self._data}")
+        self.debug("data::getter=%s", self._data)
         return self._data
 
     @data.setter
     def data(self, value: str | typing.SupportsBytes):
         """Setter for data"""
-        self.debug(f"data::setter={value}")
+        self.debug("data::setter=%s", value)
         self._data = value
@@ -0,0 +1,126 @@
+# The MIT License (MIT)
+
+# Copyright (c) 2021-2024 Krux contributors
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""
+hash_engine.py
+"""
+
+import os
+import time
+import typing
+import hashlib
+from ..trigger import Trigger
+
+
+class HashEngine(Trigger):
+    """
+    Hash files reading them with `readinto` in a reused buffer of some MiB,
+    so big files (like release zips) are hashed in few iterations and without
+    allocating a new bytes object for each block. Only a summary, with the
+    throughput, is logged at end of each file.
+    """
+
+    BUFFER_SIZE = 4 * 1024 * 1024
+
+    def __init__(self, algorithm: str = "sha256", buffer_size: int = BUFFER_SIZE):
+        super().__init__()
+        self.algorithm = algorithm
+        self.buffer_size = buffer_size
+        self.hashed_len = 0
+        self.elapsed = 0.0
+
+    @property
+    def algorithm(self) -> str:
+        """Getter for the hashlib algorithm name"""
+        self.debug("algorithm::getter=%s", self._algorithm)
+        return self._algorithm
+
+    @algorithm.setter
+    def algorithm(self, value: str):
+        """Setter for the hashlib algorithm name"""
+        if value in hashlib.algorithms_available:
+            self.debug("algorithm::setter=%s", value)
+            self._algorithm = value
+        else:
+            raise ValueError(f"Invalid algorithm: {value}")
+
+    @property
+    def buffer_size(self) -> int:
+        """Getter for the size of buffer where file is read"""
+        self.debug("buffer_size::getter=%s", self._buffer_size)
+        return self._buffer_size
+
+    @buffer_size.setter
+    def buffer_size(self, value: int):
+        """Setter for the size of buffer where file is read"""
+        if value > 0:
+            self.debug("buffer_size::setter=%s", value)
+            self._buffer_size = value
+        else:
+            raise ValueError(f"Invalid buffer size: {value}")
+
+    @property
+    def throughput(self) -> float:
+        """Throughput, in MB/s, of the last hashed file"""
+        if self.elapsed <= 0:
+            return 0.0
+        return self.hashed_len / self.elapsed / 1e6
+
+    def hash_file(
+        self,
+        filename: str,
+        on_data: typing.Callable[[int, int], None] | None = None,
+    ) -> "hashlib._Hash":
+        """
+        Hash a file, returning the `hashlib` object (so callers can use
+        `digest` or `hexdigest`). If `on_data` is given, it is called with
+        the number of hashed bytes and the file size after each block
+        """
+        hasher = hashlib.new(self.algorithm)
+        buffer = bytearray(self.buffer_size)
+        view = memoryview(buffer)
+        hashed_len = 0
+        start = time.perf_counter()
+
+        with open(filename, "rb") as f_data:
+            total_len = os.fstat(f_data.fileno()).st_size
+
+            while True:
+                read_len = f_data.readinto(buffer)
+                if not read_len:
+                    break
+
+                hasher.update(view[:read_len])
+                hashed_len += read_len
+
+                if on_data is not None:
+                    on_data(hashed_len, total_len)
+
+        self.hashed_len = hashed_len
+        self.elapsed = time.perf_counter() - start
+        self.debug(
+            "hash_file::%s::%s bytes in %.3fs (%.2f MB/s)",
+            filename,
+            hashed_len,
+            self.elapsed,
+            self.throughput,
+        )
+        return hasher
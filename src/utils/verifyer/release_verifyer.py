@@ -0,0 +1,139 @@
+# The MIT License (MIT)
+
+# Copyright (c) 2021-2024 Krux contributors
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""
+release_verifyer.py
+"""
+
+import os
+import typing
+from .base_verifyer import BaseVerifyer
+from .hash_engine import HashEngine
+
+
+class ReleaseVerifyer(BaseVerifyer):
+    """
+    Verify both sha256 checksum and signature of a release reading it once:
+    the computed digest is compared with the provided sha256sum and given
+    to ECDSA as a prehashed message, so the file isn't read (neither hashed)
+    again nor loaded whole in memory
+    """
+
+    CHUNK_SIZE = HashEngine.BUFFER_SIZE
+
+    def __init__(
+        self,
+        filename: str,
+        sha256sum: str,
+        signature: bytes,
+        pubkey: bytes,
+        *,
+        chunk_size: int = CHUNK_SIZE,
+    ):
+        if not os.path.exists(filename):
+            raise ValueError(f"File {filename} do not exist")
+
+        super().__init__(filename=filename, read_mode="rb")
+
+        # import here, so cryptography is only loaded to verify a release
+        # pylint: disable=import-outside-toplevel
+        from cryptography.hazmat.primitives import serialization
+
+        self.sha256sum = sha256sum
+        self.signature = signature
+        self.certificate = serialization.load_pem_public_key(pubkey)
+        self.chunk_size = chunk_size
+        self.digest = None
+
+    @property
+    def sha256sum(self) -> str:
+        """Getter for the provided sha256sum"""
+        self.debug("sha256sum::getter=%s", self._sha256sum)
+        return self._sha256sum
+
+    @sha256sum.setter
+    def sha256sum(self, value: str):
+        """Setter for the provided sha256sum"""
+        self.debug("sha256sum::setter=%s", value)
+        self._sha256sum = value
+
+    @property
+    def signature(self) -> bytes:
+        """Getter for signature bytes"""
+        self.debug("signature::getter=%s", self._signature)
+        return self._signature
+
+    @signature.setter
+    def signature(self, value: bytes):
+        """Setter for signature bytes"""
+        self.debug("signature::setter=%s", value)
+        self._signature = value
+
+    @property
+    def chunk_size(self) -> int:
+        """Getter for the size of blocks read from file"""
+        self.debug("chunk_size::getter=%s", self._chunk_size)
+        return self._chunk_size
+
+    @chunk_size.setter
+    def chunk_size(self, value: int):
+        """Setter for the size of blocks read from file"""
+        if value > 0:
+            self.debug("chunk_size::setter=%s", value)
+            self._chunk_size = value
+        else:
+            raise ValueError(f"Invalid chunk size: {value}")
+
+    def load(self, on_data: typing.Callable[[int, int], None] | None = None):
+        """
+        Hash the file in blocks of :attr:`chunk_size`, assigning its
+        hex digest to :attr:`data` and the raw one to :attr:`digest`.
+        If `on_data` is given, it is called with the number of hashed
+        bytes and the file size after each block
+        """
+        self.debug("load::%s::%s", self.filename, self.read_mode)
+        engine = HashEngine(algorithm="sha256", buffer_size=self.chunk_size)
+        sha256_hash = engine.hash_file(self.filename, on_data=on_data)
+        self.digest = sha256_hash.digest()
+        self.data = sha256_hash.hexdigest()
+
+    def verify_sha256(self) -> bool:
+        """Verify the computed digest against the provided sha256sum"""
+        return self.data == self.sha256sum.strip().lower()
+
+    def verify_signature(self) -> bool:
+        """Verify signature against the computed digest and public key"""
+        # pylint: disable=import-outside-toplevel
+        from cryptography.exceptions import InvalidSignature
+        from cryptography.hazmat.primitives import hashes, asymmetric
+        from cryptography.hazmat.primitives.asymmetric.utils import Prehashed
+
+        try:
+            algorithm = asymmetric.ec.ECDSA(Prehashed(hashes.SHA256()))
+            self.certificate.verify(self.signature, self.digest, algorithm)
+            return True
+        except InvalidSignature:
+            self.warning("Invalid signature for %s", self.filename)
+            return False
+
+    def verify(self) -> bool:
+        """Verify both sha256sum and signature"""
+        return self.verify_sha256() and self.verify_signature()
@@ -24,8 +24,10 @@ sha256_verifyer.py
 """
 
 import os
-import hashlib
+import typing
 from .base_verifyer import BaseVerifyer
+from .hash_engine import HashEngine
+from ..profiler import profiled
 
 
 class Sha256Verifyer(BaseVerifyer):
@@ -34,23 +36,21 @@ class Sha256Verifyer(BaseVerifyer):
     def __init__(self, filename: str):
         if os.path.exists(filename):
             super().__init__(filename, "rb")
+            self.engine = None
         else:
             raise ValueError(f"File {filename} do not exist")
 
-    def load(self):
-        """Load data from file and assigns its sha256sum"""
-        sha256_hash = hashlib.sha256()
-
-        self.debug(f"load::{self.filename}::{self.read_mode}")
-
-        # pylint: disable=unspecified-encoding
-        with open(self.filename, self.read_mode) as f_data:
-            # Read and update hash string value in blocks of 1K bytes
-            for byte_block in iter(lambda: f_data.read(1024), b""):
-                self.debug(f"load::block={byte_block}")
-                sha256_hash.update(byte_block)
-
-            self.data = sha256_hash.hexdigest()
+    @profiled("Sha256Verifyer.load")
+    def load(self, on_data: typing.Callable[[int, int], None] | None = None):
+        """
+        Load data from file and assigns its sha256sum. If `on_data` is given,
+        it is called with the number of hashed bytes and the file size after
+        each block, so callers can show the progress of big files
+        """
+        self.debug("load::%s::%s", self.filename, self.read_mode)
+        self.engine = HashEngine(algorithm="sha256")
+        sha256_hash = self.engine.hash_file(self.filename, on_data=on_data)
+        self.data = sha256_hash.hexdigest()
 
     def verify(self, sha256sum: str) -> bool:
         """Verify self.hash against a providede sha256_hash"""
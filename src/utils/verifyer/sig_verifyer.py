@@ -24,9 +24,8 @@ sig_verifyer.py
 """
 
 import typing
-from cryptography.exceptions import InvalidSignature
-from cryptography.hazmat.primitives import serialization, hashes, asymmetric
 from .check_verifyer import CheckVerifyer
+from ..profiler import profiled
 
 
 class SigVerifyer(CheckVerifyer):
@@ -34,11 +33,21 @@ class SigVerifyer(CheckVerifyer):
 
     def __init__(self, filename: str, signature: str, pubkey: str, regexp: typing.re):
         super().__init__(filename=filename, read_mode="rb", regexp=regexp)
+
+        # import here, so cryptography is only loaded to verify a release
+        # pylint: disable=import-outside-toplevel
+        from cryptography.hazmat.primitives import serialization
+
         self.certificate = serialization.load_pem_public_key(pubkey)
         self.signature = signature
 
+    @profiled("SigVerifyer.verify")
     def verify(self) -> bool:
         """Apply signature verification against a signature data and public key data"""
+        # pylint: disable=import-outside-toplevel
+        from cryptography.exceptions import InvalidSignature
+        from cryptography.hazmat.primitives import hashes, asymmetric
+
         try:
             algorithm = asymmetric.ec.ECDSA(hashes.SHA256())
             self.certificate.verify(self.signature, self.data, algorithm)
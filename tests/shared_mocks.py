@@ -25,7 +25,6 @@ was-called-on-a-specific-instance
 """
 
 import typing
-import sys
 from unittest.mock import Mock, MagicMock, PropertyMock
 
 
@@ -127,26 +126,6 @@ class MonkeyPort:
         self.device = device
 
 
-class MockListPortsGrep(MagicMock):
-
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.devices = []
-
-        if sys.platform in ("linux", "darwin"):
-            self.devices = [
-                MagicMock(vid="0403", device="/mock/path0"),
-                MagicMock(vid="0403", device="/mock/path1"),
-                MagicMock(vid="7523", device="/mock/path0"),
-            ]
-        elif sys.platform == "win32":
-            self.devices = [
-                MagicMock(vid="0403", device="MOCK0"),
-                MagicMock(vid="0403", device="MOCK1"),
-                MagicMock(vid="7523", device="MOCK0"),
-            ]
-
-
 class MockSerial(MagicMock):
 
     def __init__(self, *args, **kwargs):
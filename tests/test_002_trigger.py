@@ -1,41 +1,90 @@
-import os
+import logging
 from unittest import TestCase
-from unittest.mock import patch
+from unittest.mock import patch, MagicMock
 from src.utils.trigger import Trigger
 
 
+class MockTrigger(Trigger):
+    pass
+
+
 class TestTrigger(TestCase):
 
-    @patch("src.utils.trigger.mro", return_value="Mock")
-    def test_info(self, mock_mro):
-        t = Trigger()
+    def test_logger_per_class(self):
+        self.assertEqual(Trigger.logger.name, "kivy.Trigger")
+        self.assertEqual(MockTrigger.logger.name, "kivy.MockTrigger")
+        self.assertIs(MockTrigger().logger, MockTrigger.logger)
+
+    @patch.object(MockTrigger, "logger")
+    def test_info(self, mock_logger):
+        mock_logger.isEnabledFor.return_value = True
+        t = MockTrigger()
         t.info("Hello World")
-        mock_mro.assert_called_once()
-
-    @patch.dict(os.environ, {"LOGLEVEL": "warning"}, clear=True)
-    @patch("src.utils.trigger.mro", return_value="Mock")
-    def test_warn(self, mock_mro):
-        trigger = Trigger()
-        trigger.warning("Hello World")
-        mock_mro.assert_called_once()
-
-    @patch.dict(os.environ, {"LOGLEVEL": "warning"}, clear=True)
-    @patch("src.utils.trigger.mro", return_value="Mock")
-    def test_error(self, mock_mro):
-        trigger = Trigger()
-        trigger.error("Hello World")
-        mock_mro.assert_called_once()
-
-    @patch.dict(os.environ, {"LOGLEVEL": "debug"}, clear=True)
-    @patch("src.utils.trigger.mro", return_value="Mock")
-    def test_debug(self, mock_mro):
-        trigger = Trigger()
-        trigger.debug("Hello World")
-        mock_mro.assert_called_once()
-
-    @patch.dict(os.environ, {"LOGLEVEL": "critical"}, clear=True)
-    @patch("src.utils.trigger.mro", return_value="Mock")
-    def test_critical(self, mock_mro):
-        trigger = Trigger()
+        mock_logger.isEnabledFor.assert_called_once_with(logging.INFO)
+        mock_logger.log.assert_called_once_with(
+            logging.INFO, "%s: %s", "MockTrigger", "Hello World"
+        )
+
+    @patch.object(MockTrigger, "logger")
+    def test_warn(self, mock_logger):
+        mock_logger.isEnabledFor.return_value = True
+        trigger = MockTrigger()
+        trigger.warning("Hello %s", "World")
+        mock_logger.log.assert_called_once_with(
+            logging.WARNING, "%s: %s", "MockTrigger", "Hello World"
+        )
+
+    @patch.object(MockTrigger, "logger")
+    def test_error(self, mock_logger):
+        mock_logger.isEnabledFor.return_value = True
+        trigger = MockTrigger()
+        trigger.error("100%% %s", "World")
+        mock_logger.log.assert_called_once_with(
+            logging.ERROR, "%s: %s", "MockTrigger", "100% World"
+        )
+
+    @patch.object(MockTrigger, "logger")
+    def test_debug(self, mock_logger):
+        mock_logger.isEnabledFor.return_value = True
+        trigger = MockTrigger()
+        trigger.debug("100% World")
+        mock_logger.log.assert_called_once_with(
+            logging.DEBUG, "%s: %s", "MockTrigger", "100% World"
+        )
+
+    @patch.object(MockTrigger, "logger")
+    def test_critical(self, mock_logger):
+        mock_logger.isEnabledFor.return_value = True
+        trigger = MockTrigger()
         trigger.critical("Hello World")
-        mock_mro.assert_called_once()
+        mock_logger.log.assert_called_once_with(
+            logging.CRITICAL, "%s: %s", "MockTrigger", "Hello World"
+        )
+
+    @patch.object(MockTrigger, "logger")
+    def test_debug_disabled(self, mock_logger):
+        mock_logger.isEnabledFor.return_value = False
+        arg = MagicMock()
+        arg.__str__ = MagicMock(return_value="data")
+        trigger = MockTrigger()
+        trigger.debug("data=%s", arg)
+        mock_logger.log.assert_not_called()
+        arg.__str__.assert_not_called()
+
+    def test_logger_is_kivy_logger(self):
+        # pylint: disable=import-outside-toplevel
+        from kivy.logger import Logger
+        from src.utils.trigger import Logger as TriggerLogger
+
+        self.assertIs(TriggerLogger, Logger)
+        self.assertIs(MockTrigger.logger.parent, Logger)
+
+    @patch.object(MockTrigger, "logger")
+    def test_log(self, mock_logger):
+        mock_logger.isEnabledFor.side_effect = lambda level: level >= logging.INFO
+        trigger = MockTrigger()
+        trigger.log(logging.DEBUG, "Hello %s", "World")
+        trigger.log(logging.INFO, "Hello %s", "World")
+        mock_logger.log.assert_called_once_with(
+            logging.INFO, "%s: %s", "MockTrigger", "Hello World"
+        )
@@ -1,6 +1,8 @@
+import tempfile
 from unittest import TestCase
 from unittest.mock import MagicMock, patch
 import requests
+from src.utils.cache import HttpCache
 from src.utils.selector import Selector
 
 
@@ -19,21 +21,23 @@ MOCKED_FOUND_API = [
 
 class TestSelector(TestCase):
 
-    @patch("src.utils.selector.requests")
-    def test_init(self, mock_requests):
+    @patch("src.utils.selector.catalog_fetcher.get_session")
+    def test_init(self, mock_get_session):
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.json.return_value = MOCKED_FOUND_API
-        mock_requests.get.return_value = mock_response
+        mock_response.links = {}
+        mock_get_session.return_value.get.return_value = mock_response
 
         selector = Selector()
 
-        mock_requests.get.assert_called_once_with(
+        mock_get_session.return_value.get.assert_called_once_with(
             url="https://api.github.com/repos/selfcustody/krux/releases",
             headers={
                 "Accept": "application/vnd.github+json",
                 "X-GitHub-Api-Version": "2022-11-28",
             },
+            params={"per_page": 100},
             timeout=10,
         )
 
@@ -41,12 +45,13 @@ class TestSelector(TestCase):
         self.assertEqual(selector.releases[1], "v0.1.0")
         self.assertEqual(selector.releases[2], "v1.0.0")
 
-    @patch("src.utils.selector.requests")
-    def test_fail_init_empty_data(self, mock_requests):
+    @patch("src.utils.selector.catalog_fetcher.get_session")
+    def test_fail_init_empty_data(self, mock_get_session):
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.json.return_value = MOCKED_EMPTY_API
-        mock_requests.get.return_value = mock_response
+        mock_response.links = {}
+        mock_get_session.return_value.get.return_value = mock_response
 
         with self.assertRaises(ValueError) as exc_info:
             Selector()
@@ -56,12 +61,13 @@ class TestSelector(TestCase):
             "https://api.github.com/repos/selfcustody/krux/releases returned empty data",
         )
 
-    @patch("src.utils.selector.requests")
-    def test_fail_init_wrong_data(self, mock_requests):
+    @patch("src.utils.selector.catalog_fetcher.get_session")
+    def test_fail_init_wrong_data(self, mock_get_session):
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.json.return_value = MOCKED_WRONG_API
-        mock_requests.get.return_value = mock_response
+        mock_response.links = {}
+        mock_get_session.return_value.get.return_value = mock_response
 
         with self.assertRaises(KeyError) as exc_info:
             Selector()
@@ -70,68 +76,65 @@ class TestSelector(TestCase):
             str(exc_info.exception), "\"Invalid key: 'tag_name' do not exist on api\""
         )
 
-    @patch("src.utils.selector.requests")
-    def test_fail_init_http_error_404(self, mock_requests):
+    @patch("src.utils.selector.catalog_fetcher.get_session")
+    def test_fail_init_http_error_404(self, mock_get_session):
         mock_response = MagicMock(status_code=404)
         mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError(
             "Mocked 404"
         )
-        mock_requests.exceptions = requests.exceptions
-        mock_requests.get.return_value = mock_response
+        mock_get_session.return_value.get.return_value = mock_response
 
         with self.assertRaises(RuntimeError) as exc_info:
             Selector()
 
         self.assertEqual(str(exc_info.exception), "Mocked 404")
 
-    @patch("src.utils.selector.requests")
-    def test_fail_init_http_error_500(self, mock_requests):
+    @patch("src.utils.selector.catalog_fetcher.get_session")
+    def test_fail_init_http_error_500(self, mock_get_session):
         mock_response = MagicMock(status_code=500)
         mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError(
             "Mocked 500"
         )
-        mock_requests.exceptions = requests.exceptions
-        mock_requests.get.return_value = mock_response
+        mock_get_session.return_value.get.return_value = mock_response
 
         with self.assertRaises(RuntimeError) as exc_info:
             Selector()
 
         self.assertEqual(str(exc_info.exception), "Mocked 500")
 
-    @patch("src.utils.selector.requests")
-    def test_fail_init_timeout(self, mock_requests):
+    @patch("src.utils.selector.catalog_fetcher.get_session")
+    def test_fail_init_timeout(self, mock_get_session):
         mock_response = MagicMock(status_code=404)
         mock_response.raise_for_status.side_effect = requests.exceptions.Timeout(
             "Mocked timeout"
         )
-        mock_requests.exceptions = requests.exceptions
-        mock_requests.get.return_value = mock_response
+        mock_get_session.return_value.get.return_value = mock_response
 
         with self.assertRaises(RuntimeError) as exc_info:
             Selector()
 
         self.assertEqual(str(exc_info.exception), "Mocked timeout")
 
-    @patch("src.utils.selector.requests")
-    def test_fail_init_http_connection_error(self, mock_requests):
+    @patch("src.utils.selector.catalog_fetcher.get_session")
+    def test_fail_init_http_connection_error(self, mock_get_session):
         mock_response = MagicMock(status_code=404)
         mock_response.raise_for_status.side_effect = (
             requests.exceptions.ConnectionError("Mocked connection")
         )
-        mock_requests.exceptions = requests.exceptions
-        mock_requests.get.return_value = mock_response
+        mock_get_session.return_value.get.return_value = mock_response
 
         with self.assertRaises(RuntimeError) as exc_info:
             Selector()
 
         self.assertEqual(str(exc_info.exception), "Mocked connection")
 
-    @patch("src.utils.selector.requests")
-    def test_set_get_device(self, mock_requests):
+    @patch("src.utils.selector.catalog_fetcher.get_session")
+    def test_set_get_device(self, mock_get_session):
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.json.return_value = MOCKED_FOUND_API
-        mock_requests.get.return_value = mock_response
+        mock_response.links = {}
+        mock_get_session.return_value.get.return_value = mock_response
 
         selector = Selector()
 
@@ -139,12 +142,13 @@ class TestSelector(TestCase):
             selector.device = device
             self.assertEqual(selector.device, device)
 
-    @patch("src.utils.selector.requests")
-    def test_fail_set_device(self, mock_requests):
+    @patch("src.utils.selector.catalog_fetcher.get_session")
+    def test_fail_set_device(self, mock_get_session):
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.json.return_value = MOCKED_FOUND_API
-        mock_requests.get.return_value = mock_response
+        mock_response.links = {}
+        mock_get_session.return_value.get.return_value = mock_response
 
         with self.assertRaises(ValueError) as exc_info:
             selector = Selector()
@@ -152,27 +156,129 @@ class TestSelector(TestCase):
 
         self.assertEqual(str(exc_info.exception), "Device 'mock' is not valid")
 
-    @patch("src.utils.selector.requests")
-    def test_set_get_firmware(self, mock_requests):
+    @patch("src.utils.selector.catalog_fetcher.get_session")
+    def test_set_get_firmware(self, mock_get_session):
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.json.return_value = MOCKED_FOUND_API
-        mock_requests.get.return_value = mock_response
+        mock_response.links = {}
+        mock_get_session.return_value.get.return_value = mock_response
 
         selector = Selector()
         for version in ("v0.0.1", "v0.1.0", "v1.0.0"):
             selector.firmware = version
             self.assertTrue(selector.firmware in ("v0.0.1", "v0.1.0", "v1.0.0"))
 
-    @patch("src.utils.selector.requests")
-    def test_fail_set_firmware(self, mock_requests):
+    @patch("src.utils.selector.catalog_fetcher.get_session")
+    def test_fail_set_firmware(self, mock_get_session):
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.json.return_value = MOCKED_FOUND_API
-        mock_requests.get.return_value = mock_response
+        mock_response.links = {}
+        mock_get_session.return_value.get.return_value = mock_response
 
         with self.assertRaises(ValueError) as exc_info:
             selector = Selector()
             selector.firmware = "v0.0.111"
 
         self.assertEqual(str(exc_info.exception), "Firmware 'v0.0.111' is not valid")
+
+    @patch("src.utils.selector.catalog_fetcher.get_session")
+    def test_init_store_releases_on_cache(self, mock_get_session):
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.headers = {"ETag": 'W/"abc"'}
+        mock_response.json.return_value = MOCKED_FOUND_API
+        mock_response.links = {}
+        mock_get_session.return_value.get.return_value = mock_response
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            selector = Selector(cachedir=tmpdir)
+            entry = HttpCache(cachedir=tmpdir).load(Selector.URL)
+
+        self.assertEqual(
+            selector.releases, ["v0.0.1", "v0.1.0", "v1.0.0", "odudex/krux_binaries"]
+        )
+        self.assertEqual(entry["etag"], 'W/"abc"')
+        self.assertEqual(
+            entry["body"],
+            [
+                {"tag_name": "v0.0.1", "assets": []},
+                {"tag_name": "v0.1.0", "assets": []},
+                {"tag_name": "v1.0.0", "assets": []},
+            ],
+        )
+
+    @patch("src.utils.selector.catalog_fetcher.get_session")
+    def test_init_not_modified_releases_from_cache(self, mock_get_session):
+        mock_response = MagicMock()
+        mock_response.status_code = 304
+        mock_get_session.return_value.get.return_value = mock_response
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            HttpCache(cachedir=tmpdir).store(
+                url=Selector.URL, body=MOCKED_FOUND_API, etag='W/"abc"'
+            )
+            selector = Selector(cachedir=tmpdir)
+
+        mock_get_session.return_value.get.assert_called_once_with(
+            url="https://api.github.com/repos/selfcustody/krux/releases",
+            headers={
+                "Accept": "application/vnd.github+json",
+                "X-GitHub-Api-Version": "2022-11-28",
+                "If-None-Match": 'W/"abc"',
+            },
+            params={"per_page": 100},
+            timeout=10,
+        )
+        mock_response.json.assert_not_called()
+        self.assertEqual(
+            selector.releases, ["v0.0.1", "v0.1.0", "v1.0.0", "odudex/krux_binaries"]
+        )
+
+    @patch("src.utils.selector.catalog_fetcher.get_session")
+    def test_init_modified_releases_update_cache(self, mock_get_session):
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.headers = {"ETag": 'W/"def"'}
+        mock_response.json.return_value = [{"tag_name": "v2.0.0"}]
+        mock_response.links = {}
+        mock_get_session.return_value.get.return_value = mock_response
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            HttpCache(cachedir=tmpdir).store(
+                url=Selector.URL, body=MOCKED_FOUND_API, etag='W/"abc"'
+            )
+            selector = Selector(cachedir=tmpdir)
+            entry = HttpCache(cachedir=tmpdir).load(Selector.URL)
+
+        self.assertEqual(selector.releases, ["v2.0.0", "odudex/krux_binaries"])
+        self.assertEqual(entry["etag"], 'W/"def"')
+        self.assertEqual(entry["body"], [{"tag_name": "v2.0.0", "assets": []}])
+
+    @patch("src.utils.selector.catalog_fetcher.get_session")
+    def test_init_incremental_releases_from_cache(self, mock_get_session):
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.headers = {"ETag": 'W/"def"'}
+        mock_response.json.return_value = [{"tag_name": "v2.0.0"}] + MOCKED_FOUND_API
+        mock_response.links = {
+            "next": {"url": f"{Selector.URL}?per_page=100&page=2", "rel": "next"}
+        }
+        mock_get_session.return_value.get.return_value = mock_response
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            HttpCache(cachedir=tmpdir).store(
+                url=Selector.URL, body=MOCKED_FOUND_API, etag='W/"abc"'
+            )
+            selector = Selector(cachedir=tmpdir)
+            entry = HttpCache(cachedir=tmpdir).load(Selector.URL)
+
+        # stop on the first known tag, without following the next page
+        mock_get_session.return_value.get.assert_called_once()
+        self.assertEqual(
+            selector.releases,
+            ["v2.0.0", "v0.0.1", "v0.1.0", "v1.0.0", "odudex/krux_binaries"],
+        )
+        self.assertEqual(entry["etag"], 'W/"def"')
+        self.assertEqual(len(entry["body"]), 4)
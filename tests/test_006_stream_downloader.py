@@ -43,19 +43,19 @@ class TestStreamDownloader(TestCase):
 
         on_data.assert_has_calls(calls, any_order=True)
 
-    @patch("src.utils.downloader.stream_downloader.requests")
-    def test_download_file_stream(self, mock_requests):
+    @patch("src.utils.downloader.stream_downloader.get_session")
+    def test_download_file_stream(self, mock_get_session):
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.headers = {"Content-Length": "210000"}
         mock_response.json.return_value = MOCKED_FOUND_API
-        mock_requests.get.return_value = mock_response
+        mock_get_session.return_value.get.return_value = mock_response
 
         sd = StreamDownloader(url=URL)
         setattr(sd, "on_data", MagicMock())
         sd.download_file_stream(url="https://any.call/test.zip")
 
-        mock_requests.get.assert_called_once_with(
+        mock_get_session.return_value.get.assert_called_once_with(
             url="https://any.call/test.zip",
             stream=True,
             headers={
@@ -66,10 +66,12 @@ class TestStreamDownloader(TestCase):
             },
             timeout=30,
         )
-        mock_requests.get.return_value.iter_content.assert_called_with(chunk_size=1024)
+        mock_get_session.return_value.get.return_value.iter_content.assert_called_with(
+            chunk_size=1024
+        )
 
-    @patch("src.utils.downloader.stream_downloader.requests")
-    def test_download_file_stream_process_data(self, mock_requests):
+    @patch("src.utils.downloader.stream_downloader.get_session")
+    def test_download_file_stream_process_data(self, mock_get_session):
         # fake a zip file to be downloaded
         file = io.BytesIO()
 
@@ -88,7 +90,7 @@ class TestStreamDownloader(TestCase):
         mock_response.headers = {"Content-Length": "210000"}
         mock_response.json.return_value = MOCKED_FOUND_API
         mock_response.iter_content.return_value = stream
-        mock_requests.get.return_value = mock_response
+        mock_get_session.return_value.get.return_value = mock_response
 
         sd = StreamDownloader(url=URL)
 
@@ -100,7 +102,7 @@ class TestStreamDownloader(TestCase):
         # download
         sd.download_file_stream(url="https://any.call/test.zip")
 
-        mock_requests.get.assert_called_once_with(
+        mock_get_session.return_value.get.assert_called_once_with(
             url="https://any.call/test.zip",
             stream=True,
             headers={
@@ -111,18 +113,20 @@ class TestStreamDownloader(TestCase):
             },
             timeout=30,
         )
-        mock_requests.get.return_value.iter_content.assert_called_with(chunk_size=1024)
+        mock_get_session.return_value.get.return_value.iter_content.assert_called_with(
+            chunk_size=1024
+        )
         assert len(on_data.mock_calls) > 0
         on_data.assert_has_calls([call()(data=[])], any_order=True)
 
-    @patch("src.utils.downloader.stream_downloader.requests")
-    def test_fail_download_file_stream_no_content_len_header(self, mock_requests):
+    @patch("src.utils.downloader.stream_downloader.get_session")
+    def test_fail_download_file_stream_no_content_len_header(self, mock_get_session):
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.headers = MagicMock()
         mock_response.headers = {"No-Content-Length": "210000"}
         mock_response.json.return_value = MOCKED_FOUND_API
-        mock_requests.get.return_value = mock_response
+        mock_get_session.return_value.get.return_value = mock_response
 
         with self.assertRaises(RuntimeError) as exc_info:
             sd = StreamDownloader(url=URL)
@@ -133,7 +137,7 @@ class TestStreamDownloader(TestCase):
             "Empty Content-Length response for https://any.call/test.zip",
         )
 
-        mock_requests.get.assert_called_once_with(
+        mock_get_session.return_value.get.assert_called_once_with(
             url="https://any.call/test.zip",
             stream=True,
             headers={
@@ -145,12 +149,11 @@ class TestStreamDownloader(TestCase):
             timeout=30,
         )
 
-    @patch("src.utils.downloader.stream_downloader.requests")
-    def test_fail_server_error_download_file_stream(self, mock_requests):
+    @patch("src.utils.downloader.stream_downloader.get_session")
+    def test_fail_server_error_download_file_stream(self, mock_get_session):
         mock_response = MagicMock(status_code=500)
         mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError()
-        mock_requests.exceptions = requests.exceptions
-        mock_requests.get.return_value = mock_response
+        mock_get_session.return_value.get.return_value = mock_response
 
         with self.assertRaises(RuntimeError) as exc_info:
             sd = StreamDownloader(url=URL)
@@ -158,38 +161,42 @@ class TestStreamDownloader(TestCase):
 
         self.assertEqual(str(exc_info.exception), "HTTP error 500: None")
 
-    @patch("src.utils.downloader.stream_downloader.requests")
-    def test_fail_timeout_download_file_stream(self, mock_requests):
+    @patch("src.utils.downloader.stream_downloader.time.sleep", return_value=None)
+    @patch("src.utils.downloader.stream_downloader.get_session")
+    def test_fail_timeout_download_file_stream(self, mock_get_session, mock_sleep):
         mock_response = MagicMock()
         mock_response.raise_for_status.side_effect = requests.exceptions.Timeout()
-        mock_requests.exceptions = requests.exceptions
-        mock_requests.get.return_value = mock_response
+        mock_get_session.return_value.get.return_value = mock_response
 
         with self.assertRaises(RuntimeError) as exc_info:
             sd = StreamDownloader(url=URL)
             sd.download_file_stream(url="https://any.request/test.zip")
 
         self.assertEqual(str(exc_info.exception), "Download timeout error: None")
+        self.assertEqual(mock_get_session.return_value.get.call_count, 6)
+        mock_sleep.assert_has_calls([call(2**i) for i in range(1, 6)])
 
-    @patch("src.utils.downloader.stream_downloader.requests")
-    def test_fail_connection_download_file_stream(self, mock_requests):
+    @patch("src.utils.downloader.stream_downloader.time.sleep", return_value=None)
+    @patch("src.utils.downloader.stream_downloader.get_session")
+    def test_fail_connection_download_file_stream(self, mock_get_session, mock_sleep):
         mock_response = MagicMock()
         mock_response.raise_for_status.side_effect = (
             requests.exceptions.ConnectionError()
         )
-        mock_requests.exceptions = requests.exceptions
-        mock_requests.get.return_value = mock_response
+        mock_get_session.return_value.get.return_value = mock_response
 
         with self.assertRaises(RuntimeError) as exc_info:
             sd = StreamDownloader(url=URL)
             sd.download_file_stream(url="https://any.request/test.zip")
 
         self.assertEqual(str(exc_info.exception), "Download connection error: None")
+        self.assertEqual(mock_get_session.return_value.get.call_count, 6)
+        mock_sleep.assert_has_calls([call(2**i) for i in range(1, 6)])
 
     @patch("src.utils.downloader.stream_downloader.time.sleep", return_value=None)
-    @patch("src.utils.downloader.stream_downloader.requests")
+    @patch("src.utils.downloader.stream_downloader.get_session")
     def test_fail_rate_limit_exceeded_download_file_stream(
-        self, mock_requests, mock_sleep
+        self, mock_get_session, mock_sleep
     ):
         mock_response = MagicMock()
         mock_response.status_code = 429
@@ -199,8 +206,7 @@ class TestStreamDownloader(TestCase):
         http_error.response = mock_response
         mock_response.raise_for_status.side_effect = http_error
 
-        mock_requests.exceptions = requests.exceptions
-        mock_requests.get.return_value = mock_response
+        mock_get_session.return_value.get.return_value = mock_response
 
         max_retries = 2
 
@@ -214,7 +220,9 @@ class TestStreamDownloader(TestCase):
         self.assertEqual(str(exc_info.exception), "HTTP error 429: None")
 
         expected_attempts = 1 + max_retries
-        self.assertEqual(mock_requests.get.call_count, expected_attempts)
+        self.assertEqual(
+            mock_get_session.return_value.get.call_count, expected_attempts
+        )
 
         self.assertEqual(mock_sleep.call_count, max_retries)
 
@@ -222,7 +230,7 @@ class TestStreamDownloader(TestCase):
         mock_sleep.assert_has_calls(expected_sleep_calls)
 
         for i in range(expected_attempts):
-            mock_requests.get.assert_any_call(
+            mock_get_session.return_value.get.assert_any_call(
                 url="https://any.request/test429.zip",
                 stream=True,
                 headers={
@@ -235,8 +243,8 @@ class TestStreamDownloader(TestCase):
             )
 
     @patch("src.utils.downloader.stream_downloader.time.sleep", return_value=None)
-    @patch("src.utils.downloader.stream_downloader.requests")
-    def test_rate_limit_retry_then_success(self, mock_requests, mock_sleep):
+    @patch("src.utils.downloader.stream_downloader.get_session")
+    def test_rate_limit_retry_then_success(self, mock_get_session, mock_sleep):
         mock_response_429 = MagicMock()
         mock_response_429.status_code = 429
         http_error = requests.exceptions.HTTPError()
@@ -248,22 +256,126 @@ class TestStreamDownloader(TestCase):
         mock_response_200.iter_content.return_value = [[b"test", b"data"]]
         mock_response_200.raise_for_status.return_value = None
 
-        mock_requests.get.side_effect = [
+        mock_get_session.return_value.get.side_effect = [
             mock_response_429,
             mock_response_429,
             mock_response_200,
         ]
-        mock_requests.exceptions = requests.exceptions
 
         sd = StreamDownloader(url=URL)
         setattr(sd, "on_data", MagicMock())
 
         sd.download_file_stream(url="https://any.call/test.zip", max_retries=5)
 
-        self.assertEqual(mock_requests.get.call_count, 3)
+        self.assertEqual(mock_get_session.return_value.get.call_count, 3)
 
         self.assertEqual(mock_sleep.call_count, 2)
         expected_sleep_calls = [call(2), call(4)]
         mock_sleep.assert_has_calls(expected_sleep_calls)
 
         self.assertEqual(sd.content_len, 210000)
+
+    @patch("src.utils.downloader.stream_downloader.time.sleep", return_value=None)
+    @patch("src.utils.downloader.stream_downloader.get_session")
+    def test_resume_after_connection_reset(self, mock_get_session, mock_sleep):
+        def broken_stream(**_):
+            yield b"krux"
+            raise requests.exceptions.ChunkedEncodingError()
+
+        mock_response_200 = MagicMock()
+        mock_response_200.status_code = 200
+        mock_response_200.headers = {"Content-Length": "12", "ETag": '"abc"'}
+        mock_response_200.iter_content.side_effect = broken_stream
+
+        mock_response_206 = MagicMock()
+        mock_response_206.status_code = 206
+        mock_response_206.headers = {
+            "Content-Length": "8",
+            "Content-Range": "bytes 4-11/12",
+        }
+        mock_response_206.iter_content.return_value = [b"-install"]
+
+        mock_get_session.return_value.get.side_effect = [
+            mock_response_200,
+            mock_response_206,
+        ]
+
+        sd = StreamDownloader(url=URL)
+        on_data = MagicMock()
+        on_restart = MagicMock()
+        setattr(sd, "on_data", on_data)
+        setattr(sd, "on_restart", on_restart)
+
+        sd.download_file_stream(url="https://any.call/test.zip")
+
+        mock_get_session.return_value.get.assert_called_with(
+            url="https://any.call/test.zip",
+            stream=True,
+            headers={
+                "Content-Disposition": "attachment filename=test.zip",
+                "Connection": "keep-alive",
+                "Cache-Control": "max-age=0",
+                "Accept-Encoding": "identity",
+                "Range": "bytes=4-",
+                "If-Range": '"abc"',
+            },
+            timeout=30,
+        )
+        mock_sleep.assert_called_once_with(2)
+        on_data.assert_has_calls([call(data=b"krux"), call(data=b"-install")])
+        on_restart.assert_not_called()
+        self.assertEqual(sd.content_len, 12)
+        self.assertEqual(sd.downloaded_len, 12)
+
+    @patch("src.utils.downloader.stream_downloader.get_session")
+    def test_resume_from_offset_ignored_by_server(self, mock_get_session):
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.headers = {"Content-Length": "12"}
+        mock_response.iter_content.return_value = [b"krux-install"]
+        mock_get_session.return_value.get.return_value = mock_response
+
+        sd = StreamDownloader(url=URL)
+        sd.last_modified = "Wed, 21 Oct 2015 07:28:00 GMT"
+        on_data = MagicMock()
+        on_restart = MagicMock()
+        setattr(sd, "on_data", on_data)
+        setattr(sd, "on_restart", on_restart)
+
+        sd.download_file_stream(url="https://any.call/test.zip", offset=4)
+
+        headers = mock_get_session.return_value.get.call_args.kwargs["headers"]
+        self.assertEqual(headers["Range"], "bytes=4-")
+        self.assertEqual(headers["If-Range"], "Wed, 21 Oct 2015 07:28:00 GMT")
+        on_restart.assert_called_once()
+        on_data.assert_called_once_with(data=b"krux-install")
+        self.assertEqual(sd.content_len, 12)
+        self.assertEqual(sd.downloaded_len, 12)
+
+    @patch("src.utils.downloader.stream_downloader.get_session")
+    def test_restart_on_range_not_satisfiable(self, mock_get_session):
+        mock_response_416 = MagicMock()
+        mock_response_416.status_code = 416
+        mock_response_416.raise_for_status.side_effect = requests.exceptions.HTTPError()
+        mock_response_200 = MagicMock()
+        mock_response_200.status_code = 200
+        mock_response_200.headers = {"Content-Length": "12"}
+        mock_response_200.iter_content.return_value = [b"krux-install"]
+        mock_get_session.return_value.get.side_effect = [
+            mock_response_416,
+            mock_response_200,
+        ]
+
+        sd = StreamDownloader(url=URL)
+        on_data = MagicMock()
+        on_restart = MagicMock()
+        setattr(sd, "on_data", on_data)
+        setattr(sd, "on_restart", on_restart)
+
+        sd.download_file_stream(url="https://any.call/test.zip", offset=20)
+
+        self.assertNotIn(
+            "Range", mock_get_session.return_value.get.call_args.kwargs["headers"]
+        )
+        on_restart.assert_called_once()
+        self.assertEqual(sd.downloaded_len, 12)
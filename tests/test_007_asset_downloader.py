@@ -1,5 +1,8 @@
 import io
+import os
 import sys
+import json
+import tempfile
 from unittest import TestCase
 from unittest.mock import MagicMock, patch, mock_open
 from src.utils.downloader.asset_downloader import AssetDownloader
@@ -59,10 +62,14 @@ class TestAssetDownloader(TestCase):
 
         self.assertEqual(str(exc_info.exception), "Write Mode 'r' not supported")
 
+    @patch("src.utils.downloader.asset_downloader.os.replace")
+    @patch("src.utils.downloader.asset_downloader.os.fsync")
     @patch("builtins.open", new_callable=mock_open)
     @patch("tempfile.gettempdir")
-    @patch("src.utils.downloader.stream_downloader.requests")
-    def test_download_wb(self, mock_requests, mock_gettempdir, open_mock):
+    @patch("src.utils.downloader.stream_downloader.get_session")
+    def test_download_wb(
+        self, mock_get_session, mock_gettempdir, open_mock, mock_fsync, mock_replace
+    ):
         if sys.platform in ("linux", "darwin"):
             mock_gettempdir.return_value = "/tmp/dir"
 
@@ -83,7 +90,7 @@ class TestAssetDownloader(TestCase):
         mock_response.headers = {"Content-Length": "210000"}
         mock_response.json.return_value = MOCKED_FOUND_API
         mock_response.iter_content.return_value = stream
-        mock_requests.get.return_value = mock_response
+        mock_get_session.return_value.get.return_value = mock_response
 
         a = AssetDownloader(
             url="https://github.com/selfcustody/krux/asset.zip",
@@ -95,15 +102,27 @@ class TestAssetDownloader(TestCase):
         a.download(on_data=mock_on_data)
 
         if sys.platform in ("linux", "darwin"):
-            open_mock.assert_called_once_with("/tmp/dir/asset.zip", "wb")
+            open_mock.assert_called_once_with("/tmp/dir/asset.zip.part", "wb")
+            mock_replace.assert_called_once_with(
+                "/tmp/dir/asset.zip.part", "/tmp/dir/asset.zip"
+            )
 
         if sys.platform == "win32":
-            open_mock.assert_called_once_with("C:\\tmp\\dir\\asset.zip", "wb")
+            open_mock.assert_called_once_with("C:\\tmp\\dir\\asset.zip.part", "wb")
+            mock_replace.assert_called_once_with(
+                "C:\\tmp\\dir\\asset.zip.part", "C:\\tmp\\dir\\asset.zip"
+            )
+
+        mock_fsync.assert_called_once()
 
+    @patch("src.utils.downloader.asset_downloader.os.replace")
+    @patch("src.utils.downloader.asset_downloader.os.fsync")
     @patch("builtins.open", new_callable=mock_open)
     @patch("tempfile.gettempdir")
-    @patch("src.utils.downloader.stream_downloader.requests")
-    def test_download_w(self, mock_requests, mock_gettempdir, open_mock):
+    @patch("src.utils.downloader.stream_downloader.get_session")
+    def test_download_w(
+        self, mock_get_session, mock_gettempdir, open_mock, mock_fsync, mock_replace
+    ):
         if sys.platform in ("linux", "darwin"):
             mock_gettempdir.return_value = "/tmp/dir"
 
@@ -122,7 +141,7 @@ class TestAssetDownloader(TestCase):
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.iter_content.return_value = stream
-        mock_requests.get.return_value = mock_response
+        mock_get_session.return_value.get.return_value = mock_response
 
         a = AssetDownloader(
             url="https://github.com/selfcustody/krux/asset.txt",
@@ -135,10 +154,195 @@ class TestAssetDownloader(TestCase):
 
         if sys.platform in ("linux", "darwin"):
             open_mock.assert_called_once_with(
-                "/tmp/dir/asset.txt", "w", encoding="utf8"
+                "/tmp/dir/asset.txt.part", "w", encoding="utf8"
+            )
+            mock_replace.assert_called_once_with(
+                "/tmp/dir/asset.txt.part", "/tmp/dir/asset.txt"
             )
 
         if sys.platform == "win32":
             open_mock.assert_called_once_with(
-                "C:\\tmp\\dir\\asset.txt", "w", encoding="utf8"
+                "C:\\tmp\\dir\\asset.txt.part", "w", encoding="utf8"
+            )
+            mock_replace.assert_called_once_with(
+                "C:\\tmp\\dir\\asset.txt.part", "C:\\tmp\\dir\\asset.txt"
+            )
+
+        mock_fsync.assert_called_once()
+
+    @patch("src.utils.downloader.stream_downloader.get_session")
+    def test_download_streams_to_disk(self, mock_get_session):
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.headers = {"Content-Length": "12"}
+        mock_response.iter_content.return_value = [b"krux", b"-inst", b"all"]
+        mock_get_session.return_value.get.return_value = mock_response
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            a = AssetDownloader(
+                url="https://github.com/selfcustody/krux/asset.zip",
+                destdir=tmpdir,
+                write_mode="wb",
+            )
+            destfile = a.download(on_data=MagicMock())
+
+            self.assertEqual(destfile, os.path.join(tmpdir, "asset.zip"))
+            self.assertEqual(os.listdir(tmpdir), ["asset.zip"])
+            with open(destfile, "rb") as file:
+                self.assertEqual(file.read(), b"krux-install")
+
+    @patch("src.utils.downloader.stream_downloader.get_session")
+    def test_download_w_split_multibyte_char(self, mock_get_session):
+        text = "ação".encode("utf8")
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.headers = {"Content-Length": str(len(text))}
+        mock_response.iter_content.return_value = [text[:2], text[2:]]
+        mock_get_session.return_value.get.return_value = mock_response
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            a = AssetDownloader(
+                url="https://github.com/selfcustody/krux/asset.txt",
+                destdir=tmpdir,
+                write_mode="w",
+            )
+            destfile = a.download(on_data=MagicMock())
+
+            with open(destfile, "r", encoding="utf8") as file:
+                self.assertEqual(file.read(), "ação")
+
+    @patch("src.utils.downloader.stream_downloader.get_session")
+    def test_fail_download_do_not_leave_partial_file(self, mock_get_session):
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.headers = {"Content-Length": "12"}
+        mock_response.iter_content.return_value = [b"krux", b"-inst", b"all"]
+        mock_get_session.return_value.get.return_value = mock_response
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            a = AssetDownloader(
+                url="https://github.com/selfcustody/krux/asset.zip",
+                destdir=tmpdir,
+                write_mode="wb",
             )
+
+            with self.assertRaises(RuntimeError):
+                a.download(on_data=MagicMock(side_effect=RuntimeError("Mock")))
+
+            self.assertEqual(os.listdir(tmpdir), [])
+
+    @patch("src.utils.downloader.stream_downloader.get_session")
+    def test_fail_download_keep_resumable_partial_file(self, mock_get_session):
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.headers = {"Content-Length": "12", "ETag": '"abc"'}
+        mock_response.iter_content.return_value = [b"krux", b"-inst", b"all"]
+        mock_get_session.return_value.get.return_value = mock_response
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            a = AssetDownloader(
+                url="https://github.com/selfcustody/krux/asset.zip",
+                destdir=tmpdir,
+                write_mode="wb",
+            )
+
+            with self.assertRaises(KeyboardInterrupt):
+                a.download(on_data=MagicMock(side_effect=[None, KeyboardInterrupt]))
+
+            self.assertEqual(
+                sorted(os.listdir(tmpdir)), ["asset.zip.part", "asset.zip.part.json"]
+            )
+
+            with open(os.path.join(tmpdir, "asset.zip.part"), "rb") as file:
+                self.assertEqual(file.read(), b"krux-inst")
+
+            with open(
+                os.path.join(tmpdir, "asset.zip.part.json"), "r", encoding="utf8"
+            ) as file:
+                self.assertEqual(
+                    json.load(file),
+                    {
+                        "url": "https://github.com/selfcustody/krux/asset.zip",
+                        "etag": '"abc"',
+                        "last_modified": None,
+                    },
+                )
+
+    @patch("src.utils.downloader.stream_downloader.get_session")
+    def test_download_resume_from_partial_file(self, mock_get_session):
+        mock_response = MagicMock()
+        mock_response.status_code = 206
+        mock_response.headers = {
+            "Content-Length": "8",
+            "Content-Range": "bytes 4-11/12",
+            "ETag": '"abc"',
+        }
+        mock_response.iter_content.return_value = [b"-inst", b"all"]
+        mock_get_session.return_value.get.return_value = mock_response
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with open(os.path.join(tmpdir, "asset.zip.part"), "wb") as file:
+                file.write(b"krux")
+
+            with open(
+                os.path.join(tmpdir, "asset.zip.part.json"), "w", encoding="utf8"
+            ) as file:
+                json.dump(
+                    {
+                        "url": "https://github.com/selfcustody/krux/asset.zip",
+                        "etag": '"abc"',
+                        "last_modified": None,
+                    },
+                    file,
+                )
+
+            a = AssetDownloader(
+                url="https://github.com/selfcustody/krux/asset.zip",
+                destdir=tmpdir,
+                write_mode="wb",
+            )
+            destfile = a.download(on_data=MagicMock())
+
+            headers = mock_get_session.return_value.get.call_args.kwargs["headers"]
+            self.assertEqual(headers["Range"], "bytes=4-")
+            self.assertEqual(headers["If-Range"], '"abc"')
+            self.assertEqual(os.listdir(tmpdir), ["asset.zip"])
+            self.assertEqual(a.content_len, 12)
+
+            with open(destfile, "rb") as file:
+                self.assertEqual(file.read(), b"krux-install")
+
+    @patch("src.utils.downloader.stream_downloader.get_session")
+    def test_download_restart_stale_partial_file(self, mock_get_session):
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.headers = {"Content-Length": "12", "ETag": '"new"'}
+        mock_response.iter_content.return_value = [b"krux-install"]
+        mock_get_session.return_value.get.return_value = mock_response
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with open(os.path.join(tmpdir, "asset.zip.part"), "wb") as file:
+                file.write(b"old-data")
+
+            with open(
+                os.path.join(tmpdir, "asset.zip.part.json"), "w", encoding="utf8"
+            ) as file:
+                json.dump(
+                    {
+                        "url": "https://github.com/selfcustody/krux/asset.zip",
+                        "etag": '"old"',
+                        "last_modified": None,
+                    },
+                    file,
+                )
+
+            a = AssetDownloader(
+                url="https://github.com/selfcustody/krux/asset.zip",
+                destdir=tmpdir,
+                write_mode="wb",
+            )
+            destfile = a.download(on_data=MagicMock())
+
+            self.assertEqual(os.listdir(tmpdir), ["asset.zip"])
+            with open(destfile, "rb") as file:
+                self.assertEqual(file.read(), b"krux-install")
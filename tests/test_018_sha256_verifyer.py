@@ -1,5 +1,7 @@
+import os
+import tempfile
 from unittest import TestCase
-from unittest.mock import patch, mock_open
+from unittest.mock import patch, MagicMock
 from src.utils.verifyer.sha256_verifyer import Sha256Verifyer
 
 MOCK_SHA = "4ab12c3cc56b2641e7b216666186558cf40a36e76947edfd1b37cc1b190255ac"
@@ -29,21 +31,39 @@ class TestSha256VerifyerDownloader(TestCase):
             "File test.mock do not exist",
         )
 
-    @patch("os.path.exists", return_value=True)
-    @patch("builtins.open", new_callable=mock_open, read_data=MOCK_ZIP)
-    def test_load(self, open_mock, mock_exists):
-        sha = Sha256Verifyer(filename="test.mock")
-        sha.load()
-        mock_exists.assert_called_once_with("test.mock")
-        open_mock.assert_called_once_with("test.mock", "rb")
+    def test_load(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, "test.mock")
+            with open(filename, "wb") as file:
+                file.write(MOCK_ZIP)
+
+            sha = Sha256Verifyer(filename=filename)
+            sha.load()
+
         self.assertEqual(sha.data, MOCK_SHA)
+        self.assertEqual(sha.engine.hashed_len, len(MOCK_ZIP))
+
+    def test_verify(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, "test.mock")
+            with open(filename, "wb") as file:
+                file.write(MOCK_ZIP)
+
+            sha = Sha256Verifyer(filename=filename)
+            sha.load()
 
-    @patch("os.path.exists", return_value=True)
-    @patch("builtins.open", new_callable=mock_open, read_data=MOCK_ZIP)
-    def test_verify(self, open_mock, mock_exists):
-        sha = Sha256Verifyer(filename="test.mock")
-        sha.load()
-        mock_exists.assert_called_once_with("test.mock")
-        open_mock.assert_called_once_with("test.mock", "rb")
         verify = sha.verify(MOCK_SHA)
         self.assertTrue(verify)
+
+    def test_load_on_data(self):
+        on_data = MagicMock()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, "test.mock")
+            with open(filename, "wb") as file:
+                file.write(MOCK_ZIP)
+
+            sha = Sha256Verifyer(filename=filename)
+            sha.load(on_data=on_data)
+
+        self.assertEqual(sha.data, MOCK_SHA)
+        on_data.assert_called_once_with(len(MOCK_ZIP), len(MOCK_ZIP))
@@ -1,9 +1,7 @@
 from unittest import TestCase
 from unittest.mock import MagicMock, patch
 
-from serial import SerialException
 from src.utils.flasher.base_flasher import BaseFlasher
-from .shared_mocks import MockListPortsGrep
 
 
 class TestBaseFlasher(TestCase):
@@ -25,85 +23,65 @@ class TestBaseFlasher(TestCase):
             str(exc_info.exception), "File does not exist: mock/test/kboot.kfpkg"
         )
 
-    @patch(
-        "src.utils.flasher.base_flasher.list_ports.grep", new_callable=MockListPortsGrep
-    )
-    def test_set_port_amigo(self, mock_grep):
+    @patch("src.utils.flasher.base_flasher.get_port_discovery")
+    def test_set_port_amigo(self, mock_get_port_discovery):
         f = BaseFlasher()
         f.port = "amigo"
-        mock_grep.assert_called_once_with("0403")
+        mock_get_port_discovery.return_value.grep.assert_called_once_with("0403")
 
-    @patch(
-        "src.utils.flasher.base_flasher.list_ports.grep", new_callable=MockListPortsGrep
-    )
-    def test_set_port_amigo_tft(self, mock_grep):
+    @patch("src.utils.flasher.base_flasher.get_port_discovery")
+    def test_set_port_amigo_tft(self, mock_get_port_discovery):
         f = BaseFlasher()
         f.port = "amigo_tft"
-        mock_grep.assert_called_once_with("0403")
+        mock_get_port_discovery.return_value.grep.assert_called_once_with("0403")
 
-    @patch(
-        "src.utils.flasher.base_flasher.list_ports.grep", new_callable=MockListPortsGrep
-    )
-    def test_set_port_amigo_ips(self, mock_grep):
+    @patch("src.utils.flasher.base_flasher.get_port_discovery")
+    def test_set_port_amigo_ips(self, mock_get_port_discovery):
         f = BaseFlasher()
         f.port = "amigo_ips"
-        mock_grep.assert_called_once_with("0403")
+        mock_get_port_discovery.return_value.grep.assert_called_once_with("0403")
 
-    @patch(
-        "src.utils.flasher.base_flasher.list_ports.grep", new_callable=MockListPortsGrep
-    )
-    def test_set_port_m5stickv(self, mock_grep):
+    @patch("src.utils.flasher.base_flasher.get_port_discovery")
+    def test_set_port_m5stickv(self, mock_get_port_discovery):
         f = BaseFlasher()
         f.port = "m5stickv"
-        mock_grep.assert_called_once_with("0403")
+        mock_get_port_discovery.return_value.grep.assert_called_once_with("0403")
 
-    @patch(
-        "src.utils.flasher.base_flasher.list_ports.grep", new_callable=MockListPortsGrep
-    )
-    def test_set_port_bit(self, mock_grep):
+    @patch("src.utils.flasher.base_flasher.get_port_discovery")
+    def test_set_port_bit(self, mock_get_port_discovery):
         f = BaseFlasher()
         f.port = "bit"
-        mock_grep.assert_called_once_with("0403")
+        mock_get_port_discovery.return_value.grep.assert_called_once_with("0403")
 
-    @patch(
-        "src.utils.flasher.base_flasher.list_ports.grep", new_callable=MockListPortsGrep
-    )
-    def test_set_ports_cube(self, mock_grep):
+    @patch("src.utils.flasher.base_flasher.get_port_discovery")
+    def test_set_ports_cube(self, mock_get_port_discovery):
         f = BaseFlasher()
         f.port = "cube"
-        mock_grep.assert_called_once_with("0403")
+        mock_get_port_discovery.return_value.grep.assert_called_once_with("0403")
 
-    @patch(
-        "src.utils.flasher.base_flasher.list_ports.grep", new_callable=MockListPortsGrep
-    )
-    def test_set_port_dock(self, mock_grep):
+    @patch("src.utils.flasher.base_flasher.get_port_discovery")
+    def test_set_port_dock(self, mock_get_port_discovery):
         f = BaseFlasher()
         f.port = "dock"
-        mock_grep.assert_called_once_with("7523")
+        mock_get_port_discovery.return_value.grep.assert_called_once_with("7523")
 
-    @patch(
-        "src.utils.flasher.base_flasher.list_ports.grep", new_callable=MockListPortsGrep
-    )
-    def test_set_port_yahboom(self, mock_grep):
+    @patch("src.utils.flasher.base_flasher.get_port_discovery")
+    def test_set_port_yahboom(self, mock_get_port_discovery):
         f = BaseFlasher()
         f.port = "yahboom"
-        mock_grep.assert_called_once_with("7523")
+        mock_get_port_discovery.return_value.grep.assert_called_once_with("7523")
 
-    @patch(
-        "src.utils.flasher.base_flasher.list_ports.grep", new_callable=MockListPortsGrep
-    )
-    def test_set_port_wonder(self, mock_grep):
+    @patch("src.utils.flasher.base_flasher.get_port_discovery")
+    def test_set_port_wonder(self, mock_get_port_discovery):
         f = BaseFlasher()
         f.port = "wonder_mv"
-        mock_grep.assert_called_once_with("7523")
+        mock_get_port_discovery.return_value.grep.assert_called_once_with("7523")
 
-    @patch(
-        "src.utils.flasher.base_flasher.list_ports.grep", new_callable=MockListPortsGrep
-    )
-    def test_set_port_tzt(self, mock_grep):
+    @patch("src.utils.flasher.base_flasher.get_port_discovery")
+    def test_set_port_tzt(self, mock_get_port_discovery):
         f = BaseFlasher()
         f.port = "tzt"
-        mock_grep.assert_called_once_with("55d3")
+        mock_get_port_discovery.return_value.grep.assert_called_once_with("55d3")
 
     def test_fail_set_port(self):
         with self.assertRaises(ValueError) as exc_info:
@@ -174,10 +152,8 @@ class TestBaseFlasher(TestCase):
         f.print_callback()
         f.print_callback.assert_called_once()
 
-    @patch(
-        "src.utils.flasher.base_flasher.list_ports.grep", new_callable=MockListPortsGrep
-    )
-    def test_embed_fire_baudrate_limit_enforced(self, mock_grep):
+    @patch("src.utils.flasher.base_flasher.get_port_discovery")
+    def test_embed_fire_baudrate_limit_enforced(self, mock_get_port_discovery):
         """Test that embed_fire baudrate is capped at 400000"""
         f = BaseFlasher()
         f.baudrate = 1500000  # Set high baudrate
@@ -188,12 +164,12 @@ class TestBaseFlasher(TestCase):
         # Baudrate should be capped to 400000
         self.assertEqual(f.baudrate, 400000)
         self.assertEqual(f.board, "dan")
-        mock_grep.assert_called_once_with("7523")
+        mock_get_port_discovery.return_value.grep.assert_called_once_with("7523")
 
-    @patch(
-        "src.utils.flasher.base_flasher.list_ports.grep", new_callable=MockListPortsGrep
-    )
-    def test_embed_fire_baudrate_limit_not_applied_when_below_limit(self, mock_grep):
+    @patch("src.utils.flasher.base_flasher.get_port_discovery")
+    def test_embed_fire_baudrate_limit_not_applied_when_below_limit(
+        self, mock_get_port_discovery
+    ):
         """Test that embed_fire baudrate is not modified when already below 400000"""
         f = BaseFlasher()
         f.baudrate = 115200  # Set acceptable baudrate
@@ -204,12 +180,10 @@ class TestBaseFlasher(TestCase):
         # Baudrate should remain unchanged
         self.assertEqual(f.baudrate, 115200)
         self.assertEqual(f.board, "dan")
-        mock_grep.assert_called_once_with("7523")
+        mock_get_port_discovery.return_value.grep.assert_called_once_with("7523")
 
-    @patch(
-        "src.utils.flasher.base_flasher.list_ports.grep", new_callable=MockListPortsGrep
-    )
-    def test_other_devices_no_baudrate_limit(self, mock_grep):
+    @patch("src.utils.flasher.base_flasher.get_port_discovery")
+    def test_other_devices_no_baudrate_limit(self, mock_get_port_discovery):
         """Test that other devices can use high baudrates without capping"""
         f = BaseFlasher()
         f.baudrate = 1500000  # Set high baudrate
@@ -220,22 +194,55 @@ class TestBaseFlasher(TestCase):
         # Baudrate should remain unchanged for non-embed_fire devices
         self.assertEqual(f.baudrate, 1500000)
         self.assertEqual(f.board, "goE")
-        mock_grep.assert_called_once_with("0403")
+        mock_get_port_discovery.return_value.grep.assert_called_once_with("0403")
 
-    @patch("src.utils.flasher.base_flasher.Serial", side_effect=SerialException())
-    def test_fail_is_port_working(self, mock_serial):
+    @patch("src.utils.flasher.base_flasher.get_port_discovery")
+    def test_fail_is_port_working(self, mock_get_port_discovery):
+        mock_get_port_discovery.return_value.probe_port.return_value = False
 
         f = BaseFlasher()
         result = f.is_port_working(port="mock")
         self.assertFalse(result)
 
-        mock_serial.assert_called_once_with("mock")
+        mock_get_port_discovery.return_value.probe_port.assert_called_once_with("mock")
 
-    @patch("src.utils.flasher.base_flasher.Serial")
-    def test_is_port_working(self, mock_serial):
+    @patch("src.utils.flasher.base_flasher.get_port_discovery")
+    def test_is_port_working(self, mock_get_port_discovery):
+        mock_get_port_discovery.return_value.probe_port.return_value = True
 
         f = BaseFlasher()
         result = f.is_port_working(port="mock")
         self.assertTrue(result)
 
-        mock_serial.assert_called_once_with("mock")
+        mock_get_port_discovery.return_value.probe_port.assert_called_once_with("mock")
+
+    def test_baudrate_ladder(self):
+        f = BaseFlasher()
+        f.device = "amigo"
+        self.assertEqual(
+            f.baudrate_ladder(),
+            (1500000, 921600, 576000, 460800, 400000, 230400, 115200),
+        )
+
+    def test_baudrate_ladder_from_start(self):
+        f = BaseFlasher()
+        f.device = "amigo"
+        self.assertEqual(
+            f.baudrate_ladder(start=460800), (460800, 400000, 230400, 115200)
+        )
+
+    def test_baudrate_ladder_device_limit(self):
+        f = BaseFlasher()
+        f.device = "embed_fire"
+        self.assertEqual(f.baudrate_ladder(), (400000, 230400, 115200))
+        self.assertEqual(f.baudrate_ladder(start=921600), (400000, 230400, 115200))
+
+    @patch("src.utils.flasher.base_flasher.get_port_discovery")
+    def test_baudrate_key(self, mock_get_port_discovery):
+        mock_get_port_discovery.return_value.grep.return_value = iter(
+            [MagicMock(device="/Mock/Path0")]
+        )
+        f = BaseFlasher()
+        f.set_device("amigo")
+        self.assertEqual(f.device, "amigo")
+        self.assertEqual(f.baudrate_key, "amigo@/mock/path0")
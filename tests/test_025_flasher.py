@@ -1,13 +1,12 @@
 from unittest import TestCase
 from unittest.mock import patch, MagicMock, call
 from src.utils.flasher import Flasher
-from .shared_mocks import MockListPortsGrep
 
 
 class TestFlasher(TestCase):
 
     @patch("os.path.exists", return_value=True)
-    @patch("src.utils.flasher.base_flasher.list_ports", new_callable=MockListPortsGrep)
+    @patch("src.utils.flasher.base_flasher.get_port_discovery")
     @patch("src.utils.flasher.base_flasher.next")
     @patch("src.utils.flasher.flasher.Flasher.is_port_working", return_value=True)
     @patch("src.utils.kboot.build.ktool.KTool.process")
@@ -16,7 +15,7 @@ class TestFlasher(TestCase):
         mock_process,
         mock_is_port_working,
         mock_next,
-        mock_list_ports,
+        mock_get_port_discovery,
         mock_exists,
     ):
         mock_next.return_value = MagicMock(device="mock")
@@ -26,7 +25,7 @@ class TestFlasher(TestCase):
         f.baudrate = 1500000
         f.flash(callback=callback)
         mock_exists.assert_called_once_with("mock/maixpy_amigo/kboot.kfpkg")
-        mock_list_ports.grep.assert_called_once_with("0403")
+        mock_get_port_discovery.return_value.grep.assert_called_once_with("0403")
         mock_next.assert_called_once()
         mock_is_port_working.assert_has_calls(
             [
@@ -66,7 +65,7 @@ class TestFlasher(TestCase):
         mock_exists.assert_called_once_with("mock/maixpy_amigo/kboot.kfpkg")
 
     @patch("os.path.exists", return_value=True)
-    @patch("src.utils.flasher.base_flasher.list_ports", new_callable=MockListPortsGrep)
+    @patch("src.utils.flasher.base_flasher.get_port_discovery")
     @patch("src.utils.flasher.base_flasher.next")
     @patch("src.utils.flasher.flasher.Flasher.is_port_working", return_value=True)
     @patch("src.utils.kboot.build.ktool.KTool.process")
@@ -75,13 +74,13 @@ class TestFlasher(TestCase):
         mock_process,
         mock_is_port_working,
         mock_next,
-        mock_list_ports,
+        mock_get_port_discovery,
         mock_exists,
     ):
         mock_exception = Exception("Greeting fail: mock test")
         mock_process.side_effect = [mock_exception, True]
         mock_next.side_effect = [MagicMock(device="mocked")]
-        mock_list_ports.grep.return_value.__next__.side_effect = [
+        mock_get_port_discovery.return_value.grep.return_value.__next__.side_effect = [
             MagicMock(device="mocked_next")
         ]
 
@@ -93,7 +92,7 @@ class TestFlasher(TestCase):
 
         # patch assertions
         mock_exists.assert_called_once_with("mock/maixpy_amigo/kboot.kfpkg")
-        mock_list_ports.grep.assert_called_once_with("0403")
+        mock_get_port_discovery.return_value.grep.assert_called_once_with("0403")
         mock_next.assert_called_once()
         mock_is_port_working.assert_has_calls(
             [
@@ -123,7 +122,7 @@ class TestFlasher(TestCase):
         )
 
     @patch("os.path.exists", return_value=True)
-    @patch("src.utils.flasher.base_flasher.list_ports", new_callable=MockListPortsGrep)
+    @patch("src.utils.flasher.base_flasher.get_port_discovery")
     @patch("src.utils.flasher.base_flasher.next")
     @patch("src.utils.flasher.flasher.Flasher.is_port_working", return_value=False)
     @patch("src.utils.flasher.base_flasher.KTool.log")
@@ -132,7 +131,7 @@ class TestFlasher(TestCase):
         mock_ktool_log,
         mock_is_port_working,
         mock_next,
-        mock_list_ports,
+        mock_get_port_discovery,
         mock_exists,
     ):
         mock_next.return_value = MagicMock(device="mock")
@@ -143,7 +142,7 @@ class TestFlasher(TestCase):
         f.baudrate = 1500000
         f.flash(callback=callback)
         mock_exists.assert_called_once_with("mock/maixpy_amigo/kboot.kfpkg")
-        mock_list_ports.grep.assert_called_once_with("0403")
+        mock_get_port_discovery.return_value.grep.assert_called_once_with("0403")
         mock_next.assert_called_once()
         mock_is_port_working.assert_has_calls(
             [
@@ -154,7 +153,7 @@ class TestFlasher(TestCase):
         mock_ktool_log.assert_called_once_with("Port mock not working")
 
     @patch("os.path.exists", return_value=True)
-    @patch("src.utils.flasher.base_flasher.list_ports", new_callable=MockListPortsGrep)
+    @patch("src.utils.flasher.base_flasher.get_port_discovery")
     @patch("src.utils.flasher.base_flasher.next")
     @patch(
         "src.utils.flasher.flasher.Flasher.is_port_working", side_effect=[True, False]
@@ -167,13 +166,13 @@ class TestFlasher(TestCase):
         mock_process,
         mock_is_port_working,
         mock_next,
-        mock_list_ports,
+        mock_get_port_discovery,
         mock_exists,
     ):
         mock_exception = RuntimeError("Greeting fail: mock test")
         mock_process.side_effect = [mock_exception]
         mock_next.side_effect = [MagicMock(device="mocked")]
-        mock_list_ports.grep.return_value.__next__.side_effect = [
+        mock_get_port_discovery.return_value.grep.return_value.__next__.side_effect = [
             MagicMock(device="mocked_next")
         ]
 
@@ -185,7 +184,7 @@ class TestFlasher(TestCase):
 
         # patch assertions
         mock_exists.assert_called_once_with("mock/maixpy_amigo/kboot.kfpkg")
-        mock_list_ports.grep.assert_called_once_with("0403")
+        mock_get_port_discovery.return_value.grep.assert_called_once_with("0403")
         mock_next.assert_called_once()
         mock_is_port_working.assert_has_calls([call("mocked"), call("mocked_next")])
         mock_process.assert_has_calls(
@@ -203,7 +202,7 @@ class TestFlasher(TestCase):
         mock_ktool_log.assert_has_calls([call("Port mocked_next not working")])
 
     @patch("os.path.exists", return_value=True)
-    @patch("src.utils.flasher.base_flasher.list_ports", new_callable=MockListPortsGrep)
+    @patch("src.utils.flasher.base_flasher.get_port_discovery")
     @patch("src.utils.flasher.base_flasher.next")
     @patch(
         "src.utils.flasher.flasher.Flasher.is_port_working", side_effect=[True, True]
@@ -216,14 +215,14 @@ class TestFlasher(TestCase):
         mock_process,
         mock_is_port_working,
         mock_next,
-        mock_list_ports,
+        mock_get_port_discovery,
         mock_exists,
     ):
         mock_exception = Exception("Greeting fail: mock test")
         mock_process.side_effect = [mock_exception, True]
 
         mock_next.side_effect = [MagicMock(device="mocked")]
-        mock_list_ports.grep.return_value.__next__.side_effect = [
+        mock_get_port_discovery.return_value.grep.return_value.__next__.side_effect = [
             StopIteration("mocked stop")
         ]
 
@@ -235,7 +234,7 @@ class TestFlasher(TestCase):
 
         # patch assertions
         mock_exists.assert_called_once_with("mock/maixpy_amigo/kboot.kfpkg")
-        mock_list_ports.grep.assert_called_once_with("0403")
+        mock_get_port_discovery.return_value.grep.assert_called_once_with("0403")
         mock_next.assert_called_once()
         mock_is_port_working.assert_has_calls(
             [
@@ -255,3 +254,134 @@ class TestFlasher(TestCase):
             ]
         )
         mock_ktool_log.assert_has_calls([call("mocked stop")])
+
+    @patch("os.path.exists", return_value=True)
+    @patch("src.utils.flasher.base_flasher.get_port_discovery")
+    @patch("src.utils.flasher.base_flasher.next")
+    @patch("src.utils.flasher.flasher.Flasher.is_port_working", return_value=True)
+    @patch("src.utils.kboot.build.ktool.KTool.log")
+    @patch("src.utils.kboot.build.ktool.KTool.process")
+    def test_flash_adaptive_step_down(
+        self,
+        mock_process,
+        mock_ktool_log,
+        mock_is_port_working,
+        mock_next,
+        mock_get_port_discovery,
+        mock_exists,
+    ):
+        mock_next.return_value = MagicMock(device="mock")
+        mock_process.side_effect = [Exception("Greeting fail"), None]
+        callback = MagicMock()
+        on_attempt = MagicMock()
+
+        f = Flasher()
+        f.firmware = "mock/maixpy_amigo/kboot.kfpkg"
+        baudrate = f.flash_adaptive(callback=callback, on_attempt=on_attempt)
+
+        self.assertEqual(baudrate, 921600)
+        self.assertEqual(f.baudrate, 921600)
+        on_attempt.assert_has_calls([call(1500000), call(921600)])
+        mock_process.assert_has_calls(
+            [
+                call(
+                    terminal=False,
+                    dev="mock",
+                    baudrate=1500000,
+                    board="goE",
+                    file="mock/maixpy_amigo/kboot.kfpkg",
+                    callback=callback,
+                ),
+                call(
+                    terminal=False,
+                    dev="mock",
+                    baudrate=921600,
+                    board="goE",
+                    file="mock/maixpy_amigo/kboot.kfpkg",
+                    callback=callback,
+                ),
+            ]
+        )
+        mock_ktool_log.assert_called_once_with("Flash at 1500000 failed: Greeting fail")
+        mock_exists.assert_called_once()
+        mock_get_port_discovery.return_value.grep.assert_called_once_with("0403")
+        mock_is_port_working.assert_called_once_with("mock")
+
+    @patch("os.path.exists", return_value=True)
+    @patch("src.utils.flasher.base_flasher.get_port_discovery")
+    @patch("src.utils.flasher.base_flasher.next")
+    @patch("src.utils.flasher.flasher.Flasher.is_port_working", return_value=True)
+    @patch("src.utils.kboot.build.ktool.KTool.process")
+    def test_flash_adaptive_from_memory(
+        self,
+        mock_process,
+        mock_is_port_working,
+        mock_next,
+        mock_get_port_discovery,
+        mock_exists,
+    ):
+        mock_next.return_value = MagicMock(device="/mock/path0")
+        f = Flasher()
+        f.firmware = "mock/maixpy_amigo/kboot.kfpkg"
+        baudrate = f.flash_adaptive(
+            callback=MagicMock(), memory={"amigo@/mock/path0": 460800}
+        )
+
+        self.assertEqual(baudrate, 460800)
+        mock_process.assert_called_once()
+        self.assertEqual(mock_process.call_args.kwargs["baudrate"], 460800)
+        mock_exists.assert_called_once()
+        mock_get_port_discovery.return_value.grep.assert_called_once_with("0403")
+        mock_is_port_working.assert_called_once()
+
+    @patch("os.path.exists", return_value=True)
+    @patch("src.utils.flasher.base_flasher.get_port_discovery")
+    @patch("src.utils.flasher.base_flasher.next")
+    @patch("src.utils.flasher.flasher.Flasher.is_port_working", return_value=True)
+    @patch("src.utils.kboot.build.ktool.KTool.log")
+    @patch("src.utils.kboot.build.ktool.KTool.process")
+    def test_fail_flash_adaptive_all_baudrates(
+        self,
+        mock_process,
+        mock_ktool_log,
+        mock_is_port_working,
+        mock_next,
+        mock_get_port_discovery,
+        mock_exists,
+    ):
+        mock_next.return_value = MagicMock(device="mock")
+        mock_process.side_effect = Exception("Cancel")
+        f = Flasher()
+        f.firmware = "mock/maixpy_embed_fire/kboot.kfpkg"
+
+        with self.assertRaises(RuntimeError) as exc_info:
+            f.flash_adaptive(callback=MagicMock())
+
+        self.assertEqual(
+            str(exc_info.exception),
+            "Flash failed at all baudrates: 400000: Cancel; 230400: Cancel; 115200: Cancel",
+        )
+        self.assertEqual(mock_process.call_count, 3)
+        self.assertEqual(mock_ktool_log.call_count, 3)
+        mock_exists.assert_called_once()
+        mock_get_port_discovery.return_value.grep.assert_called_once_with("7523")
+        mock_is_port_working.assert_called_once()
+
+    @patch("os.path.exists", return_value=True)
+    @patch("src.utils.flasher.base_flasher.get_port_discovery")
+    @patch("src.utils.flasher.base_flasher.next")
+    @patch("src.utils.flasher.flasher.Flasher.is_port_working", return_value=False)
+    def test_fail_flash_adaptive_port_not_working(
+        self, mock_is_port_working, mock_next, mock_get_port_discovery, mock_exists
+    ):
+        mock_next.return_value = MagicMock(device="mock")
+        f = Flasher()
+        f.firmware = "mock/maixpy_amigo/kboot.kfpkg"
+
+        with self.assertRaises(RuntimeError) as exc_info:
+            f.flash_adaptive(callback=MagicMock())
+
+        self.assertEqual(str(exc_info.exception), "Port mock not working")
+        mock_exists.assert_called_once()
+        mock_get_port_discovery.return_value.grep.assert_called_once()
+        mock_is_port_working.assert_called_once_with("mock")
@@ -25,22 +25,21 @@ base_flasher.py
 from unittest import TestCase
 from unittest.mock import patch, call, MagicMock
 from src.utils.flasher import Wiper
-from .shared_mocks import MockListPortsGrep
 
 
 class TestWiper(TestCase):
 
-    @patch("src.utils.flasher.base_flasher.list_ports", new_callable=MockListPortsGrep)
+    @patch("src.utils.flasher.base_flasher.get_port_discovery")
     @patch("src.utils.flasher.base_flasher.next")
     @patch("src.utils.flasher.wiper.Wiper.is_port_working", return_value=True)
     @patch("src.utils.kboot.build.ktool.KTool.process")
     def test_wipe_success(
-        self, mock_process, mock_is_port_working, mock_next, mock_list_ports
+        self, mock_process, mock_is_port_working, mock_next, mock_get_port_discovery
     ):
         f = Wiper()
         f.baudrate = 1500000
         f.wipe(device="amigo")
-        mock_list_ports.grep.assert_called_once_with("0403")
+        mock_get_port_discovery.return_value.grep.assert_called_once_with("0403")
         mock_next.assert_called_once()
         mock_is_port_working.assert_called_once_with(mock_next().device)
         mock_process.assert_called_once()
@@ -52,7 +51,7 @@ class TestWiper(TestCase):
 
         self.assertEqual(str(exc_info.exception), "Invalid baudrate: 1234567")
 
-    @patch("src.utils.flasher.base_flasher.list_ports", new_callable=MockListPortsGrep)
+    @patch("src.utils.flasher.base_flasher.get_port_discovery")
     @patch("src.utils.flasher.base_flasher.next")
     @patch("src.utils.flasher.wiper.Wiper.is_port_working", return_value=True)
     @patch("src.utils.kboot.build.ktool.KTool.process")
@@ -61,12 +60,12 @@ class TestWiper(TestCase):
         mock_process,
         mock_is_port_working,
         mock_next,
-        mock_list_ports,
+        mock_get_port_discovery,
     ):
         mock_exception = Exception("Greeting fail: mock test")
         mock_process.side_effect = [mock_exception, True]
         mock_next.side_effect = [MagicMock(device="mocked")]
-        mock_list_ports.grep.return_value.__next__.side_effect = [
+        mock_get_port_discovery.return_value.grep.return_value.__next__.side_effect = [
             MagicMock(device="mocked_next")
         ]
 
@@ -75,7 +74,7 @@ class TestWiper(TestCase):
         f.wipe(device="amigo")
 
         # patch assertions
-        mock_list_ports.grep.assert_called_once_with("0403")
+        mock_get_port_discovery.return_value.grep.assert_called_once_with("0403")
         mock_next.assert_called_once()
         mock_is_port_working.assert_has_calls(
             [
@@ -85,19 +84,19 @@ class TestWiper(TestCase):
         )
         mock_process.assert_has_calls([call(), call()])
 
-    @patch("src.utils.flasher.base_flasher.list_ports", new_callable=MockListPortsGrep)
+    @patch("src.utils.flasher.base_flasher.get_port_discovery")
     @patch("src.utils.flasher.base_flasher.next")
     @patch("src.utils.flasher.wiper.Wiper.is_port_working", return_value=False)
     @patch("src.utils.flasher.base_flasher.KTool.log")
     def test_fail_wipe_port_not_working(
-        self, mock_ktool_log, mock_is_port_working, mock_next, mock_list_ports
+        self, mock_ktool_log, mock_is_port_working, mock_next, mock_get_port_discovery
     ):
         mock_next.return_value = MagicMock(device="mocked")
 
         f = Wiper()
         f.baudrate = 1500000
         f.wipe(device="amigo")
-        mock_list_ports.grep.assert_called_once_with("0403")
+        mock_get_port_discovery.return_value.grep.assert_called_once_with("0403")
         mock_next.assert_called_once()
         mock_is_port_working.assert_has_calls(
             [
@@ -107,7 +106,7 @@ class TestWiper(TestCase):
         )
         mock_ktool_log.assert_called_once_with("Port mocked not working")
 
-    @patch("src.utils.flasher.base_flasher.list_ports", new_callable=MockListPortsGrep)
+    @patch("src.utils.flasher.base_flasher.get_port_discovery")
     @patch("src.utils.flasher.base_flasher.next")
     @patch("src.utils.flasher.wiper.Wiper.is_port_working", side_effect=[True, False])
     @patch("src.utils.kboot.build.ktool.KTool.process")
@@ -118,12 +117,12 @@ class TestWiper(TestCase):
         mock_process,
         mock_is_port_working,
         mock_next,
-        mock_list_ports,
+        mock_get_port_discovery,
     ):
         mock_exception = Exception("Greeting fail: mock test")
         mock_process.side_effect = [mock_exception]
         mock_next.side_effect = [MagicMock(device="mocked")]
-        mock_list_ports.grep.return_value.__next__.side_effect = [
+        mock_get_port_discovery.return_value.grep.return_value.__next__.side_effect = [
             MagicMock(device="mocked_next"),
         ]
 
@@ -132,7 +131,7 @@ class TestWiper(TestCase):
         f.wipe(device="amigo")
 
         # patch assertions
-        mock_list_ports.grep.assert_called_once_with("0403")
+        mock_get_port_discovery.return_value.grep.assert_called_once_with("0403")
         mock_next.assert_called_once()
         mock_is_port_working.assert_has_calls(
             [
@@ -143,7 +142,7 @@ class TestWiper(TestCase):
         mock_process.assert_called_once()
         mock_ktool_log.assert_has_calls([call("Port mocked_next not working")])
 
-    @patch("src.utils.flasher.base_flasher.list_ports", new_callable=MockListPortsGrep)
+    @patch("src.utils.flasher.base_flasher.get_port_discovery")
     @patch("src.utils.flasher.base_flasher.next")
     @patch("src.utils.flasher.wiper.Wiper.is_port_working", side_effect=[True, True])
     @patch("src.utils.kboot.build.ktool.KTool.process")
@@ -154,12 +153,12 @@ class TestWiper(TestCase):
         mock_process,
         mock_is_port_working,
         mock_next,
-        mock_list_ports,
+        mock_get_port_discovery,
     ):
         mock_exception = Exception("Greeting fail: mock test")
         mock_process.side_effect = [mock_exception, True]
         mock_next.side_effect = [MagicMock(device="mocked")]
-        mock_list_ports.grep.return_value.__next__.side_effect = [
+        mock_get_port_discovery.return_value.grep.return_value.__next__.side_effect = [
             StopIteration("mocked stop")
         ]
 
@@ -168,7 +167,7 @@ class TestWiper(TestCase):
         f.wipe(device="amigo")
 
         # patch assertions
-        mock_list_ports.grep.assert_called_once_with("0403")
+        mock_get_port_discovery.return_value.grep.assert_called_once_with("0403")
         mock_next.assert_called_once()
         mock_is_port_working.assert_has_calls(
             [
@@ -1,23 +1,89 @@
+import os
+import tempfile
 from unittest import TestCase
-from unittest.mock import patch, mock_open, call
+from unittest.mock import patch, mock_open, call, MagicMock
 from src.utils.signer.trigger_signer import TriggerSigner
 from .shared_mocks import MOCKED_SIGNATURE
 
 
 class TestTriggerSigner(TestCase):
 
-    @patch("os.path.exists", return_value=True)
-    @patch("builtins.open", new_callable=mock_open, read_data=b"Mocked")
-    def test_make_hash(self, mocked_open, mock_exists):
-        s = TriggerSigner(filename="mock.txt")
-        s.make_hash()
-        mock_exists.assert_called_once_with("mock.txt")
-        mocked_open.assert_called_once_with("mock.txt", "rb")
+    def test_make_hash(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, "mock.txt")
+            with open(filename, "wb") as file:
+                file.write(b"Mocked")
+
+            s = TriggerSigner(filename=filename)
+            s.make_hash()
+
         self.assertEqual(
             s.filehash,
             "28839e02daae61fae440d5e9617f6fd16a572f4e76c2e68566592fb902f74be5",
         )
 
+    def test_make_hash_on_data(self):
+        on_data = MagicMock()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, "mock.txt")
+            with open(filename, "wb") as file:
+                file.write(b"Mocked")
+
+            s = TriggerSigner(filename=filename)
+            s.make_hash(on_data=on_data)
+
+        on_data.assert_called_once_with(6, 6)
+
+    def test_hash_files(self):
+        on_data = MagicMock()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filenames = []
+            for name, data in (("a.bin", b"Mocked"), ("b.bin", b"")):
+                filename = os.path.join(tmpdir, name)
+                with open(filename, "wb") as file:
+                    file.write(data)
+                filenames.append(filename)
+
+            signers = TriggerSigner.hash_files(filenames, on_data=on_data)
+
+            with open(f"{filenames[0]}.sha256.txt", "r", encoding="utf-8") as file:
+                content = file.read()
+            self.assertTrue(os.path.exists(f"{filenames[1]}.sha256.txt"))
+
+        self.assertEqual([s.filename for s in signers], filenames)
+        self.assertEqual(
+            content,
+            "28839e02daae61fae440d5e9617f6fd16a572f4e76c2e68566592fb902f74be5 "
+            f"{filenames[0]}",
+        )
+        self.assertEqual(
+            signers[1].filehash,
+            "e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855",
+        )
+        on_data.assert_called_once_with(filenames[0], 6, 6)
+
+    @patch("src.utils.signer.trigger_signer.HashEngine")
+    def test_hash_files_share_engine(self, mock_engine):
+        mock_hash_file = mock_engine.return_value.hash_file
+        mock_hash_file.return_value.hexdigest.return_value = "0" * 64
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filenames = [os.path.join(tmpdir, "a.bin"), os.path.join(tmpdir, "b.bin")]
+            for filename in filenames:
+                open(filename, "wb").close()  # pylint: disable=consider-using-with
+
+            TriggerSigner.hash_files(filenames)
+
+        mock_engine.assert_called_once_with(algorithm="sha256")
+        mock_hash_file.assert_has_calls(
+            [
+                call(filenames[0], on_data=None),
+                call().hexdigest(),
+                call(filenames[1], on_data=None),
+                call().hexdigest(),
+            ]
+        )
+
     @patch("os.path.exists", return_value=True)
     def test_fail_save_hash(self, mock_exists):
         with self.assertRaises(ValueError) as exc_info:
@@ -27,19 +93,23 @@ class TestTriggerSigner(TestCase):
         self.assertEqual(str(exc_info.exception), "Empty hash")
 
     @patch("os.path.exists", return_value=True)
-    @patch("builtins.open", new_callable=mock_open, read_data=b"Mocked")
-    def test_save_hash(self, mocked_open, mock_exists):
+    @patch("src.utils.signer.trigger_signer.HashEngine")
+    def test_save_hash(self, mock_engine, mock_exists):
+        mock_hash_file = mock_engine.return_value.hash_file
+        mock_hash_file.return_value.hexdigest.return_value = (
+            "28839e02daae61fae440d5e9617f6fd16a572f4e76c2e68566592fb902f74be5"
+        )
         s = TriggerSigner(filename="mock.txt")
         s.make_hash()
-        s.save_hash()
+
+        with patch("builtins.open", new_callable=mock_open) as mocked_open:
+            s.save_hash()
+
         mock_exists.assert_called_once_with("mock.txt")
+        mock_engine.assert_called_once_with(algorithm="sha256")
+        mock_hash_file.assert_called_once_with("mock.txt", on_data=None)
         mocked_open.assert_has_calls(
             [
-                call("mock.txt", "rb"),
-                # pylint: disable=unnecessary-dunder-call
-                call().__enter__(),
-                call().read(),
-                call().__exit__(None, None, None),
                 call("mock.txt.sha256.txt", mode="w", encoding="utf-8"),
                 # pylint: disable=unnecessary-dunder-call
                 call().__enter__(),
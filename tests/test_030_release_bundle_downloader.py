@@ -0,0 +1,130 @@
+import os
+import tempfile
+from unittest import TestCase
+from unittest.mock import patch, MagicMock
+import requests
+from src.utils.downloader import ReleaseBundleDownloader
+
+RELEASE_URL = "https://github.com/selfcustody/krux/releases/download/v0.0.1"
+PEM_URL = "https://raw.githubusercontent.com/selfcustody/krux/main/selfcustody.pem"
+
+CONTENTS = {
+    f"{RELEASE_URL}/krux-v0.0.1.zip": b"krux-zip-data",
+    f"{RELEASE_URL}/krux-v0.0.1.zip.sha256.txt": b"abcdef krux-v0.0.1.zip",
+    f"{RELEASE_URL}/krux-v0.0.1.zip.sig": b"\x30\x44\x02",
+    PEM_URL: b"-----BEGIN PUBLIC KEY-----",
+}
+
+
+def mock_get(url, **_):
+    response = MagicMock()
+    response.status_code = 200
+    response.headers = {"Content-Length": str(len(CONTENTS[url]))}
+    response.iter_content.return_value = [CONTENTS[url]]
+    return response
+
+
+class TestReleaseBundleDownloader(TestCase):
+
+    @patch("tempfile.gettempdir")
+    def test_init_assets(self, mock_gettempdir):
+        mock_gettempdir.return_value = "/tmp/dir"
+
+        r = ReleaseBundleDownloader(version="v0.0.1", destdir=mock_gettempdir())
+        self.assertEqual(r.url, f"{RELEASE_URL}/krux-v0.0.1.zip")
+        self.assertEqual(r.destdir, "/tmp/dir")
+        self.assertEqual(
+            [asset.url for asset in r.assets],
+            list(CONTENTS.keys()),
+        )
+        self.assertEqual(r.content_len, 0)
+        self.assertEqual(r.downloaded_len, 0)
+        self.assertEqual(
+            r.destfiles,
+            [
+                "/tmp/dir/krux-v0.0.1.zip",
+                "/tmp/dir/krux-v0.0.1.zip.sha256.txt",
+                "/tmp/dir/krux-v0.0.1.zip.sig",
+                "/tmp/dir/selfcustody.pem",
+            ],
+        )
+
+    def test_progress_until_all_content_len_known(self):
+        r = ReleaseBundleDownloader(version="v0.0.1", destdir="/tmp/dir")
+        zip_asset, sha256_asset, sig_asset, pem_asset = r.assets
+
+        # a resumed zip starts from its offset, before its headers arrive
+        zip_asset.downloaded_len = 100
+        for asset in (sha256_asset, sig_asset, pem_asset):
+            asset.content_len = 10
+            asset.downloaded_len = 10
+
+        self.assertEqual(r.content_len, 0)
+        self.assertEqual(r.downloaded_len, 30)
+
+        zip_asset.content_len = 1000
+        self.assertEqual(r.content_len, 1030)
+        self.assertEqual(r.downloaded_len, 130)
+
+    def test_downloaded_len_compressed_text_asset(self):
+        r = ReleaseBundleDownloader(version="v0.0.1", destdir="/tmp/dir")
+        for asset in r.assets:
+            asset.content_len = 10
+            asset.downloaded_len = 10
+
+        # a decompressed .sha256.txt is bigger than its Content-Length
+        r.assets[1].downloaded_len = 25
+        self.assertEqual(r.content_len, 40)
+        self.assertEqual(r.downloaded_len, 40)
+
+    @patch("src.utils.downloader.stream_downloader.get_session")
+    def test_download(self, mock_get_session):
+        mock_get_session.return_value.get.side_effect = mock_get
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            r = ReleaseBundleDownloader(version="v0.0.1", destdir=tmpdir)
+            on_data = MagicMock()
+            destfiles = r.download(on_data=on_data)
+
+            self.assertEqual(
+                destfiles,
+                [
+                    os.path.join(tmpdir, "krux-v0.0.1.zip"),
+                    os.path.join(tmpdir, "krux-v0.0.1.zip.sha256.txt"),
+                    os.path.join(tmpdir, "krux-v0.0.1.zip.sig"),
+                    os.path.join(tmpdir, "selfcustody.pem"),
+                ],
+            )
+
+            for url, destfile in zip(CONTENTS.keys(), destfiles):
+                with open(destfile, "rb") as file:
+                    self.assertEqual(file.read(), CONTENTS[url])
+
+        total = sum(len(data) for data in CONTENTS.values())
+        self.assertEqual(mock_get_session.return_value.get.call_count, 4)
+        self.assertEqual(on_data.call_count, 4)
+        self.assertEqual(r.content_len, total)
+        self.assertEqual(r.downloaded_len, total)
+
+    @patch("src.utils.downloader.stream_downloader.get_session")
+    def test_fail_download(self, mock_get_session):
+        def mock_get_fail_sig(url, **kwargs):
+            response = mock_get(url, **kwargs)
+            if url.endswith(".sig"):
+                response.status_code = 404
+                response.raise_for_status.side_effect = requests.exceptions.HTTPError()
+            return response
+
+        mock_get_session.return_value.get.side_effect = mock_get_fail_sig
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            r = ReleaseBundleDownloader(version="v0.0.1", destdir=tmpdir)
+
+            with self.assertRaises(RuntimeError) as exc_info:
+                r.download(on_data=MagicMock())
+
+            self.assertFalse(
+                os.path.exists(os.path.join(tmpdir, "krux-v0.0.1.zip.sig"))
+            )
+
+        self.assertEqual(str(exc_info.exception), "HTTP error 404: None")
@@ -0,0 +1,37 @@
+from unittest import TestCase
+from unittest.mock import patch
+import requests
+from src.utils.session import (
+    get_session,
+    close_session,
+    POOL_CONNECTIONS,
+    POOL_MAXSIZE,
+)
+
+
+class TestSession(TestCase):
+
+    def tearDown(self):
+        close_session()
+
+    def test_get_session(self):
+        session = get_session()
+        self.assertIsInstance(session, requests.Session)
+        self.assertEqual(session.headers["Connection"], "keep-alive")
+
+        adapter = session.get_adapter("https://github.com")
+        # pylint: disable=protected-access
+        self.assertEqual(adapter._pool_connections, POOL_CONNECTIONS)
+        self.assertEqual(adapter._pool_maxsize, POOL_MAXSIZE)
+
+    def test_get_session_is_shared(self):
+        self.assertIs(get_session(), get_session())
+
+    @patch("src.utils.session.requests.Session")
+    def test_close_session(self, mock_session):
+        get_session()
+        close_session()
+        get_session()
+
+        mock_session.return_value.close.assert_called_once()
+        self.assertEqual(mock_session.call_count, 2)
@@ -0,0 +1,117 @@
+import os
+import json
+import tempfile
+from unittest import TestCase
+from src.utils.cache import AssetCache
+
+URL = "https://github.com/selfcustody/krux/releases/download/v0.0.1/krux-v0.0.1.zip"
+
+
+class TestAssetCache(TestCase):
+
+    def setUp(self):
+        # pylint: disable=consider-using-with
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.cachedir = os.path.join(self.tmpdir.name, "local")
+        self.assetsdir = os.path.join(self.tmpdir.name, "assets")
+        os.makedirs(self.assetsdir)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def make_asset(self, name: str, data: bytes) -> str:
+        path = os.path.join(self.assetsdir, name)
+        with open(path, "wb") as file:
+            file.write(data)
+        return path
+
+    def test_init(self):
+        cache = AssetCache(cachedir=self.cachedir)
+        self.assertTrue(os.path.isdir(self.cachedir))
+        self.assertEqual(cache.cachedir, self.cachedir)
+        self.assertEqual(cache.entries, {})
+        self.assertEqual(
+            cache.index_file, os.path.join(self.cachedir, "assets-index.json")
+        )
+
+    def test_init_corrupted_index(self):
+        os.makedirs(self.cachedir)
+        with open(
+            os.path.join(self.cachedir, "assets-index.json"), "w", encoding="utf8"
+        ) as file:
+            file.write("{not json")
+
+        cache = AssetCache(cachedir=self.cachedir)
+        self.assertEqual(cache.entries, {})
+
+    def test_record_save_and_load(self):
+        path = self.make_asset("krux-v0.0.1.zip", b"krux")
+        cache = AssetCache(cachedir=self.cachedir)
+        entry = cache.record(path, URL, etag='"abc"', sha256="00ff", verified=True)
+        cache.save()
+
+        self.assertEqual(entry["url"], URL)
+        self.assertEqual(entry["size"], 4)
+        self.assertEqual(entry["etag"], '"abc"')
+        self.assertEqual(entry["sha256"], "00ff")
+        self.assertTrue(entry["verified"])
+        self.assertEqual(os.listdir(self.cachedir), ["assets-index.json"])
+
+        with open(cache.index_file, "r", encoding="utf8") as file:
+            self.assertEqual(json.load(file), {os.path.abspath(path): entry})
+
+        other = AssetCache(cachedir=self.cachedir)
+        self.assertEqual(other.lookup(path)["sha256"], "00ff")
+
+    def test_lookup_miss(self):
+        cache = AssetCache(cachedir=self.cachedir)
+        self.assertIsNone(cache.lookup(os.path.join(self.assetsdir, "none.zip")))
+
+    def test_lookup_changed_file(self):
+        path = self.make_asset("krux-v0.0.1.zip", b"krux")
+        cache = AssetCache(cachedir=self.cachedir)
+        cache.record(path, URL, verified=True)
+
+        self.make_asset("krux-v0.0.1.zip", b"krux-changed")
+
+        self.assertIsNone(cache.lookup(path))
+        self.assertEqual(cache.entries, {})
+
+    def test_lookup_removed_file(self):
+        path = self.make_asset("krux-v0.0.1.zip", b"krux")
+        cache = AssetCache(cachedir=self.cachedir)
+        cache.record(path, URL, verified=True)
+        os.remove(path)
+
+        self.assertIsNone(cache.lookup(path))
+
+    def test_is_verified(self):
+        zipfile = self.make_asset("krux-v0.0.1.zip", b"krux")
+        sigfile = self.make_asset("krux-v0.0.1.zip.sig", b"sig")
+        cache = AssetCache(cachedir=self.cachedir)
+
+        self.assertFalse(cache.is_verified([zipfile, sigfile]))
+
+        cache.record(zipfile, URL, verified=True)
+        cache.record(sigfile, f"{URL}.sig", verified=False)
+        self.assertFalse(cache.is_verified([zipfile, sigfile]))
+
+        cache.record(sigfile, f"{URL}.sig", verified=True)
+        self.assertTrue(cache.is_verified([zipfile, sigfile]))
+
+    def test_prune_on_save(self):
+        kept = self.make_asset("krux-v0.0.1.zip", b"0" * 6)
+        removed = self.make_asset("krux-v0.0.2.zip", b"1" * 6)
+        cache = AssetCache(cachedir=self.cachedir)
+        cache.record(kept, URL)
+        cache.record(removed, URL.replace("v0.0.1", "v0.0.2"))
+        os.remove(removed)
+        cache.save()
+
+        # the cache never removes the user's downloads, only stale entries
+        self.assertTrue(os.path.isfile(kept))
+        self.assertEqual(list(cache.entries.keys()), [os.path.abspath(kept)])
+        self.assertEqual(
+            list(AssetCache(cachedir=self.cachedir).entries.keys()),
+            [os.path.abspath(kept)],
+        )
@@ -0,0 +1,49 @@
+import os
+import tempfile
+from unittest import TestCase
+from src.utils.cache import HttpCache
+
+URL = "https://api.github.com/repos/selfcustody/krux/releases"
+
+
+class TestHttpCache(TestCase):
+
+    def test_init(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = HttpCache(cachedir=tmpdir)
+            self.assertEqual(cache.cachedir, tmpdir)
+            self.assertTrue(os.path.isdir(os.path.join(tmpdir, "http")))
+
+    def test_filename(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = HttpCache(cachedir=tmpdir)
+            filename = cache.filename(URL)
+
+        self.assertEqual(os.path.dirname(filename), os.path.join(tmpdir, "http"))
+        self.assertRegex(os.path.basename(filename), r"^[0-9a-f]{64}\.json$")
+
+    def test_load_miss(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = HttpCache(cachedir=tmpdir)
+            self.assertIsNone(cache.load(URL))
+
+    def test_store_and_load(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = HttpCache(cachedir=tmpdir)
+            cache.store(url=URL, body=[{"tag_name": "v0.0.1"}], etag='W/"abc"')
+            entry = cache.load(URL)
+            files = os.listdir(os.path.join(tmpdir, "http"))
+
+        self.assertEqual(
+            entry,
+            {"url": URL, "etag": 'W/"abc"', "body": [{"tag_name": "v0.0.1"}]},
+        )
+        self.assertEqual(len(files), 1)
+
+    def test_load_corrupted(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = HttpCache(cachedir=tmpdir)
+            with open(cache.filename(URL), "w", encoding="utf8") as file:
+                file.write("{not json")
+
+            self.assertIsNone(cache.load(URL))
@@ -0,0 +1,80 @@
+from unittest import TestCase
+from unittest.mock import patch
+from src.utils.selector.release_catalog import ReleaseCatalog, get_release_catalog
+
+RELEASES = ["v24.03.0", "v23.09.1", "odudex/krux_binaries"]
+
+
+class TestReleaseCatalog(TestCase):
+
+    def test_init(self):
+        catalog = ReleaseCatalog()
+        self.assertEqual(catalog.ttl, ReleaseCatalog.TTL)
+        self.assertEqual(catalog.releases, [])
+        self.assertTrue(catalog.is_expired())
+
+    def test_fail_init_ttl(self):
+        with self.assertRaises(ValueError) as exc_info:
+            ReleaseCatalog(ttl=-1)
+
+        self.assertEqual(str(exc_info.exception), "Invalid TTL: -1")
+
+    @patch("src.utils.selector.release_catalog.Selector")
+    def test_fetch_memoized(self, mock_selector):
+        mock_selector.return_value.releases = RELEASES
+        catalog = ReleaseCatalog()
+
+        self.assertEqual(catalog.fetch(cachedir="/tmp/local"), RELEASES)
+        self.assertEqual(catalog.fetch(cachedir="/tmp/local"), RELEASES)
+        self.assertFalse(catalog.is_expired())
+        mock_selector.assert_called_once_with(cachedir="/tmp/local")
+
+    @patch("src.utils.selector.release_catalog.time.monotonic")
+    @patch("src.utils.selector.release_catalog.Selector")
+    def test_fetch_expired(self, mock_selector, mock_monotonic):
+        mock_selector.return_value.releases = RELEASES
+        catalog = ReleaseCatalog(ttl=10)
+
+        mock_monotonic.return_value = 100
+        catalog.fetch()
+        mock_monotonic.return_value = 110
+        catalog.fetch()
+        self.assertEqual(mock_selector.call_count, 1)
+
+        mock_monotonic.return_value = 111
+        self.assertTrue(catalog.is_expired())
+        catalog.fetch()
+        self.assertEqual(mock_selector.call_count, 2)
+
+    @patch("src.utils.selector.release_catalog.Selector")
+    def test_fetch_refresh(self, mock_selector):
+        mock_selector.return_value.releases = RELEASES
+        catalog = ReleaseCatalog()
+
+        catalog.fetch()
+        catalog.fetch(refresh=True)
+        self.assertEqual(mock_selector.call_count, 2)
+
+    @patch("src.utils.selector.release_catalog.Selector")
+    def test_releases_copy(self, mock_selector):
+        mock_selector.return_value.releases = RELEASES
+        catalog = ReleaseCatalog()
+
+        releases = catalog.fetch()
+        releases.pop()
+        self.assertEqual(catalog.releases, RELEASES)
+
+    @patch("src.utils.selector.release_catalog.Selector")
+    def test_clear(self, mock_selector):
+        mock_selector.return_value.releases = RELEASES
+        catalog = ReleaseCatalog()
+
+        catalog.fetch()
+        catalog.clear()
+        self.assertEqual(catalog.releases, [])
+        self.assertTrue(catalog.is_expired())
+
+    def test_get_release_catalog(self):
+        catalog = get_release_catalog()
+        self.assertIsInstance(catalog, ReleaseCatalog)
+        self.assertIs(get_release_catalog(), catalog)
@@ -0,0 +1,130 @@
+from unittest import TestCase
+from unittest.mock import MagicMock, patch, call
+import requests
+from src.utils.selector import AssetRecord, CatalogFetcher, ReleaseRecord
+
+URL = "https://api.github.com/repos/selfcustody/krux/releases"
+HEADERS = {"Accept": "application/vnd.github+json"}
+
+RELEASE_API = {
+    "tag_name": "v24.03.0",
+    "body": "a long changelog",
+    "author": {"login": "test"},
+    "assets": [
+        {
+            "name": "krux-v24.03.0.zip",
+            "browser_download_url": "https://github.com/krux-v24.03.0.zip",
+            "size": 1024,
+            "digest": "sha256:00ff",
+            "uploader": {"login": "test"},
+        }
+    ],
+}
+
+
+def make_page(tags, next_url=None, etag=None):
+    response = MagicMock()
+    response.status_code = 200
+    response.headers = {"ETag": etag} if etag else {}
+    response.json.return_value = [{"tag_name": tag} for tag in tags]
+    response.links = {"next": {"url": next_url}} if next_url else {}
+    return response
+
+
+class TestCatalogFetcher(TestCase):
+
+    def test_release_record_from_api(self):
+        record = ReleaseRecord.from_api(RELEASE_API)
+        self.assertEqual(record.tag, "v24.03.0")
+        self.assertEqual(
+            record.assets,
+            (
+                AssetRecord(
+                    name="krux-v24.03.0.zip",
+                    url="https://github.com/krux-v24.03.0.zip",
+                    size=1024,
+                    digest="sha256:00ff",
+                ),
+            ),
+        )
+
+    def test_fail_release_record_from_api(self):
+        with self.assertRaises(KeyError) as exc_info:
+            ReleaseRecord.from_api({"author": "test"})
+
+        self.assertEqual(
+            str(exc_info.exception), "\"Invalid key: 'tag_name' do not exist on api\""
+        )
+
+    def test_release_record_dict(self):
+        record = ReleaseRecord.from_api(RELEASE_API)
+        self.assertEqual(ReleaseRecord.from_dict(record.to_dict()), record)
+        self.assertEqual(
+            ReleaseRecord.from_dict({"tag_name": "v0.0.1"}),
+            ReleaseRecord(tag="v0.0.1"),
+        )
+
+    def test_fail_per_page(self):
+        with self.assertRaises(ValueError) as exc_info:
+            CatalogFetcher(url=URL, headers=HEADERS, per_page=101)
+
+        self.assertEqual(str(exc_info.exception), "Invalid per_page: 101")
+
+    @patch("src.utils.selector.catalog_fetcher.get_session")
+    def test_fetch_pages(self, mock_get_session):
+        mock_get_session.return_value.get.side_effect = [
+            make_page(["v3", "v2"], next_url=f"{URL}?page=2", etag='W/"abc"'),
+            make_page(["v1"]),
+        ]
+
+        fetcher = CatalogFetcher(url=URL, headers=HEADERS)
+        records = fetcher.fetch()
+
+        self.assertEqual([record.tag for record in records], ["v3", "v2", "v1"])
+        self.assertEqual(fetcher.etag, 'W/"abc"')
+        self.assertFalse(fetcher.not_modified)
+        mock_get_session.return_value.get.assert_has_calls(
+            [
+                call(url=URL, headers=HEADERS, params={"per_page": 100}, timeout=10),
+                call(url=f"{URL}?page=2", headers=HEADERS, params=None, timeout=10),
+            ]
+        )
+
+    @patch("src.utils.selector.catalog_fetcher.get_session")
+    def test_fetch_stop_on_known_tag(self, mock_get_session):
+        mock_get_session.return_value.get.side_effect = [
+            make_page(["v4", "v3"], next_url=f"{URL}?page=2"),
+            make_page(["v2", "v1"], next_url=f"{URL}?page=3"),
+        ]
+        known = [ReleaseRecord(tag="v2"), ReleaseRecord(tag="v1")]
+
+        fetcher = CatalogFetcher(url=URL, headers=HEADERS)
+        records = fetcher.fetch(known=known, etag='W/"abc"')
+
+        self.assertEqual([record.tag for record in records], ["v4", "v3", "v2", "v1"])
+        self.assertEqual(mock_get_session.return_value.get.call_count, 2)
+        first_headers = mock_get_session.return_value.get.call_args_list[0][1]
+        self.assertEqual(first_headers["headers"]["If-None-Match"], 'W/"abc"')
+
+    @patch("src.utils.selector.catalog_fetcher.get_session")
+    def test_fetch_not_modified(self, mock_get_session):
+        mock_get_session.return_value.get.return_value = MagicMock(status_code=304)
+        known = [ReleaseRecord(tag="v1")]
+
+        fetcher = CatalogFetcher(url=URL, headers=HEADERS)
+        records = fetcher.fetch(known=known, etag='W/"abc"')
+
+        self.assertEqual(records, known)
+        self.assertTrue(fetcher.not_modified)
+        mock_get_session.return_value.get.return_value.json.assert_not_called()
+
+    @patch("src.utils.selector.catalog_fetcher.get_session")
+    def test_fail_fetch_timeout(self, mock_get_session):
+        mock_get_session.return_value.get.side_effect = requests.exceptions.Timeout(
+            "Mocked timeout"
+        )
+
+        with self.assertRaises(RuntimeError) as exc_info:
+            CatalogFetcher(url=URL, headers=HEADERS).fetch()
+
+        self.assertEqual(str(exc_info.exception), "Mocked timeout")
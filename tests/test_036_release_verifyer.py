@@ -0,0 +1,87 @@
+import os
+import tempfile
+from unittest import TestCase
+from unittest.mock import MagicMock, call, patch
+from src.utils.verifyer import ReleaseVerifyer
+from .test_018_sha256_verifyer import MOCK_SHA
+from .test_019_sig_verifyer import MOCK_PEM, MOCK_SIG, MOCK_SIG_FAIL, MOCK_ZIP
+
+
+class TestReleaseVerifyer(TestCase):
+
+    def setUp(self):
+        # pylint: disable=consider-using-with
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.tmpdir.name, "krux-v0.0.1.zip")
+        with open(self.filename, "wb") as file:
+            file.write(MOCK_ZIP)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def make_verifyer(self, **kwargs) -> ReleaseVerifyer:
+        params = {"sha256sum": MOCK_SHA, "signature": MOCK_SIG, "pubkey": MOCK_PEM}
+        params.update(kwargs)
+        return ReleaseVerifyer(filename=self.filename, **params)
+
+    def test_init(self):
+        release = self.make_verifyer()
+        self.assertEqual(release.filename, self.filename)
+        self.assertEqual(release.read_mode, "rb")
+        self.assertEqual(release.sha256sum, MOCK_SHA)
+        self.assertEqual(release.signature, MOCK_SIG)
+        self.assertEqual(release.chunk_size, ReleaseVerifyer.CHUNK_SIZE)
+        self.assertEqual(release.data, None)
+        self.assertEqual(release.digest, None)
+
+    def test_fail_init_file(self):
+        with self.assertRaises(ValueError) as exc_info:
+            ReleaseVerifyer(
+                filename="mock.zip",
+                sha256sum=MOCK_SHA,
+                signature=MOCK_SIG,
+                pubkey=MOCK_PEM,
+            )
+
+        self.assertEqual(str(exc_info.exception), "File mock.zip do not exist")
+
+    def test_fail_init_chunk_size(self):
+        with self.assertRaises(ValueError) as exc_info:
+            self.make_verifyer(chunk_size=0)
+
+        self.assertEqual(str(exc_info.exception), "Invalid chunk size: 0")
+
+    def test_load_once(self):
+        on_data = MagicMock()
+        release = self.make_verifyer(chunk_size=512)
+
+        with patch("builtins.open", wraps=open) as mock_open:
+            release.load(on_data=on_data)
+
+        mock_open.assert_called_once_with(self.filename, "rb")
+        on_data.assert_has_calls(
+            [call(512, len(MOCK_ZIP)), call(len(MOCK_ZIP), len(MOCK_ZIP))]
+        )
+        self.assertEqual(release.data, MOCK_SHA)
+        self.assertEqual(release.digest.hex(), MOCK_SHA)
+
+    def test_verify(self):
+        release = self.make_verifyer(sha256sum=f"{MOCK_SHA.upper()}\n")
+        release.load()
+        self.assertTrue(release.verify_sha256())
+        self.assertTrue(release.verify_signature())
+        self.assertTrue(release.verify())
+
+    def test_fail_verify_sha256(self):
+        release = self.make_verifyer(sha256sum="00" * 32)
+        release.load()
+        self.assertFalse(release.verify_sha256())
+        self.assertTrue(release.verify_signature())
+        self.assertFalse(release.verify())
+
+    def test_fail_verify_signature(self):
+        release = self.make_verifyer(signature=MOCK_SIG_FAIL)
+        release.load()
+        self.assertTrue(release.verify_sha256())
+        self.assertFalse(release.verify_signature())
+        self.assertFalse(release.verify())
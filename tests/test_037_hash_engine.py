@@ -0,0 +1,80 @@
+import os
+import hashlib
+import tempfile
+from unittest import TestCase
+from unittest.mock import MagicMock, call, patch
+from src.utils.verifyer import HashEngine
+
+DATA = os.urandom(10 * 1024 + 7)
+
+
+class TestHashEngine(TestCase):
+
+    def setUp(self):
+        # pylint: disable=consider-using-with
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.tmpdir.name, "krux.zip")
+        with open(self.filename, "wb") as file:
+            file.write(DATA)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_init(self):
+        engine = HashEngine()
+        self.assertEqual(engine.algorithm, "sha256")
+        self.assertEqual(engine.buffer_size, HashEngine.BUFFER_SIZE)
+        self.assertEqual(engine.hashed_len, 0)
+        self.assertEqual(engine.throughput, 0.0)
+
+    def test_fail_init_algorithm(self):
+        with self.assertRaises(ValueError) as exc_info:
+            HashEngine(algorithm="mock")
+
+        self.assertEqual(str(exc_info.exception), "Invalid algorithm: mock")
+
+    def test_fail_init_buffer_size(self):
+        with self.assertRaises(ValueError) as exc_info:
+            HashEngine(buffer_size=0)
+
+        self.assertEqual(str(exc_info.exception), "Invalid buffer size: 0")
+
+    def test_hash_file(self):
+        engine = HashEngine()
+        hasher = engine.hash_file(self.filename)
+
+        self.assertEqual(hasher.hexdigest(), hashlib.sha256(DATA).hexdigest())
+        self.assertEqual(engine.hashed_len, len(DATA))
+
+    def test_hash_file_small_buffer(self):
+        on_data = MagicMock()
+        engine = HashEngine(algorithm="sha512", buffer_size=4096)
+        hasher = engine.hash_file(self.filename, on_data=on_data)
+
+        self.assertEqual(hasher.hexdigest(), hashlib.sha512(DATA).hexdigest())
+        on_data.assert_has_calls(
+            [
+                call(4096, len(DATA)),
+                call(8192, len(DATA)),
+                call(len(DATA), len(DATA)),
+            ]
+        )
+
+    def test_hash_empty_file(self):
+        filename = os.path.join(self.tmpdir.name, "empty")
+        open(filename, "wb").close()  # pylint: disable=consider-using-with
+
+        engine = HashEngine()
+        hasher = engine.hash_file(filename)
+
+        self.assertEqual(hasher.hexdigest(), hashlib.sha256(b"").hexdigest())
+        self.assertEqual(engine.hashed_len, 0)
+
+    @patch("src.utils.verifyer.hash_engine.time.perf_counter", side_effect=[1.0, 1.5])
+    def test_throughput(self, mock_perf_counter):
+        engine = HashEngine()
+        engine.hash_file(self.filename)
+
+        self.assertEqual(engine.elapsed, 0.5)
+        self.assertAlmostEqual(engine.throughput, len(DATA) / 0.5 / 1e6)
+        self.assertEqual(mock_perf_counter.call_count, 2)
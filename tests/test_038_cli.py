@@ -0,0 +1,140 @@
+import io
+import os
+import json
+import tempfile
+from contextlib import redirect_stdout, redirect_stderr
+from unittest import TestCase
+from unittest.mock import patch
+from src.cli import main
+from src.utils.profiler import Profiler
+from src.cli.batch import find_artifacts, run
+from .test_018_sha256_verifyer import MOCK_SHA
+from .test_019_sig_verifyer import MOCK_PEM, MOCK_SIG, MOCK_SIG_FAIL, MOCK_ZIP
+
+
+class TestCli(TestCase):
+
+    def setUp(self):
+        # pylint: disable=consider-using-with
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.rootdir = self.tmpdir.name
+        self.zipfile = self.write("krux-v0.0.1.zip", MOCK_ZIP)
+        self.write("krux-v0.0.1.zip.sig", MOCK_SIG)
+        self.write("krux-v0.0.1.zip.sha256.txt", f"{MOCK_SHA} krux-v0.0.1.zip")
+        self.binfile = self.write(
+            os.path.join("maixpy_amigo", "firmware.bin"), MOCK_ZIP
+        )
+        self.write(os.path.join("maixpy_amigo", "firmware.bin.sig"), MOCK_SIG_FAIL)
+        self.write(os.path.join("maixpy_amigo", "kboot.kfpkg"), b"ignored")
+        self.pemfile = self.write("selfcustody.pem", MOCK_PEM)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def write(self, name: str, data: bytes | str) -> str:
+        path = os.path.join(self.rootdir, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        mode = "wb" if isinstance(data, bytes) else "w"
+        # pylint: disable=unspecified-encoding
+        with open(path, mode) as file:
+            file.write(data)
+        return path
+
+    def test_find_artifacts(self):
+        self.assertEqual(find_artifacts(self.rootdir), [self.zipfile, self.binfile])
+
+    def test_fail_find_artifacts(self):
+        with self.assertRaises(ValueError) as exc_info:
+            find_artifacts(self.zipfile)
+
+        self.assertEqual(str(exc_info.exception), f"{self.zipfile} is not a directory")
+
+    def test_fail_run_jobs(self):
+        with self.assertRaises(ValueError) as exc_info:
+            list(run("hash", [self.zipfile], jobs=0))
+
+        self.assertEqual(str(exc_info.exception), "Invalid jobs: 0")
+
+    def test_run_verify(self):
+        reports = list(
+            run("verify", [self.zipfile, self.binfile], jobs=1, pubkey=MOCK_PEM)
+        )
+
+        self.assertEqual(reports[0]["file"], self.zipfile)
+        self.assertEqual(reports[0]["sha256"], MOCK_SHA)
+        self.assertTrue(reports[0]["checksum"])
+        self.assertTrue(reports[0]["signature"])
+        self.assertTrue(reports[0]["ok"])
+        self.assertEqual(reports[0]["size"], len(MOCK_ZIP))
+
+        # firmware.bin without .sha256.txt and with a bad signature
+        self.assertIsNone(reports[1]["checksum"])
+        self.assertFalse(reports[1]["signature"])
+        self.assertFalse(reports[1]["ok"])
+
+    def test_run_verify_missing_signature(self):
+        os.remove(f"{self.zipfile}.sig")
+        report = next(run("verify", [self.zipfile], jobs=1, pubkey=MOCK_PEM))
+
+        self.assertFalse(report["ok"])
+        self.assertIn("krux-v0.0.1.zip.sig", report["error"])
+
+    def test_run_hash_process_pool(self):
+        reports = list(run("hash", [self.zipfile, self.binfile], jobs=2))
+
+        self.assertEqual([r["file"] for r in reports], [self.zipfile, self.binfile])
+        self.assertTrue(all(r["ok"] and r["sha256"] == MOCK_SHA for r in reports))
+        with open(f"{self.binfile}.sha256.txt", "r", encoding="utf8") as file:
+            self.assertEqual(file.read(), f"{MOCK_SHA} {self.binfile}")
+
+    def test_main_verify(self):
+        out = io.StringIO()
+        with redirect_stdout(out):
+            code = main(["verify", self.rootdir, "--jobs", "1"])
+
+        lines = [json.loads(line) for line in out.getvalue().splitlines()]
+        self.assertEqual(code, 1)
+        self.assertEqual([line["ok"] for line in lines], [True, False])
+        self.assertTrue(all("seconds" in line and "mbps" in line for line in lines))
+
+    def test_fail_main_pem(self):
+        os.remove(self.pemfile)
+        with redirect_stdout(io.StringIO()):
+            code = main(["verify", self.rootdir])
+
+        self.assertEqual(code, 2)
+
+    def test_fail_main_trust_ledger_without_ledger(self):
+        kfpkg = os.path.join(self.rootdir, "maixpy_amigo", "kboot.kfpkg")
+        err = io.StringIO()
+        with redirect_stdout(io.StringIO()), redirect_stderr(err):
+            code = main(["flash", kfpkg, "--trust-ledger"])
+
+        self.assertEqual(code, 2)
+        self.assertEqual(
+            json.loads(err.getvalue()),
+            {"ok": False, "error": "--trust-ledger needs a --ledger"},
+        )
+
+    def test_main_hash(self):
+        out = io.StringIO()
+        with redirect_stdout(out):
+            code = main(["hash", self.rootdir, "--jobs", "1"])
+
+        self.assertEqual(code, 0)
+        self.assertEqual(len(out.getvalue().splitlines()), 2)
+
+    @patch("src.utils.profiler.profiler.atexit.register")
+    @patch("src.cli.get_profiler")
+    def test_main_hash_profile(self, mock_get_profiler, mock_register):
+        profiler = Profiler()
+        mock_get_profiler.return_value = profiler
+        trace = os.path.join(self.rootdir, "trace.json")
+
+        with redirect_stdout(io.StringIO()):
+            code = main(["--profile", trace, "hash", self.rootdir, "--jobs", "1"])
+
+        self.assertEqual(code, 0)
+        self.assertEqual(profiler.filename, trace)
+        mock_register.assert_called_once_with(profiler.save)
+        self.assertEqual(list(profiler.summary().keys()), ["cli.hash"])
@@ -0,0 +1,232 @@
+import tempfile
+from unittest import TestCase
+from unittest.mock import patch, MagicMock, call
+from src.utils.cache import FlashLedger
+from src.utils.flasher import BatchFlasher, FlashEvent
+from src.utils.flasher.base_flasher import BaseFlasher
+
+FIRMWARE = "mock/maixpy_amigo/kboot.kfpkg"
+
+
+# pylint: disable=unused-argument
+class TestBatchFlasher(TestCase):
+
+    @patch("os.path.exists", return_value=True)
+    def test_init(self, mock_exists):
+        b = BatchFlasher(firmware=FIRMWARE, baudrate=1500000)
+        mock_exists.assert_called_once_with(FIRMWARE)
+        self.assertEqual(b.firmware, FIRMWARE)
+        self.assertEqual(b.baudrate, 1500000)
+        self.assertEqual(b.device, "amigo")
+        self.assertEqual(b.states, {})
+
+    @patch("os.path.exists", return_value=True)
+    def test_init_device(self, _):
+        b = BatchFlasher(firmware=FIRMWARE, baudrate=1500000, device="dock")
+        self.assertEqual(b.device, "dock")
+
+    @patch("os.path.exists", return_value=False)
+    def test_fail_init_firmware_not_exist(self, _):
+        with self.assertRaises(ValueError) as exc_info:
+            BatchFlasher(firmware=FIRMWARE, baudrate=1500000)
+
+        self.assertEqual(str(exc_info.exception), f"File does not exist: {FIRMWARE}")
+
+    @patch("os.path.exists", return_value=True)
+    def test_fail_init_wrong_baudrate(self, _):
+        with self.assertRaises(ValueError) as exc_info:
+            BatchFlasher(firmware=FIRMWARE, baudrate=1)
+
+        self.assertEqual(str(exc_info.exception), "Invalid baudrate: 1")
+
+    @patch("os.path.exists", return_value=True)
+    def test_fail_init_unknown_device(self, _):
+        with self.assertRaises(ValueError) as exc_info:
+            BatchFlasher(firmware="mock/kboot.kfpkg", baudrate=1500000)
+
+        self.assertEqual(str(exc_info.exception), "Device not implemented: None")
+
+    @patch("os.path.exists", return_value=True)
+    @patch("src.utils.flasher.batch_flasher.get_port_discovery")
+    def test_find_ports(self, mock_get_port_discovery, _):
+        mock_get_port_discovery.return_value.ports.return_value = [
+            MagicMock(device="/mock/path0"),
+            MagicMock(device="/mock/path1"),
+        ]
+        b = BatchFlasher(firmware=FIRMWARE, baudrate=1500000)
+        self.assertEqual(b.find_ports(), ["/mock/path0", "/mock/path1"])
+        mock_get_port_discovery.return_value.ports.assert_called_once_with(
+            "0403", refresh=True
+        )
+
+    @patch("os.path.exists", return_value=True)
+    @patch("src.utils.flasher.batch_flasher.get_port_discovery")
+    @patch("src.utils.flasher.batch_flasher.FlashEngine")
+    def test_flash_all_ports(self, mock_engine, mock_get_port_discovery, _):
+        mock_get_port_discovery.return_value.ports.return_value = [
+            MagicMock(device="/mock/path0"),
+            MagicMock(device="/mock/path1"),
+        ]
+
+        def make_engine(device, port, baudrate, firmware, **_):
+            engine = MagicMock()
+            engine.flash.return_value = iter(
+                [
+                    FlashEvent(port, "start"),
+                    FlashEvent(port, "log", message="[INFO] Greeting"),
+                    FlashEvent(port, "firmware", 50.0, 1024.0),
+                    FlashEvent(port, "done", 100.0),
+                ]
+            )
+            return engine
+
+        mock_engine.side_effect = make_engine
+        on_event = MagicMock()
+
+        b = BatchFlasher(firmware=FIRMWARE, baudrate=1500000)
+        summary = b.flash(on_event=on_event)
+
+        self.assertEqual(
+            summary,
+            [
+                {
+                    "port": "/mock/path0",
+                    "device": "amigo",
+                    "ok": True,
+                    "status": "passed",
+                    "error": None,
+                },
+                {
+                    "port": "/mock/path1",
+                    "device": "amigo",
+                    "ok": True,
+                    "status": "passed",
+                    "error": None,
+                },
+            ],
+        )
+        mock_engine.assert_has_calls(
+            [
+                call(
+                    device="amigo",
+                    port="/mock/path0",
+                    baudrate=1500000,
+                    firmware=FIRMWARE,
+                    ledger=None,
+                    trust_ledger=False,
+                    digest=None,
+                ),
+                call(
+                    device="amigo",
+                    port="/mock/path1",
+                    baudrate=1500000,
+                    firmware=FIRMWARE,
+                    ledger=None,
+                    trust_ledger=False,
+                    digest=None,
+                ),
+            ],
+            any_order=True,
+        )
+        self.assertEqual(b.states["/mock/path0"]["percent"], 100.0)
+        self.assertEqual(b.states["/mock/path1"]["log"], ["[INFO] Greeting"])
+        self.assertEqual(on_event.call_count, 8)
+        on_event.assert_any_call(FlashEvent("/mock/path1", "firmware", 50.0, 1024.0))
+
+    @patch("os.path.exists", return_value=True)
+    @patch("src.utils.flasher.batch_flasher.FlashEngine")
+    def test_flash_one_port_fail(self, mock_engine, _):
+        def make_engine(device, port, baudrate, firmware, **_):
+            engine = MagicMock()
+            last = (
+                FlashEvent(port, "failed", message="Cancel")
+                if port == "/mock/path1"
+                else FlashEvent(port, "done", 100.0)
+            )
+            engine.flash.return_value = iter([FlashEvent(port, "start"), last])
+            return engine
+
+        mock_engine.side_effect = make_engine
+
+        b = BatchFlasher(firmware=FIRMWARE, baudrate=1500000)
+        summary = b.flash(ports=["/mock/path0", "/mock/path1"])
+
+        self.assertEqual([s["ok"] for s in summary], [True, False])
+        self.assertEqual([s["status"] for s in summary], ["passed", "failed"])
+        self.assertEqual([s["error"] for s in summary], [None, "Cancel"])
+
+    @patch("os.path.exists", return_value=True)
+    @patch("src.utils.flasher.batch_flasher.get_port_discovery")
+    def test_fail_flash_no_ports(self, mock_get_port_discovery, _):
+        mock_get_port_discovery.return_value.ports.return_value = []
+        b = BatchFlasher(firmware=FIRMWARE, baudrate=1500000)
+
+        with self.assertRaises(RuntimeError) as exc_info:
+            b.flash()
+
+        self.assertEqual(str(exc_info.exception), "No ports found for device amigo")
+
+    @patch("os.path.exists", return_value=True)
+    @patch("src.utils.flasher.batch_flasher.HashEngine")
+    @patch("src.utils.flasher.batch_flasher.FlashEngine")
+    def test_flash_skipped_with_ledger(self, mock_engine, mock_hash_engine, _):
+        def make_engine(device, port, baudrate, firmware, **_):
+            engine = MagicMock()
+            last = (
+                FlashEvent(port, "skipped", 100.0, message="Firmware unchanged")
+                if port == "/mock/path1"
+                else FlashEvent(port, "done", 100.0)
+            )
+            engine.flash.return_value = iter([FlashEvent(port, "start"), last])
+            return engine
+
+        mock_engine.side_effect = make_engine
+        mock_hash_engine.return_value.hash_file.return_value.hexdigest.return_value = (
+            "00ff"
+        )
+        ledger = MagicMock()
+
+        b = BatchFlasher(
+            firmware=FIRMWARE, baudrate=1500000, ledger=ledger, trust_ledger=True
+        )
+        summary = b.flash(ports=["/mock/path0", "/mock/path1"])
+
+        self.assertEqual([s["ok"] for s in summary], [True, True])
+        self.assertEqual([s["status"] for s in summary], ["passed", "skipped"])
+        mock_hash_engine.return_value.hash_file.assert_called_once_with(FIRMWARE)
+        for c in mock_engine.call_args_list:
+            self.assertEqual(c.kwargs["ledger"], ledger)
+            self.assertTrue(c.kwargs["trust_ledger"])
+            self.assertEqual(c.kwargs["digest"], "00ff")
+
+    @patch("os.path.exists", return_value=True)
+    @patch("src.utils.flasher.batch_flasher.HashEngine")
+    @patch("src.utils.flasher.flasher.Flasher.is_port_working", return_value=True)
+    @patch("src.utils.flasher.engine.get_port_discovery")
+    @patch("src.utils.kboot.build.ktool.KTool.process")
+    def test_flash_not_skipped_after_forget_usb_id(
+        self, mock_process, mock_get_port_discovery, _, mock_hash_engine, __
+    ):
+        mock_get_port_discovery.return_value.lookup.return_value = MagicMock(
+            vid=0x0403, pid=0x6010, serial_number="ABC"
+        )
+        mock_hash_engine.return_value.hash_file.return_value.hexdigest.return_value = (
+            "00ff"
+        )
+
+        with tempfile.TemporaryDirectory() as cachedir:
+            # recorded as an amigo_tft, then reflashed by the GUI as an amigo
+            ledger = FlashLedger(cachedir=cachedir)
+            ledger.record("0403:6010:abc", "00ff", device="amigo_tft")
+            ledger.forget_usb_id(BaseFlasher.DEVICE_VID_MAP["amigo"])
+
+            b = BatchFlasher(
+                firmware="mock/maixpy_amigo_tft/kboot.kfpkg",
+                baudrate=1500000,
+                ledger=ledger,
+                trust_ledger=True,
+            )
+            summary = b.flash(ports=["/mock/path0"])
+
+        self.assertEqual([s["status"] for s in summary], ["passed"])
+        mock_process.assert_called_once()
@@ -0,0 +1,268 @@
+import sys
+import subprocess
+from unittest import TestCase
+from unittest.mock import patch, MagicMock
+from src.utils.flasher import FlashEngine, FlashEvent
+from src.utils.flasher.engine import parse_rate, route_print
+
+FIRMWARE = "mock/maixpy_amigo/kboot.kfpkg"
+
+
+class TestFlashEngine(TestCase):
+
+    def test_parse_rate(self):
+        self.assertEqual(parse_rate("95.5 KiB/s"), 95.5 * 1024)
+        self.assertEqual(parse_rate("Speed: 1MiB/s"), 1024**2)
+        self.assertEqual(parse_rate("12 B/s"), 12.0)
+        self.assertIsNone(parse_rate("42%"))
+        self.assertIsNone(parse_rate(None))
+
+    def test_event_to_dict(self):
+        event = FlashEvent("/mock/path0", "firmware", 50.0, 1024.0)
+        self.assertEqual(
+            event.to_dict(),
+            {
+                "port": "/mock/path0",
+                "stage": "firmware",
+                "percent": 50.0,
+                "rate": 1024.0,
+                "message": None,
+            },
+        )
+
+    def test_fail_init_device(self):
+        with self.assertRaises(ValueError) as exc_info:
+            FlashEngine(device="mock", port="/mock/path0", baudrate=1500000)
+
+        self.assertEqual(str(exc_info.exception), "Device not implemented: mock")
+
+    def test_fail_flash_without_firmware(self):
+        engine = FlashEngine(device="amigo", port="/mock/path0", baudrate=1500000)
+
+        with self.assertRaises(ValueError) as exc_info:
+            engine.flash()
+
+        self.assertEqual(str(exc_info.exception), "A firmware is needed to flash")
+
+    @patch("os.path.exists", return_value=True)
+    @patch("src.utils.flasher.flasher.Flasher.is_port_working", return_value=True)
+    @patch("src.utils.kboot.build.ktool.KTool.process")
+    def test_flash(self, mock_process, mock_is_port_working, _):
+        def process(**kwargs):
+            route_print("[INFO]", "Greeting")
+            kwargs["callback"]("firmware", 1, 4, "95.5 KiB/s")
+            kwargs["callback"]("firmware", 1, 4, "95.5 KiB/s")
+            kwargs["callback"]("firmware", 4, 4, "95.5 KiB/s")
+
+        mock_process.side_effect = process
+        engine = FlashEngine(
+            device="amigo", port="/mock/path0", baudrate=1500000, firmware=FIRMWARE
+        )
+
+        events = list(engine.flash())
+
+        self.assertEqual(
+            events,
+            [
+                FlashEvent("/mock/path0", "start"),
+                FlashEvent("/mock/path0", "log", message="[INFO] Greeting"),
+                FlashEvent("/mock/path0", "firmware", 25.0, 95.5 * 1024),
+                FlashEvent("/mock/path0", "firmware", 100.0, 95.5 * 1024),
+                FlashEvent("/mock/path0", "done", 100.0),
+            ],
+        )
+        mock_is_port_working.assert_called_once_with("/mock/path0")
+        self.assertEqual(mock_process.call_args.kwargs["dev"], "/mock/path0")
+        self.assertEqual(mock_process.call_args.kwargs["board"], "goE")
+        self.assertEqual(mock_process.call_args.kwargs["file"], FIRMWARE)
+
+    @patch("os.path.exists", return_value=True)
+    @patch("src.utils.flasher.flasher.Flasher.is_port_working", return_value=False)
+    def test_flash_port_not_working(self, _, __):
+        engine = FlashEngine(
+            device="amigo", port="/mock/path0", baudrate=1500000, firmware=FIRMWARE
+        )
+
+        events = list(engine.flash())
+
+        self.assertEqual(
+            events[-1],
+            FlashEvent("/mock/path0", "failed", message="Port /mock/path0 not working"),
+        )
+
+    @patch("os.path.exists", return_value=True)
+    @patch("src.utils.flasher.flasher.Flasher.is_port_working", return_value=True)
+    @patch("src.utils.kboot.build.ktool.KTool.checkKillExit")
+    @patch("src.utils.kboot.build.ktool.KTool.kill")
+    @patch("src.utils.kboot.build.ktool.KTool.process")
+    def test_flash_greeting_fail(self, mock_process, mock_kill, mock_check, _, __):
+        def process(**_):
+            route_print("[WARN]", "Greeting fail")
+
+        mock_process.side_effect = process
+        mock_check.side_effect = RuntimeError("Cancel")
+        engine = FlashEngine(
+            device="amigo", port="/mock/path0", baudrate=1500000, firmware=FIRMWARE
+        )
+
+        events = list(engine.flash())
+
+        mock_kill.assert_called_once()
+        self.assertEqual(
+            events[-1],
+            FlashEvent("/mock/path0", "failed", message="[WARN] Greeting fail"),
+        )
+
+    @patch("src.utils.flasher.wiper.Wiper.is_port_working", return_value=True)
+    @patch("src.utils.kboot.build.ktool.KTool.process")
+    def test_wipe_restore_argv(self, mock_process, _):
+        argv = sys.argv
+        seen = []
+        mock_process.side_effect = lambda: seen.append(list(sys.argv))
+
+        engine = FlashEngine(device="dock", port="/mock/path0", baudrate=1500000)
+        events = list(engine.wipe())
+
+        self.assertEqual(events[-1], FlashEvent("/mock/path0", "done", 100.0))
+        self.assertEqual(
+            seen,
+            [
+                [
+                    argv[0],
+                    "-B",
+                    "dan",
+                    "-b",
+                    "1500000",
+                    "-p",
+                    "/mock/path0",
+                    "-E",
+                ]
+            ],
+        )
+        self.assertIs(sys.argv, argv)
+
+    @patch("os.path.exists", return_value=True)
+    @patch("src.utils.flasher.engine.get_port_discovery")
+    @patch("src.utils.kboot.build.ktool.KTool.process")
+    def test_flash_skipped_by_ledger(self, mock_process, mock_get_port_discovery, _):
+        mock_get_port_discovery.return_value.lookup.return_value = MagicMock(
+            vid=0x0403, pid=0x6010, serial_number="ABC"
+        )
+        ledger = MagicMock()
+        ledger.is_flashed.return_value = True
+        engine = FlashEngine(
+            device="amigo",
+            port="/mock/path0",
+            baudrate=1500000,
+            firmware=FIRMWARE,
+            ledger=ledger,
+            trust_ledger=True,
+            digest="00ff",
+        )
+
+        events = list(engine.flash())
+
+        self.assertEqual(
+            events,
+            [
+                FlashEvent("/mock/path0", "start"),
+                FlashEvent(
+                    "/mock/path0",
+                    "skipped",
+                    100.0,
+                    message="Firmware unchanged on 0403:6010:abc",
+                ),
+            ],
+        )
+        ledger.is_flashed.assert_called_once_with("0403:6010:abc", "00ff")
+        ledger.forget.assert_not_called()
+        mock_process.assert_not_called()
+
+    @patch("os.path.exists", return_value=True)
+    @patch("src.utils.flasher.flasher.Flasher.is_port_working", return_value=True)
+    @patch("src.utils.flasher.engine.get_port_discovery")
+    @patch("src.utils.kboot.build.ktool.KTool.process")
+    def test_flash_not_skipped_by_untrusted_ledger(
+        self, mock_process, mock_get_port_discovery, _, __
+    ):
+        mock_get_port_discovery.return_value.lookup.return_value = MagicMock(
+            vid=0x0403, pid=0x6010, serial_number="ABC"
+        )
+        ledger = MagicMock()
+        ledger.is_flashed.return_value = True
+        engine = FlashEngine(
+            device="amigo",
+            port="/mock/path0",
+            baudrate=1500000,
+            firmware=FIRMWARE,
+            ledger=ledger,
+            digest="00ff",
+        )
+
+        events = list(engine.flash())
+
+        self.assertEqual(events[-1], FlashEvent("/mock/path0", "done", 100.0))
+        ledger.is_flashed.assert_not_called()
+        mock_process.assert_called_once()
+
+    @patch("os.path.exists", return_value=True)
+    @patch("src.utils.flasher.flasher.Flasher.is_port_working", return_value=True)
+    @patch("src.utils.flasher.engine.get_port_discovery")
+    @patch("src.utils.kboot.build.ktool.KTool.process")
+    def test_flash_recorded_by_ledger(self, _, mock_get_port_discovery, __, ___):
+        mock_get_port_discovery.return_value.lookup.return_value = MagicMock(
+            vid=0x0403, pid=0x6010, serial_number="ABC"
+        )
+        ledger = MagicMock()
+        ledger.is_flashed.return_value = False
+        engine = FlashEngine(
+            device="amigo",
+            port="/mock/path0",
+            baudrate=1500000,
+            firmware=FIRMWARE,
+            ledger=ledger,
+            digest="00ff",
+        )
+
+        events = list(engine.flash())
+
+        self.assertEqual(events[-1], FlashEvent("/mock/path0", "done", 100.0))
+
+        # forgotten before flashing, since a failed flash is unknown
+        ledger.forget.assert_called_once_with("0403:6010:abc")
+        ledger.record.assert_called_once_with(
+            "0403:6010:abc", "00ff", device="amigo", port="/mock/path0"
+        )
+        self.assertEqual(ledger.save.call_count, 2)
+
+    @patch("src.utils.flasher.wiper.Wiper.is_port_working", return_value=True)
+    @patch("src.utils.flasher.engine.get_port_discovery")
+    @patch("src.utils.kboot.build.ktool.KTool.process")
+    def test_wipe_forgotten_by_ledger(self, _, mock_get_port_discovery, __):
+        mock_get_port_discovery.return_value.lookup.return_value = MagicMock(
+            vid=0x0403, pid=0x6010, serial_number="ABC"
+        )
+        ledger = MagicMock()
+        engine = FlashEngine(
+            device="amigo", port="/mock/path0", baudrate=1500000, ledger=ledger
+        )
+
+        events = list(engine.wipe())
+
+        self.assertEqual(events[-1], FlashEvent("/mock/path0", "done", 100.0))
+        ledger.forget.assert_called_once_with("0403:6010:abc")
+        ledger.save.assert_called_once()
+
+    def test_no_kivy(self):
+        # a line controller should not pay the GUI startup cost
+        code = "\n".join(
+            [
+                "import sys",
+                "import src.utils.flasher.engine",
+                "print(any(m.startswith('kivy') for m in sys.modules))",
+            ]
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, check=True, text=True
+        )
+        self.assertEqual(result.stdout.strip(), "False")
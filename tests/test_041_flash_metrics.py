@@ -0,0 +1,131 @@
+import os
+import json
+import tempfile
+import zipfile
+from unittest import TestCase
+from unittest.mock import MagicMock
+from src.utils.flasher import FlashMetrics
+
+
+class TestFlashMetrics(TestCase):
+
+    def setUp(self):
+        # pylint: disable=consider-using-with
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.firmware = os.path.join(self.tmpdir.name, "kboot.kfpkg")
+        with zipfile.ZipFile(self.firmware, "w") as kfpkg:
+            kfpkg.writestr("flash-list.json", "{}")
+            kfpkg.writestr("bootloader_lo.bin", b"0" * 1024)
+            kfpkg.writestr("firmware.bin", b"1" * 3072)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def make_metrics(self, **kwargs) -> FlashMetrics:
+        # each call of the clock is one second later
+        clock = MagicMock(side_effect=range(100))
+        return FlashMetrics(
+            baudrate=1500000, firmware=self.firmware, clock=clock, **kwargs
+        )
+
+    def test_init(self):
+        m = FlashMetrics(baudrate="1500000", cachedir=self.tmpdir.name)
+        self.assertEqual(m.baudrate, 1500000)
+        self.assertIsNone(m.firmware)
+        self.assertIsNone(m.stage)
+        self.assertEqual(m.stages, {})
+        self.assertEqual(
+            m.metrics_file, os.path.join(self.tmpdir.name, "flash-metrics.jsonl")
+        )
+
+    def test_payload_size(self):
+        self.assertEqual(FlashMetrics.payload_size(self.firmware), 4096)
+        self.assertIsNone(FlashMetrics.payload_size(None))
+        self.assertIsNone(FlashMetrics.payload_size(self.tmpdir.name + "/none"))
+
+    def test_stages(self):
+        m = self.make_metrics()
+        m.on_data("\x1b[32m\x1b[1m[INFO]\x1b[0m Default baudrate is 115200")
+        self.assertIsNone(m.stage)
+
+        m.on_data("[INFO]", "Trying to Enter the ISP Mode...")
+        self.assertEqual(m.stage, "greeting")
+
+        m.on_data("[INFO] Greeting Message Detected, Start Downloading ISP")
+        self.assertEqual(m.stage, "isp_load")
+
+        m.on_data("\x1b[33mISP loaded\x1b[0m")
+        m.on_data("\x1b[33mInitialize K210 SPI Flash\x1b[0m")
+        self.assertEqual(m.stage, "flash_init")
+
+        m.on_process("Programming BIN", 1, 4, "95.50 KiB/s")
+        m.on_process("Programming BIN", 4, 4, "100.00 KiB/s")
+        self.assertEqual(m.stage, "programming")
+        self.assertEqual(m.rate, 100 * 1024)
+
+        # going back is not allowed
+        m.on_data("[INFO] Greeting Message Detected")
+        self.assertEqual(m.stage, "programming")
+
+        m.on_data("[INFO] Rebooting...")
+        self.assertEqual(m.stage, "reboot")
+        self.assertEqual(
+            m.stages,
+            {"greeting": 1, "isp_load": 1, "flash_init": 1, "programming": 1},
+        )
+
+    def test_finish(self):
+        m = self.make_metrics()
+        m.on_data("[INFO] Trying to Enter the ISP Mode...")
+        m.on_process("Programming BIN", 1, 4, "95.50 KiB/s")
+        m.on_data("[INFO] Rebooting...")
+        record = m.finish(ok=True, board="goE", port="/mock/path0")
+
+        self.assertTrue(record["ok"])
+        self.assertEqual(record["board"], "goE")
+        self.assertEqual(record["port"], "/mock/path0")
+        self.assertEqual(record["baudrate"], 1500000)
+        self.assertEqual(
+            record["stages"], {"greeting": 1, "programming": 1, "reboot": 1}
+        )
+        self.assertEqual(record["bytes"], 4096)
+        self.assertEqual(record["rate"], 4096)
+        self.assertEqual(record["reported_rate"], 95.5 * 1024)
+        self.assertEqual(record["efficiency"], 4096 / 150000)
+        self.assertIsNone(m.stage)
+
+    def test_finish_without_programming(self):
+        m = self.make_metrics()
+        m.on_data("[INFO] Trying to Enter the ISP Mode...")
+        record = m.finish(ok=False, error="Greeting fail")
+
+        self.assertFalse(record["ok"])
+        self.assertEqual(record["error"], "Greeting fail")
+        self.assertIsNone(record["rate"])
+        self.assertIsNone(record["efficiency"])
+
+    def test_save_and_load(self):
+        cachedir = os.path.join(self.tmpdir.name, "local")
+        m = self.make_metrics(cachedir=cachedir)
+        m.save({"ok": True})
+        m.save({"ok": False})
+
+        with open(m.metrics_file, "a", encoding="utf8") as file:
+            file.write("{broken\n")
+
+        self.assertEqual(
+            FlashMetrics.load(m.metrics_file), [{"ok": True}, {"ok": False}]
+        )
+
+    def test_save_without_cachedir(self):
+        m = self.make_metrics()
+        m.save({"ok": True})
+        self.assertEqual(os.listdir(self.tmpdir.name), ["kboot.kfpkg"])
+
+    def test_load_missing_file(self):
+        self.assertEqual(FlashMetrics.load(self.tmpdir.name + "/none.jsonl"), [])
+
+    def test_record_is_json(self):
+        m = self.make_metrics()
+        record = m.finish(ok=True)
+        self.assertEqual(json.loads(json.dumps(record))["ok"], True)
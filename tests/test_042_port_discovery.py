@@ -0,0 +1,192 @@
+from threading import Event
+from unittest import TestCase
+from unittest.mock import patch, MagicMock, call
+from serial.serialutil import SerialException
+from src.utils.ports import PortDiscovery, get_port_discovery
+
+
+def make_port(device: str, vid: int | None, pid: int | None = None):
+    return MagicMock(device=device, vid=vid, pid=pid)
+
+
+AMIGO0 = make_port("/mock/path0", 0x0403, 0x6010)
+AMIGO1 = make_port("/mock/path1", 0x0403, 0x6001)
+DOCK = make_port("/mock/path2", 0x1A86, 0x7523)
+NOT_USB = make_port("/mock/ttyS0", None)
+
+
+class TestPortDiscovery(TestCase):
+
+    def test_init(self):
+        d = PortDiscovery()
+        self.assertEqual(d.ttl, PortDiscovery.TTL)
+        self.assertTrue(d.is_expired())
+
+    def test_fail_init_ttl(self):
+        with self.assertRaises(ValueError) as exc_info:
+            PortDiscovery(ttl=-1)
+
+        self.assertEqual(str(exc_info.exception), "Invalid TTL: -1")
+
+    def test_make_key(self):
+        self.assertEqual(PortDiscovery.make_key(0x0403), "0403")
+        self.assertEqual(PortDiscovery.make_key("0403"), "0403")
+        self.assertEqual(PortDiscovery.make_key("0x7523"), "7523")
+        self.assertIsNone(PortDiscovery.make_key(None))
+
+    @patch("src.utils.ports.port_discovery.list_ports.comports")
+    def test_ports_cached(self, mock_comports):
+        mock_comports.return_value = [DOCK, AMIGO1, NOT_USB, AMIGO0]
+        d = PortDiscovery()
+
+        self.assertEqual(d.ports("0403"), [AMIGO0, AMIGO1])
+        self.assertEqual(d.ports(0x7523), [DOCK])
+        self.assertEqual(d.ports("1a86"), [DOCK])
+        self.assertEqual(d.ports("0403", pid="6001"), [AMIGO1])
+        self.assertEqual(d.ports(), [AMIGO0, AMIGO1, DOCK])
+        self.assertEqual(d.ports("55d3"), [])
+        self.assertFalse(d.is_expired())
+        mock_comports.assert_called_once()
+
+        d.ports("0403", refresh=True)
+        self.assertEqual(mock_comports.call_count, 2)
+
+    @patch("src.utils.ports.port_discovery.time.monotonic")
+    @patch("src.utils.ports.port_discovery.list_ports.comports")
+    def test_ports_expired(self, mock_comports, mock_monotonic):
+        mock_comports.return_value = [AMIGO0]
+        mock_monotonic.return_value = 10
+        d = PortDiscovery(ttl=2)
+        d.ports("0403")
+
+        mock_monotonic.return_value = 11
+        d.ports("0403")
+        mock_comports.assert_called_once()
+
+        mock_monotonic.return_value = 13
+        d.ports("0403")
+        self.assertEqual(mock_comports.call_count, 2)
+
+    @patch("src.utils.ports.port_discovery.list_ports.comports")
+    def test_grep_rescan_on_fallback(self, mock_comports):
+        # the second port was unplugged before the first one failed
+        mock_comports.side_effect = [[AMIGO0, AMIGO1], [AMIGO0], [AMIGO0]]
+        d = PortDiscovery()
+        ports = d.grep("0403")
+
+        self.assertEqual(next(ports), AMIGO0)
+        self.assertEqual(list(ports), [])
+        self.assertEqual(mock_comports.call_count, 2)
+
+    @patch("src.utils.ports.port_discovery.list_ports.comports")
+    def test_grep_new_port_on_fallback(self, mock_comports):
+        mock_comports.side_effect = [[AMIGO0], [AMIGO0, AMIGO1], [AMIGO0, AMIGO1]]
+        d = PortDiscovery()
+
+        self.assertEqual(list(d.grep("0403")), [AMIGO0, AMIGO1])
+
+    @patch("src.utils.ports.port_discovery.list_ports.comports")
+    def test_lookup(self, mock_comports):
+        mock_comports.return_value = [AMIGO0, DOCK]
+        d = PortDiscovery()
+
+        self.assertEqual(d.lookup("/mock/path2"), DOCK)
+        self.assertIsNone(d.lookup("/mock/path9"))
+        mock_comports.assert_called_once()
+
+    @patch("src.utils.ports.port_discovery.list_ports.comports")
+    def test_devices(self, mock_comports):
+        mock_comports.return_value = [AMIGO0, NOT_USB]
+        d = PortDiscovery()
+
+        self.assertEqual(
+            d.devices({"amigo": "0403", "m5stickv": "0403", "dock": "7523"}),
+            ["amigo", "m5stickv"],
+        )
+
+    @patch("src.utils.ports.port_discovery.list_ports.comports")
+    def test_devices_by_pid(self, mock_comports):
+        # CH340 boards are mapped by the PID of their USB-to-serial chip
+        mock_comports.return_value = [DOCK]
+        d = PortDiscovery()
+
+        self.assertEqual(
+            d.devices({"amigo": "0403", "dock": "7523", "yahboom": "7523"}),
+            ["dock", "yahboom"],
+        )
+        self.assertEqual(d.ports(), [DOCK])
+
+    @patch("src.utils.ports.port_discovery.Serial")
+    def test_probe_port(self, mock_serial):
+        def serial(port, **_):
+            if port == "/mock/path1":
+                raise SerialException("busy")
+            return MagicMock()
+
+        mock_serial.side_effect = serial
+
+        self.assertTrue(PortDiscovery.probe_port("/mock/path0", timeout=0.1))
+        self.assertFalse(PortDiscovery.probe_port("/mock/path1"))
+        mock_serial.assert_has_calls(
+            [
+                call("/mock/path0", timeout=0.1, write_timeout=0.1),
+                call("/mock/path1", timeout=0.5, write_timeout=0.5),
+            ]
+        )
+
+    @patch("src.utils.ports.port_discovery.Serial")
+    def test_probe_port_open_timeout(self, mock_serial):
+        release = Event()
+
+        def serial(*_, **__):
+            release.wait(5)
+            return MagicMock()
+
+        mock_serial.side_effect = serial
+
+        try:
+            self.assertFalse(PortDiscovery.probe_port("/mock/path0", timeout=0.05))
+        finally:
+            release.set()
+
+    @patch("src.utils.ports.port_discovery.list_ports.comports")
+    def test_poll(self, mock_comports):
+        callback = MagicMock()
+        mock_comports.return_value = [AMIGO0]
+        d = PortDiscovery()
+        d.scan()
+        d._watchers.append(callback)  # pylint: disable=protected-access
+
+        self.assertFalse(d.poll())
+        callback.assert_not_called()
+
+        mock_comports.return_value = [AMIGO1, DOCK]
+        self.assertTrue(d.poll())
+        callback.assert_called_once_with(
+            ["/mock/path1", "/mock/path2"], ["/mock/path0"]
+        )
+
+    @patch("src.utils.ports.port_discovery.Thread")
+    def test_watch_and_unwatch(self, mock_thread):
+        callback = MagicMock()
+        d = PortDiscovery()
+
+        d.watch(callback, interval=0.1)
+        d.watch(callback, interval=0.1)
+        mock_thread.assert_called_once()
+        mock_thread.return_value.start.assert_called_once()
+
+        d.unwatch(callback)
+        d.unwatch(callback)
+        d.unwatch(callback)
+
+    def test_clear(self):
+        d = PortDiscovery()
+        with patch("src.utils.ports.port_discovery.list_ports.comports") as comports:
+            comports.return_value = [AMIGO0]
+            d.ports()
+        d.clear()
+        self.assertTrue(d.is_expired())
+
+    def test_get_port_discovery(self):
+        self.assertIs(get_port_discovery(), get_port_discovery())
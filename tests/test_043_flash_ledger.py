@@ -0,0 +1,91 @@
+import os
+import json
+import tempfile
+from unittest import TestCase
+from unittest.mock import patch, MagicMock
+from src.utils.cache import FlashLedger
+
+
+class TestFlashLedger(TestCase):
+
+    def setUp(self):
+        # pylint: disable=consider-using-with
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.cachedir = os.path.join(self.tmpdir.name, "local")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_init(self):
+        ledger = FlashLedger(cachedir=self.cachedir)
+        self.assertTrue(os.path.isdir(self.cachedir))
+        self.assertEqual(ledger.entries, {})
+        self.assertEqual(
+            ledger.index_file, os.path.join(self.cachedir, "flash-ledger.json")
+        )
+
+    def test_init_corrupted_index(self):
+        os.makedirs(self.cachedir)
+        with open(
+            os.path.join(self.cachedir, "flash-ledger.json"), "w", encoding="utf8"
+        ) as file:
+            file.write("[]")
+
+        ledger = FlashLedger(cachedir=self.cachedir)
+        self.assertEqual(ledger.entries, {})
+
+    def test_make_key(self):
+        self.assertEqual(
+            FlashLedger.make_key(
+                MagicMock(vid=0x0403, pid=0x6010, serial_number="ABC")
+            ),
+            "0403:6010:abc",
+        )
+        self.assertIsNone(
+            FlashLedger.make_key(MagicMock(vid=0x1A86, pid=0x7523, serial_number=None))
+        )
+        self.assertIsNone(FlashLedger.make_key(None))
+
+    @patch("src.utils.cache.flash_ledger.time.time", return_value=1)
+    def test_record_save_and_load(self, _):
+        ledger = FlashLedger(cachedir=self.cachedir)
+        entry = ledger.record("0403:6010:abc", "00ff", device="amigo")
+        ledger.save()
+
+        self.assertEqual(entry, {"sha256": "00ff", "time": 1, "device": "amigo"})
+        self.assertEqual(os.listdir(self.cachedir), ["flash-ledger.json"])
+
+        with open(ledger.index_file, "r", encoding="utf8") as file:
+            self.assertEqual(json.load(file), {"0403:6010:abc": entry})
+
+        other = FlashLedger(cachedir=self.cachedir)
+        self.assertTrue(other.is_flashed("0403:6010:abc", "00ff"))
+
+    def test_is_flashed(self):
+        ledger = FlashLedger(cachedir=self.cachedir)
+        self.assertFalse(ledger.is_flashed("0403:6010:abc", "00ff"))
+
+        ledger.record("0403:6010:abc", "00ff")
+        self.assertTrue(ledger.is_flashed("0403:6010:abc", "00ff"))
+        self.assertFalse(ledger.is_flashed("0403:6010:abc", "ff00"))
+        self.assertFalse(ledger.is_flashed("0403:6010:def", "00ff"))
+
+    def test_forget(self):
+        ledger = FlashLedger(cachedir=self.cachedir)
+        ledger.record("0403:6010:abc", "00ff")
+        ledger.forget("0403:6010:abc")
+        ledger.forget("0403:6010:def")
+
+        self.assertEqual(ledger.entries, {})
+
+    def test_forget_usb_id(self):
+        ledger = FlashLedger(cachedir=self.cachedir)
+        ledger.record("0403:6010:abc", "00ff", device="amigo")
+        ledger.record("0403:6010:def", "00ff", device="amigo_tft")
+        ledger.record("0403:6001:ghi", "00ff", device="m5stickv")
+        ledger.record("1a86:7523:jkl", "00ff", device="dock")
+        ledger.record("55d3:0001:mno", "00ff", device="tzt")
+        ledger.forget_usb_id("0403")
+        ledger.forget_usb_id("7523")
+
+        self.assertEqual(list(ledger.entries.keys()), ["55d3:0001:mno"])
@@ -0,0 +1,147 @@
+import os
+import json
+import tempfile
+import threading
+from unittest import TestCase
+from unittest.mock import patch, MagicMock
+from src.utils.profiler import Profiler, get_profiler, profiled
+from src.utils.profiler import profiler as profiler_module
+
+
+class TestProfiler(TestCase):
+
+    def test_init_disabled(self):
+        p = Profiler()
+        self.assertIsNone(p.filename)
+        self.assertFalse(p.enabled)
+        self.assertEqual(p.events, [])
+
+    @patch("src.utils.profiler.profiler.atexit.register")
+    def test_init_enabled(self, mock_register):
+        p = Profiler(filename="trace.json")
+        self.assertTrue(p.enabled)
+        mock_register.assert_called_once_with(p.save)
+
+        # register once, even if enabled again
+        p.filename = "other.json"
+        mock_register.assert_called_once()
+
+    @patch.dict(os.environ, {}, clear=True)
+    def test_filename_from_env_unset(self):
+        self.assertIsNone(Profiler.filename_from_env())
+
+    @patch.dict(os.environ, {"KRUX_PROFILE": "1"}, clear=True)
+    def test_filename_from_env_default(self):
+        self.assertEqual(Profiler.filename_from_env(), "krux-installer-trace.json")
+
+    @patch.dict(os.environ, {"KRUX_PROFILE": "/tmp/trace.json"}, clear=True)
+    def test_filename_from_env(self):
+        self.assertEqual(Profiler.filename_from_env(), "/tmp/trace.json")
+
+    @patch.dict(os.environ, {"KRUX_PROFILE": "/tmp/trace.json"}, clear=True)
+    @patch("src.utils.profiler.profiler.multiprocessing.parent_process")
+    def test_filename_from_env_worker_process(self, mock_parent_process):
+        mock_parent_process.return_value = MagicMock()
+        self.assertIsNone(Profiler.filename_from_env())
+
+    def test_span_disabled(self):
+        p = Profiler()
+        with p.span("mock"):
+            pass
+
+        self.assertEqual(p.events, [])
+
+    @patch("src.utils.profiler.profiler.atexit.register")
+    def test_span(self, _):
+        clock = MagicMock(side_effect=[1000, 3000, 7000])
+        p = Profiler(filename="trace.json", clock=clock)
+
+        with p.span("mock", url="https://mock"):
+            pass
+
+        thread = threading.current_thread()
+        self.assertEqual(
+            p.events,
+            [
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": os.getpid(),
+                    "tid": thread.ident,
+                    "args": {"name": thread.name},
+                },
+                {
+                    "name": "mock",
+                    "cat": "krux",
+                    "ph": "X",
+                    "ts": 2.0,
+                    "dur": 4.0,
+                    "pid": os.getpid(),
+                    "tid": thread.ident,
+                    "args": {"url": "https://mock"},
+                },
+            ],
+        )
+
+    @patch("src.utils.profiler.profiler.atexit.register")
+    def test_span_raise(self, _):
+        p = Profiler(filename="trace.json")
+
+        with self.assertRaises(RuntimeError):
+            with p.span("mock"):
+                raise RuntimeError("mock")
+
+        self.assertEqual(p.summary()["mock"]["count"], 1)
+
+    @patch("src.utils.profiler.profiler.atexit.register")
+    def test_summary_and_save(self, _):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            trace = os.path.join(tmpdir, "trace.json")
+            p = Profiler(filename=trace)
+            p.add("mock", p.origin, 2_000_000)
+            p.add("mock", p.origin, 1_000_000)
+
+            self.assertEqual(p.summary(), {"mock": {"count": 2, "total": 3.0}})
+            self.assertEqual(p.save(), trace)
+
+            with open(trace, "r", encoding="utf8") as file:
+                data = json.load(file)
+
+        self.assertEqual(data["displayTimeUnit"], "ms")
+        self.assertEqual(len(data["traceEvents"]), 3)
+
+    def test_save_disabled(self):
+        self.assertIsNone(Profiler().save())
+
+    @patch("src.utils.profiler.profiler.atexit.register")
+    def test_profiled(self, _):
+        p = Profiler(filename="trace.json")
+
+        @profiled("mock")
+        def add(a, b):
+            return a + b
+
+        with patch("src.utils.profiler.profiler.get_profiler", return_value=p):
+            self.assertEqual(add(1, 2), 3)
+
+        self.assertEqual(list(p.summary().keys()), ["mock"])
+
+    def test_profiled_disabled(self):
+        p = Profiler()
+
+        @profiled()
+        def add(a, b):
+            return a + b
+
+        with patch("src.utils.profiler.profiler.get_profiler", return_value=p):
+            self.assertEqual(add(1, 2), 3)
+
+        self.assertEqual(add.__name__, "add")
+        self.assertEqual(p.events, [])
+
+    @patch.dict(os.environ, {}, clear=True)
+    @patch.object(profiler_module, "_profiler", None)
+    def test_get_profiler(self):
+        p = get_profiler()
+        self.assertIs(get_profiler(), p)
+        self.assertFalse(p.enabled)
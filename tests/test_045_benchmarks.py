@@ -0,0 +1,108 @@
+import os
+import tempfile
+from unittest import TestCase
+from zipfile import ZipFile
+import requests
+from benchmarks.bench_utils import compare, result_key, make_parser
+from benchmarks.bench_import import parse_importtime, over_budget
+from benchmarks.release_stand_in import make_release, ReleaseServer, StandInAdapter
+from src.utils.verifyer import Sha256Verifyer, SigVerifyer
+
+BASELINE = [
+    {"stage": "sha256", "size_mb": 1, "seconds": 1.0},
+    {"stage": "i18n", "size_mb": None, "ns_per_call": 100.0},
+]
+
+
+class TestBenchmarks(TestCase):
+
+    def test_result_key(self):
+        self.assertEqual(result_key(BASELINE[0]), "sha256@1MB")
+        self.assertEqual(result_key(BASELINE[1]), "i18n")
+
+    def test_compare(self):
+        results = [
+            {"stage": "sha256", "size_mb": 1, "seconds": 1.1},
+            {"stage": "i18n", "size_mb": None, "ns_per_call": 150.0},
+            {"stage": "unzip", "size_mb": 1, "seconds": 9.0},
+        ]
+
+        self.assertEqual(
+            compare(results, BASELINE, tolerance=0.2),
+            ["i18n: 1.50x slower than baseline"],
+        )
+        self.assertEqual(len(compare(results, BASELINE, tolerance=0.0)), 2)
+
+    def test_parser_sizes(self):
+        args = make_parser().parse_args(["--sizes", "1,200"])
+        self.assertEqual(args.sizes, [1, 200])
+
+    def test_make_release(self):
+        with tempfile.TemporaryDirectory() as rootdir:
+            paths = make_release(rootdir, "v0.0.1", 6 * 1024)
+
+            with ZipFile(paths["zip"]) as zip_obj:
+                self.assertIn(
+                    "krux-v0.0.1/maixpy_amigo/kboot.kfpkg", zip_obj.namelist()
+                )
+
+            with open(paths["sha256"], "r", encoding="utf8") as sha:
+                expected = sha.read().split(" ")[0]
+
+            sha256 = Sha256Verifyer(filename=paths["zip"])
+            sha256.load()
+            self.assertTrue(sha256.verify(expected))
+
+            with open(paths["sig"], "rb") as sig, open(paths["pem"], "rb") as pem:
+                verifyer = SigVerifyer(
+                    filename=paths["zip"],
+                    signature=sig.read(),
+                    pubkey=pem.read(),
+                    regexp=r".*\.zip$",
+                )
+            verifyer.load()
+            self.assertTrue(verifyer.verify())
+
+    def test_release_server(self):
+        with tempfile.TemporaryDirectory() as rootdir:
+            paths = make_release(rootdir, "v0.0.1", 6 * 1024)
+
+            with ReleaseServer(rootdir) as server:
+                session = requests.Session()
+                session.mount("https://github.com/", StandInAdapter(server.url))
+                res = session.get(
+                    "https://github.com/selfcustody/krux/releases/download/"
+                    "v0.0.1/krux-v0.0.1.zip",
+                    timeout=5,
+                )
+
+            self.assertEqual(res.status_code, 200)
+            self.assertEqual(len(res.content), os.path.getsize(paths["zip"]))
+
+    def test_parse_importtime(self):
+        stderr = "\n".join(
+            [
+                "import time: self [us] | cumulative | imported package",
+                "import time:       120 |        120 |     requests.compat",
+                "import time:      3000 |       3120 |   requests",
+                "import time:        20 |       3140 | src.utils.session",
+                "some warning",
+            ]
+        )
+
+        self.assertEqual(
+            parse_importtime(stderr),
+            {
+                "requests.compat": (120, 120),
+                "requests": (3000, 3120),
+                "src.utils.session": (20, 3140),
+            },
+        )
+
+    def test_over_budget(self):
+        self.assertEqual(
+            over_budget("cli", ["src.cli", "requests.compat", "serialization"]),
+            ["requests"],
+        )
+        self.assertEqual(over_budget("cli", ["src.cli"]), [])
+        self.assertEqual(over_budget("unknown", ["requests"]), [])